@@ -10,7 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.models.base import Base
-from app.models.user import User  # Import all models
+import app.models  # noqa: F401 - registers all models on Base.metadata
 
 # this is the Alembic Config object
 config = context.config
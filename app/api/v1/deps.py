@@ -1,71 +1,135 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from ...core.database import get_db
+from ...core.cache import principal_cache
+from ...core.database import get_db, set_consistency_key
+from ...core.principal import Principal
+from ...core.revocation import token_revocation
+from ...core.tenancy import set_tenant
 from ...core.security import decode_access_token
 from ...models.user import User
-from ...schemas.enums import UserRole, UserStatus
+from ...schemas.enums import UserStatus
 from ...repositories.user_repository import UserRepository
 
 # HTTP Bearer scheme
 security = HTTPBearer()
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from Bearer token"""
-    
-    # Get token from credentials
-    token = credentials.credentials
-    
-    credentials_exception = HTTPException(
+def _user_snapshot(user: User) -> dict:
+    """Column values of a user, safe to share between requests"""
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    """Build a detached User instance from a cached snapshot"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _ensure_active(user_status: UserStatus) -> None:
+    """Check if user is active"""
+    if user_status != UserStatus.ACTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Account is {user_status.value}. Contact administrator."
+        )
+
+def _load_user(email: str, db: Session) -> Optional[User]:
+    """Get user from the principal cache, falling back to the database"""
+    snapshot = principal_cache.get(email)
+    if snapshot is not None:
+        return _user_from_snapshot(snapshot)
     
-    # Decode token
-    payload = decode_access_token(token)
+    user = UserRepository(db).get_by_email(email)
+    if user is not None:
+        principal_cache.set(email, _user_snapshot(user))
+    return user
+
+def get_token_claims(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Claims of a valid, unrevoked access token"""
+    
+    # Decode token (verified claims are cached per token)
+    payload = decode_access_token(credentials.credentials)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    
+    # Revoked tokens are rejected from the in-memory denylist, without a DB query
+    if token_revocation.is_revoked(payload):
+        raise _credentials_exception()
     
+    return payload
+
+def get_current_principal(
+    payload: dict = Depends(get_token_claims),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    Get the caller's identity from the Bearer token
+    
+    Does not query the database; the User row is loaded only if the
+    handler reads `principal.user`.
+    """
     # Get email from token
-    email: str = payload.get("sub")
+    email: Optional[str] = payload.get("sub")
     if email is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
-    # Get user from database
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_email(email)
+    # Reads right after this user's own writes stay on the primary
+    set_consistency_key(db, email)
     
-    if user is None:
-        raise credentials_exception
+    principal = Principal.from_claims(payload, loader=lambda: _load_user(email, db))
+    if principal is None:
+        # Token without identity claims: fall back to the user row
+        user = _load_user(email, db)
+        if user is None:
+            raise _credentials_exception()
+        principal = Principal.from_user(user, payload)
     
-    # Check if user is active
-    if user.status != UserStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Account is {user.status.value}. Contact administrator."
-        )
+    _ensure_active(principal.status)
     
+    # Every query in this request only sees the caller's company
+    set_tenant(db, principal.tenant_id)
+    return principal
+
+def get_current_user(principal: Principal = Depends(get_current_principal)) -> User:
+    """Get current authenticated user from Bearer token"""
+    user = principal.user
+    if user is None:
+        raise _credentials_exception()
+    
+    _ensure_active(user.status)
     return user
 
-def get_current_superadmin(current_user: User = Depends(get_current_user)) -> User:
+def get_current_superadmin(principal: Principal = Depends(get_current_principal)) -> Principal:
     """Verify current user is superadmin"""
-    if current_user.role != UserRole.SUPERADMIN:
+    if not principal.is_superadmin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions. Superadmin access required."
         )
-    return current_user
+    return principal
 
-def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+def get_current_admin(principal: Principal = Depends(get_current_principal)) -> Principal:
     """Verify current user is admin or superadmin"""
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPERADMIN]:
+    if not principal.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions. Admin access required."
         )
-    return current_user
\ No newline at end of file
+    return principal
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match already names `etag`"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
\ No newline at end of file
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional
+
+from ....core.database import get_db
+from ....schemas.attendance import PunchBatch, PunchBatchResponse, PunchResponse
+from ....services.attendance_service import AttendanceService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("/punches", response_model=PunchBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+def ingest_punches(
+    batch: PunchBatch,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Push attendance punches from devices (Admin only)
+
+    - Up to PUNCH_BATCH_MAX_ITEMS punches per request
+    - punched_at without an offset is taken as UTC
+    - Punches are deduplicated on (employee_id, device_id, punched_at),
+      so a batch can be resent after a timeout
+
+    Accepted punches are buffered and stored within about a second.
+    Returns 503 with Retry-After when the buffer is full.
+    """
+    return AttendanceService(db).ingest(batch)
+
+@router.get("/punches", response_model=List[PunchResponse])
+def list_punches(
+    start: datetime,
+    end: datetime,
+    employee_id: Optional[int] = None,
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Stored punches with start <= punched_at < end, oldest first (Admin only)"""
+    return AttendanceService(db).list_punches(start, end, employee_id, limit)
\ No newline at end of file
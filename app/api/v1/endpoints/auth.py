@@ -1,19 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....core.database import get_db
-from ....schemas.token import LoginRequest, TokenResponse
+from ....core.database import get_async_db
+from ....schemas.token import LoginRequest, RefreshRequest, TokenResponse
 from ....schemas.user import AdminResponse
 from ....services.auth_service import AuthService
-from ..deps import get_current_user
+from ....middleware.rate_limiter import limit_login_by_email
+from ..deps import get_current_user, get_token_claims
 from ....models.user import User
 
 router = APIRouter()
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(limit_login_by_email)])
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Login endpoint - Returns JWT Bearer token
@@ -42,7 +43,7 @@ async def login(
     """
     try:
         auth_service = AuthService(db)
-        return auth_service.login(login_data)
+        return await auth_service.login(login_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -61,37 +62,35 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     return current_user
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    claims: dict = Depends(get_token_claims),
+    current_user: User = Depends(get_current_user)
+):
     """
     Logout endpoint
     
-    Note: JWT tokens are stateless, actual logout happens client-side
-    This endpoint is for logging/tracking purposes
+    Revokes the access token and every refresh token issued from the same
+    login, in all workers.
     
     Requires: Bearer token in Authorization header
     """
+    AuthService.logout(claims)
     return {
         "message": "Successfully logged out",
         "user": current_user.email
     }
 
-@router.post("/refresh")
-async def refresh_token(current_user: User = Depends(get_current_user)):
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(
+    refresh_data: RefreshRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Refresh access token
     
-    Returns a new token for the authenticated user
-    
-    Requires: Bearer token in Authorization header
+    Exchanges a refresh token for a new access token and a new refresh
+    token. Refresh tokens are single use; reusing an old one revokes the
+    whole login session.
     """
-    from ....core.security import create_access_token
-    
-    access_token = create_access_token(
-        data={"sub": current_user.email, "role": current_user.role.value}
-    )
-    
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "user": AdminResponse.model_validate(current_user)
-    }
\ No newline at end of file
+    auth_service = AuthService(db)
+    return await auth_service.refresh(refresh_data.refresh_token)
\ No newline at end of file
@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ....core.database import get_db
+from ....schemas.business_unit import BusinessUnitCreate, BusinessUnitUpdate, BusinessUnitResponse
+from ....schemas.employee import EmployeeSummary
+from ....services.business_unit_service import BusinessUnitService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=BusinessUnitResponse, status_code=status.HTTP_201_CREATED)
+def create_business_unit(
+    unit_data: BusinessUnitCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a business unit (Admin only)"""
+    return BusinessUnitService(db).create(unit_data, current_admin.id)
+
+@router.get("", response_model=List[BusinessUnitResponse])
+def list_business_units(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List business units (Admin only)"""
+    return BusinessUnitService(db).get_all(skip, limit)
+
+@router.get("/{business_unit_id}", response_model=BusinessUnitResponse)
+def get_business_unit(
+    business_unit_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get business unit details (Admin only)"""
+    return BusinessUnitService(db).get_by_id(business_unit_id)
+
+@router.put("/{business_unit_id}", response_model=BusinessUnitResponse)
+def update_business_unit(
+    business_unit_id: int,
+    unit_data: BusinessUnitUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Update business unit (Admin only)
+    
+    Changing `parent_id` moves the business unit with everything below it.
+    """
+    return BusinessUnitService(db).update(business_unit_id, unit_data, current_admin.id)
+
+@router.delete("/{business_unit_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_business_unit(
+    business_unit_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete business unit; its children move up to its parent (Admin only)"""
+    BusinessUnitService(db).delete(business_unit_id)
+
+@router.get("/{business_unit_id}/children", response_model=List[BusinessUnitResponse])
+def get_business_unit_children(
+    business_unit_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Direct children of a business unit (Admin only)"""
+    return BusinessUnitService(db).get_children(business_unit_id)
+
+@router.get("/{business_unit_id}/descendants", response_model=List[BusinessUnitResponse])
+def get_business_unit_descendants(
+    business_unit_id: int,
+    max_depth: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Every business unit below this one, nearest levels first (Admin only)"""
+    return BusinessUnitService(db).get_descendants(business_unit_id, max_depth)
+
+@router.get("/{business_unit_id}/ancestors", response_model=List[BusinessUnitResponse])
+def get_business_unit_ancestors(
+    business_unit_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Parent, grandparent, ... up to the top-level business unit (Admin only)"""
+    return BusinessUnitService(db).get_ancestors(business_unit_id)
+
+@router.get("/{business_unit_id}/employees", response_model=List[EmployeeSummary])
+def get_business_unit_employees(
+    business_unit_id: int,
+    include_descendants: bool = True,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Employees of a business unit, by default including every business unit below it (Admin only)"""
+    return BusinessUnitService(db).get_employees(business_unit_id, include_descendants, skip, limit)
\ No newline at end of file
@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ....core.database import get_db
+from ....schemas.cost_center import CostCenterCreate, CostCenterUpdate, CostCenterResponse
+from ....schemas.employee import EmployeeSummary
+from ....services.cost_center_service import CostCenterService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=CostCenterResponse, status_code=status.HTTP_201_CREATED)
+def create_cost_center(
+    unit_data: CostCenterCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a cost center (Admin only)"""
+    return CostCenterService(db).create(unit_data, current_admin.id)
+
+@router.get("", response_model=List[CostCenterResponse])
+def list_cost_centers(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List cost centers (Admin only)"""
+    return CostCenterService(db).get_all(skip, limit)
+
+@router.get("/{cost_center_id}", response_model=CostCenterResponse)
+def get_cost_center(
+    cost_center_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get cost center details (Admin only)"""
+    return CostCenterService(db).get_by_id(cost_center_id)
+
+@router.put("/{cost_center_id}", response_model=CostCenterResponse)
+def update_cost_center(
+    cost_center_id: int,
+    unit_data: CostCenterUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Update cost center (Admin only)
+    
+    Changing `parent_id` moves the cost center with everything below it.
+    """
+    return CostCenterService(db).update(cost_center_id, unit_data, current_admin.id)
+
+@router.delete("/{cost_center_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_cost_center(
+    cost_center_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete cost center; its children move up to its parent (Admin only)"""
+    CostCenterService(db).delete(cost_center_id)
+
+@router.get("/{cost_center_id}/children", response_model=List[CostCenterResponse])
+def get_cost_center_children(
+    cost_center_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Direct children of a cost center (Admin only)"""
+    return CostCenterService(db).get_children(cost_center_id)
+
+@router.get("/{cost_center_id}/descendants", response_model=List[CostCenterResponse])
+def get_cost_center_descendants(
+    cost_center_id: int,
+    max_depth: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Every cost center below this one, nearest levels first (Admin only)"""
+    return CostCenterService(db).get_descendants(cost_center_id, max_depth)
+
+@router.get("/{cost_center_id}/ancestors", response_model=List[CostCenterResponse])
+def get_cost_center_ancestors(
+    cost_center_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Parent, grandparent, ... up to the top-level cost center (Admin only)"""
+    return CostCenterService(db).get_ancestors(cost_center_id)
+
+@router.get("/{cost_center_id}/employees", response_model=List[EmployeeSummary])
+def get_cost_center_employees(
+    cost_center_id: int,
+    include_descendants: bool = True,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Employees of a cost center, by default including every cost center below it (Admin only)"""
+    return CostCenterService(db).get_employees(cost_center_id, include_descendants, skip, limit)
\ No newline at end of file
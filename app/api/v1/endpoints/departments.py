@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ....core.database import get_db
+from ....schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
+from ....schemas.employee import EmployeeSummary
+from ....services.department_service import DepartmentService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=DepartmentResponse, status_code=status.HTTP_201_CREATED)
+def create_department(
+    unit_data: DepartmentCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a department (Admin only)"""
+    return DepartmentService(db).create(unit_data, current_admin.id)
+
+@router.get("", response_model=List[DepartmentResponse])
+def list_departments(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List departments (Admin only)"""
+    return DepartmentService(db).get_all(skip, limit)
+
+@router.get("/{department_id}", response_model=DepartmentResponse)
+def get_department(
+    department_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get department details (Admin only)"""
+    return DepartmentService(db).get_by_id(department_id)
+
+@router.put("/{department_id}", response_model=DepartmentResponse)
+def update_department(
+    department_id: int,
+    unit_data: DepartmentUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Update department (Admin only)
+    
+    Changing `parent_id` moves the department with everything below it.
+    """
+    return DepartmentService(db).update(department_id, unit_data, current_admin.id)
+
+@router.delete("/{department_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_department(
+    department_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete department; its children move up to its parent (Admin only)"""
+    DepartmentService(db).delete(department_id)
+
+@router.get("/{department_id}/children", response_model=List[DepartmentResponse])
+def get_department_children(
+    department_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Direct children of a department (Admin only)"""
+    return DepartmentService(db).get_children(department_id)
+
+@router.get("/{department_id}/descendants", response_model=List[DepartmentResponse])
+def get_department_descendants(
+    department_id: int,
+    max_depth: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Every department below this one, nearest levels first (Admin only)"""
+    return DepartmentService(db).get_descendants(department_id, max_depth)
+
+@router.get("/{department_id}/ancestors", response_model=List[DepartmentResponse])
+def get_department_ancestors(
+    department_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Parent, grandparent, ... up to the top-level department (Admin only)"""
+    return DepartmentService(db).get_ancestors(department_id)
+
+@router.get("/{department_id}/employees", response_model=List[EmployeeSummary])
+def get_department_employees(
+    department_id: int,
+    include_descendants: bool = True,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Employees of a department, by default including every department below it (Admin only)"""
+    return DepartmentService(db).get_employees(department_id, include_descendants, skip, limit)
\ No newline at end of file
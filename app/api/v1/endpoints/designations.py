@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.designation import DesignationCreate, DesignationUpdate, DesignationResponse
+from ....services.designation_service import DesignationService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=DesignationResponse, status_code=status.HTTP_201_CREATED)
+def create_designation(
+    data: DesignationCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a designation (Admin only)"""
+    return DesignationService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[DesignationResponse])
+def list_designations(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List designations (Admin only)"""
+    return DesignationService(db).get_all(skip, limit)
+
+@router.get("/{designation_id}", response_model=DesignationResponse)
+def get_designation(
+    designation_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get designation details (Admin only)"""
+    return DesignationService(db).get_by_id(designation_id)
+
+@router.put("/{designation_id}", response_model=DesignationResponse)
+def update_designation(
+    designation_id: int,
+    data: DesignationUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update designation (Admin only)"""
+    return DesignationService(db).update(designation_id, data, current_admin.id)
+
+@router.delete("/{designation_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_designation(
+    designation_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete designation (Admin only)"""
+    DesignationService(db).delete(designation_id)
\ No newline at end of file
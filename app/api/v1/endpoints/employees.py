@@ -0,0 +1,118 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
+from sqlalchemy.orm import Session
+from pathlib import Path
+from typing import List
+import tempfile
+
+from ....core.config import settings
+from ....core.database import get_db
+from ....schemas.employee import (
+    EmployeeImportJobResponse, EmployeeReminderRequest, EmployeeReminderResponse, ManagerChainEntry
+)
+from ....services.department_service import DepartmentService
+from ....services.email_service import EmailService
+from ....services.employee_import_service import ImportJob, import_jobs, run_employee_import
+from ....utils.import_readers import SUPPORTED_IMPORT_EXTENSIONS
+from ..deps import get_current_admin
+from ....core.principal import Principal
+from ....schemas.enums import UserRole
+
+router = APIRouter()
+
+# Copy uploads in 1MB chunks so large rosters never sit in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+@router.post(
+    "/import",
+    response_model=EmployeeImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def import_employees(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Import an employee roster (Admin only)
+    
+    - Formats: CSV (UTF-8) or XLSX, first row is the header
+    - Columns: employee_code, first_name, last_name, email, phone_number,
+      gender, date_of_birth, date_of_joining, department, designation,
+      location, status
+    - department/designation/location accept a code or a name
+    
+    The file is processed in the background; poll
+    `GET /employees/import/{job_id}` for progress and per-row errors.
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    if suffix not in SUPPORTED_IMPORT_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only CSV and XLSX files are allowed"
+        )
+    
+    with tempfile.NamedTemporaryFile(prefix="employee_import_", suffix=suffix, delete=False) as tmp:
+        path = Path(tmp.name)
+        size = 0
+        while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.EMPLOYEE_IMPORT_MAX_FILE_SIZE:
+                break
+            tmp.write(chunk)
+    
+    if size > settings.EMPLOYEE_IMPORT_MAX_FILE_SIZE:
+        path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds {settings.EMPLOYEE_IMPORT_MAX_FILE_SIZE // (1024 * 1024)}MB limit"
+        )
+    
+    job = import_jobs.add(ImportJob(file.filename, created_by=current_admin.id, tenant_id=current_admin.tenant_id))
+    background_tasks.add_task(run_employee_import, job, path)
+    return job.to_dict()
+
+@router.get("/import/{job_id}", response_model=EmployeeImportJobResponse)
+def get_import_job(
+    job_id: str,
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get progress and row errors of an employee import (Admin only)"""
+    job = import_jobs.get(job_id)
+    if not job or (job.created_by != current_admin.id and current_admin.role != UserRole.SUPERADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found"
+        )
+    return job.to_dict()
+
+@router.post(
+    "/reminders",
+    response_model=EmployeeReminderResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def send_reminder(
+    reminder: EmployeeReminderRequest,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Email a reminder to every active employee (Admin only)
+    
+    Returns as soon as the reminder is queued; the emails go out in the
+    background.
+    """
+    return {"recipients": EmailService(db).queue_reminder(reminder.subject, reminder.message)}
+
+@router.get("/{employee_id}/managers", response_model=List[ManagerChainEntry])
+def get_manager_chain(
+    employee_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Reporting line of an employee (Admin only)
+    
+    Heads of the employee's department and of each department above it,
+    nearest first.
+    """
+    return DepartmentService(db).get_manager_chain(employee_id)
\ No newline at end of file
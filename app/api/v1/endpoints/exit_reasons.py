@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.exit_reason import ExitReasonCreate, ExitReasonUpdate, ExitReasonResponse
+from ....services.exit_reason_service import ExitReasonService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=ExitReasonResponse, status_code=status.HTTP_201_CREATED)
+def create_exit_reason(
+    data: ExitReasonCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a exit reason (Admin only)"""
+    return ExitReasonService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[ExitReasonResponse])
+def list_exit_reasons(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List exit reasons (Admin only)"""
+    return ExitReasonService(db).get_all(skip, limit)
+
+@router.get("/{exit_reason_id}", response_model=ExitReasonResponse)
+def get_exit_reason(
+    exit_reason_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get exit reason details (Admin only)"""
+    return ExitReasonService(db).get_by_id(exit_reason_id)
+
+@router.put("/{exit_reason_id}", response_model=ExitReasonResponse)
+def update_exit_reason(
+    exit_reason_id: int,
+    data: ExitReasonUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update exit reason (Admin only)"""
+    return ExitReasonService(db).update(exit_reason_id, data, current_admin.id)
+
+@router.delete("/{exit_reason_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_exit_reason(
+    exit_reason_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete exit reason (Admin only)"""
+    ExitReasonService(db).delete(exit_reason_id)
\ No newline at end of file
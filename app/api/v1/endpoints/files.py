@@ -1,16 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+import asyncio
 
 from ....core.config import settings
-from ..deps import get_current_user
+from ....core.storage import blob_storage, is_valid_digest
+from ....services.file_service import UnsupportedFileType, UploadTooLarge, save_image_upload
+from ....services.image_service import FULL_SIZE, image_store, image_url
+from ..deps import etag_matches, get_current_user
 from ....models.user import User
 
 router = APIRouter()
 
-# Create upload directory
-UPLOAD_DIR = Path(settings.UPLOAD_DIR)
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+# Content-addressed responses never change, so caches may keep them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def blob_url(digest: str) -> str:
+    """URL serving a stored blob"""
+    return f"/api/v1/upload/files/{digest}"
+
+def _immutable_response(
+    request: Request,
+    path: Path,
+    etag: str,
+    media_type: Optional[str] = None,
+    vary: Optional[str] = None
+) -> Response:
+    """
+    Serve a content-addressed file with a strong ETag
+    
+    Conditional requests get 304; FileResponse handles Range/If-Range and
+    uses zero-copy `pathsend` when the server supports it.
+    """
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if vary:
+        headers["Vary"] = vary
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
 
 @router.post("/profile-image")
 async def upload_profile_image(
@@ -21,38 +50,117 @@ async def upload_profile_image(
     Upload profile image
     
     - Maximum file size: 4MB
-    - Allowed formats: JPEG, PNG, GIF
-    """
-    # Read file content
-    contents = await file.read()
+    - Allowed formats: JPEG, PNG, GIF (detected from the file contents)
     
-    # Validate file size
-    if len(contents) > settings.MAX_FILE_SIZE:
+    Files are stored by content hash, so uploading the same image again
+    reuses the stored copy.
+    """
+    try:
+        blob = await save_image_upload(
+            file,
+            blob_storage,
+            max_size=settings.MAX_FILE_SIZE,
+            allowed_types=settings.ALLOWED_IMAGE_TYPES
+        )
+    except UploadTooLarge:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds 4MB limit"
+            detail=f"File size exceeds {settings.MAX_FILE_SIZE // (1024 * 1024)}MB limit"
         )
-    
-    # Validate file type
-    if file.content_type not in settings.ALLOWED_IMAGE_TYPES:
+    except UnsupportedFileType:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only image files (JPEG, PNG, GIF) are allowed"
         )
     
-    # Generate unique filename
-    file_extension = file.filename.split(".")[-1]
-    unique_filename = f"{current_user.id}_{int(datetime.utcnow().timestamp())}.{file_extension}"
-    file_path = UPLOAD_DIR / unique_filename
-    
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Thumbnails and WebP variants are generated in the background
+    image_store.schedule(blob.digest)
     
-    # Return file URL
-    file_url = f"/{settings.UPLOAD_DIR}/{unique_filename}"
     return {
-        "file_url": file_url,
-        "filename": unique_filename,
+        "file_url": blob_url(blob.digest),
+        "filename": blob.digest,
+        "image_id": blob.digest,
+        "image_url": image_url(blob.digest),
+        "thumbnail_urls": {
+            str(size): image_url(blob.digest, size) for size in image_store.sizes
+        },
+        "deduplicated": not blob.created,
         "message": "File uploaded successfully"
-    }
\ No newline at end of file
+    }
+
+@router.api_route("/files/{digest}", methods=["GET", "HEAD"])
+async def get_file(digest: str, request: Request):
+    """
+    Serve a stored file by content hash
+    
+    Supports `If-None-Match` (304) and `Range` requests.
+    """
+    if not is_valid_digest(digest):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    
+    blob = await run_in_threadpool(blob_storage.stat, digest)
+    if blob is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    
+    path = await run_in_threadpool(blob_storage.local_path, digest)
+    if path is not None:
+        return _immutable_response(request, path, blob.etag, blob.content_type)
+    
+    # Non-local backends stream through the application
+    if etag_matches(request, blob.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": blob.etag})
+    handle = await run_in_threadpool(blob_storage.open, digest)
+    return StreamingResponse(
+        handle,
+        media_type=blob.content_type,
+        headers={"ETag": blob.etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    )
+
+def _existing_variant(digest: str, variant: str, webp: bool) -> Optional[Path]:
+    path = image_store.derivative_path(digest, variant, webp)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    return path if path.exists() else None
+
+@router.api_route("/images/{digest}", methods=["GET", "HEAD"])
+async def get_image(digest: str, request: Request, size: Optional[int] = None):
+    """
+    Serve an uploaded image by content hash
+    
+    - `size`: one of the configured thumbnail sizes; omit for full size
+    - WebP is returned when the client accepts it
+    
+    Store the `image_url` from the upload response in `profile_image` and
+    request `?size=40` for avatars. Derivatives missing at request time
+    are generated on first access.
+    """
+    if not is_valid_digest(digest):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    if size is not None and size not in image_store.sizes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported size. Allowed sizes: {image_store.sizes}"
+        )
+    
+    blob = await run_in_threadpool(blob_storage.stat, digest)
+    if blob is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    
+    variant = str(size) if size else FULL_SIZE
+    webp = "image/webp" in request.headers.get("accept", "")
+    
+    path = await run_in_threadpool(_existing_variant, digest, variant, webp)
+    if path is None:
+        future = image_store.schedule(digest)
+        if future is not None:
+            await asyncio.wrap_future(future)
+        path = await run_in_threadpool(_existing_variant, digest, variant, webp)
+    if path is None:
+        # Pillow unavailable or the image could not be decoded
+        path = await run_in_threadpool(image_store.source_path, digest)
+    
+    # Derivatives are deterministic for a given source, so this tag is strong;
+    # the original blob has no extension and keeps its own tag and type
+    if path.suffix:
+        return _immutable_response(request, path, f'"{digest}-{path.stem}{path.suffix}"', vary="Accept")
+    return _immutable_response(request, path, blob.etag, blob.content_type, vary="Accept")
\ No newline at end of file
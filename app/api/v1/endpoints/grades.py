@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.grade import GradeCreate, GradeUpdate, GradeResponse
+from ....services.grade_service import GradeService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=GradeResponse, status_code=status.HTTP_201_CREATED)
+def create_grade(
+    data: GradeCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a grade (Admin only)"""
+    return GradeService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[GradeResponse])
+def list_grades(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List grades (Admin only)"""
+    return GradeService(db).get_all(skip, limit)
+
+@router.get("/{grade_id}", response_model=GradeResponse)
+def get_grade(
+    grade_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get grade details (Admin only)"""
+    return GradeService(db).get_by_id(grade_id)
+
+@router.put("/{grade_id}", response_model=GradeResponse)
+def update_grade(
+    grade_id: int,
+    data: GradeUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update grade (Admin only)"""
+    return GradeService(db).update(grade_id, data, current_admin.id)
+
+@router.delete("/{grade_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_grade(
+    grade_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete grade (Admin only)"""
+    GradeService(db).delete(grade_id)
\ No newline at end of file
@@ -1,6 +1,17 @@
 # Health check endpoints
 from fastapi import APIRouter
 from ....core.config import settings
+from ....core.cache import principal_cache, verified_token_cache
+from ....core.database import replicas
+from ....core.events import job_worker
+from ....core.revocation import token_revocation
+from ....core.security import password_hasher
+from ....services.attendance_service import punch_ingestor
+from ....services.email_service import email_sender, email_worker
+from ....services.employee_code_service import employee_code_allocator
+from ....services.reference_data_service import reference_data_cache
+from ....services.roster_service import roster_engine
+from ....services.workflow_service import workflow_engine
 
 router = APIRouter()
 
@@ -11,4 +22,22 @@ def health_check():
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION
+    }
+
+@router.get("/runtime")
+def runtime_stats():
+    """In-process runtime counters for this worker"""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "verified_token_cache": verified_token_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "read_replicas": replicas.stats(),
+        "token_revocation": token_revocation.stats(),
+        "roster": roster_engine.stats(),
+        "workflow_engine": workflow_engine.stats(),
+        "employee_codes": employee_code_allocator.stats(),
+        "reference_data": reference_data_cache.stats(),
+        "jobs": job_worker.stats(),
+        "email": {**email_sender.stats(), "worker": email_worker.stats()},
+        "attendance": punch_ingestor.stats()
     }
\ No newline at end of file
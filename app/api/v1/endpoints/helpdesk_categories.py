@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.helpdesk_category import HelpdeskCategoryCreate, HelpdeskCategoryUpdate, HelpdeskCategoryResponse
+from ....services.helpdesk_category_service import HelpdeskCategoryService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=HelpdeskCategoryResponse, status_code=status.HTTP_201_CREATED)
+def create_helpdesk_category(
+    data: HelpdeskCategoryCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a helpdesk category (Admin only)"""
+    return HelpdeskCategoryService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[HelpdeskCategoryResponse])
+def list_helpdesk_categories(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List helpdesk categories (Admin only)"""
+    return HelpdeskCategoryService(db).get_all(skip, limit)
+
+@router.get("/{helpdesk_category_id}", response_model=HelpdeskCategoryResponse)
+def get_helpdesk_category(
+    helpdesk_category_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get helpdesk category details (Admin only)"""
+    return HelpdeskCategoryService(db).get_by_id(helpdesk_category_id)
+
+@router.put("/{helpdesk_category_id}", response_model=HelpdeskCategoryResponse)
+def update_helpdesk_category(
+    helpdesk_category_id: int,
+    data: HelpdeskCategoryUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update helpdesk category (Admin only)"""
+    return HelpdeskCategoryService(db).update(helpdesk_category_id, data, current_admin.id)
+
+@router.delete("/{helpdesk_category_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_helpdesk_category(
+    helpdesk_category_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete helpdesk category (Admin only)"""
+    HelpdeskCategoryService(db).delete(helpdesk_category_id)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.location import LocationCreate, LocationUpdate, LocationResponse
+from ....services.location_service import LocationService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=LocationResponse, status_code=status.HTTP_201_CREATED)
+def create_location(
+    data: LocationCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a location (Admin only)"""
+    return LocationService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[LocationResponse])
+def list_locations(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List locations (Admin only)"""
+    return LocationService(db).get_all(skip, limit)
+
+@router.get("/{location_id}", response_model=LocationResponse)
+def get_location(
+    location_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get location details (Admin only)"""
+    return LocationService(db).get_by_id(location_id)
+
+@router.put("/{location_id}", response_model=LocationResponse)
+def update_location(
+    location_id: int,
+    data: LocationUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update location (Admin only)"""
+    return LocationService(db).update(location_id, data, current_admin.id)
+
+@router.delete("/{location_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_location(
+    location_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete location (Admin only)"""
+    LocationService(db).delete(location_id)
\ No newline at end of file
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+
+from ....core.database import get_db
+from ....core.principal import Principal
+from ....core.responses import FastJSONResponse
+from ....schemas.reference_data import ReferenceDataResponse
+from ....services.reference_data_service import ReferenceDataService
+from ..deps import etag_matches, get_current_principal
+
+router = APIRouter()
+
+@router.get("", response_model=ReferenceDataResponse, response_class=FastJSONResponse)
+def get_reference_data(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_principal: Principal = Depends(get_current_principal)
+):
+    """
+    Grades, designations, visit types, exit reasons, helpdesk categories and
+    locations of the caller's company in one response
+    
+    The ETag changes with every master data write; send it back in
+    `If-None-Match` to get a 304 while nothing changed.
+    """
+    bundle = ReferenceDataService(db).get_bundle()
+    headers = {"ETag": bundle.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, bundle.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FastJSONResponse(bundle.body, headers=headers)
\ No newline at end of file
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Optional
+
+from ....core.database import get_db
+from ....schemas.roster import RosterResponse
+from ....services.roster_service import RosterService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.get("", response_model=RosterResponse)
+def get_roster(
+    start_date: date,
+    end_date: date,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    employee_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Shift roster for a date range (Admin only)
+    
+    Each employee's schedule is derived from their shift rule (rotation),
+    or their shift policy's default shift, minus week-off days. Employees
+    are ordered by ID; page with `skip`/`limit` or pass `employee_id`.
+    """
+    return RosterService(db).get_roster(start_date, end_date, skip, limit, employee_id)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.shift_policy import ShiftPolicyCreate, ShiftPolicyUpdate, ShiftPolicyResponse
+from ....services.shift_policy_service import ShiftPolicyService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=ShiftPolicyResponse, status_code=status.HTTP_201_CREATED)
+def create_shift_policy(
+    policy_data: ShiftPolicyCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a shift policy (Admin only)"""
+    return ShiftPolicyService(db).create_shift_policy(policy_data, current_admin.id)
+
+@router.get("", response_model=List[ShiftPolicyResponse])
+def list_shift_policies(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List shift policies (Admin only)"""
+    return ShiftPolicyService(db).get_shift_policies(skip, limit)
+
+@router.get("/{shift_policy_id}", response_model=ShiftPolicyResponse)
+def get_shift_policy(
+    shift_policy_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get shift policy details (Admin only)"""
+    return ShiftPolicyService(db).get_shift_policy_by_id(shift_policy_id)
+
+@router.put("/{shift_policy_id}", response_model=ShiftPolicyResponse)
+def update_shift_policy(
+    shift_policy_id: int,
+    policy_data: ShiftPolicyUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update shift policy (Admin only)"""
+    return ShiftPolicyService(db).update_shift_policy(shift_policy_id, policy_data, current_admin.id)
+
+@router.delete("/{shift_policy_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_shift_policy(
+    shift_policy_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete shift policy (Admin only)"""
+    ShiftPolicyService(db).delete_shift_policy(shift_policy_id)
\ No newline at end of file
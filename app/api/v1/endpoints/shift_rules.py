@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.shift_rule import ShiftRuleCreate, ShiftRuleUpdate, ShiftRuleResponse
+from ....services.shift_rule_service import ShiftRuleService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=ShiftRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_shift_rule(
+    rule_data: ShiftRuleCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a shift rule (Admin only)"""
+    return ShiftRuleService(db).create_shift_rule(rule_data, current_admin.id)
+
+@router.get("", response_model=List[ShiftRuleResponse])
+def list_shift_rules(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List shift rules (Admin only)"""
+    return ShiftRuleService(db).get_shift_rules(skip, limit)
+
+@router.get("/{shift_rule_id}", response_model=ShiftRuleResponse)
+def get_shift_rule(
+    shift_rule_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get shift rule details (Admin only)"""
+    return ShiftRuleService(db).get_shift_rule_by_id(shift_rule_id)
+
+@router.put("/{shift_rule_id}", response_model=ShiftRuleResponse)
+def update_shift_rule(
+    shift_rule_id: int,
+    rule_data: ShiftRuleUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update shift rule (Admin only)"""
+    return ShiftRuleService(db).update_shift_rule(shift_rule_id, rule_data, current_admin.id)
+
+@router.delete("/{shift_rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_shift_rule(
+    shift_rule_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete shift rule (Admin only)"""
+    ShiftRuleService(db).delete_shift_rule(shift_rule_id)
\ No newline at end of file
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
 from ....core.database import get_db
-from ....schemas.user import AdminCreateRequest, AdminUpdateRequest, AdminResponse
+from ....core.responses import FastJSONResponse
+from ....schemas.user import (
+    AdminCreateRequest, AdminUpdateRequest, AdminResponse, admin_serializer
+)
+from ....schemas.common import CursorPage
 from ....services.admin_service import AdminService
 from ..deps import get_current_superadmin
-from ....models.user import User
+from ....core.principal import Principal
 
 router = APIRouter()
 
@@ -14,7 +18,7 @@ router = APIRouter()
 def create_admin(
     admin_data: AdminCreateRequest,
     db: Session = Depends(get_db),
-    current_superadmin: User = Depends(get_current_superadmin)
+    current_superadmin: Principal = Depends(get_current_superadmin)
 ):
     """
     Create a new admin account (Superadmin only)
@@ -25,33 +29,40 @@ def create_admin(
     admin_service = AdminService(db)
     return admin_service.create_admin(admin_data, current_superadmin.id)
 
-@router.get("/admins", response_model=List[AdminResponse])
+@router.get("/admins", response_model=CursorPage[AdminResponse], response_class=FastJSONResponse)
 def list_admins(
-    skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_superadmin: User = Depends(get_current_superadmin)
+    current_superadmin: Principal = Depends(get_current_superadmin)
 ):
-    """List all admin accounts (Superadmin only)"""
+    """
+    List admin accounts (Superadmin only)
+    
+    Results are ordered by creation time. Pass the returned `next_cursor`
+    as `cursor` to fetch the following page.
+    """
     admin_service = AdminService(db)
-    return admin_service.get_all_admins(skip, limit)
+    page = admin_service.get_admins_page(limit, cursor)
+    # Rows come straight from the database, so they are encoded without re-validation
+    return FastJSONResponse(admin_serializer.page(page.items, page.next_cursor, page.has_more, limit))
 
-@router.get("/admins/{admin_id}", response_model=AdminResponse)
+@router.get("/admins/{admin_id}", response_model=AdminResponse, response_class=FastJSONResponse)
 def get_admin(
     admin_id: int,
     db: Session = Depends(get_db),
-    current_superadmin: User = Depends(get_current_superadmin)
+    current_superadmin: Principal = Depends(get_current_superadmin)
 ):
     """Get specific admin details (Superadmin only)"""
     admin_service = AdminService(db)
-    return admin_service.get_admin_by_id(admin_id)
+    return FastJSONResponse(admin_serializer.one(admin_service.get_admin_by_id(admin_id)))
 
 @router.put("/admins/{admin_id}", response_model=AdminResponse)
 def update_admin(
     admin_id: int,
     admin_data: AdminUpdateRequest,
     db: Session = Depends(get_db),
-    current_superadmin: User = Depends(get_current_superadmin)
+    current_superadmin: Principal = Depends(get_current_superadmin)
 ):
     """Update admin account (Superadmin only)"""
     admin_service = AdminService(db)
@@ -61,7 +72,7 @@ def update_admin(
 def delete_admin(
     admin_id: int,
     db: Session = Depends(get_db),
-    current_superadmin: User = Depends(get_current_superadmin)
+    current_superadmin: Principal = Depends(get_current_superadmin)
 ):
     """Delete admin account (Superadmin only)"""
     admin_service = AdminService(db)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.visit_type import VisitTypeCreate, VisitTypeUpdate, VisitTypeResponse
+from ....services.visit_type_service import VisitTypeService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=VisitTypeResponse, status_code=status.HTTP_201_CREATED)
+def create_visit_type(
+    data: VisitTypeCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a visit type (Admin only)"""
+    return VisitTypeService(db).create(data, current_admin.id)
+
+@router.get("", response_model=List[VisitTypeResponse])
+def list_visit_types(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List visit types (Admin only)"""
+    return VisitTypeService(db).get_all(skip, limit)
+
+@router.get("/{visit_type_id}", response_model=VisitTypeResponse)
+def get_visit_type(
+    visit_type_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get visit type details (Admin only)"""
+    return VisitTypeService(db).get_by_id(visit_type_id)
+
+@router.put("/{visit_type_id}", response_model=VisitTypeResponse)
+def update_visit_type(
+    visit_type_id: int,
+    data: VisitTypeUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update visit type (Admin only)"""
+    return VisitTypeService(db).update(visit_type_id, data, current_admin.id)
+
+@router.delete("/{visit_type_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_visit_type(
+    visit_type_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete visit type (Admin only)"""
+    VisitTypeService(db).delete(visit_type_id)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.weekoff_policy import WeekoffPolicyCreate, WeekoffPolicyUpdate, WeekoffPolicyResponse
+from ....services.weekoff_policy_service import WeekoffPolicyService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=WeekoffPolicyResponse, status_code=status.HTTP_201_CREATED)
+def create_weekoff_policy(
+    policy_data: WeekoffPolicyCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a week-off policy (Admin only)"""
+    return WeekoffPolicyService(db).create_weekoff_policy(policy_data, current_admin.id)
+
+@router.get("", response_model=List[WeekoffPolicyResponse])
+def list_weekoff_policies(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List week-off policies (Admin only)"""
+    return WeekoffPolicyService(db).get_weekoff_policies(skip, limit)
+
+@router.get("/{weekoff_policy_id}", response_model=WeekoffPolicyResponse)
+def get_weekoff_policy(
+    weekoff_policy_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get week-off policy details (Admin only)"""
+    return WeekoffPolicyService(db).get_weekoff_policy_by_id(weekoff_policy_id)
+
+@router.put("/{weekoff_policy_id}", response_model=WeekoffPolicyResponse)
+def update_weekoff_policy(
+    weekoff_policy_id: int,
+    policy_data: WeekoffPolicyUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update week-off policy (Admin only)"""
+    return WeekoffPolicyService(db).update_weekoff_policy(weekoff_policy_id, policy_data, current_admin.id)
+
+@router.delete("/{weekoff_policy_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_weekoff_policy(
+    weekoff_policy_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete week-off policy (Admin only)"""
+    WeekoffPolicyService(db).delete_weekoff_policy(weekoff_policy_id)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.work_shift import WorkShiftCreate, WorkShiftUpdate, WorkShiftResponse
+from ....services.work_shift_service import WorkShiftService
+from ..deps import get_current_admin
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("", response_model=WorkShiftResponse, status_code=status.HTTP_201_CREATED)
+def create_work_shift(
+    shift_data: WorkShiftCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Create a work shift (Admin only)"""
+    return WorkShiftService(db).create_work_shift(shift_data, current_admin.id)
+
+@router.get("", response_model=List[WorkShiftResponse])
+def list_work_shifts(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List work shifts (Admin only)"""
+    return WorkShiftService(db).get_work_shifts(skip, limit)
+
+@router.get("/{work_shift_id}", response_model=WorkShiftResponse)
+def get_work_shift(
+    work_shift_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get work shift details (Admin only)"""
+    return WorkShiftService(db).get_work_shift_by_id(work_shift_id)
+
+@router.put("/{work_shift_id}", response_model=WorkShiftResponse)
+def update_work_shift(
+    work_shift_id: int,
+    shift_data: WorkShiftUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Update work shift (Admin only)"""
+    return WorkShiftService(db).update_work_shift(work_shift_id, shift_data, current_admin.id)
+
+@router.delete("/{work_shift_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_work_shift(
+    work_shift_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Delete work shift (Admin only)"""
+    WorkShiftService(db).delete_work_shift(work_shift_id)
\ No newline at end of file
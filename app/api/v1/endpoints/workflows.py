@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ....core.database import get_db
+from ....schemas.workflow import (
+    WorkflowActionRequest,
+    WorkflowDefinitionCreate,
+    WorkflowDefinitionResponse,
+    WorkflowDefinitionUpdate,
+    WorkflowInstanceResponse,
+    WorkflowStartRequest,
+)
+from ....services.workflow_service import WorkflowService
+from ..deps import get_current_admin, get_current_principal
+from ....core.principal import Principal
+
+router = APIRouter()
+
+@router.post("/definitions", response_model=WorkflowDefinitionResponse, status_code=status.HTTP_201_CREATED)
+def create_definition(
+    definition_data: WorkflowDefinitionCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Create a workflow (Admin only)
+    
+    The definition is compiled on save; unknown states, duplicate
+    transitions and timeout actions without a transition are rejected.
+    """
+    return WorkflowService(db).create_definition(definition_data, current_admin.id)
+
+@router.get("/definitions", response_model=List[WorkflowDefinitionResponse])
+def list_definitions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """List workflow definitions, every version (Admin only)"""
+    return WorkflowService(db).get_definitions(skip, limit)
+
+@router.get("/definitions/{definition_id}", response_model=WorkflowDefinitionResponse)
+def get_definition(
+    definition_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Get workflow definition details (Admin only)"""
+    return WorkflowService(db).get_definition_by_id(definition_id)
+
+@router.put("/definitions/{definition_id}", response_model=WorkflowDefinitionResponse)
+def publish_definition_version(
+    definition_id: int,
+    definition_data: WorkflowDefinitionUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Publish the next version of a workflow (Admin only)
+    
+    Running instances keep the version they started on.
+    """
+    return WorkflowService(db).publish_version(definition_id, definition_data, current_admin.id)
+
+@router.post("/instances", response_model=WorkflowInstanceResponse, status_code=status.HTTP_201_CREATED)
+def start_instance(
+    start_data: WorkflowStartRequest,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
+):
+    """Start a workflow for a leave, exit or helpdesk request"""
+    return WorkflowService(db).start_instance(start_data, principal.id)
+
+@router.get("/instances/{instance_id}", response_model=WorkflowInstanceResponse)
+def get_instance(
+    instance_id: int,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
+):
+    """Get a workflow instance with its transition history"""
+    return WorkflowService(db).get_instance(instance_id, with_history=True)
+
+@router.post(
+    "/instances/{instance_id}/actions",
+    response_model=WorkflowInstanceResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def submit_action(
+    instance_id: int,
+    action_data: WorkflowActionRequest,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal)
+):
+    """
+    Take an action (approve, reject, ...) on a workflow instance
+    
+    The action is validated and queued; the workflow engine applies queued
+    actions in batches within WORKFLOW_TICK_INTERVAL seconds.
+    """
+    return WorkflowService(db).submit_action(instance_id, action_data, principal)
\ No newline at end of file
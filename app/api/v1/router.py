@@ -1,6 +1,12 @@
 # Aggregates all v1 routes
 from fastapi import APIRouter
-from .endpoints import auth, superadmin, health, files
+from .endpoints import (
+    auth, superadmin, health, files, employees,
+    departments, business_units, cost_centers,
+    grades, designations, visit_types, exit_reasons, helpdesk_categories, locations,
+    reference_data, work_shifts, shift_rules, shift_policies, weekoff_policies, rosters,
+    workflows, attendance
+)
 
 api_router = APIRouter()
 
@@ -10,6 +16,36 @@ api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 # Superadmin routes
 api_router.include_router(superadmin.router, prefix="/superadmin", tags=["Superadmin"])
 
+# Employee routes
+api_router.include_router(employees.router, prefix="/employees", tags=["Employees"])
+
+# Organization structure routes
+api_router.include_router(departments.router, prefix="/departments", tags=["Organization"])
+api_router.include_router(business_units.router, prefix="/business-units", tags=["Organization"])
+api_router.include_router(cost_centers.router, prefix="/cost-centers", tags=["Organization"])
+
+# Master data routes
+api_router.include_router(grades.router, prefix="/grades", tags=["Master Data"])
+api_router.include_router(designations.router, prefix="/designations", tags=["Master Data"])
+api_router.include_router(visit_types.router, prefix="/visit-types", tags=["Master Data"])
+api_router.include_router(exit_reasons.router, prefix="/exit-reasons", tags=["Master Data"])
+api_router.include_router(helpdesk_categories.router, prefix="/helpdesk-categories", tags=["Master Data"])
+api_router.include_router(locations.router, prefix="/locations", tags=["Master Data"])
+api_router.include_router(reference_data.router, prefix="/reference-data", tags=["Master Data"])
+
+# Shift scheduling routes
+api_router.include_router(work_shifts.router, prefix="/work-shifts", tags=["Shifts"])
+api_router.include_router(shift_rules.router, prefix="/shift-rules", tags=["Shifts"])
+api_router.include_router(shift_policies.router, prefix="/shift-policies", tags=["Shifts"])
+api_router.include_router(weekoff_policies.router, prefix="/weekoff-policies", tags=["Shifts"])
+api_router.include_router(rosters.router, prefix="/rosters", tags=["Shifts"])
+
+# Workflow routes
+api_router.include_router(workflows.router, prefix="/workflows", tags=["Workflows"])
+
+# Attendance routes
+api_router.include_router(attendance.router, prefix="/attendance", tags=["Attendance"])
+
 # File upload routes
 api_router.include_router(files.router, prefix="/upload", tags=["File Upload"])
 
@@ -1,6 +1,8 @@
 from .config import settings
-from .database import engine, SessionLocal, get_db, get_db_context
-from .security import verify_password, get_password_hash, create_access_token, decode_access_token
+from .database import (
+    engine, SessionLocal, get_db, get_db_context, async_engine, AsyncSessionLocal, get_async_db
+)
+from .security import verify_password, get_password_hash, create_access_token, decode_access_token, password_hasher
 
 __all__ = [
     "settings",
@@ -8,8 +10,12 @@ __all__ = [
     "SessionLocal",
     "get_db",
     "get_db_context",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
     "verify_password",
     "get_password_hash",
     "create_access_token",
     "decode_access_token",
+    "password_hasher",
 ]
\ No newline at end of file
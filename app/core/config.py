@@ -2,6 +2,13 @@ from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 from typing import Optional, List
 from urllib.parse import quote_plus
+from sqlalchemy.engine import make_url
+
+# asyncio drivers substituted into DATABASE_URL for the async engine
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
 class Settings(BaseSettings):
     # Pydantic v2 configuration
@@ -26,6 +33,7 @@ class Settings(BaseSettings):
     
     # Database URL (auto-generated from above or can be set directly)
     DATABASE_URL: Optional[str] = None
+    ASYNC_DATABASE_URL: Optional[str] = None  # Defaults to DATABASE_URL with the asyncpg driver
     
     # Connection Pool Settings
     DB_POOL_SIZE: int = 5
@@ -33,11 +41,59 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800  # 30 minutes
     DB_ECHO: bool = False  # Set to True for SQL query logging
+    DB_BULK_CHUNK_SIZE: int = 1000  # Rows per statement for bulk repository operations
+    
+    # Read replicas (repository reads only; empty list sends everything to the primary)
+    DATABASE_REPLICA_URLS: List[str] = []
+    DB_REPLICA_SELECTION: str = "round_robin"  # "round_robin" or "least_connections"
+    DB_REPLICA_RETRY_SECONDS: int = 30  # How long a failing replica is skipped
+    DB_READ_YOUR_WRITES_SECONDS: int = 5  # Reads stay on the primary this long after a user's commit
+    
+    # Async engine pool (async routes hold a connection only while awaiting queries)
+    DB_ASYNC_POOL_SIZE: int = 20
+    DB_ASYNC_MAX_OVERFLOW: int = 20
+    
+    # Per-request query diagnostics
+    DB_QUERY_BUDGET: int = 0  # Max statements per request, 0 disables
+    DB_QUERY_BUDGET_ENFORCE: bool = False  # Raise instead of logging (enable in tests)
+    DB_REPEATED_QUERY_THRESHOLD: int = 5  # Same statement this often flags a likely N+1
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # Rotated on every /auth/refresh
+    
+    # Token revocation (jti denylist checked in memory on every request)
+    TOKEN_REVOCATION_BACKEND: str = "memory"  # "memory" (single worker) or "redis" (shared)
+    TOKEN_REVOCATION_REDIS_URL: str = "redis://localhost:6379/0"
+    TOKEN_REVOCATION_SYNC_INTERVAL: float = 1.0  # Seconds between replays of other workers' revocations
+    
+    # Authenticated principal cache (per worker process)
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60  # Set to 0 to disable
+    
+    # Verified access token cache (skips HMAC/claims parsing for repeated tokens)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300  # Upper bound; entries never outlive the token's exp
+    
+    # Password hashing executor (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # Requests beyond this get HTTP 503
+    
+    # Rate limiting (sliding window, "<count>/<second|minute|hour|day>", empty disables)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "redis" (shared)
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_DEFAULT: str = "600/minute"  # Per client IP across all routes
+    RATE_LIMIT_LOGIN_IP: str = "20/minute"  # Per client IP on /auth/login
+    RATE_LIMIT_LOGIN_EMAIL: str = "5/minute"  # Per account on /auth/login
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False  # Use X-Forwarded-For behind a trusted proxy
+    
+    # Metrics (/metrics, Prometheus text format)
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: Optional[str] = None  # Shared directory to aggregate uvicorn workers
+    METRICS_FLUSH_INTERVAL: float = 5.0  # Seconds between worker snapshots in multi-process mode
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
@@ -47,6 +103,81 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads/profile_images"
     ALLOWED_IMAGE_TYPES: List[str] = ["image/jpeg", "image/png", "image/jpg", "image/gif"]
     
+    # Blob storage (content-addressed uploads)
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_ROOT: str = "uploads/blobs"
+    
+    # Image derivatives (thumbnails and WebP variants, requires Pillow)
+    IMAGE_DERIVATIVE_DIR: str = "uploads/derivatives"
+    IMAGE_THUMBNAIL_SIZES: List[int] = [40, 96, 256]
+    IMAGE_WORKERS: int = 2
+    
+    # Employee Import
+    EMPLOYEE_IMPORT_MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
+    EMPLOYEE_IMPORT_BATCH_SIZE: int = 1000
+    EMPLOYEE_IMPORT_MAX_ERRORS: int = 1000  # Row errors kept per job
+    
+    # Employee codes
+    EMPLOYEE_CODE_BLOCK_SIZE: int = 1000  # Sequence numbers reserved per database round trip
+    
+    # Shift rosters
+    ROSTER_MAX_DAYS: int = 92  # Longest range per roster request
+    ROSTER_CACHE_MAX_RANGES: int = 32  # Computed (tenant, date range) rosters kept per worker
+    ROSTER_CACHE_TTL_SECONDS: int = 300  # Bounds staleness after employee changes in other workers
+    
+    # Reference data (grades, designations, visit types, exit reasons, helpdesk categories, locations)
+    REFERENCE_DATA_LISTEN_ENABLED: bool = True  # LISTEN/NOTIFY invalidation across workers (PostgreSQL)
+    REFERENCE_DATA_RECHECK_SECONDS: int = 30  # Version check interval while not listening
+    REFERENCE_DATA_CACHE_MAX_TENANTS: int = 1000
+    REFERENCE_DATA_CACHE_TTL_SECONDS: int = 3600  # Upper bound on staleness if a notification is lost
+    
+    # Workflow engine
+    WORKFLOW_ENGINE_ENABLED: bool = True
+    WORKFLOW_TICK_INTERVAL: float = 1.0  # Seconds between batches of queued actions
+    WORKFLOW_BATCH_SIZE: int = 500  # Instances claimed per batch
+    WORKFLOW_SLA_HORIZON_SECONDS: int = 600  # SLA timers held in memory this far ahead
+    WORKFLOW_COMPILED_CACHE_SIZE: int = 1000  # Compiled definition versions per worker
+    
+    # Background jobs
+    JOB_WORKER_ENABLED: bool = True  # Run job worker threads inside each API process
+    JOB_WORKER_THREADS: int = 2  # Worker threads per process
+    JOB_WORKER_PROCESSES: int = 2  # Processes started by scripts/run_job_workers.py
+    JOB_QUEUES: List[str] = ["default"]  # Queues this process works on
+    JOB_BATCH_SIZE: int = 50  # Jobs claimed per poll
+    JOB_POLL_INTERVAL: float = 1.0  # Seconds an idle worker waits between polls
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0  # First retry delay, doubled on every further attempt
+    JOB_RETRY_MAX_SECONDS: float = 3600.0
+    JOB_LOCK_TIMEOUT_SECONDS: int = 900  # Running jobs locked longer than this are requeued
+    JOB_RETENTION_HOURS: int = 72  # Finished jobs are deleted after this long
+    
+    # Email (sent from the "email" job queue)
+    EMAIL_SENDER_ENABLED: bool = True  # Run the email sender inside each API process
+    EMAIL_FROM: str = "Levitica HR <no-reply@levitica.com>"
+    EMAIL_LOGIN_URL: str = "http://localhost:3000/login"  # Linked from welcome and credential emails
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_STARTTLS: bool = False
+    SMTP_TIMEOUT: float = 10.0
+    SMTP_POOL_SIZE: int = 8  # Persistent SMTP connections per process
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 500  # Reconnect after this many messages
+    SMTP_IDLE_CHECK_SECONDS: float = 30.0  # Idle connections get a NOOP before reuse
+    EMAIL_MAX_PER_DOMAIN: int = 4  # Concurrent sends to one recipient domain
+    EMAIL_BATCH_SIZE: int = 500  # Outbox messages claimed per batch
+    EMAIL_SENDER_THREADS: int = 1
+    
+    # Attendance punches (buffered per process, written with COPY)
+    PUNCH_INGEST_ENABLED: bool = True  # Run the punch flusher inside each API process
+    PUNCH_FLUSH_INTERVAL: float = 0.5  # Seconds between buffer flushes
+    PUNCH_FLUSH_ROWS: int = 10000  # Flush early once this many punches are waiting
+    PUNCH_BUFFER_MAX_ROWS: int = 200000  # Reject batches with 503 beyond this backlog
+    PUNCH_FLUSH_MAX_ATTEMPTS: int = 3  # Failed flushes before refused rows are isolated and dead-lettered
+    PUNCH_BATCH_MAX_ITEMS: int = 5000  # Punches per request
+    PUNCH_MAX_CLOCK_SKEW_SECONDS: int = 300  # Punches dated further ahead are rejected
+    PUNCH_PARTITION_MONTHS_AHEAD: int = 2  # Monthly partitions created ahead of the current one
+    
     # Superadmin
     SUPERADMIN_EMAIL: str = "superadmin@levitica.com"
     SUPERADMIN_PASSWORD: str = "Admin@123"
@@ -61,5 +192,17 @@ class Settings(BaseSettings):
         # URL-encode the password to handle special characters
         encoded_password = quote_plus(self.DB_PASSWORD)
         return f"postgresql://{self.DB_USER}:{encoded_password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
+    @property
+    def async_database_url(self) -> str:
+        """Database URL for the asyncio engine"""
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        
+        url = make_url(self.database_url)
+        driver = ASYNC_DRIVERS.get(url.get_backend_name())
+        if driver:
+            url = url.set(drivername=driver)
+        return url.render_as_string(hide_password=False)
 
 settings = Settings()
\ No newline at end of file
@@ -1,16 +1,38 @@
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from .cache import TTLCache
 from .config import settings
+from .metrics import (
+    DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW, DB_POOL_SIZE, DB_POOL_WAIT, registry
+)
+import itertools
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
 # Create PostgreSQL engine with connection pooling
 engine = create_engine(
     settings.database_url,
-    poolclass=QueuePool,
+    poolclass=InstrumentedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_timeout=settings.DB_POOL_TIMEOUT,
@@ -20,14 +42,184 @@ engine = create_engine(
     future=True
 )
 
+def _collect_pool_stats():
+    """Refresh pool gauges at scrape time"""
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+registry.add_collector(_collect_pool_stats)
+
+class ReplicaSet:
+    """
+    Read replica engines with passive health checking
+
+    A replica whose connection fails is skipped for DB_REPLICA_RETRY_SECONDS;
+    when no replica is available reads fall back to the primary.
+    """
+
+    def __init__(self, engines: List[Engine], selection: str, retry_seconds: float):
+        if selection not in ("round_robin", "least_connections"):
+            raise RuntimeError(f"Unknown DB_REPLICA_SELECTION '{selection}'")
+        self.engines = engines
+        self.selection = selection
+        self.retry_seconds = retry_seconds
+        self._down_until: Dict[Engine, float] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        for replica in engines:
+            event.listen(replica, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect or isinstance(context.sqlalchemy_exception, OperationalError):
+            self.mark_down(context.engine, context.original_exception)
+
+    def mark_down(self, replica: Engine, reason: Any = None) -> None:
+        with self._lock:
+            self._down_until[replica] = time.monotonic() + self.retry_seconds
+        logger.warning(f"Read replica {replica.url.render_as_string()} marked unavailable: {reason}")
+
+    def available(self) -> List[Engine]:
+        now = time.monotonic()
+        return [e for e in self.engines if self._down_until.get(e, 0.0) <= now]
+
+    def choose(self) -> Optional[Engine]:
+        """Pick a healthy replica, or None to use the primary"""
+        candidates = self.available()
+        if not candidates:
+            return None
+        if self.selection == "least_connections":
+            return min(candidates, key=lambda e: e.pool.checkedout())
+        return candidates[next(self._counter) % len(candidates)]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                "url": e.url.render_as_string(),
+                "available": self._down_until.get(e, 0.0) <= now,
+                "checked_out": e.pool.checkedout(),
+            }
+            for e in self.engines
+        ]
+
+    def dispose(self) -> None:
+        for replica in self.engines:
+            replica.dispose()
+
+
+replicas = ReplicaSet(
+    [
+        create_engine(
+            url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            echo=settings.DB_ECHO
+        )
+        for url in settings.DATABASE_REPLICA_URLS
+    ],
+    selection=settings.DB_REPLICA_SELECTION,
+    retry_seconds=settings.DB_REPLICA_RETRY_SECONDS
+)
+
+# Users (consistency keys) who committed recently and must read from the primary
+_recent_writers = TTLCache(
+    max_size=100000,
+    ttl=settings.DB_READ_YOUR_WRITES_SECONDS,
+    name="recent_writers"
+)
+
+# Execution option marking a SELECT as safe to serve from a replica
+READ_REPLICA = "read_replica"
+
+_WROTE = "routing_wrote"
+_STICKY = "routing_sticky_primary"
+_CONSISTENCY_KEY = "routing_consistency_key"
+
+
+def set_consistency_key(db: Session, key: Optional[str]) -> None:
+    """
+    Associate a session with the acting user
+
+    After that user commits, their reads in any session go to the primary
+    for DB_READ_YOUR_WRITES_SECONDS, covering replication lag.
+    """
+    db.info[_CONSISTENCY_KEY] = key
+
+
+class RoutingSession(Session):
+    """
+    Session sending replica-safe reads to a read replica
+
+    Only SELECTs executed with execution_options(read_replica=True) are
+    candidates (see BaseRepository). Flushes, DML, SELECT ... FOR UPDATE and
+    anything after this session has written go to the primary, as do reads
+    by a user inside their read-your-writes window.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info[_WROTE] = True
+            return primary
+        if not replicas.engines or clause is None or self.info.get(_STICKY) or self.info.get(_WROTE):
+            return primary
+        if not clause.get_execution_options().get(READ_REPLICA):
+            return primary
+        if getattr(clause, "_for_update_arg", None) is not None:
+            return primary
+        key = self.info.get(_CONSISTENCY_KEY)
+        if key is not None and _recent_writers.get(key):
+            return primary
+        return replicas.choose() or primary
+
+    def commit(self) -> None:
+        wrote = self.info.pop(_WROTE, False) or bool(self.new or self.dirty or self.deleted)
+        super().commit()
+        if wrote:
+            # Later reads in this session see our own writes
+            self.info[_STICKY] = True
+            key = self.info.get(_CONSISTENCY_KEY)
+            if key is not None:
+                _recent_writers.set(key, True)
+
+    def rollback(self) -> None:
+        self.info.pop(_WROTE, None)
+        super().rollback()
+
+
 # Create session factory
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
     bind=engine,
     expire_on_commit=False
 )
 
+# Asyncio engine for async routes; shares models and metadata with the sync engine
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=settings.DB_ECHO
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 def get_db():
     """
     Dependency for FastAPI routes
@@ -43,6 +235,19 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """
+    Async dependency for FastAPI routes
+    Yields an AsyncSession; queries never block the event loop
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Database session error: {str(e)}")
+            raise
+
 @contextmanager
 def get_db_context():
     """
@@ -74,4 +279,10 @@ def check_db_connection():
 def close_db_connection():
     """Close all database connections"""
     engine.dispose()
-    logger.info("Database connections closed")
\ No newline at end of file
+    replicas.dispose()
+    logger.info("Database connections closed")
+
+async def close_async_db_connection():
+    """Close all async database connections"""
+    await async_engine.dispose()
+    logger.info("Async database connections closed")
\ No newline at end of file
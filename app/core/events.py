@@ -1 +1,484 @@
-# Startup/shutdown events
+# Durable background jobs
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import logging
+import os
+import random
+import socket
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .database import SessionLocal
+from .metrics import JOB_DURATION, JOB_QUEUE_DELAY, JOBS_PROCESSED
+from .tenancy import get_tenant, set_tenant
+from ..repositories.job_repository import JobRepository
+from ..schemas.enums import JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Session.info flag: jobs were queued in the open transaction
+_ENQUEUED = "jobs_enqueued"
+
+# Housekeeping (stale locks, finished jobs) interval per process
+HOUSEKEEPING_SECONDS = 60.0
+
+# Every JobWorker of this process, woken when jobs are committed here
+_workers: List["JobWorker"] = []
+
+
+class JobError(Exception):
+    """Raised by a handler to fail a job; retry=False skips the remaining attempts"""
+
+    def __init__(self, message: str, retry: bool = True):
+        super().__init__(message)
+        self.retry = retry
+
+
+class JobBatchError(Exception):
+    """
+    Raised by a batch handler when only some payloads failed
+
+    `failures` maps positions in the payload list to error messages and
+    positions in `permanent` are not retried; the other jobs of the batch
+    count as done and the handler's session is still committed.
+    """
+
+    def __init__(self, failures: Dict[int, str], permanent: Iterable[int] = ()):
+        super().__init__(f"{len(failures)} jobs of the batch failed")
+        self.failures = failures
+        self.permanent = set(permanent)
+
+
+class Task:
+    """Handler registered under a job name"""
+
+    __slots__ = ("name", "handler", "queue", "priority", "max_attempts", "batch")
+
+    def __init__(self, name: str, handler: Callable, queue: str, priority: int, max_attempts: int, batch: bool):
+        self.name = name
+        self.handler = handler
+        self.queue = queue
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.batch = batch
+
+
+class ClaimedJob:
+    """One job handed to a worker by dequeue()"""
+
+    __slots__ = ("id", "name", "payload", "priority", "attempts", "max_attempts", "tenant_id", "run_at")
+
+    def __init__(self, id, name, payload, priority, attempts, max_attempts, tenant_id, run_at):
+        self.id = id
+        self.name = name
+        self.payload = payload
+        self.priority = priority
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.tenant_id = tenant_id
+        self.run_at = run_at
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueue:
+    """
+    Job registry plus enqueue and batch dequeue on the jobs table
+
+    Handlers register with @job_queue.task(name). Request code calls
+    enqueue(db, name, payload): the row is written in the caller's
+    transaction, so a job exists exactly when the change that caused it
+    commits, and nothing is sent to a broker. Delivery is at least once;
+    handlers should tolerate running twice.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float
+    ):
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._tasks: Dict[str, Task] = {}
+
+    def task(
+        self,
+        name: str,
+        queue: str = "default",
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+        batch: bool = False
+    ) -> Callable:
+        """
+        Register a handler for jobs named `name`
+
+        A handler is called as handler(db, payload) with a session scoped
+        to the job's tenant and committed after it returns. With batch=True
+        it is called as handler(db, payloads) once for every claimed job of
+        the same name and tenant.
+        """
+        def register(handler: Callable) -> Callable:
+            if name in self._tasks:
+                raise ValueError(f"Job '{name}' is already registered")
+            self._tasks[name] = Task(name, handler, queue, priority, max_attempts or self.max_attempts, batch)
+            return handler
+        return register
+
+    def get_task(self, name: str) -> Optional[Task]:
+        return self._tasks.get(name)
+
+    def _row(
+        self,
+        db: Session,
+        name: str,
+        payload: Optional[dict],
+        priority: Optional[int],
+        delay: Optional[float],
+        queue: Optional[str]
+    ) -> dict:
+        task = self._tasks.get(name)
+        if task is None:
+            raise ValueError(f"Unknown job '{name}'")
+        now = _utcnow()
+        return {
+            "queue": queue or task.queue,
+            "name": name,
+            "payload": payload or {},
+            "priority": task.priority if priority is None else priority,
+            "status": JobStatus.QUEUED,
+            "attempts": 0,
+            "max_attempts": task.max_attempts,
+            "run_at": now + timedelta(seconds=delay) if delay else now,
+            "tenant_id": get_tenant(db),
+            "created_at": now,
+        }
+
+    def enqueue(
+        self,
+        db: Session,
+        name: str,
+        payload: Optional[dict] = None,
+        priority: Optional[int] = None,
+        delay: Optional[float] = None,
+        queue: Optional[str] = None
+    ) -> None:
+        """Queue one job in the caller's transaction; it runs after the caller commits"""
+        self.enqueue_many(db, name, [payload], priority=priority, delay=delay, queue=queue)
+
+    def enqueue_many(
+        self,
+        db: Session,
+        name: str,
+        payloads: Sequence[Optional[dict]],
+        priority: Optional[int] = None,
+        delay: Optional[float] = None,
+        queue: Optional[str] = None
+    ) -> None:
+        """Queue one job per payload with a single multi-row INSERT"""
+        rows = [self._row(db, name, payload, priority, delay, queue) for payload in payloads]
+        if rows:
+            JobRepository(db).add_many(rows)
+            db.info[_ENQUEUED] = True
+
+    def dequeue(self, db: Session, limit: int, queues: Sequence[str], worker_id: str) -> List[ClaimedJob]:
+        """
+        Claim up to `limit` due jobs, highest priority first
+
+        Commits the claim, so the jobs stay marked as running by worker_id
+        while they are processed; report the outcome with acknowledge().
+        """
+        now = _utcnow()
+        rows = JobRepository(db).claim(queues, limit, worker_id, now)
+        db.commit()
+        claimed = sorted((ClaimedJob(*row) for row in rows), key=lambda job: (-job.priority, job.run_at, job.id))
+        for job in claimed:
+            JOB_QUEUE_DELAY.observe(max((now - _aware(job.run_at)).total_seconds(), 0.0))
+        return claimed
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter after `attempts` failed attempts"""
+        delay = min(self.retry_base_seconds * 2 ** (attempts - 1), self.retry_max_seconds)
+        return delay * random.uniform(0.5, 1.0)
+
+    def acknowledge(
+        self,
+        db: Session,
+        done: Sequence[ClaimedJob],
+        failed: Dict[int, tuple],
+        deferred: Sequence[ClaimedJob] = ()
+    ) -> None:
+        """
+        Record a batch outcome and commit
+
+        `failed` maps job IDs to (job, error, retry); jobs that may retry
+        and have attempts left go back to the queue with a backoff delay.
+        `deferred` jobs were not run at all: they are requeued after the
+        base retry delay and the attempt is not counted.
+        """
+        now = _utcnow()
+        repo = JobRepository(db)
+        deferrals = [
+            {
+                "b_id": job.id,
+                "b_run_at": now + timedelta(seconds=self.retry_base_seconds),
+                "b_error": f"Unknown job '{job.name}'",
+            }
+            for job in deferred
+        ]
+        for job in deferred:
+            JOBS_PROCESSED.labels(job.name, "deferred").inc()
+        retries: List[dict] = []
+        failures: List[dict] = []
+        for job, error, retry in failed.values():
+            result = "retried" if retry and job.attempts < job.max_attempts else "failed"
+            row = {"b_id": job.id, "b_error": error[:2000]}
+            if result == "retried":
+                row["b_run_at"] = now + timedelta(seconds=self.retry_delay(job.attempts))
+                retries.append(row)
+            else:
+                failures.append(row)
+                logger.error(f"Job {job.id} ('{job.name}') failed after {job.attempts} attempts: {error}")
+            JOBS_PROCESSED.labels(job.name, result).inc()
+        repo.complete((job.id for job in done), now)
+        repo.reschedule(retries)
+        repo.defer(deferrals)
+        repo.fail(failures, now)
+        db.commit()
+        for job in done:
+            JOBS_PROCESSED.labels(job.name, "done").inc()
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class JobWorker:
+    """
+    Pool of threads running queued jobs in this process
+
+    Each thread claims a batch, runs it and acknowledges it, and polls
+    again right away while batches come back full; an idle thread sleeps
+    for poll_interval or until a job is committed in this process. More
+    throughput comes from more threads, or more processes via
+    scripts/run_job_workers.py, all sharing the table.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        threads: int,
+        batch_size: int,
+        poll_interval: float,
+        queues: Sequence[str],
+        lock_timeout_seconds: float,
+        retention_hours: float,
+        housekeeping: bool = True
+    ):
+        self.queue = queue
+        self.threads = threads
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.queues = list(queues)
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.retention_hours = retention_hours
+        self.housekeeping_enabled = housekeeping  # One pool per process is enough
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._housekeeping_at = 0.0
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.completed = 0
+        self.failed = 0
+        self.deferred = 0
+        _workers.append(self)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def _run_group(self, task: Any, group: List[ClaimedJob], failed: Dict[int, tuple]) -> List[ClaimedJob]:
+        """Run the jobs of one name and tenant; returns the ones that succeeded"""
+        started = time.perf_counter()
+        db = SessionLocal()
+        set_tenant(db, group[0].tenant_id)
+        done = []
+        try:
+            if task.batch:
+                task.handler(db, [job.payload for job in group])
+                done = group
+            else:
+                for job in group:
+                    savepoint = db.begin_nested()
+                    try:
+                        task.handler(db, job.payload)
+                        savepoint.commit()
+                        done.append(job)
+                    except Exception as e:
+                        savepoint.rollback()
+                        failed[job.id] = (job, _describe(e), _retryable(e))
+            db.commit()
+        except JobBatchError as e:
+            db.commit()
+            for position, job in enumerate(group):
+                if position in e.failures:
+                    failed[job.id] = (job, e.failures[position], position not in e.permanent)
+                else:
+                    done.append(job)
+        except Exception as e:
+            db.rollback()
+            done = []
+            for job in group:
+                failed[job.id] = (job, _describe(e), _retryable(e))
+        finally:
+            db.close()
+        JOB_DURATION.labels(group[0].name).observe(time.perf_counter() - started)
+        return done
+
+    def run_once(self) -> int:
+        """Claim, run and acknowledge one batch; returns the number of jobs claimed"""
+        db = SessionLocal()
+        try:
+            claimed = self.queue.dequeue(db, self.batch_size, self.queues, self.worker_id)
+            if not claimed:
+                return 0
+            groups: Dict[tuple, List[ClaimedJob]] = {}
+            for job in claimed:
+                groups.setdefault((job.name, job.tenant_id), []).append(job)
+
+            done: List[ClaimedJob] = []
+            failed: Dict[int, tuple] = {}
+            deferred: List[ClaimedJob] = []
+            for (name, _), group in groups.items():
+                task = self.queue.get_task(name)
+                if task is None:
+                    # Possibly queued by a newer release during a rolling deploy: put it
+                    # back without using up an attempt, for workers that know the task
+                    deferred.extend(group)
+                    continue
+                done.extend(self._run_group(task, group, failed))
+
+            self.queue.acknowledge(db, done, failed, deferred)
+            with self._lock:
+                self.batches += 1
+                self.completed += len(done)
+                self.failed += len(failed)
+                self.deferred += len(deferred)
+            return len(claimed)
+        finally:
+            db.close()
+
+    def housekeeping(self) -> None:
+        """Requeue jobs of crashed workers and delete old finished jobs"""
+        now = _utcnow()
+        db = SessionLocal()
+        try:
+            repo = JobRepository(db)
+            released = repo.release_stale(now - timedelta(seconds=self.lock_timeout_seconds), now)
+            purged = repo.purge_finished(now - timedelta(hours=self.retention_hours))
+            db.commit()
+            if released:
+                logger.warning(f"Requeued {released} jobs with expired worker locks")
+            if purged:
+                logger.info(f"Deleted {purged} finished jobs")
+        finally:
+            db.close()
+
+    def _due_for_housekeeping(self) -> bool:
+        with self._lock:
+            clock = time.monotonic()
+            if clock < self._housekeeping_at:
+                return False
+            self._housekeeping_at = clock + HOUSEKEEPING_SECONDS
+            return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            claimed = 0
+            try:
+                if self.housekeeping_enabled and self._due_for_housekeeping():
+                    self.housekeeping()
+                claimed = self.run_once()
+            except Exception:
+                logger.exception("Job worker batch failed")
+            if claimed < self.batch_size:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        for index in range(self.threads):
+            thread = threading.Thread(target=self._loop, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop polling and wait for the running batches to finish"""
+        self._stop.set()
+        self._wakeup.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "worker_id": self.worker_id,
+                "threads": self.threads,
+                "running": bool(self._threads),
+                "queues": self.queues,
+                "batches": self.batches,
+                "completed": self.completed,
+                "failed_attempts": self.failed,
+                "deferred": self.deferred,
+            }
+
+
+def _describe(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _retryable(error: Exception) -> bool:
+    return error.retry if isinstance(error, JobError) else True
+
+
+job_queue = JobQueue(
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    retry_base_seconds=settings.JOB_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.JOB_RETRY_MAX_SECONDS
+)
+
+job_worker = JobWorker(
+    job_queue,
+    threads=settings.JOB_WORKER_THREADS,
+    batch_size=settings.JOB_BATCH_SIZE,
+    poll_interval=settings.JOB_POLL_INTERVAL,
+    queues=settings.JOB_QUEUES,
+    lock_timeout_seconds=settings.JOB_LOCK_TIMEOUT_SECONDS,
+    retention_hours=settings.JOB_RETENTION_HOURS
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_local_workers(session: Session) -> None:
+    # Jobs committed in this process start without waiting for the next poll
+    if session.info.pop(_ENQUEUED, False):
+        for worker in _workers:
+            worker.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_enqueued(session: Session) -> None:
+    session.info.pop(_ENQUEUED, None)
\ No newline at end of file
@@ -0,0 +1,434 @@
+# Prometheus-compatible in-process metrics
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import os
+import threading
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def observe_many(self, values: Sequence[float]) -> None:
+        """Record a batch of observations under one lock acquisition"""
+        buckets = self.buckets
+        indexes = [bisect_left(buckets, value) for value in values]
+        total = sum(values)
+        with self._lock:
+            counts = self.counts
+            for index in indexes:
+                counts[index] += 1
+            self.sum += total
+            self.count += len(indexes)
+
+
+class _Metric:
+    """
+    A metric family with fixed label names
+
+    labels() returns a child that is created once per label combination
+    and reused, so recording a sample allocates nothing. Hot paths should
+    keep the child returned by labels() instead of looking it up each time.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": [[list(values), self._child_state(child)] for values, child in list(self._children.items())],
+        }
+
+    def _child_state(self, child) -> Any:
+        return child.value
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def observe_many(self, values: Sequence[float]) -> None:
+        self._default.observe_many(values)
+
+    def _child_state(self, child) -> Any:
+        return {"buckets": list(self.buckets), "counts": list(child.counts), "sum": child.sum, "count": child.count}
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets)
+        return data
+
+
+class MetricsRegistry:
+    """
+    Metric families plus scrape-time collectors
+
+    With METRICS_MULTIPROC_DIR set, every worker periodically writes a
+    snapshot file there and render() merges all live workers' files:
+    counters and histograms are summed, gauges are summed across workers.
+    """
+
+    def __init__(self, multiproc_dir: Optional[str] = None):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self.multiproc_dir = Path(multiproc_dir) if multiproc_dir else None
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Callback run before each snapshot, e.g. to refresh pool gauges"""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.debug(f"Metrics collector failed: {e}")
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    # Multi-process aggregation
+
+    def _snapshot_path(self, pid: int) -> Path:
+        return self.multiproc_dir / f"metrics_{pid}.json"
+
+    def flush(self) -> None:
+        """Write this worker's snapshot for other workers to aggregate"""
+        if self.multiproc_dir is None:
+            return
+        self.multiproc_dir.mkdir(parents=True, exist_ok=True)
+        path = self._snapshot_path(os.getpid())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._flush_stop.wait(interval):
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning(f"Could not write metrics snapshot: {e}")
+
+    def start(self, interval: float) -> None:
+        """Start periodic snapshot flushing in multi-process mode"""
+        if self.multiproc_dir is None or self._flush_thread is not None:
+            return
+        self.flush()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, args=(interval,), name="metrics-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def stop(self) -> None:
+        """Stop flushing and remove this worker's snapshot"""
+        self._flush_stop.set()
+        if self.multiproc_dir is not None:
+            self._snapshot_path(os.getpid()).unlink(missing_ok=True)
+
+    def _worker_snapshots(self) -> Iterable[Dict[str, Dict[str, Any]]]:
+        own_pid = os.getpid()
+        yield self.snapshot()
+        for path in self.multiproc_dir.glob("metrics_*.json"):
+            try:
+                pid = int(path.stem.split("_", 1)[1])
+                if pid == own_pid:
+                    continue
+                os.kill(pid, 0)
+            except (ValueError, ProcessLookupError):
+                path.unlink(missing_ok=True)
+                continue
+            except PermissionError:
+                pass
+            try:
+                yield json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+
+    def _aggregate(self) -> Dict[str, Dict[str, Any]]:
+        if self.multiproc_dir is None:
+            return self.snapshot()
+        merged: Dict[str, Dict[str, Any]] = {}
+        for snapshot in self._worker_snapshots():
+            for name, family in snapshot.items():
+                target = merged.setdefault(name, {**family, "samples": {}})
+                for values, state in family["samples"]:
+                    key = tuple(values)
+                    current = target["samples"].get(key)
+                    if current is None:
+                        target["samples"][key] = json.loads(json.dumps(state))
+                    elif family["type"] == "histogram":
+                        current["counts"] = [a + b for a, b in zip(current["counts"], state["counts"])]
+                        current["sum"] += state["sum"]
+                        current["count"] += state["count"]
+                    else:
+                        target["samples"][key] = current + state
+        for family in merged.values():
+            family["samples"] = list(family["samples"].items())
+        return merged
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines: List[str] = []
+        for name, family in self._aggregate().items():
+            lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            labelnames = family["labelnames"]
+            for values, state in family["samples"]:
+                if family["type"] == "histogram":
+                    cumulative = 0
+                    bounds = list(state["buckets"]) + [float("inf")]
+                    for bound, count in zip(bounds, state["counts"]):
+                        cumulative += count
+                        le = f'le="{_format_value(bound)}"'
+                        lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+                    labels = _format_labels(labelnames, values)
+                    lines.append(f"{name}_sum{labels} {_format_value(state['sum'])}")
+                    lines.append(f"{name}_count{labels} {state['count']}")
+                else:
+                    lines.append(f"{name}{_format_labels(labelnames, values)} {_format_value(state)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(settings.METRICS_MULTIPROC_DIR)
+
+# HTTP
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_IN_FLIGHT = registry.gauge("http_requests_in_flight", "HTTP requests being handled")
+
+# Database connection pool
+DB_POOL_SIZE = registry.gauge("db_pool_size", "Configured pool size")
+DB_POOL_CHECKED_OUT = registry.gauge("db_pool_checked_out", "Connections currently checked out")
+DB_POOL_OVERFLOW = registry.gauge("db_pool_overflow", "Connections open beyond pool_size")
+DB_POOL_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+
+# Authentication
+PASSWORD_HASH_DURATION = registry.histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify duration",
+    ("operation",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0)
+)
+TOKEN_DECODE_FAILURES = registry.counter(
+    "token_decode_failures_total", "Access tokens rejected during decoding", ("reason",)
+)
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total", "Requests rejected by a rate limit policy", ("policy",)
+)
+
+# Workflows
+WORKFLOW_TRANSITIONS = registry.counter(
+    "workflow_transitions_total", "Workflow actions processed by the engine", ("result",)
+)
+WORKFLOW_TICK_DURATION = registry.histogram(
+    "workflow_tick_duration_seconds",
+    "Duration of one workflow engine batch",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+# Reference data
+REFERENCE_DATA_LOOKUPS = registry.counter(
+    "reference_data_lookups_total", "Reference data bundle reads by outcome", ("result",)
+)
+REFERENCE_DATA_NOTIFICATIONS = registry.counter(
+    "reference_data_notifications_total", "Reference data change notifications received"
+)
+
+# Background jobs
+JOBS_PROCESSED = registry.counter(
+    "jobs_processed_total", "Background job attempts by outcome", ("job", "result")
+)
+JOB_DURATION = registry.histogram(
+    "job_duration_seconds", "Handler run time of one job or batch", ("job",)
+)
+JOB_QUEUE_DELAY = registry.histogram(
+    "job_queue_delay_seconds",
+    "Time from a job becoming due to a worker claiming it",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 15.0, 60.0, 300.0)
+)
+
+# Email
+EMAILS_SENT = registry.counter(
+    "emails_sent_total", "Outbox messages handed to SMTP by outcome", ("result",)
+)
+SMTP_CONNECTIONS_OPENED = registry.counter(
+    "smtp_connections_opened_total", "SMTP connections opened by the sender pool"
+)
+
+# Attendance punches
+PUNCHES_INGESTED = registry.counter(
+    "attendance_punches_total", "Attendance punches by outcome", ("result",)
+)
+PUNCH_BUFFERED = registry.gauge(
+    "attendance_punch_buffer_rows", "Punches accepted but not yet written"
+)
+PUNCH_INGEST_LAG = registry.histogram(
+    "attendance_punch_ingest_lag_seconds",
+    "Time from a punch on the device to its row being committed",
+    buckets=(0.5, 1.0, 2.5, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0, 21600.0, 86400.0)
+)
+PUNCH_BUFFER_DELAY = registry.histogram(
+    "attendance_punch_buffer_delay_seconds",
+    "Time from the API accepting a punch batch to its rows being committed",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+)
+PUNCH_FLUSH_DURATION = registry.histogram(
+    "attendance_punch_flush_duration_seconds",
+    "Duration of one buffered punch write",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
\ No newline at end of file
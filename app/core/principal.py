@@ -0,0 +1,87 @@
+# Authenticated caller built from token claims
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from ..schemas.enums import UserRole, UserStatus
+
+if TYPE_CHECKING:
+    from ..models.user import User
+
+
+class Principal:
+    """
+    Identity of the caller as stated by a verified access token
+
+    id, email, role and status come from the claims, so role checks need
+    no database access. The full User row is loaded on first access to
+    `user` and reused for the rest of the request. Claims cannot go stale
+    silently: status, email and password changes revoke the user's tokens.
+    """
+
+    __slots__ = ("id", "email", "role", "status", "claims", "_loader", "_user")
+
+    def __init__(
+        self,
+        id: int,
+        email: str,
+        role: UserRole,
+        status: UserStatus,
+        claims: Dict[str, Any],
+        loader: Callable[[], Optional["User"]]
+    ):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.status = status
+        self.claims = claims
+        self._loader = loader
+        self._user: Optional["User"] = None
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any], loader: Callable[[], Optional["User"]]) -> Optional["Principal"]:
+        """Build a principal, or None when the token lacks identity claims"""
+        try:
+            return cls(
+                id=int(claims["uid"]),
+                email=claims["sub"],
+                role=UserRole(claims["role"]),
+                status=UserStatus(claims["status"]),
+                claims=claims,
+                loader=loader
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def from_user(cls, user: "User", claims: Dict[str, Any]) -> "Principal":
+        principal = cls(user.id, user.email, user.role, user.status, claims, loader=lambda: user)
+        principal._user = user
+        return principal
+
+    @property
+    def user(self) -> Optional["User"]:
+        """Full user row, loaded on first access"""
+        if self._user is None:
+            self._user = self._loader()
+        return self._user
+
+    @property
+    def tenant_id(self) -> Optional[int]:
+        """
+        Company whose rows this caller sees: an admin is its own tenant,
+        other users carry their admin's ID in the `tid` claim. Superadmins
+        are not scoped (None).
+        """
+        if self.is_superadmin:
+            return None
+        return self.claims.get("tid", self.id)
+
+    @property
+    def is_superadmin(self) -> bool:
+        return self.role == UserRole.SUPERADMIN
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role in (UserRole.ADMIN, UserRole.SUPERADMIN)
+
+    def __repr__(self) -> str:
+        return f"<Principal(id={self.id}, email='{self.email}', role='{self.role.value}')>"
@@ -0,0 +1,43 @@
+# Fast JSON responses for large, trusted payloads
+from typing import Any
+import json
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; dict content falls back to the stdlib encoder
+    orjson = None
+
+
+def _orjson_default(value: Any) -> Any:
+    """Values orjson does not encode natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return jsonable_encoder(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Opt-in JSON response that bypasses FastAPI's response encoding
+
+    When an endpoint returns a Response, FastAPI skips response_model
+    validation, jsonable_encoder and the stdlib json encoder. Content must
+    therefore already have the documented shape: JSON bytes from a
+    RowSerializer (see schemas/common.py), or plain dicts and lists, which
+    are encoded with orjson. Keep response_model on the route so the
+    OpenAPI schema is unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if orjson is not None:
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
\ No newline at end of file
@@ -0,0 +1,255 @@
+# Token revocation (jti denylist shared across workers)
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import json
+import logging
+import threading
+import time
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Revoked jtis are grouped by the token's own expiry, one set per bucket
+BUCKET_SECONDS = 60
+
+
+class TokenDenylist:
+    """
+    Revoked tokens, subjects and refresh token families
+
+    A revoked jti is stored in the bucket of its token's expiry, so a lookup
+    only probes the single set named by the token's `exp` claim, and whole
+    buckets are dropped once every token in them has expired anyway. Subject
+    revocations reject every token of that user issued at or before a point
+    in time; family revocations reject every refresh token of one login.
+    All lookups are O(1) and never touch the database.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._buckets: Dict[int, Set[str]] = {}
+        self._subjects: Dict[str, Tuple[float, int]] = {}  # subject -> (revoked_before, until)
+        self._families: Dict[str, int] = {}  # family -> until
+        self._lock = threading.Lock()
+
+    def revoke_jti(self, jti: str, exp: int) -> None:
+        with self._lock:
+            self._buckets.setdefault(int(exp) // BUCKET_SECONDS, set()).add(jti)
+
+    def revoke_subject(self, subject: str, before: float, until: int) -> None:
+        with self._lock:
+            current = self._subjects.get(subject)
+            if current is None or current[0] < before:
+                self._subjects[subject] = (before, until)
+
+    def revoke_family(self, family: str, until: int) -> None:
+        with self._lock:
+            self._families[family] = max(until, self._families.get(family, 0))
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        """True when the token's jti, subject or refresh family was revoked"""
+        jti = claims.get("jti")
+        exp = claims.get("exp")
+        if jti is not None and exp is not None and jti in self._buckets.get(int(exp) // BUCKET_SECONDS, ()):
+            return True
+        subject = self._subjects.get(claims.get("sub"))
+        if subject is not None and claims.get("iat", 0) <= subject[0]:
+            return True
+        family = claims.get("fam")
+        return family is not None and family in self._families
+
+    def is_jti_revoked(self, jti: str, exp: int) -> bool:
+        return jti in self._buckets.get(int(exp) // BUCKET_SECONDS, ())
+
+    def prune(self) -> None:
+        """Forget revocations whose tokens have expired"""
+        now = int(self._clock())
+        current_bucket = now // BUCKET_SECONDS
+        with self._lock:
+            for bucket in [b for b in self._buckets if b < current_bucket]:
+                del self._buckets[bucket]
+            for subject in [s for s, (_, until) in self._subjects.items() if until < now]:
+                del self._subjects[subject]
+            for family in [f for f, until in self._families.items() if until < now]:
+                del self._families[family]
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """Apply a revocation event received from another worker"""
+        kind = event.get("kind")
+        if kind == "jti":
+            self.revoke_jti(event["jti"], event["exp"])
+        elif kind == "subject":
+            self.revoke_subject(event["sub"], event["before"], event["until"])
+        elif kind == "family":
+            self.revoke_family(event["fam"], event["until"])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "revoked_tokens": sum(len(bucket) for bucket in self._buckets.values()),
+                "buckets": len(self._buckets),
+                "revoked_subjects": len(self._subjects),
+                "revoked_families": len(self._families),
+            }
+
+
+class RevocationBackend(ABC):
+    """Shared log of revocation events, replayed by every worker"""
+
+    @abstractmethod
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Append an event for other workers"""
+
+    @abstractmethod
+    def fetch(self) -> List[Dict[str, Any]]:
+        """Events published since the previous fetch (all retained events on the first call)"""
+
+    def close(self) -> None:
+        """Release backend resources"""
+
+
+class InMemoryRevocationBackend(RevocationBackend):
+    """No sharing; revocations only affect the current worker (single-worker deployments)"""
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        pass
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class RedisRevocationBackend(RevocationBackend):
+    """
+    Events in a capped Redis stream
+
+    `client` is a synchronous Redis-protocol client exposing xadd/xread
+    (redis.Redis or a compatible local stand-in).
+    """
+
+    def __init__(self, client: Any, stream: str = "token_revocations", max_len: int = 100000):
+        self.client = client
+        self.stream = stream
+        self.max_len = max_len
+        self._last_id = "0"
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisRevocationBackend":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("TOKEN_REVOCATION_BACKEND 'redis' requires the 'redis' package")
+        return cls(redis.Redis.from_url(url))
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        self.client.xadd(self.stream, {"event": json.dumps(event)}, maxlen=self.max_len, approximate=True)
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        events = []
+        for _, entries in self.client.xread({self.stream: self._last_id}, count=1000) or []:
+            for entry_id, fields in entries:
+                self._last_id = entry_id
+                payload = fields.get(b"event") or fields.get("event")
+                events.append(json.loads(payload))
+        return events
+
+    def close(self) -> None:
+        self.client.close()
+
+
+# Backend factories by TOKEN_REVOCATION_BACKEND name
+REVOCATION_BACKENDS: Dict[str, Callable[[], RevocationBackend]] = {
+    "memory": InMemoryRevocationBackend,
+    "redis": lambda: RedisRevocationBackend.from_url(settings.TOKEN_REVOCATION_REDIS_URL),
+}
+
+
+class TokenRevocation:
+    """
+    Local denylist kept in sync through a shared backend
+
+    Revocations are applied locally at once and published; a background
+    thread replays other workers' events every TOKEN_REVOCATION_SYNC_INTERVAL
+    seconds. Checks only consult the local denylist.
+    """
+
+    def __init__(self, backend: RevocationBackend, clock: Callable[[], float] = time.time):
+        self.backend = backend
+        self.denylist = TokenDenylist(clock)
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        self.denylist.apply(event)
+        try:
+            self.backend.publish(event)
+        except Exception as e:
+            logger.error(f"Could not publish token revocation: {e}")
+
+    def revoke_token(self, claims: Dict[str, Any]) -> None:
+        """Revoke a single access or refresh token until it expires"""
+        if claims.get("jti") and claims.get("exp"):
+            self._record({"kind": "jti", "jti": claims["jti"], "exp": int(claims["exp"])})
+
+    def revoke_subject(self, subject: Optional[str]) -> None:
+        """Revoke every token issued to a user so far (status, password or email change)"""
+        if not subject:
+            return
+        now = self._clock()
+        until = int(now) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        # Same millisecond resolution as the tokens' iat claim
+        self._record({"kind": "subject", "sub": subject, "before": round(now, 3), "until": until})
+
+    def revoke_family(self, family: Optional[str]) -> None:
+        """Revoke every refresh token descending from one login"""
+        if not family:
+            return
+        until = int(self._clock()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        self._record({"kind": "family", "fam": family, "until": until})
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        return self.denylist.is_revoked(claims)
+
+    def sync(self) -> None:
+        """Replay events from other workers and drop expired entries"""
+        for event in self.backend.fetch():
+            self.denylist.apply(event)
+        self.denylist.prune()
+
+    def _sync_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Token revocation sync failed: {e}")
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None:
+            return
+        try:
+            self.sync()
+        except Exception as e:
+            logger.warning(f"Token revocation sync failed: {e}")
+        self._thread = threading.Thread(
+            target=self._sync_loop, args=(interval,), name="token-revocation-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self.backend).__name__, **self.denylist.stats()}
+
+
+def _create_revocation() -> TokenRevocation:
+    try:
+        factory = REVOCATION_BACKENDS[settings.TOKEN_REVOCATION_BACKEND]
+    except KeyError:
+        raise RuntimeError(f"Unknown TOKEN_REVOCATION_BACKEND '{settings.TOKEN_REVOCATION_BACKEND}'")
+    return TokenRevocation(factory())
+
+
+token_revocation = _create_revocation()
@@ -1,9 +1,17 @@
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from uuid import uuid4
+from .cache import verified_token_cache
 from .config import settings
+from .metrics import PASSWORD_HASH_DURATION, TOKEN_DECODE_FAILURES
+import asyncio
+import hashlib
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -33,34 +41,193 @@ def get_password_hash(password: str) -> str:
         logger.error(f"Password hashing error: {e}")
         raise
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create JWT access token"""
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is saturated"""
+
+
+class PasswordHasher:
+    """
+    Dedicated executor for bcrypt work
+
+    bcrypt releases the GIL while hashing, so a small thread pool keeps
+    the event loop and Starlette's request threadpool free. Submissions
+    beyond workers + max_queue are rejected with PasswordHasherBusy instead
+    of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self._timers = {
+            verify_password: PASSWORD_HASH_DURATION.labels("verify"),
+            get_password_hash: PASSWORD_HASH_DURATION.labels("hash"),
+        }
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            timer = self._timers.get(func)
+            if timer is not None:
+                timer.observe(elapsed)
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self.completed += 1
+                self.total_seconds += elapsed
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy("Password hashing queue is full")
+            self._pending += 1
+        try:
+            return self._executor.submit(self._run, func, *args)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password without blocking the event loop"""
+        future = self._submit(verify_password, plain_password, hashed_password)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop"""
+        future = self._submit(get_password_hash, password)
+        return await asyncio.wrap_future(future)
+
+    def verify_blocking(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password from sync code, sharing the same bounded pool"""
+        return self._submit(verify_password, plain_password, hashed_password).result()
+
+    def hash_blocking(self, password: str) -> str:
+        """Hash a password from sync code, sharing the same bounded pool"""
+        return self._submit(get_password_hash, password).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_seconds": round(self.total_seconds / self.completed, 4) if self.completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Wait for in-flight hashes and stop the worker threads"""
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+def new_token_family() -> str:
+    """Identifier shared by all tokens issued from one login"""
+    return uuid4().hex
+
+def _encode_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
+    now = datetime.utcnow()
     to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
+    to_encode.update({
+        "exp": now + expires_delta,
+        # Milliseconds, so a revocation and a re-login in the same second stay ordered
+        "iat": round(time.time(), 3),
+        "jti": uuid4().hex,
+        "type": token_type,
+    })
     
     try:
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-        logger.info(f"Token created for user: {data.get('sub')}")
+        logger.info(f"{token_type.capitalize()} token created for user: {data.get('sub')}")
         return encoded_jwt
     except Exception as e:
         logger.error(f"Token creation error: {e}")
         raise
 
-def decode_access_token(token: str) -> Optional[dict]:
-    """Decode JWT access token"""
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """Create JWT access token"""
+    return _encode_token(
+        data, ACCESS_TOKEN, expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """Create JWT refresh token (single use, rotated by /auth/refresh)"""
+    return _encode_token(
+        data, REFRESH_TOKEN, expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+
+_DECODE_EXPIRED = TOKEN_DECODE_FAILURES.labels("expired")
+_DECODE_INVALID = TOKEN_DECODE_FAILURES.labels("invalid")
+_DECODE_WRONG_TYPE = TOKEN_DECODE_FAILURES.labels("wrong_type")
+_DECODE_ERROR = TOKEN_DECODE_FAILURES.labels("error")
+
+def _decode_token(token: str, token_type: str) -> Optional[dict]:
+    # Bad tokens are routine under attack traffic: count them, log at DEBUG
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        logger.debug(f"Token decoded successfully for: {payload.get('sub')}")
-        return payload
+    except ExpiredSignatureError as e:
+        _DECODE_EXPIRED.inc()
+        logger.debug(f"Token decode error: {e}")
+        return None
     except JWTError as e:
-        logger.error(f"Token decode error: {e}")
+        _DECODE_INVALID.inc()
+        logger.debug(f"Token decode error: {e}")
         return None
     except Exception as e:
-        logger.error(f"Unexpected token error: {e}")
-        return None
\ No newline at end of file
+        _DECODE_ERROR.inc()
+        logger.warning(f"Unexpected token error: {e}")
+        return None
+    
+    if payload.get("type") != token_type:
+        _DECODE_WRONG_TYPE.inc()
+        logger.debug(f"Token decode error: expected a {token_type} token")
+        return None
+    return payload
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """
+    Decode JWT access token
+    
+    Verified claims are cached by token digest until the token expires, so
+    repeated requests with the same token skip signature verification. The
+    returned dict is shared with the cache and must not be modified.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = verified_token_cache.get(key)
+    if payload is not None:
+        return payload
+    
+    payload = _decode_token(token, ACCESS_TOKEN)
+    if payload is not None:
+        verified_token_cache.set(key, payload, ttl=payload["exp"] - time.time())
+    return payload
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    """Decode JWT refresh token"""
+    return _decode_token(token, REFRESH_TOKEN)
\ No newline at end of file
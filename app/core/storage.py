@@ -0,0 +1,141 @@
+# Content-addressed blob storage
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Optional
+import json
+import logging
+import os
+import re
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_valid_digest(digest: str) -> bool:
+    """True for a lowercase hex SHA-256 digest"""
+    return bool(_DIGEST_PATTERN.match(digest))
+
+
+@dataclass(frozen=True)
+class BlobInfo:
+    digest: str
+    size: int
+    content_type: str
+    created: bool = False  # False when identical content was already stored
+
+    @property
+    def etag(self) -> str:
+        """Strong validator: the content hash itself"""
+        return f'"{self.digest}"'
+
+
+class BlobStorage(ABC):
+    """
+    Immutable blobs addressed by the SHA-256 of their content
+
+    Storing the same bytes twice keeps a single copy. Backends that keep
+    blobs on the local filesystem return a path from local_path() so they
+    can be served with zero-copy file responses.
+    """
+
+    @abstractmethod
+    def staging_dir(self) -> Path:
+        """Local directory for in-progress uploads before put_file()"""
+
+    @abstractmethod
+    def put_file(self, path: Path, digest: str, content_type: str) -> BlobInfo:
+        """Take ownership of a fully written local file with a known digest"""
+
+    @abstractmethod
+    def stat(self, digest: str) -> Optional[BlobInfo]:
+        """Metadata of a stored blob, or None"""
+
+    @abstractmethod
+    def open(self, digest: str) -> BinaryIO:
+        """Open a stored blob for reading"""
+
+    @abstractmethod
+    def delete(self, digest: str) -> bool:
+        """Remove a blob; returns False if it did not exist"""
+
+    def local_path(self, digest: str) -> Optional[Path]:
+        """Filesystem path of a blob when the backend is local"""
+        return None
+
+
+class LocalBlobStorage(BlobStorage):
+    """Blobs on local disk at {root}/{aa}/{bb}/{digest} with a JSON sidecar"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._staging = root / ".staging"
+        self._staging.mkdir(parents=True, exist_ok=True)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def _meta_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}.json"
+
+    def staging_dir(self) -> Path:
+        return self._staging
+
+    def put_file(self, path: Path, digest: str, content_type: str) -> BlobInfo:
+        target = self._blob_path(digest)
+        info = self.stat(digest)
+        if info is not None:
+            path.unlink(missing_ok=True)
+            return info
+        # New content, or a blob whose sidecar went missing: the upload
+        # has the same bytes, so it replaces the blob and rewrites the sidecar
+        target.parent.mkdir(parents=True, exist_ok=True)
+        size = path.stat().st_size
+        meta_tmp = path.with_suffix(".json")
+        meta_tmp.write_text(json.dumps({"content_type": content_type, "size": size}))
+        # Metadata first, so a visible blob always has its sidecar
+        os.replace(meta_tmp, self._meta_path(digest))
+        os.replace(path, target)
+        return BlobInfo(digest=digest, size=size, content_type=content_type, created=True)
+
+    def stat(self, digest: str) -> Optional[BlobInfo]:
+        try:
+            meta = json.loads(self._meta_path(digest).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        if not self._blob_path(digest).exists():
+            return None
+        return BlobInfo(digest=digest, size=meta["size"], content_type=meta["content_type"])
+
+    def open(self, digest: str) -> BinaryIO:
+        return open(self._blob_path(digest), "rb")
+
+    def delete(self, digest: str) -> bool:
+        existed = self._blob_path(digest).exists()
+        self._blob_path(digest).unlink(missing_ok=True)
+        self._meta_path(digest).unlink(missing_ok=True)
+        return existed
+
+    def local_path(self, digest: str) -> Optional[Path]:
+        path = self._blob_path(digest)
+        return path if path.exists() else None
+
+
+# Backend factories by STORAGE_BACKEND name; register new backends here
+STORAGE_BACKENDS: Dict[str, Callable[[], BlobStorage]] = {
+    "local": lambda: LocalBlobStorage(Path(settings.STORAGE_LOCAL_ROOT)),
+}
+
+
+def _create_storage() -> BlobStorage:
+    try:
+        factory = STORAGE_BACKENDS[settings.STORAGE_BACKEND]
+    except KeyError:
+        raise RuntimeError(f"Unknown STORAGE_BACKEND '{settings.STORAGE_BACKEND}'")
+    return factory()
+
+
+blob_storage = _create_storage()
\ No newline at end of file
@@ -0,0 +1,75 @@
+# Row-level tenant isolation
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from ..models.base import BaseModel
+
+# Session.info key holding the tenant of the current unit of work
+_TENANT = "tenant_id"
+
+# Execution option that lifts the tenant filter for one statement
+ALL_TENANTS = "all_tenants"
+
+
+def set_tenant(db: Session, tenant_id: Optional[int]) -> None:
+    """
+    Scope a session to one tenant (the ID of the company's admin user)
+
+    Every ORM SELECT, UPDATE and DELETE against a BaseModel table then gets
+    `tenant_id = :tenant` added, including joins, aliases and lazy loads,
+    and new rows are stamped with the tenant on flush. None (superadmins,
+    background engines) leaves the session unfiltered.
+    """
+    if tenant_id is None:
+        db.info.pop(_TENANT, None)
+    else:
+        db.info[_TENANT] = tenant_id
+
+
+def get_tenant(db: Session) -> Optional[int]:
+    return db.info.get(_TENANT)
+
+
+def with_tenant(db: Session, model: type, rows: Iterable[dict]) -> Iterator[dict]:
+    """
+    Stamp the session's tenant on row dicts for bulk INSERTs of `model`
+
+    Bulk statements skip the flush, so repositories pass their rows
+    through here; rows that already carry a tenant_id keep it.
+    """
+    tenant_id = get_tenant(db)
+    if tenant_id is None or not issubclass(model, BaseModel):
+        yield from rows
+        return
+    for row in rows:
+        yield row if row.get("tenant_id") is not None else {**row, "tenant_id": tenant_id}
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filter_by_tenant(state: ORMExecuteState) -> None:
+    tenant_id = state.session.info.get(_TENANT)
+    if tenant_id is None or state.execution_options.get(ALL_TENANTS):
+        return
+    # Relationship and deferred column loads inherit the criteria from their parent query
+    if state.is_column_load or state.is_relationship_load:
+        return
+    if state.is_select or state.is_update or state.is_delete:
+        state.statement = state.statement.options(
+            with_loader_criteria(
+                BaseModel,
+                lambda cls: cls.tenant_id == tenant_id,
+                include_aliases=True
+            )
+        )
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_tenant(session: Session, flush_context, instances) -> None:
+    tenant_id = session.info.get(_TENANT)
+    if tenant_id is None:
+        return
+    for obj in session.new:
+        if isinstance(obj, BaseModel) and obj.tenant_id is None:
+            obj.tenant_id = tenant_id
\ No newline at end of file
@@ -1 +1,24 @@
 # HTTP-specific exceptions
+from fastapi import HTTPException, status
+
+
+class ServiceBusyException(HTTPException):
+    """503 raised when a bounded worker pool rejects new work"""
+
+    def __init__(self, detail: str = "Service is busy. Please retry shortly.", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class TooManyRequestsException(HTTPException):
+    """429 raised when a client exceeds a rate limit"""
+
+    def __init__(self, detail: str = "Too many requests. Please retry later.", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
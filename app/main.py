@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.utils import get_openapi
@@ -7,8 +7,22 @@ from contextlib import asynccontextmanager
 import logging
 
 from .core.config import settings
-from .core.database import check_db_connection, close_db_connection
+from .core.database import (
+    engine, async_engine, replicas, check_db_connection, close_db_connection, close_async_db_connection
+)
+from .core.events import job_worker
+from .core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, registry as metrics_registry
+from .core.revocation import token_revocation
+from .core.security import password_hasher
+from .services.attendance_service import punch_ingestor
+from .services.email_service import email_sender, email_worker
+from .services.image_service import image_store
+from .services.reference_data_service import reference_data_listener
+from .services.workflow_service import workflow_engine
 from .api.v1.router import api_router
+from .middleware.metrics import MetricsMiddleware
+from .middleware.rate_limiter import RateLimitMiddleware, rate_limiter
+from .middleware.request_logger import RequestLoggerMiddleware, install_query_hooks
 
 # Configure logging
 logging.basicConfig(
@@ -32,11 +46,43 @@ async def lifespan(app: FastAPI):
     upload_path.mkdir(parents=True, exist_ok=True)
     logger.info(f"✓ Upload directory ready")
     
+    if settings.METRICS_ENABLED:
+        metrics_registry.start(settings.METRICS_FLUSH_INTERVAL)
+    
+    token_revocation.start(settings.TOKEN_REVOCATION_SYNC_INTERVAL)
+    
+    if settings.WORKFLOW_ENGINE_ENABLED:
+        workflow_engine.start(settings.WORKFLOW_TICK_INTERVAL)
+
+    if settings.REFERENCE_DATA_LISTEN_ENABLED:
+        reference_data_listener.start()
+
+    if settings.JOB_WORKER_ENABLED:
+        job_worker.start()
+
+    if settings.EMAIL_SENDER_ENABLED:
+        email_worker.start()
+
+    if settings.PUNCH_INGEST_ENABLED:
+        punch_ingestor.start()
+
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    punch_ingestor.stop()
+    job_worker.stop()
+    email_worker.stop()
+    email_sender.close()
+    password_hasher.shutdown()
+    image_store.shutdown()
+    metrics_registry.stop()
+    token_revocation.stop()
+    workflow_engine.stop()
+    reference_data_listener.stop()
+    await rate_limiter.backend.close()
     close_db_connection()
+    await close_async_db_connection()
 
 # Create FastAPI app
 app = FastAPI(
@@ -105,7 +151,18 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-# CORS middleware
+# Per-request SQL statement counting
+install_query_hooks(engine)
+install_query_hooks(async_engine.sync_engine)
+for replica in replicas.engines:
+    install_query_hooks(replica)
+app.add_middleware(RequestLoggerMiddleware)
+
+# Per-IP rate limits, rejected before any application work
+app.add_middleware(RateLimitMiddleware)
+
+# CORS middleware, outside the rate limiter: preflights are answered without
+# being counted and 429 responses still carry the CORS headers
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -114,6 +171,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency and in-flight requests (outermost, so it times everything)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Mount static files
 upload_path = Path(settings.UPLOAD_DIR)
 if upload_path.exists():
@@ -135,6 +196,13 @@ def root():
         "login": "/api/v1/auth/login"
     }
 
+# Prometheus metrics
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", tags=["System"], include_in_schema=False)
+    def metrics():
+        """Prometheus scrape endpoint"""
+        return Response(content=metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
 # Health check
 @app.get("/health", tags=["System"])
 def health_check():
@@ -0,0 +1,89 @@
+# HTTP request metrics
+import time
+from typing import Any, Dict, Optional
+
+from starlette.routing import BaseRoute, Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.metrics import HTTP_IN_FLIGHT, HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _router_prefix(route: BaseRoute, path: str, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Part of the path in front of the route's own template
+
+    That is the prefixes the route's routers were included with, which the
+    route itself does not know. The shortest prefix whose remainder the
+    route matches with the same path parameters wins.
+    """
+    regex = getattr(route, "path_regex", None)
+    if regex is None:
+        return None
+    start = 0
+    while start != -1:
+        match = regex.match(path[start:])
+        if match and {
+            name: route.param_convertors[name].convert(value) for name, value in match.groupdict().items()
+        } == params:
+            return path[:start]
+        start = path.find("/", start + 1)
+    return None
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, e.g. /api/v1/upload/files/{digest}
+
+    The route's own path format, behind the router prefixes the request
+    path carries ahead of it; parameter values never end up in the label.
+    Mounted apps (static files) are labelled with the mount path.
+    """
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    if isinstance(route, Mount):
+        return route.path or "/"
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return UNMATCHED_ROUTE
+    prefix = _router_prefix(route, scope["path"], scope.get("path_params") or {})
+    return (prefix or "") + path_format
+
+
+class MetricsMiddleware:
+    """
+    Request count, latency histogram and in-flight gauge per route
+
+    Requests are labelled with the route template (e.g. /api/v1/upload/
+    files/{digest}) rather than the raw path, so label cardinality stays
+    bounded; requests that match no route share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
@@ -1 +1,308 @@
 # Rate limiting
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+import logging
+import math
+import re
+import threading
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..core.config import settings
+from ..core.metrics import RATE_LIMIT_REJECTIONS
+from ..exceptions.http_exceptions import TooManyRequestsException
+from ..schemas.token import LoginRequest
+
+logger = logging.getLogger(__name__)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$")
+
+
+@dataclass(frozen=True)
+class Rate:
+    limit: int
+    window: int  # seconds
+
+
+def parse_rate(value: Optional[str]) -> Optional[Rate]:
+    """Parse '<count>/<second|minute|hour|day>'; empty or zero disables the limit"""
+    if not value or not value.strip():
+        return None
+    match = _RATE_PATTERN.match(value.lower())
+    if match is None:
+        raise ValueError(f"Invalid rate limit '{value}', expected e.g. '10/minute'")
+    limit = int(match.group(1))
+    return Rate(limit, _PERIODS[match.group(2)]) if limit > 0 else None
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int  # seconds until a request would be allowed again, 0 when allowed
+
+
+def _window_position(now: float, window: int) -> Tuple[int, float]:
+    """Index of the current fixed window and the elapsed fraction of it"""
+    index = int(now // window)
+    return index, (now - index * window) / window
+
+
+def _retry_after(rate: Rate, current: int, previous: int, elapsed: float) -> int:
+    """
+    Seconds until the sliding estimate previous * (1 - elapsed) + current
+    leaves room for one more request
+    """
+    if current + 1 <= rate.limit and previous > 0:
+        needed = 1 - (rate.limit - current - 1) / previous
+        return max(1, math.ceil((needed - elapsed) * rate.window))
+    # The current window alone is full: wait for it to roll over and decay
+    needed = max(0.0, 1 - (rate.limit - 1) / current) if current else 0.0
+    return max(1, math.ceil((1 - elapsed + needed) * rate.window))
+
+
+def _result(rate: Rate, allowed: bool, current: int, previous: int, elapsed: float) -> RateLimitResult:
+    estimate = previous * (1 - elapsed) + current
+    if allowed:
+        return RateLimitResult(True, rate.limit, max(0, int(rate.limit - estimate)), 0)
+    return RateLimitResult(False, rate.limit, 0, _retry_after(rate, current, previous, elapsed))
+
+
+class RateLimitBackend(ABC):
+    """
+    Sliding window counter storage
+
+    Each key keeps the request count of the current and the previous fixed
+    window; the rate is estimated as previous * (1 - elapsed) + current, which
+    is O(1) in time and memory per key. Rejected requests are not counted,
+    so rejecting costs a single read.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        """Count one request for key if it fits within rate"""
+
+    async def close(self) -> None:
+        """Release backend resources"""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Counters local to the worker process (single-node deployments)"""
+
+    SWEEP_INTERVAL = 60.0
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._windows: Dict[str, list] = {}  # key -> [window index, current, previous, window]
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + self.SWEEP_INTERVAL
+
+    def _sweep(self, now: float) -> None:
+        stale = [
+            key for key, (index, _, _, window) in self._windows.items()
+            if index < int(now // window) - 1
+        ]
+        for key in stale:
+            del self._windows[key]
+        self._next_sweep = now + self.SWEEP_INTERVAL
+
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        now = self._clock()
+        index, elapsed = _window_position(now, rate.window)
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            state = self._windows.get(key)
+            if state is None or state[3] != rate.window:
+                state = self._windows[key] = [index, 0, 0, rate.window]
+            elif state[0] != index:
+                state[2] = state[1] if state[0] == index - 1 else 0
+                state[1] = 0
+                state[0] = index
+            _, current, previous, _ = state
+            allowed = previous * (1 - elapsed) + current + 1 <= rate.limit
+            if allowed:
+                current = state[1] = current + 1
+        return _result(rate, allowed, current, previous, elapsed)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+
+# Atomic check-and-increment: KEYS = current, previous window; ARGV = limit, weight, ttl ms
+_SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + current + 1 > tonumber(ARGV[1]) then
+    return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+end
+return {1, current, previous}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Counters shared by every worker in a Redis-protocol store
+
+    `client` is any asyncio client exposing eval(script, numkeys, *keys_and_args),
+    e.g. redis.asyncio.Redis or a compatible local stand-in.
+    """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit", clock: Callable[[], float] = time.time):
+        self.client = client
+        self.prefix = prefix
+        self._clock = clock
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisRateLimitBackend":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_BACKEND 'redis' requires the 'redis' package")
+        return cls(redis_asyncio.from_url(url))
+
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        index, elapsed = _window_position(self._clock(), rate.window)
+        base = f"{self.prefix}:{key}:{rate.window}"
+        allowed, current, previous = await self.client.eval(
+            _SLIDING_WINDOW_SCRIPT, 2,
+            f"{base}:{index}", f"{base}:{index - 1}",
+            rate.limit, repr(1 - elapsed), rate.window * 2000
+        )
+        return _result(rate, bool(int(allowed)), int(current), int(previous), elapsed)
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+
+# Backend factories by RATE_LIMIT_BACKEND name
+RATE_LIMIT_BACKENDS: Dict[str, Callable[[], RateLimitBackend]] = {
+    "memory": InMemoryRateLimitBackend,
+    "redis": lambda: RedisRateLimitBackend.from_url(settings.RATE_LIMIT_REDIS_URL),
+}
+
+
+class RateLimiter:
+    """Applies named policies against a backend, failing open if it is unavailable"""
+
+    def __init__(self, backend: RateLimitBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+
+    async def check(self, policy: str, key: str, rate: Optional[Rate]) -> RateLimitResult:
+        if not self.enabled or rate is None:
+            return RateLimitResult(True, 0, 0, 0)
+        try:
+            result = await self.backend.hit(f"{policy}:{key}", rate)
+        except Exception as e:
+            logger.warning(f"Rate limit backend unavailable, allowing request: {e}")
+            return RateLimitResult(True, rate.limit, rate.limit, 0)
+        if not result.allowed:
+            RATE_LIMIT_REJECTIONS.labels(policy).inc()
+        return result
+
+
+def _create_rate_limiter() -> RateLimiter:
+    try:
+        factory = RATE_LIMIT_BACKENDS[settings.RATE_LIMIT_BACKEND]
+    except KeyError:
+        raise RuntimeError(f"Unknown RATE_LIMIT_BACKEND '{settings.RATE_LIMIT_BACKEND}'")
+    return RateLimiter(factory(), enabled=settings.RATE_LIMIT_ENABLED)
+
+
+rate_limiter = _create_rate_limiter()
+
+# Per-IP limits for individual routes, on top of RATE_LIMIT_DEFAULT
+ROUTE_RATE_LIMITS: Dict[Tuple[str, str], Optional[Rate]] = {
+    ("POST", "/api/v1/auth/login"): parse_rate(settings.RATE_LIMIT_LOGIN_IP),
+}
+
+_LOGIN_EMAIL_RATE = parse_rate(settings.RATE_LIMIT_LOGIN_EMAIL)
+
+
+def client_ip(scope: Scope) -> str:
+    """Client address, from X-Forwarded-For when the proxy is trusted"""
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",", 1)[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    Per-IP limits applied before routing
+
+    Every request counts against RATE_LIMIT_DEFAULT for its client IP and,
+    for routes listed in ROUTE_RATE_LIMITS, against the route's own limit.
+    Rejections are answered here with 429 without touching the application.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[RateLimiter] = None,
+        default_rate: Optional[Rate] = None,
+        route_rates: Optional[Dict[Tuple[str, str], Optional[Rate]]] = None
+    ):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+        self.default_rate = default_rate if default_rate is not None else parse_rate(settings.RATE_LIMIT_DEFAULT)
+        self.route_rates = ROUTE_RATE_LIMITS if route_rates is None else route_rates
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        ip = client_ip(scope)
+        route_rate = self.route_rates.get((scope["method"], scope["path"]))
+        if route_rate is not None:
+            result = await self.limiter.check(f"route:{scope['path']}", ip, route_rate)
+            if not result.allowed:
+                await self._reject(result, scope, receive, send)
+                return
+        result = await self.limiter.check("ip", ip, self.default_rate)
+        if not result.allowed:
+            await self._reject(result, scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(result: RateLimitResult, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            {"detail": "Too many requests. Please retry later."},
+            status_code=429,
+            headers={
+                "Retry-After": str(result.retry_after),
+                "X-RateLimit-Limit": str(result.limit),
+                "X-RateLimit-Remaining": "0",
+            },
+        )
+        await response(scope, receive, send)
+
+
+async def limit_login_by_email(login_data: LoginRequest) -> None:
+    """
+    Route dependency limiting login attempts per account
+
+    Runs before the endpoint, so throttled attempts never reach the
+    database or bcrypt.
+    """
+    result = await rate_limiter.check("login_email", login_data.email.lower(), _LOGIN_EMAIL_RATE)
+    if not result.allowed:
+        raise TooManyRequestsException(
+            "Too many login attempts for this account. Please retry later.",
+            retry_after=result.retry_after
+        )
@@ -1 +1,199 @@
 # Request/response logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+import re
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Collapse bind parameters and literals so repeated statements share a fingerprint
+_PARAM_LIST = re.compile(r"\(\s*(?:%\(\w+\)s|\?|\$\d+)(?:\s*,\s*(?:%\(\w+\)s|\?|\$\d+))*\s*\)")
+_PARAM = re.compile(r"%\(\w+\)s|\$\d+")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so executions with different values compare equal"""
+    statement = _STRING.sub("?", statement)
+    statement = _PARAM_LIST.sub("(?)", statement)
+    statement = _PARAM.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a request issues more statements than its budget allows"""
+
+
+class QueryStats:
+    """SQL statements executed while handling one request"""
+
+    __slots__ = ("count", "duration", "statements", "budget")
+
+    def __init__(self, budget: int = 0):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.budget = budget
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times (likely N+1 patterns)"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget > 0 and self.count > self.budget
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statistics of the request being handled, if any"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(budget: int = 0) -> Iterator[QueryStats]:
+    """
+    Count statements outside of a request, e.g. in service tests
+
+        with track_queries() as stats:
+            service.update_admin(...)
+        assert stats.count <= 4
+    """
+    stats = QueryStats(budget)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def query_budget(max_queries: int):
+    """
+    Route dependency overriding the statement budget for one endpoint
+
+        @router.get("/admins", dependencies=[Depends(query_budget(3))])
+    """
+    def set_budget() -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.budget = max_queries
+    return set_budget
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        started = getattr(context, "_query_started", None)
+        stats.record(statement, time.perf_counter() - started if started else 0.0)
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Attach statement counting to an engine (idempotent)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RequestLoggerMiddleware:
+    """
+    Per-request SQL statement count, DB time and repeated statements
+
+    In DEBUG the numbers are returned as X-DB-Query-Count / X-DB-Time-Ms
+    and Server-Timing headers; every request is also logged with them as
+    structured fields. Requests over DB_QUERY_BUDGET log a warning, or raise
+    QueryBudgetExceeded when DB_QUERY_BUDGET_ENFORCE is set (for tests).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(settings.DB_QUERY_BUDGET)
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if stats.over_budget and settings.DB_QUERY_BUDGET_ENFORCE:
+                    raise QueryBudgetExceeded(
+                        f"{scope['method']} {scope['path']} executed {stats.count} statements "
+                        f"(budget {stats.budget})"
+                    )
+                if settings.DEBUG:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    db_ms = stats.duration * 1000
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (b"x-db-time-ms", f"{db_ms:.2f}".encode()),
+                        (b"server-timing", (
+                            f'db;dur={db_ms:.2f};desc="{stats.count} queries", '
+                            f"app;dur={elapsed_ms:.2f}"
+                        ).encode()),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats, elapsed: float) -> None:
+        repeated = stats.repeated(settings.DB_REPEATED_QUERY_THRESHOLD)
+        fields: Dict[str, Any] = {
+            "http_method": scope["method"],
+            "http_path": scope["path"],
+            "http_status": status_code,
+            "duration_ms": round(elapsed * 1000, 2),
+            "db_queries": stats.count,
+            "db_time_ms": round(stats.duration * 1000, 2),
+            "db_repeated": [{"statement": sql, "count": n} for sql, n in repeated],
+        }
+        logger.info(
+            f"{scope['method']} {scope['path']} {status_code} {fields['duration_ms']}ms "
+            f"db_queries={stats.count} db_time_ms={fields['db_time_ms']}",
+            extra=fields
+        )
+        if repeated:
+            logger.warning(
+                f"Possible N+1 on {scope['method']} {scope['path']}: "
+                + "; ".join(f"{n}x {sql[:120]}" for sql, n in repeated),
+                extra=fields
+            )
+        if stats.over_budget:
+            logger.warning(
+                f"Query budget exceeded on {scope['method']} {scope['path']}: "
+                f"{stats.count} statements (budget {stats.budget})",
+                extra=fields
+            )
\ No newline at end of file
@@ -1,4 +1,52 @@
 from .base import Base, BaseModel
 from .user import User
+from .department import Department, DepartmentClosure
+from .business_unit import BusinessUnit, BusinessUnitClosure
+from .cost_center import CostCenter, CostCenterClosure
+from .designation import Designation
+from .location import Location
+from .grade import Grade
+from .visit_type import VisitType
+from .exit_reason import ExitReason
+from .helpdesk_category import HelpdeskCategory
+from .reference_data import ReferenceDataVersion
+from .employee_code_config import EmployeeCodeConfig
+from .work_shift import WorkShift
+from .shift_rule import ShiftRule
+from .shift_policy import ShiftPolicy
+from .weekoff_policy import WeekoffPolicy
+from .employee import Employee
+from .workflow import WorkflowDefinition, WorkflowInstance, WorkflowHistory
+from .job import Job
+from .attendance import AttendancePunch, AttendancePunchReject
 
-__all__ = ["Base", "BaseModel", "User"]
\ No newline at end of file
+__all__ = [
+    "Base",
+    "BaseModel",
+    "User",
+    "Department",
+    "DepartmentClosure",
+    "BusinessUnit",
+    "BusinessUnitClosure",
+    "CostCenter",
+    "CostCenterClosure",
+    "Designation",
+    "Location",
+    "Grade",
+    "VisitType",
+    "ExitReason",
+    "HelpdeskCategory",
+    "ReferenceDataVersion",
+    "EmployeeCodeConfig",
+    "WorkShift",
+    "ShiftRule",
+    "ShiftPolicy",
+    "WeekoffPolicy",
+    "Employee",
+    "WorkflowDefinition",
+    "WorkflowInstance",
+    "WorkflowHistory",
+    "Job",
+    "AttendancePunch",
+    "AttendancePunchReject",
+]
\ No newline at end of file
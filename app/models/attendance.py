@@ -0,0 +1,49 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, PrimaryKeyConstraint, Index
+from .base import Base
+
+class AttendancePunch(Base):
+    """
+    One clock-in/out event from a biometric device or the mobile app
+    
+    Partitioned by month of punched_at on PostgreSQL (partitions are
+    created ahead by the punch ingestor, older or far-future punches land
+    in the default partition). The primary key doubles as the dedup key:
+    a device resending a punch is ignored.
+    """
+    __tablename__ = "attendance_punches"
+    
+    employee_id = Column(Integer, nullable=False)
+    device_id = Column(String(64), nullable=False)
+    punched_at = Column(DateTime(timezone=True), nullable=False)
+    punch_type = Column(String(10), nullable=True)  # in / out; None when the device does not say
+    source = Column(String(20), nullable=False, default="device")
+    received_at = Column(DateTime(timezone=True), nullable=False)
+    # Company of the employee; set from the pushing client's tenant
+    tenant_id = Column(Integer, nullable=True)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint('employee_id', 'device_id', 'punched_at', name='pk_attendance_punches'),
+        Index('ix_attendance_punches_tenant_punched_at', 'tenant_id', 'punched_at'),
+        {"postgresql_partition_by": "RANGE (punched_at)"},
+    )
+    
+    def __repr__(self):
+        return f"<AttendancePunch(employee_id={self.employee_id}, device_id='{self.device_id}', punched_at={self.punched_at})>"
+
+class AttendancePunchReject(Base):
+    """
+    Dead letter for punches the database refused to store
+
+    The punch is kept as JSON text (control characters escaped) so the
+    row that broke the flush can always be written here.
+    """
+    __tablename__ = "attendance_punch_rejects"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tenant_id = Column(Integer, nullable=True, index=True)
+    payload = Column(Text, nullable=False)
+    error = Column(Text, nullable=False)
+    failed_at = Column(DateTime(timezone=True), nullable=False)
+    
+    def __repr__(self):
+        return f"<AttendancePunchReject(id={self.id}, failed_at={self.failed_at})>"
\ No newline at end of file
@@ -22,6 +22,8 @@ class BaseModel(Base):
     )
     created_by = Column(Integer, nullable=True)
     updated_by = Column(Integer, nullable=True)
+    # Company (admin user ID) owning the row, filtered by app.core.tenancy
+    tenant_id = Column(Integer, nullable=True, index=True)
     
     def to_dict(self):
         """Convert model to dictionary"""
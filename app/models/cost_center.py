@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Index, UniqueConstraint
+from .base import Base, BaseModel
+from .hierarchy import ClosureMixin
+
+class CostCenter(BaseModel):
+    __tablename__ = "cost_centers"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    parent_id = Column(Integer, ForeignKey("cost_centers.id", ondelete="SET NULL"), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_cost_centers_tenant_code'),
+        Index('ix_cost_centers_parent_id', 'parent_id'),
+    )
+    
+    def __repr__(self):
+        return f"<CostCenter(id={self.id}, code='{self.code}')>"
+
+class CostCenterClosure(ClosureMixin, Base):
+    __tablename__ = "cost_center_closure"
+    __node_table__ = "cost_centers"
\ No newline at end of file
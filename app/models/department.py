@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Index, UniqueConstraint
+from .base import Base, BaseModel
+from .hierarchy import ClosureMixin
+
+class Department(BaseModel):
+    __tablename__ = "departments"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    parent_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"), nullable=True)
+    head_employee_id = Column(
+        Integer,
+        ForeignKey("employees.id", ondelete="SET NULL", use_alter=True, name="fk_departments_head_employee_id"),
+        nullable=True
+    )
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_departments_tenant_code'),
+        Index('ix_departments_parent_id', 'parent_id'),
+    )
+    
+    def __repr__(self):
+        return f"<Department(id={self.id}, code='{self.code}')>"
+
+class DepartmentClosure(ClosureMixin, Base):
+    __tablename__ = "department_closure"
+    __node_table__ = "departments"
\ No newline at end of file
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Boolean, UniqueConstraint
+from .base import BaseModel
+
+class Designation(BaseModel):
+    __tablename__ = "designations"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_designations_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<Designation(id={self.id}, code='{self.code}')>"
\ No newline at end of file
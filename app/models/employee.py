@@ -0,0 +1,50 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum as SQLEnum, Index, UniqueConstraint
+from .base import BaseModel
+from ..schemas.enums import EmployeeStatus
+
+class Employee(BaseModel):
+    __tablename__ = "employees"
+    
+    # Identification
+    employee_code = Column(String(50), nullable=False)
+    first_name = Column(String(100), nullable=False)
+    last_name = Column(String(100), nullable=True)
+    email = Column(String(255), nullable=False)
+    phone_number = Column(String(50), nullable=True)
+    gender = Column(String(20), nullable=True)
+    date_of_birth = Column(Date, nullable=True)
+    date_of_joining = Column(Date, nullable=False)
+    
+    # Organization
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"), nullable=True)
+    designation_id = Column(Integer, ForeignKey("designations.id", ondelete="SET NULL"), nullable=True)
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True)
+    business_unit_id = Column(Integer, ForeignKey("business_units.id", ondelete="SET NULL"), nullable=True)
+    cost_center_id = Column(Integer, ForeignKey("cost_centers.id", ondelete="SET NULL"), nullable=True)
+    
+    # Scheduling
+    shift_rule_id = Column(Integer, ForeignKey("shift_rules.id", ondelete="SET NULL"), nullable=True)
+    shift_policy_id = Column(Integer, ForeignKey("shift_policies.id", ondelete="SET NULL"), nullable=True)
+    weekoff_policy_id = Column(Integer, ForeignKey("weekoff_policies.id", ondelete="SET NULL"), nullable=True)
+    
+    status = Column(
+        SQLEnum(EmployeeStatus, native_enum=False, create_constraint=False),
+        nullable=False,
+        default=EmployeeStatus.ACTIVE
+    )
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'employee_code', name='uq_employees_tenant_employee_code'),
+        UniqueConstraint('tenant_id', 'email', name='uq_employees_tenant_email'),
+        Index('ix_employees_department_id', 'department_id'),
+        Index('ix_employees_designation_id', 'designation_id'),
+        Index('ix_employees_location_id', 'location_id'),
+        Index('ix_employees_business_unit_id', 'business_unit_id'),
+        Index('ix_employees_cost_center_id', 'cost_center_id'),
+        Index('ix_employees_shift_rule_id', 'shift_rule_id'),
+        Index('ix_employees_shift_policy_id', 'shift_policy_id'),
+        Index('ix_employees_weekoff_policy_id', 'weekoff_policy_id'),
+    )
+    
+    def __repr__(self):
+        return f"<Employee(id={self.id}, employee_code='{self.employee_code}')>"
\ No newline at end of file
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, Boolean
+from .base import BaseModel
+
+class EmployeeCodeConfig(BaseModel):
+    """Format and sequence used to generate employee codes"""
+    __tablename__ = "employee_code_configs"
+    
+    prefix = Column(String(20), nullable=False, default="EMP")
+    suffix = Column(String(20), nullable=True)
+    padding = Column(Integer, nullable=False, default=5)
+    next_number = Column(Integer, nullable=False, default=1)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    def __repr__(self):
+        return f"<EmployeeCodeConfig(id={self.id}, prefix='{self.prefix}', next_number={self.next_number})>"
\ No newline at end of file
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Boolean, Integer, UniqueConstraint
+from .base import BaseModel
+
+class Grade(BaseModel):
+    __tablename__ = "grades"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    level = Column(Integer, nullable=True)  # Seniority order, lowest first
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_grades_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<Grade(id={self.id}, code='{self.code}')>"
\ No newline at end of file
@@ -0,0 +1,31 @@
+# Closure tables for tree-shaped organization units
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from sqlalchemy.orm import declared_attr
+
+class ClosureMixin:
+    """
+    Every (ancestor, descendant) pair of a tree, with their distance
+    
+    Each node is also paired with itself at depth 0, so "subtree of X" is
+    the rows with ancestor_id = X (primary key prefix) and "ancestors of Y"
+    the rows with descendant_id = Y (secondary index), at any depth.
+    Subclasses set `__node_table__` to the tree's table name.
+    """
+    __node_table__: str
+    
+    @declared_attr
+    def ancestor_id(cls):
+        return Column(Integer, ForeignKey(f"{cls.__node_table__}.id", ondelete="CASCADE"), primary_key=True)
+    
+    @declared_attr
+    def descendant_id(cls):
+        return Column(Integer, ForeignKey(f"{cls.__node_table__}.id", ondelete="CASCADE"), primary_key=True)
+    
+    depth = Column(Integer, nullable=False)
+    
+    @declared_attr
+    def __table_args__(cls):
+        return (Index(f"ix_{cls.__tablename__}_descendant_id", "descendant_id", "depth"),)
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}(ancestor_id={self.ancestor_id}, descendant_id={self.descendant_id}, depth={self.depth})>"
\ No newline at end of file
@@ -0,0 +1,51 @@
+from sqlalchemy import Column, String, Integer, BigInteger, SmallInteger, DateTime, JSON, Index, text, Enum as SQLEnum
+from .base import Base
+from ..schemas.enums import JobStatus
+
+class Job(Base):
+    """
+    Background job queued by app.core.events
+    
+    Workers claim queued rows whose run_at has passed, highest priority
+    first, with FOR UPDATE SKIP LOCKED. A failed attempt puts the job back
+    with a later run_at until max_attempts is used up.
+    """
+    __tablename__ = "jobs"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    queue = Column(String(50), nullable=False, default="default")
+    name = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    priority = Column(SmallInteger, nullable=False, default=0)  # Higher runs first
+    status = Column(
+        SQLEnum(JobStatus, native_enum=False, create_constraint=False),
+        nullable=False,
+        default=JobStatus.QUEUED
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(String(2000), nullable=True)
+    # Company the job runs for; its handler session is scoped to it
+    tenant_id = Column(Integer, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text('CURRENT_TIMESTAMP')
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Covers the claim query; finished jobs drop out of the partial index
+        Index(
+            'ix_jobs_claim', 'queue', 'priority', 'run_at',
+            postgresql_where=text("status = 'QUEUED'"),
+            sqlite_where=text("status = 'QUEUED'")
+        ),
+        Index('ix_jobs_status_locked_at', 'status', 'locked_at'),
+    )
+    
+    def __repr__(self):
+        return f"<Job(id={self.id}, name='{self.name}', status='{self.status}')>"
\ No newline at end of file
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Boolean, UniqueConstraint
+from .base import BaseModel
+
+class Location(BaseModel):
+    __tablename__ = "locations"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    address = Column(String(500), nullable=True)
+    city = Column(String(100), nullable=True)
+    state = Column(String(100), nullable=True)
+    country = Column(String(100), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_locations_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<Location(id={self.id}, code='{self.code}')>"
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, text
+from .base import Base
+
+# tenant_key of master data rows without a tenant (created by a superadmin)
+NO_TENANT_KEY = 0
+
+class ReferenceDataVersion(Base):
+    """
+    Version stamp of one tenant's master data
+    
+    Incremented in the same transaction as every write to grades,
+    designations, visit types, exit reasons, helpdesk categories and
+    locations; caches compare it to decide whether they are current.
+    """
+    __tablename__ = "reference_data_versions"
+    
+    tenant_key = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text('CURRENT_TIMESTAMP')
+    )
+    
+    def __repr__(self):
+        return f"<ReferenceDataVersion(tenant_key={self.tenant_key}, version={self.version})>"
\ No newline at end of file
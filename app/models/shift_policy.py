@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, UniqueConstraint
+from .base import BaseModel
+
+class ShiftPolicy(BaseModel):
+    __tablename__ = "shift_policies"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    
+    # Worked every day by employees without a shift rule
+    default_shift_id = Column(Integer, ForeignKey("work_shifts.id", ondelete="SET NULL"), nullable=True)
+    
+    # Attendance thresholds
+    grace_in_minutes = Column(Integer, nullable=False, default=0)
+    grace_out_minutes = Column(Integer, nullable=False, default=0)
+    half_day_minutes = Column(Integer, nullable=False, default=240)
+    full_day_minutes = Column(Integer, nullable=False, default=480)
+    
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_shift_policies_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<ShiftPolicy(id={self.id}, code='{self.code}')>"
\ No newline at end of file
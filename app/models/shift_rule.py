@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Boolean, Date, JSON, UniqueConstraint
+from .base import BaseModel
+
+class ShiftRule(BaseModel):
+    """
+    Rotation of work shifts repeating from an anchor date
+    
+    `pattern` holds one entry per day of the cycle: a work shift ID, or
+    null for a rest day. [1, 1, 1, 2, 2, 2, null] works three days on
+    shift 1, three on shift 2, then rests, starting again every 7 days.
+    """
+    __tablename__ = "shift_rules"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    pattern = Column(JSON, nullable=False)
+    anchor_date = Column(Date, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_shift_rules_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<ShiftRule(id={self.id}, code='{self.code}')>"
\ No newline at end of file
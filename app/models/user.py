@@ -54,6 +54,7 @@ class User(Base):
     __table_args__ = (
         Index('ix_users_email_status', 'email', 'status'),
         Index('ix_users_role_status', 'role', 'status'),
+        Index('ix_users_role_created_at_id', 'role', 'created_at', 'id'),
     )
     
     def __repr__(self):
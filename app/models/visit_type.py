@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Boolean, UniqueConstraint
+from .base import BaseModel
+
+class VisitType(BaseModel):
+    __tablename__ = "visit_types"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_visit_types_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<VisitType(id={self.id}, code='{self.code}')>"
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Boolean, JSON, UniqueConstraint
+from .base import BaseModel
+
+class WeekoffPolicy(BaseModel):
+    """
+    Weekly rest days
+    
+    Weekdays are numbered 0 (Monday) to 6 (Sunday). `weekly_off_days` are
+    off every week; `monthly_off_days` maps a weekday to the weeks of the
+    month it is off, e.g. {"5": [2, 4]} for the 2nd and 4th Saturday.
+    """
+    __tablename__ = "weekoff_policies"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(500), nullable=True)
+    weekly_off_days = Column(JSON, nullable=False, default=list)
+    monthly_off_days = Column(JSON, nullable=False, default=dict)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_weekoff_policies_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<WeekoffPolicy(id={self.id}, code='{self.code}')>"
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Boolean, Integer, Time, UniqueConstraint
+from .base import BaseModel
+
+class WorkShift(BaseModel):
+    __tablename__ = "work_shifts"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), nullable=False)
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)  # Before start_time for overnight shifts
+    break_minutes = Column(Integer, nullable=False, default=0)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    @property
+    def is_overnight(self) -> bool:
+        return self.end_time <= self.start_time
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', name='uq_work_shifts_tenant_code'),
+    )
+    
+    def __repr__(self):
+        return f"<WorkShift(id={self.id}, code='{self.code}')>"
\ No newline at end of file
@@ -0,0 +1,93 @@
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, JSON, Index, UniqueConstraint, Enum as SQLEnum
+from .base import BaseModel
+from ..schemas.enums import WorkflowEntityType
+
+class WorkflowDefinition(BaseModel):
+    """
+    Approval state machine for one kind of request
+    
+    `states` is a list of {"name", "sla_minutes", "on_timeout", "final"}:
+    an instance left in a state longer than sla_minutes gets the
+    `on_timeout` action applied by the engine. `transitions` is a list of
+    {"from", "action", "to", "roles"}. Definitions are never edited in
+    place: an update adds the next version, and running instances finish
+    on the version they started with.
+    """
+    __tablename__ = "workflow_definitions"
+    
+    name = Column(String(255), nullable=False)
+    code = Column(String(50), index=True, nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    entity_type = Column(
+        SQLEnum(WorkflowEntityType, native_enum=False, create_constraint=False),
+        nullable=False
+    )
+    description = Column(String(500), nullable=True)
+    initial_state = Column(String(100), nullable=False)
+    states = Column(JSON, nullable=False)
+    transitions = Column(JSON, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'code', 'version', name='uq_workflow_definitions_tenant_code_version'),
+    )
+    
+    def __repr__(self):
+        return f"<WorkflowDefinition(id={self.id}, code='{self.code}', version={self.version})>"
+
+class WorkflowInstance(BaseModel):
+    """One request moving through a workflow"""
+    __tablename__ = "workflow_instances"
+    
+    definition_id = Column(Integer, ForeignKey("workflow_definitions.id", ondelete="RESTRICT"), nullable=False)
+    entity_type = Column(
+        SQLEnum(WorkflowEntityType, native_enum=False, create_constraint=False),
+        nullable=False
+    )
+    entity_id = Column(Integer, nullable=False)
+    state = Column(String(100), nullable=False)
+    state_entered_at = Column(DateTime(timezone=True), nullable=False)
+    is_completed = Column(Boolean, nullable=False, default=False)
+    
+    # Action queued for the engine's next tick
+    pending_action = Column(String(100), nullable=True)
+    pending_actor_id = Column(Integer, nullable=True)
+    pending_comment = Column(String(1000), nullable=True)
+    last_error = Column(String(500), nullable=True)
+    
+    # SLA timer of the current state
+    due_at = Column(DateTime(timezone=True), nullable=True)
+    escalation_level = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        Index('ix_workflow_instances_entity', 'entity_type', 'entity_id'),
+        Index(
+            'ix_workflow_instances_pending', 'id',
+            postgresql_where=pending_action.isnot(None)
+        ),
+        Index(
+            'ix_workflow_instances_due_at', 'due_at',
+            postgresql_where=is_completed.is_(False)
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<WorkflowInstance(id={self.id}, state='{self.state}')>"
+
+class WorkflowHistory(BaseModel):
+    """Transition applied to an instance; actor_id is null for timer escalations"""
+    __tablename__ = "workflow_history"
+    
+    instance_id = Column(Integer, ForeignKey("workflow_instances.id", ondelete="CASCADE"), nullable=False)
+    from_state = Column(String(100), nullable=False)
+    to_state = Column(String(100), nullable=False)
+    action = Column(String(100), nullable=False)
+    actor_id = Column(Integer, nullable=True)
+    comment = Column(String(1000), nullable=True)
+    
+    __table_args__ = (
+        Index('ix_workflow_history_instance_id', 'instance_id'),
+    )
+    
+    def __repr__(self):
+        return f"<WorkflowHistory(instance_id={self.instance_id}, action='{self.action}')>"
\ No newline at end of file
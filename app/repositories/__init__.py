@@ -1,4 +1,5 @@
 from .base_repository import BaseRepository
-from .user_repository import UserRepository
+from .async_base_repository import AsyncBaseRepository
+from .user_repository import AsyncUserRepository, UserRepository
 
-__all__ = ["BaseRepository", "UserRepository"]
\ No newline at end of file
+__all__ = ["BaseRepository", "AsyncBaseRepository", "UserRepository", "AsyncUserRepository"]
\ No newline at end of file
@@ -0,0 +1,227 @@
+# Generic CRUD operations for AsyncSession
+from typing import TypeVar, Generic, Type, Optional, List, Any, Iterable, Sequence
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.config import settings
+from ..core.tenancy import get_tenant, with_tenant
+from ..models.base import Base, BaseModel
+from ..utils.helpers import chunked
+from ..utils.pagination import CursorPageResult, InvalidCursorError, decode_cursor, encode_cursor
+from .base_repository import MAX_BIND_PARAMS, tenant_scoped_updates
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """
+    Async counterpart of BaseRepository with the same method names
+
+    Lazy loading does not work with AsyncSession, so relationships needed
+    by the caller must be loaded eagerly (selectinload/joinedload).
+    """
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    async def get(self, id: int) -> Optional[ModelType]:
+        """Get a single record by ID"""
+        return await self.db.get(self.model, id)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        """Get all records with pagination"""
+        result = await self.db.scalars(select(self.model).offset(skip).limit(limit))
+        return list(result.all())
+
+    async def get_lookup_map(self, *fields: str) -> dict:
+        """Map normalized values of the given columns to record IDs"""
+        columns = [getattr(self.model, field) for field in fields]
+        lookup = {}
+        for row in (await self.db.execute(select(self.model.id, *columns))).all():
+            for value in reversed(row[1:]):
+                if value is not None:
+                    lookup[str(value).strip().lower()] = row[0]
+        return lookup
+
+    async def get_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sort_key: str = "created_at",
+        descending: bool = False,
+        *criteria: Any
+    ) -> CursorPageResult:
+        """Get records with keyset (cursor) pagination, see BaseRepository.get_page"""
+        sort_column = getattr(self.model, sort_key)
+        stmt = select(self.model).where(*criteria)
+
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("k") != sort_key or position.get("desc") != descending:
+                raise InvalidCursorError("Cursor does not match this listing")
+            boundary = tuple_(sort_column, self.model.id)
+            after = tuple_(position["v"], position["id"])
+            stmt = stmt.where(boundary < after if descending else boundary > after)
+
+        if descending:
+            stmt = stmt.order_by(sort_column.desc(), self.model.id.desc())
+        else:
+            stmt = stmt.order_by(sort_column.asc(), self.model.id.asc())
+
+        rows = list((await self.db.scalars(stmt.limit(limit + 1))).all())
+        has_more = len(rows) > limit
+        items = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = items[-1]
+            next_cursor = encode_cursor({
+                "k": sort_key,
+                "desc": descending,
+                "v": getattr(last, sort_key),
+                "id": last.id,
+            })
+        return CursorPageResult(items=items, next_cursor=next_cursor, has_more=has_more)
+
+    async def create(self, obj_in: dict) -> ModelType:
+        """Create a new record"""
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, db_obj: ModelType, obj_in: dict) -> ModelType:
+        """Update an existing record"""
+        for field, value in obj_in.items():
+            setattr(db_obj, field, value)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, id: int) -> bool:
+        """Delete a record"""
+        obj = await self.get(id)
+        if obj:
+            await self.db.delete(obj)
+            await self.db.commit()
+            return True
+        return False
+
+    async def count(self) -> int:
+        """Count total records"""
+        return await self.db.scalar(select(func.count()).select_from(self.model))
+
+    def _chunk_size(self, chunk_size: Optional[int]) -> int:
+        return chunk_size or settings.DB_BULK_CHUNK_SIZE
+
+    async def _finish(self, commit: bool) -> None:
+        if commit:
+            await self.db.commit()
+        else:
+            await self.db.flush()
+
+    async def bulk_create(
+        self,
+        objs_in: Iterable[dict],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Insert many records using multi-row INSERT ... RETURNING"""
+        created: List[ModelType] = []
+        try:
+            for chunk in chunked(with_tenant(self.db, self.model, objs_in), self._chunk_size(chunk_size)):
+                result = await self.db.scalars(insert(self.model).returning(self.model), chunk)
+                created.extend(result.all())
+            await self._finish(commit)
+        except Exception:
+            await self.db.rollback()
+            raise
+        return created
+
+    async def bulk_update(
+        self,
+        objs_in: Iterable[dict],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> int:
+        """Update many records by primary key; each dict must contain "id\""""
+        tenant_id = get_tenant(self.db)
+        scoped = tenant_id is not None and issubclass(self.model, BaseModel)
+        total = 0
+        try:
+            for chunk in chunked(objs_in, self._chunk_size(chunk_size)):
+                if scoped:
+                    for stmt, params in tenant_scoped_updates(self.model, tenant_id, chunk):
+                        total += (await self.db.execute(stmt, params)).rowcount
+                else:
+                    await self.db.execute(update(self.model), chunk)
+                    total += len(chunk)
+            await self._finish(commit)
+        except Exception:
+            await self.db.rollback()
+            raise
+        return total
+
+    async def bulk_upsert(
+        self,
+        objs_in: Sequence[dict],
+        index_elements: Sequence[str],
+        update_fields: Optional[Sequence[str]] = None,
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Insert or update many records with INSERT ... ON CONFLICT ... RETURNING"""
+        if not objs_in:
+            return []
+        objs_in = list(with_tenant(self.db, self.model, objs_in))
+
+        columns = list(objs_in[0].keys())
+        if update_fields is None:
+            update_fields = [c for c in columns if c not in index_elements and c != "id"]
+        width = len(self.model.__table__.columns)
+        size = min(self._chunk_size(chunk_size), max(1, MAX_BIND_PARAMS // width))
+
+        results: List[ModelType] = []
+        try:
+            for chunk in chunked(objs_in, size):
+                stmt = pg_insert(self.model).values(chunk)
+                if update_fields:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=list(index_elements),
+                        set_={field: stmt.excluded[field] for field in update_fields}
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+                result = await self.db.scalars(
+                    stmt.returning(self.model),
+                    execution_options={"populate_existing": True}
+                )
+                results.extend(result.all())
+            await self._finish(commit)
+        except Exception:
+            await self.db.rollback()
+            raise
+        return results
+
+    async def bulk_delete(
+        self,
+        ids: Iterable[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> int:
+        """Delete many records by ID; returns the number of deleted rows"""
+        total = 0
+        try:
+            for chunk in chunked(ids, self._chunk_size(chunk_size)):
+                result = await self.db.execute(
+                    delete(self.model)
+                    .where(self.model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                total += result.rowcount
+            await self._finish(commit)
+        except Exception:
+            await self.db.rollback()
+            raise
+        return total
\ No newline at end of file
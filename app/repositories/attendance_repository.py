@@ -0,0 +1,181 @@
+# Attendance punch storage: binary COPY into a staging table, deduplicated INSERT
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
+import io
+import json
+import logging
+import struct
+from ..core.tenancy import get_tenant
+from ..models.attendance import AttendancePunch, AttendancePunchReject
+
+logger = logging.getLogger(__name__)
+
+# Column order of buffered punch tuples, the COPY stream and the staging table
+PUNCH_COLUMNS = ("employee_id", "device_id", "punched_at", "punch_type", "source", "received_at", "tenant_id")
+
+PUNCH_TABLE = AttendancePunch.__tablename__
+STAGING_TABLE = "attendance_punch_staging"
+
+# PostgreSQL binary COPY framing
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_TRAILER = struct.pack("!h", -1)
+_FIELD_COUNT = struct.pack("!h", len(PUNCH_COLUMNS))
+_NULL = struct.pack("!i", -1)
+_INT4 = struct.Struct("!ii")  # length 4 + int4
+_TIMESTAMP = struct.Struct("!iq")  # length 8 + microseconds since 2000-01-01 UTC
+_LENGTH = struct.Struct("!i")
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+PunchRow = Tuple[int, str, datetime, Optional[str], str, datetime, Optional[int]]
+
+
+def encode_binary_copy(rows: Sequence[PunchRow]) -> bytes:
+    """Rows in PUNCH_COLUMNS order as a COPY ... (FORMAT binary) stream"""
+    out = bytearray(_COPY_HEADER)
+    for employee_id, device_id, punched_at, punch_type, source, received_at, tenant_id in rows:
+        out += _FIELD_COUNT
+        out += _INT4.pack(4, employee_id)
+        encoded = device_id.encode("utf-8")
+        out += _LENGTH.pack(len(encoded))
+        out += encoded
+        out += _TIMESTAMP.pack(8, (punched_at - _PG_EPOCH) // _MICROSECOND)
+        if punch_type is None:
+            out += _NULL
+        else:
+            encoded = punch_type.encode("utf-8")
+            out += _LENGTH.pack(len(encoded))
+            out += encoded
+        encoded = source.encode("utf-8")
+        out += _LENGTH.pack(len(encoded))
+        out += encoded
+        out += _TIMESTAMP.pack(8, (received_at - _PG_EPOCH) // _MICROSECOND)
+        out += _NULL if tenant_id is None else _INT4.pack(4, tenant_id)
+    out += _COPY_TRAILER
+    return bytes(out)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class AttendancePunchRepository:
+    """
+    Punch writes and reads
+
+    The table holds no BaseModel columns (no surrogate ID, audit fields),
+    so it is outside the automatic tenant filter; reads filter by the
+    session's tenant here.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @property
+    def is_postgresql(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def ensure_partitions(self, first_month: date, months: int) -> None:
+        """Create the default partition and monthly partitions from first_month on (PostgreSQL)"""
+        if not self.is_postgresql:
+            return
+        self.db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {PUNCH_TABLE}_default PARTITION OF {PUNCH_TABLE} DEFAULT"
+        ))
+        month = month_start(first_month)
+        for _ in range(months):
+            following = next_month(month)
+            savepoint = self.db.begin_nested()
+            try:
+                self.db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {PUNCH_TABLE}_y{month.year}m{month.month:02d} "
+                    f"PARTITION OF {PUNCH_TABLE} "
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{following.isoformat()} 00:00+00')"
+                ))
+                savepoint.commit()
+            except Exception as e:
+                # The default partition already holds rows of that month
+                savepoint.rollback()
+                logger.warning(f"Could not create {PUNCH_TABLE} partition for {month:%Y-%m}: {e}")
+            month = following
+        self.db.commit()
+
+    def write(self, rows: Sequence[PunchRow]) -> int:
+        """
+        Insert punches, skipping ones already stored; returns the number inserted
+
+        On PostgreSQL the rows go through one binary COPY into a
+        per-connection temporary staging table and one INSERT ... SELECT ...
+        ON CONFLICT DO NOTHING into the partitioned table. Not committed.
+        """
+        if not rows:
+            return 0
+        if self.is_postgresql:
+            return self._copy(rows)
+        stmt = sqlite.insert(AttendancePunch.__table__).on_conflict_do_nothing()
+        return self.db.connection().execute(stmt, [dict(zip(PUNCH_COLUMNS, row)) for row in rows]).rowcount
+
+    def _copy(self, rows: Sequence[PunchRow]) -> int:
+        connection = self.db.connection()
+        # Every time: the CREATE is transactional, so a rolled back flush drops the table again
+        connection.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} "
+            f"(LIKE {PUNCH_TABLE} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+
+        columns = ", ".join(PUNCH_COLUMNS)
+        copy_sql = f"COPY {STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT binary)"
+        data = encode_binary_copy(rows)
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(copy_sql, io.BytesIO(data))
+            else:  # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    copy.write(data)
+        finally:
+            cursor.close()
+
+        return connection.exec_driver_sql(
+            f"INSERT INTO {PUNCH_TABLE} ({columns}) SELECT {columns} FROM {STAGING_TABLE} "
+            f"ON CONFLICT DO NOTHING"
+        ).rowcount
+
+    def write_rejects(self, rows: Sequence[PunchRow], error: str) -> None:
+        """Dead-letter punches as JSON text; not committed"""
+        failed_at = datetime.now(timezone.utc)
+        self.db.execute(insert(AttendancePunchReject), [
+            {
+                "tenant_id": row[6],
+                "payload": json.dumps(dict(zip(PUNCH_COLUMNS, row)), default=str),
+                "error": error,
+                "failed_at": failed_at,
+            }
+            for row in rows
+        ])
+
+    def get_punches(
+        self,
+        start: datetime,
+        end: datetime,
+        employee_id: Optional[int] = None,
+        limit: int = 1000
+    ) -> List[AttendancePunch]:
+        """Punches in [start, end) of the session's tenant, oldest first"""
+        query = self.db.query(AttendancePunch).filter(
+            AttendancePunch.punched_at >= start,
+            AttendancePunch.punched_at < end
+        )
+        tenant_id = get_tenant(self.db)
+        if tenant_id is not None:
+            query = query.filter(AttendancePunch.tenant_id == tenant_id)
+        if employee_id is not None:
+            query = query.filter(AttendancePunch.employee_id == employee_id)
+        return query.order_by(AttendancePunch.punched_at, AttendancePunch.employee_id).limit(limit).all()
\ No newline at end of file
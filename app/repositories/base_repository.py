@@ -1,22 +1,126 @@
 # Generic CRUD operations
-from typing import TypeVar, Generic, Type, Optional, List, Any
+from typing import TypeVar, Generic, Type, Optional, List, Any, Dict, Iterable, Sequence, Tuple
+from sqlalchemy import bindparam, delete, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from ..models.base import Base
+from ..core.config import settings
+from ..core.database import READ_REPLICA
+from ..core.tenancy import ALL_TENANTS, get_tenant, with_tenant
+from ..models.base import Base, BaseModel
+from ..utils.helpers import chunked
+from ..utils.pagination import CursorPageResult, InvalidCursorError, decode_cursor, encode_cursor
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# PostgreSQL accepts at most 65535 bind parameters per statement
+MAX_BIND_PARAMS = 65535
+
+def tenant_scoped_updates(model: type, tenant_id: int, rows: Sequence[dict]) -> List[Tuple[Any, List[dict]]]:
+    """
+    (statement, params) executemany pairs updating `rows` by ID within one tenant
+
+    ORM bulk UPDATE by primary key bypasses the tenant filter of
+    tenancy.py, so scoped sessions update through Core statements that
+    match on both ID and tenant_id. Rows are grouped by the columns they set.
+    """
+    table = model.__table__
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        values = {key: value for key, value in row.items() if key != "id"}
+        values["b_id"] = row["id"]
+        groups.setdefault(tuple(sorted(values)), []).append(values)
+    return [
+        (
+            update(table)
+            .where(table.c.id == bindparam("b_id"), table.c.tenant_id == tenant_id)
+            .execution_options(**{ALL_TENANTS: True}),
+            params
+        )
+        for params in groups.values()
+    ]
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, model: Type[ModelType], db: Session):
         self.model = model
         self.db = db
     
+    def _read_query(self, *entities: Any):
+        """
+        Query for read-only methods, which may be served by a read replica
+        
+        The session keeps it on the primary after this session or the
+        acting user has written recently (see RoutingSession).
+        """
+        return self.db.query(*(entities or (self.model,))).execution_options(**{READ_REPLICA: True})
+    
     def get(self, id: int) -> Optional[ModelType]:
         """Get a single record by ID"""
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        return self._read_query().filter(self.model.id == id).first()
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """Get all records with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return self._read_query().offset(skip).limit(limit).all()
+    
+    def get_lookup_map(self, *fields: str) -> dict:
+        """
+        Map normalized values of the given columns to record IDs
+        
+        Used to resolve references by code or name in one query instead of
+        one lookup per row. Earlier fields win when values collide.
+        """
+        columns = [getattr(self.model, field) for field in fields]
+        lookup = {}
+        for row in self._read_query(self.model.id, *columns).all():
+            for value in reversed(row[1:]):
+                if value is not None:
+                    lookup[str(value).strip().lower()] = row[0]
+        return lookup
+    
+    def get_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sort_key: str = "created_at",
+        descending: bool = False,
+        *criteria: Any
+    ) -> CursorPageResult:
+        """
+        Get records with keyset (cursor) pagination
+        
+        Rows are ordered by (sort_key, id) and each page continues strictly
+        after the last row of the previous one, so deep pages cost the same
+        as the first page when (sort_key, id) is indexed.
+        """
+        sort_column = getattr(self.model, sort_key)
+        query = self._read_query().filter(*criteria)
+        
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("k") != sort_key or position.get("desc") != descending:
+                raise InvalidCursorError("Cursor does not match this listing")
+            boundary = tuple_(sort_column, self.model.id)
+            after = tuple_(position["v"], position["id"])
+            query = query.filter(boundary < after if descending else boundary > after)
+        
+        if descending:
+            query = query.order_by(sort_column.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), self.model.id.asc())
+        
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        items = rows[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = items[-1]
+            next_cursor = encode_cursor({
+                "k": sort_key,
+                "desc": descending,
+                "v": getattr(last, sort_key),
+                "id": last.id,
+            })
+        return CursorPageResult(items=items, next_cursor=next_cursor, has_more=has_more)
     
     def create(self, obj_in: dict) -> ModelType:
         """Create a new record"""
@@ -45,4 +149,135 @@ class BaseRepository(Generic[ModelType]):
     
     def count(self) -> int:
         """Count total records"""
-        return self.db.query(self.model).count()
\ No newline at end of file
+        return self._read_query().count()
+    
+    def _chunk_size(self, chunk_size: Optional[int]) -> int:
+        return chunk_size or settings.DB_BULK_CHUNK_SIZE
+    
+    def _finish(self, commit: bool) -> None:
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+    
+    def bulk_create(
+        self,
+        objs_in: Iterable[dict],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Insert many records using multi-row INSERT ... RETURNING
+        
+        All chunks run in one transaction; pass commit=False to leave it
+        open for the caller.
+        """
+        created: List[ModelType] = []
+        try:
+            for chunk in chunked(with_tenant(self.db, self.model, objs_in), self._chunk_size(chunk_size)):
+                created.extend(self.db.scalars(insert(self.model).returning(self.model), chunk).all())
+            self._finish(commit)
+        except Exception:
+            self.db.rollback()
+            raise
+        return created
+    
+    def bulk_update(
+        self,
+        objs_in: Iterable[dict],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> int:
+        """
+        Update many records by primary key in batched executemany calls
+        
+        Each dict must contain "id" plus the columns to change. In a
+        tenant-scoped session, rows of other tenants are left untouched and
+        not counted.
+        """
+        tenant_id = get_tenant(self.db)
+        scoped = tenant_id is not None and issubclass(self.model, BaseModel)
+        total = 0
+        try:
+            for chunk in chunked(objs_in, self._chunk_size(chunk_size)):
+                if scoped:
+                    for stmt, params in tenant_scoped_updates(self.model, tenant_id, chunk):
+                        total += self.db.execute(stmt, params).rowcount
+                else:
+                    self.db.execute(update(self.model), chunk)
+                    total += len(chunk)
+            self._finish(commit)
+        except Exception:
+            self.db.rollback()
+            raise
+        return total
+    
+    def bulk_upsert(
+        self,
+        objs_in: Sequence[dict],
+        index_elements: Sequence[str],
+        update_fields: Optional[Sequence[str]] = None,
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Insert or update many records with INSERT ... ON CONFLICT ... RETURNING
+        
+        Rows conflicting on `index_elements` get `update_fields` overwritten
+        (defaults to every supplied column except the conflict keys and id).
+        With an empty `update_fields`, conflicting rows are left untouched and
+        only newly inserted rows are returned. All rows must share the same keys.
+        """
+        if not objs_in:
+            return []
+        objs_in = list(with_tenant(self.db, self.model, objs_in))
+        
+        columns = list(objs_in[0].keys())
+        if update_fields is None:
+            update_fields = [c for c in columns if c not in index_elements and c != "id"]
+        # Column defaults are rendered as parameters too, so budget per table column
+        width = len(self.model.__table__.columns)
+        size = min(self._chunk_size(chunk_size), max(1, MAX_BIND_PARAMS // width))
+        
+        results: List[ModelType] = []
+        try:
+            for chunk in chunked(objs_in, size):
+                stmt = pg_insert(self.model).values(chunk)
+                if update_fields:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=list(index_elements),
+                        set_={field: stmt.excluded[field] for field in update_fields}
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+                results.extend(self.db.scalars(
+                    stmt.returning(self.model),
+                    execution_options={"populate_existing": True}
+                ).all())
+            self._finish(commit)
+        except Exception:
+            self.db.rollback()
+            raise
+        return results
+    
+    def bulk_delete(
+        self,
+        ids: Iterable[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = True
+    ) -> int:
+        """Delete many records by ID; returns the number of deleted rows"""
+        total = 0
+        try:
+            for chunk in chunked(ids, self._chunk_size(chunk_size)):
+                result = self.db.execute(
+                    delete(self.model)
+                    .where(self.model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                total += result.rowcount
+            self._finish(commit)
+        except Exception:
+            self.db.rollback()
+            raise
+        return total
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.business_unit import BusinessUnit, BusinessUnitClosure
+from .hierarchy_repository import HierarchyRepository
+
+class BusinessUnitRepository(HierarchyRepository[BusinessUnit]):
+    def __init__(self, db: Session):
+        super().__init__(BusinessUnit, BusinessUnitClosure, db)
+    
+    def get_by_code(self, code: str) -> Optional[BusinessUnit]:
+        """Get business unit by code"""
+        return self.db.query(BusinessUnit).filter(BusinessUnit.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another business unit"""
+        query = self.db.query(BusinessUnit.id).filter(BusinessUnit.code == code)
+        if exclude_id is not None:
+            query = query.filter(BusinessUnit.id != exclude_id)
+        return query.first() is not None
\ No newline at end of file
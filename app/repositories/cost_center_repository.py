@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.cost_center import CostCenter, CostCenterClosure
+from .hierarchy_repository import HierarchyRepository
+
+class CostCenterRepository(HierarchyRepository[CostCenter]):
+    def __init__(self, db: Session):
+        super().__init__(CostCenter, CostCenterClosure, db)
+    
+    def get_by_code(self, code: str) -> Optional[CostCenter]:
+        """Get cost center by code"""
+        return self.db.query(CostCenter).filter(CostCenter.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another cost center"""
+        query = self.db.query(CostCenter.id).filter(CostCenter.code == code)
+        if exclude_id is not None:
+            query = query.filter(CostCenter.id != exclude_id)
+        return query.first() is not None
\ No newline at end of file
@@ -0,0 +1,37 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from ..models.department import Department, DepartmentClosure
+from ..models.employee import Employee
+from .hierarchy_repository import HierarchyRepository
+
+class DepartmentRepository(HierarchyRepository[Department]):
+    def __init__(self, db: Session):
+        super().__init__(Department, DepartmentClosure, db)
+    
+    def get_by_code(self, code: str) -> Optional[Department]:
+        """Get department by code"""
+        return self.db.query(Department).filter(Department.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another department"""
+        query = self.db.query(Department.id).filter(Department.code == code)
+        if exclude_id is not None:
+            query = query.filter(Department.id != exclude_id)
+        return query.first() is not None
+    
+    def get_manager_chain(self, department_id: int) -> List[Tuple[Department, Employee]]:
+        """
+        (department, head) from department_id up to the root, nearest first
+        
+        Departments without a head are skipped. One indexed closure lookup
+        joined to departments and employees.
+        """
+        closure = DepartmentClosure
+        return (
+            self._read_query(Department, Employee)
+            .join(closure, closure.ancestor_id == Department.id)
+            .join(Employee, Employee.id == Department.head_employee_id)
+            .filter(closure.descendant_id == department_id)
+            .order_by(closure.depth)
+            .all()
+        )
\ No newline at end of file
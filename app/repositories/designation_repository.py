@@ -0,0 +1,7 @@
+from sqlalchemy.orm import Session
+from ..models.designation import Designation
+from .reference_data_repository import ReferenceDataRepository
+
+class DesignationRepository(ReferenceDataRepository[Designation]):
+    def __init__(self, db: Session):
+        super().__init__(Designation, db)
\ No newline at end of file
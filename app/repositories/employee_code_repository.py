@@ -0,0 +1,35 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.employee_code_config import EmployeeCodeConfig
+from .base_repository import BaseRepository
+
+class EmployeeCodeRepository(BaseRepository[EmployeeCodeConfig]):
+    def __init__(self, db: Session):
+        super().__init__(EmployeeCodeConfig, db)
+    
+    def get_active(self) -> Optional[EmployeeCodeConfig]:
+        """Get the active employee code configuration"""
+        return (
+            self.db.query(EmployeeCodeConfig)
+            .filter(EmployeeCodeConfig.is_active.is_(True))
+            .order_by(EmployeeCodeConfig.id)
+            .first()
+        )
+    
+    def reserve_numbers(self, config_id: int, count: int) -> int:
+        """
+        Atomically advance the sequence by `count`
+        
+        Returns the first reserved number; the range is
+        [first, first + count). The row lock is held until the caller's
+        transaction ends, so callers reserve in a short transaction of
+        their own (see EmployeeCodeService).
+        """
+        next_number = self.db.execute(
+            update(EmployeeCodeConfig)
+            .where(EmployeeCodeConfig.id == config_id)
+            .values(next_number=EmployeeCodeConfig.next_number + count)
+            .returning(EmployeeCodeConfig.next_number)
+        ).scalar_one()
+        return next_number - count
\ No newline at end of file
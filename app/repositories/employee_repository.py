@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Session
+from typing import Any, Iterable, List, Optional, Set
+from ..models.employee import Employee
+from ..schemas.enums import EmployeeStatus
+from .base_repository import BaseRepository
+
+class EmployeeRepository(BaseRepository[Employee]):
+    def __init__(self, db: Session):
+        super().__init__(Employee, db)
+    
+    def get_by_code(self, employee_code: str) -> Optional[Employee]:
+        """Get employee by employee code"""
+        return self.db.query(Employee).filter(Employee.employee_code == employee_code).first()
+    
+    def get_by_email(self, email: str) -> Optional[Employee]:
+        """Get employee by email"""
+        return self.db.query(Employee).filter(Employee.email == email).first()
+    
+    def existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Return the subset of emails already used by employees"""
+        emails = list(emails)
+        if not emails:
+            return set()
+        rows = self.db.query(Employee.email).filter(Employee.email.in_(emails)).all()
+        return {row[0] for row in rows}
+    
+    def existing_codes(self, codes: Iterable[str]) -> Set[str]:
+        """Return the subset of employee codes already in use"""
+        codes = list(codes)
+        if not codes:
+            return set()
+        rows = self.db.query(Employee.employee_code).filter(Employee.employee_code.in_(codes)).all()
+        return {row[0] for row in rows}
+    
+    def existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """Return the subset of IDs that belong to employees"""
+        ids = list(ids)
+        if not ids:
+            return set()
+        rows = self.db.query(Employee.id).filter(Employee.id.in_(ids)).all()
+        return {row[0] for row in rows}
+    
+    def get_schedule_assignments(self) -> List[tuple]:
+        """
+        (id, shift_rule_id, shift_policy_id, weekoff_policy_id, date_of_joining)
+        of every employee who has not exited, ordered by ID
+        
+        Column tuples only: the roster engine needs tens of thousands of
+        these and no ORM instances.
+        """
+        return (
+            self._read_query(
+                Employee.id,
+                Employee.shift_rule_id,
+                Employee.shift_policy_id,
+                Employee.weekoff_policy_id,
+                Employee.date_of_joining
+            )
+            .filter(Employee.status != EmployeeStatus.EXITED)
+            .order_by(Employee.id)
+            .all()
+        )
+    
+    def get_in_units(self, column: Any, unit_ids: Any, skip: int = 0, limit: int = 100) -> List[Employee]:
+        """
+        Employees whose unit column (department_id, business_unit_id, ...)
+        is in unit_ids, a list or a SELECT such as a closure subtree query
+        """
+        return (
+            self._read_query()
+            .filter(column.in_(unit_ids))
+            .order_by(Employee.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    
+    def count_in_units(self, column: Any, unit_ids: Any) -> int:
+        return self._read_query(Employee.id).filter(column.in_(unit_ids)).count()
\ No newline at end of file
@@ -0,0 +1,7 @@
+from sqlalchemy.orm import Session
+from ..models.exit_reason import ExitReason
+from .reference_data_repository import ReferenceDataRepository
+
+class ExitReasonRepository(ReferenceDataRepository[ExitReason]):
+    def __init__(self, db: Session):
+        super().__init__(ExitReason, db)
\ No newline at end of file
@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Session
+from typing import List
+from ..models.grade import Grade
+from .reference_data_repository import ReferenceDataRepository
+
+class GradeRepository(ReferenceDataRepository[Grade]):
+    def __init__(self, db: Session):
+        super().__init__(Grade, db)
+    
+    def get_all_current(self) -> List[Grade]:
+        """Every grade, most junior first (read from the primary)"""
+        return self.db.query(Grade).order_by(Grade.level.nulls_last(), Grade.name, Grade.id).all()
\ No newline at end of file
@@ -0,0 +1,7 @@
+from sqlalchemy.orm import Session
+from ..models.helpdesk_category import HelpdeskCategory
+from .reference_data_repository import ReferenceDataRepository
+
+class HelpdeskCategoryRepository(ReferenceDataRepository[HelpdeskCategory]):
+    def __init__(self, db: Session):
+        super().__init__(HelpdeskCategory, db)
\ No newline at end of file
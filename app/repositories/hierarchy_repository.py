@@ -0,0 +1,210 @@
+# Tree queries and maintenance backed by a closure table
+from typing import Any, List, Optional, Type
+from sqlalchemy import delete, func, insert, literal, or_, select, true
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from .base_repository import BaseRepository, ModelType
+
+# Deepest tree a rebuild accepts; deeper parent_id chains are treated as cycles
+MAX_HIERARCHY_DEPTH = 64
+
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+class HierarchyError(ValueError):
+    """Change that would break the tree (cycle, unknown parent)"""
+
+class HierarchyRepository(BaseRepository[ModelType]):
+    """
+    Repository for models with a `parent_id` and a closure table
+
+    Writes keep the closure table in step inside the same transaction:
+    create adds the new node's ancestor rows, a move re-links the whole
+    subtree with one DELETE and one INSERT ... SELECT, and delete re-parents
+    the node's children first. Subtree and ancestor reads are single
+    indexed lookups at any depth, with no recursive queries.
+    """
+
+    def __init__(self, model: Type[ModelType], closure: Type[Any], db: Session):
+        super().__init__(model, db)
+        self.closure = closure
+
+    # Reads
+
+    def subtree_ids_query(self, node_id: int, include_self: bool = True):
+        """SELECT of the IDs in a subtree, for IN (...) filters on other tables"""
+        query = select(self.closure.descendant_id).where(self.closure.ancestor_id == node_id)
+        if not include_self:
+            query = query.where(self.closure.depth > 0)
+        return query
+
+    def get_descendants(
+        self,
+        node_id: int,
+        max_depth: Optional[int] = None,
+        include_self: bool = False
+    ) -> List[ModelType]:
+        """Nodes below node_id, nearest levels first"""
+        closure = self.closure
+        query = (
+            self._read_query()
+            .join(closure, closure.descendant_id == self.model.id)
+            .filter(closure.ancestor_id == node_id)
+        )
+        if not include_self:
+            query = query.filter(closure.depth > 0)
+        if max_depth is not None:
+            query = query.filter(closure.depth <= max_depth)
+        return query.order_by(closure.depth, self.model.id).all()
+
+    def get_children(self, node_id: int) -> List[ModelType]:
+        return self.get_descendants(node_id, max_depth=1)
+
+    def get_ancestors(self, node_id: int, include_self: bool = False) -> List[ModelType]:
+        """Nodes above node_id, nearest first (parent, grandparent, ..., root)"""
+        closure = self.closure
+        query = (
+            self._read_query()
+            .join(closure, closure.ancestor_id == self.model.id)
+            .filter(closure.descendant_id == node_id)
+        )
+        if not include_self:
+            query = query.filter(closure.depth > 0)
+        return query.order_by(closure.depth).all()
+
+    def get_roots(self) -> List[ModelType]:
+        return self._read_query().filter(self.model.parent_id.is_(None)).order_by(self.model.id).all()
+
+    def is_in_subtree(self, node_id: int, root_id: int) -> bool:
+        """True when node_id is root_id or below it (read from the primary)"""
+        closure = self.closure
+        return self.db.query(closure.depth).filter(
+            closure.ancestor_id == root_id,
+            closure.descendant_id == node_id
+        ).first() is not None
+
+    # Writes
+
+    def _link(self, node_id: int, parent_id: Optional[int]) -> None:
+        """Closure rows of a new leaf: itself, plus every ancestor of its parent"""
+        closure = self.closure
+        self.db.execute(insert(closure).values(ancestor_id=node_id, descendant_id=node_id, depth=0))
+        if parent_id is not None:
+            self.db.execute(
+                insert(closure).from_select(
+                    CLOSURE_COLUMNS,
+                    select(closure.ancestor_id, literal(node_id), closure.depth + 1)
+                    .where(closure.descendant_id == parent_id)
+                )
+            )
+
+    def _move(self, db_obj: ModelType, parent_id: Optional[int]) -> None:
+        """Re-link db_obj and its whole subtree under parent_id (not committed)"""
+        if parent_id == db_obj.parent_id:
+            return
+        if parent_id is not None and self.is_in_subtree(parent_id, db_obj.id):
+            raise HierarchyError("Cannot move a node under itself or one of its descendants")
+
+        closure = self.closure
+        subtree = select(closure.descendant_id).where(closure.ancestor_id == db_obj.id)
+
+        # Detach: drop links from the old ancestors into the subtree
+        self.db.execute(
+            delete(closure).where(
+                closure.descendant_id.in_(subtree),
+                closure.ancestor_id.not_in(subtree)
+            )
+        )
+
+        # Attach: every ancestor of the new parent (inclusive) to every node of the subtree
+        if parent_id is not None:
+            above = aliased(closure)
+            below = aliased(closure)
+            self.db.execute(
+                insert(closure).from_select(
+                    CLOSURE_COLUMNS,
+                    select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+                    .select_from(above)
+                    .join(below, true())  # cross product of the two sets
+                    .where(above.descendant_id == parent_id, below.ancestor_id == db_obj.id)
+                )
+            )
+        db_obj.parent_id = parent_id
+
+    def create(self, obj_in: dict) -> ModelType:
+        """Create a node and its closure rows"""
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        self.db.flush()
+        self._link(db_obj.id, db_obj.parent_id)
+        self.db.commit()
+        self.db.refresh(db_obj)
+        return db_obj
+
+    def update(self, db_obj: ModelType, obj_in: dict) -> ModelType:
+        """Update a node; a changed parent_id moves its subtree"""
+        obj_in = dict(obj_in)
+        if "parent_id" in obj_in:
+            self._move(db_obj, obj_in.pop("parent_id"))
+        return super().update(db_obj, obj_in)
+
+    def move(self, db_obj: ModelType, parent_id: Optional[int]) -> ModelType:
+        """Move a node and its subtree under another parent (None for a root)"""
+        self._move(db_obj, parent_id)
+        self.db.commit()
+        self.db.refresh(db_obj)
+        return db_obj
+
+    def delete(self, id: int) -> bool:
+        """Delete a node; its children move up to the node's parent"""
+        obj = self.get(id)
+        if not obj:
+            return False
+        for child in self.db.query(self.model).filter(self.model.parent_id == id).all():
+            self._move(child, obj.parent_id)
+        closure = self.closure
+        self.db.execute(delete(closure).where(or_(closure.ancestor_id == id, closure.descendant_id == id)))
+        self.db.delete(obj)
+        self.db.commit()
+        return True
+
+    def rebuild(self) -> int:
+        """
+        Recompute the whole closure table from parent_id
+
+        For migrations and repairs after parent_id was written directly.
+        One recursive INSERT ... SELECT in a single transaction; returns the
+        number of closure rows.
+        """
+        nodes = self.model.__table__
+        tree = select(
+            nodes.c.id.label("ancestor_id"),
+            nodes.c.id.label("descendant_id"),
+            literal(0).label("depth")
+        ).cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(tree.c.ancestor_id, nodes.c.id, tree.c.depth + 1)
+            .where(nodes.c.parent_id == tree.c.descendant_id, tree.c.depth < MAX_HIERARCHY_DEPTH)
+        )
+
+        closure = self.closure
+        invalid = HierarchyError(
+            f"{self.model.__tablename__} has a parent_id cycle or is deeper than {MAX_HIERARCHY_DEPTH} levels"
+        )
+        self.db.execute(delete(closure))
+        try:
+            # A cycle repeats (ancestor, descendant) pairs and trips the primary key
+            self.db.execute(
+                insert(closure).from_select(
+                    CLOSURE_COLUMNS,
+                    select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth)
+                )
+            )
+        except IntegrityError:
+            self.db.rollback()
+            raise invalid
+        if self.db.query(closure.depth).filter(closure.depth >= MAX_HIERARCHY_DEPTH).first() is not None:
+            self.db.rollback()
+            raise invalid
+        count = self.db.query(func.count()).select_from(closure).scalar()
+        self.db.commit()
+        return count
\ No newline at end of file
@@ -0,0 +1,137 @@
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable, List, Sequence
+from ..models.job import Job
+from ..schemas.enums import JobStatus
+
+jobs = Job.__table__
+
+class JobRepository:
+    """
+    Queue operations on the jobs table
+
+    Core statements only: a claim or acknowledgement is one round trip for
+    the whole batch, and the table sits outside the tenant filter since
+    workers serve every company.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add_many(self, rows: List[dict]) -> None:
+        """Insert jobs in the caller's transaction"""
+        if rows:
+            self.db.execute(insert(jobs), rows)
+
+    def claim(self, queues: Sequence[str], limit: int, worker_id: str, now: datetime) -> List[tuple]:
+        """
+        Mark up to `limit` due jobs as running and return them
+
+        The inner SELECT ... FOR UPDATE SKIP LOCKED hands concurrent
+        workers disjoint batches without waiting on each other; the caller
+        commits to release the row locks.
+        """
+        due = (
+            select(jobs.c.id)
+            .where(
+                jobs.c.status == JobStatus.QUEUED,
+                jobs.c.queue.in_(queues),
+                jobs.c.run_at <= now
+            )
+            .order_by(jobs.c.priority.desc(), jobs.c.run_at, jobs.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return self.db.execute(
+            update(jobs)
+            .where(jobs.c.id.in_(due.scalar_subquery()))
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=jobs.c.attempts + 1,
+                locked_at=now,
+                locked_by=worker_id
+            )
+            .returning(
+                jobs.c.id, jobs.c.name, jobs.c.payload, jobs.c.priority, jobs.c.attempts,
+                jobs.c.max_attempts, jobs.c.tenant_id, jobs.c.run_at
+            )
+        ).all()
+
+    def complete(self, ids: Iterable[int], now: datetime) -> None:
+        ids = list(ids)
+        if ids:
+            self.db.execute(
+                update(jobs)
+                .where(jobs.c.id.in_(ids))
+                .values(status=JobStatus.DONE, finished_at=now, locked_at=None, locked_by=None, last_error=None)
+            )
+
+    def reschedule(self, retries: List[dict]) -> None:
+        """Put failed attempts back in the queue; rows carry b_id, b_run_at and b_error"""
+        if retries:
+            self.db.execute(
+                update(jobs)
+                .where(jobs.c.id == bindparam("b_id"))
+                .values(
+                    status=JobStatus.QUEUED,
+                    run_at=bindparam("b_run_at"),
+                    last_error=bindparam("b_error"),
+                    locked_at=None,
+                    locked_by=None
+                ),
+                retries
+            )
+
+    def defer(self, deferrals: List[dict]) -> None:
+        """Requeue claimed jobs without counting the attempt; rows carry b_id, b_run_at and b_error"""
+        if deferrals:
+            self.db.execute(
+                update(jobs)
+                .where(jobs.c.id == bindparam("b_id"))
+                .values(
+                    status=JobStatus.QUEUED,
+                    attempts=jobs.c.attempts - 1,
+                    run_at=bindparam("b_run_at"),
+                    last_error=bindparam("b_error"),
+                    locked_at=None,
+                    locked_by=None
+                ),
+                deferrals
+            )
+
+    def fail(self, failures: List[dict], now: datetime) -> None:
+        """Give up on jobs; rows carry b_id and b_error"""
+        if failures:
+            self.db.execute(
+                update(jobs)
+                .where(jobs.c.id == bindparam("b_id"))
+                .values(
+                    status=JobStatus.FAILED,
+                    finished_at=now,
+                    last_error=bindparam("b_error"),
+                    locked_at=None,
+                    locked_by=None
+                ),
+                failures
+            )
+
+    def release_stale(self, locked_before: datetime, now: datetime) -> int:
+        """Requeue running jobs of workers that died mid-batch; jobs out of attempts fail"""
+        stale = (jobs.c.status == JobStatus.RUNNING) & (jobs.c.locked_at < locked_before)
+        self.db.execute(
+            update(jobs)
+            .where(stale, jobs.c.attempts >= jobs.c.max_attempts)
+            .values(status=JobStatus.FAILED, finished_at=now, last_error="Worker lock expired", locked_by=None)
+        )
+        return self.db.execute(
+            update(jobs)
+            .where(stale)
+            .values(status=JobStatus.QUEUED, run_at=now, locked_at=None, locked_by=None)
+        ).rowcount
+
+    def purge_finished(self, finished_before: datetime) -> int:
+        """Delete completed jobs; failed ones stay for inspection"""
+        return self.db.execute(
+            delete(jobs).where(jobs.c.status == JobStatus.DONE, jobs.c.finished_at < finished_before)
+        ).rowcount
\ No newline at end of file
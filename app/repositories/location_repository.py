@@ -0,0 +1,7 @@
+from sqlalchemy.orm import Session
+from ..models.location import Location
+from .reference_data_repository import ReferenceDataRepository
+
+class LocationRepository(ReferenceDataRepository[Location]):
+    def __init__(self, db: Session):
+        super().__init__(Location, db)
\ No newline at end of file
@@ -0,0 +1,113 @@
+# Master data tables and their version stamps
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from typing import List, Optional, Type
+from ..core.tenancy import get_tenant
+from ..models.reference_data import NO_TENANT_KEY, ReferenceDataVersion
+from .base_repository import BaseRepository, ModelType
+
+# NOTIFY channel announcing "<tenant_key>:<version>" after master data commits
+REFERENCE_DATA_CHANNEL = "reference_data"
+
+def tenant_key(tenant_id: Optional[int]) -> int:
+    return NO_TENANT_KEY if tenant_id is None else tenant_id
+
+class ReferenceVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def bump(self, tenant_id: Optional[int]) -> int:
+        """
+        Increment a tenant's version inside the caller's transaction
+        
+        One upsert, so concurrent writers serialize on the version row and
+        each commit gets a distinct, increasing version. On PostgreSQL a
+        NOTIFY is queued with it and delivered only if the transaction
+        commits.
+        """
+        key = tenant_key(tenant_id)
+        dialect = self.db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(ReferenceDataVersion).values(tenant_key=key, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tenant_key"],
+            set_={"version": ReferenceDataVersion.version + 1, "updated_at": func.now()}
+        ).returning(ReferenceDataVersion.version)
+        version = self.db.execute(stmt).scalar_one()
+        if dialect == "postgresql":
+            self.db.execute(select(func.pg_notify(REFERENCE_DATA_CHANNEL, f"{key}:{version}")))
+        return version
+    
+    def current(self, tenant_id: Optional[int]) -> int:
+        """
+        Current version of the master data visible to a tenant
+        
+        Unscoped sessions (superadmins) see every tenant's rows, so their
+        version is the sum of all versions, which also only ever grows.
+        """
+        if tenant_id is None:
+            return self.db.query(func.coalesce(func.sum(ReferenceDataVersion.version), 0)).scalar()
+        version = self.db.query(ReferenceDataVersion.version).filter(
+            ReferenceDataVersion.tenant_key == tenant_id
+        ).scalar()
+        return version or 0
+
+class ReferenceDataRepository(BaseRepository[ModelType]):
+    """
+    Repository for master data with a tenant-unique `code`
+    
+    Every write also bumps the tenant's reference data version in the
+    same transaction (see ReferenceDataCache).
+    """
+    
+    def __init__(self, model: Type[ModelType], db: Session):
+        super().__init__(model, db)
+        self.version_repo = ReferenceVersionRepository(db)
+    
+    def get_by_code(self, code: str) -> Optional[ModelType]:
+        return self.db.query(self.model).filter(self.model.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another record"""
+        query = self.db.query(self.model.id).filter(self.model.code == code)
+        if exclude_id is not None:
+            query = query.filter(self.model.id != exclude_id)
+        return query.first() is not None
+    
+    def get_all_current(self) -> List[ModelType]:
+        """
+        Every record, for the reference data bundle
+        
+        Read from the primary: the bundle is stamped with a version read
+        from the primary just before, and a lagging replica could pair an
+        old row set with a new version.
+        """
+        return self.db.query(self.model).order_by(self.model.name, self.model.id).all()
+    
+    def _commit_change(self) -> None:
+        self.db.flush()
+        self.version_repo.bump(get_tenant(self.db))
+        self.db.commit()
+    
+    def create(self, obj_in: dict) -> ModelType:
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        self._commit_change()
+        self.db.refresh(db_obj)
+        return db_obj
+    
+    def update(self, db_obj: ModelType, obj_in: dict) -> ModelType:
+        for field, value in obj_in.items():
+            setattr(db_obj, field, value)
+        self._commit_change()
+        self.db.refresh(db_obj)
+        return db_obj
+    
+    def delete(self, id: int) -> bool:
+        obj = self.get(id)
+        if not obj:
+            return False
+        self.db.delete(obj)
+        self._commit_change()
+        return True
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.shift_policy import ShiftPolicy
+from .base_repository import BaseRepository
+
+class ShiftPolicyRepository(BaseRepository[ShiftPolicy]):
+    def __init__(self, db: Session):
+        super().__init__(ShiftPolicy, db)
+    
+    def get_by_code(self, code: str) -> Optional[ShiftPolicy]:
+        """Get shift policy by code"""
+        return self.db.query(ShiftPolicy).filter(ShiftPolicy.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another shift policy"""
+        query = self.db.query(ShiftPolicy.id).filter(ShiftPolicy.code == code)
+        if exclude_id is not None:
+            query = query.filter(ShiftPolicy.id != exclude_id)
+        return query.first() is not None
+    
+    def get_all_by_id(self) -> dict:
+        """Every shift policy, keyed by ID (small configuration table)"""
+        return {row.id: row for row in self._read_query().all()}
\ No newline at end of file
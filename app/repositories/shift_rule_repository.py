@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.shift_rule import ShiftRule
+from .base_repository import BaseRepository
+
+class ShiftRuleRepository(BaseRepository[ShiftRule]):
+    def __init__(self, db: Session):
+        super().__init__(ShiftRule, db)
+    
+    def get_by_code(self, code: str) -> Optional[ShiftRule]:
+        """Get shift rule by code"""
+        return self.db.query(ShiftRule).filter(ShiftRule.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another shift rule"""
+        query = self.db.query(ShiftRule.id).filter(ShiftRule.code == code)
+        if exclude_id is not None:
+            query = query.filter(ShiftRule.id != exclude_id)
+        return query.first() is not None
+    
+    def get_all_by_id(self) -> dict:
+        """Every shift rule, keyed by ID (small configuration table)"""
+        return {row.id: row for row in self._read_query().all()}
\ No newline at end of file
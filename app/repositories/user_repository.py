@@ -1,7 +1,11 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from ..models.user import User
 from ..schemas.enums import UserRole, UserStatus
+from ..utils.pagination import CursorPageResult
+from .async_base_repository import AsyncBaseRepository
 from .base_repository import BaseRepository
 
 class UserRepository(BaseRepository[User]):
@@ -14,15 +18,50 @@ class UserRepository(BaseRepository[User]):
     
     def get_by_role(self, role: UserRole, skip: int = 0, limit: int = 100) -> List[User]:
         """Get users by role"""
-        return self.db.query(User).filter(User.role == role).offset(skip).limit(limit).all()
+        return self._read_query().filter(User.role == role).offset(skip).limit(limit).all()
+    
+    def get_page_by_role(
+        self,
+        role: UserRole,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        descending: bool = False
+    ) -> CursorPageResult:
+        """Get users by role with keyset pagination over (created_at, id)"""
+        return self.get_page(limit, cursor, "created_at", descending, User.role == role)
     
     def get_active_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all active users"""
-        return self.db.query(User).filter(User.status == UserStatus.ACTIVE).offset(skip).limit(limit).all()
+        return self._read_query().filter(User.status == UserStatus.ACTIVE).offset(skip).limit(limit).all()
     
     def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
         """Check if email exists (optionally excluding a specific user ID)"""
         query = self.db.query(User).filter(User.email == email)
         if exclude_id:
             query = query.filter(User.id != exclude_id)
-        return query.first() is not None
\ No newline at end of file
+        return query.first() is not None
+
+class AsyncUserRepository(AsyncBaseRepository[User]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(User, db)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email"""
+        return await self.db.scalar(select(User).where(User.email == email).limit(1))
+    
+    async def get_page_by_role(
+        self,
+        role: UserRole,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        descending: bool = False
+    ) -> CursorPageResult:
+        """Get users by role with keyset pagination over (created_at, id)"""
+        return await self.get_page(limit, cursor, "created_at", descending, User.role == role)
+    
+    async def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if email exists (optionally excluding a specific user ID)"""
+        query = select(User.id).where(User.email == email)
+        if exclude_id:
+            query = query.where(User.id != exclude_id)
+        return await self.db.scalar(query.limit(1)) is not None
\ No newline at end of file
@@ -0,0 +1,7 @@
+from sqlalchemy.orm import Session
+from ..models.visit_type import VisitType
+from .reference_data_repository import ReferenceDataRepository
+
+class VisitTypeRepository(ReferenceDataRepository[VisitType]):
+    def __init__(self, db: Session):
+        super().__init__(VisitType, db)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.weekoff_policy import WeekoffPolicy
+from .base_repository import BaseRepository
+
+class WeekoffPolicyRepository(BaseRepository[WeekoffPolicy]):
+    def __init__(self, db: Session):
+        super().__init__(WeekoffPolicy, db)
+    
+    def get_by_code(self, code: str) -> Optional[WeekoffPolicy]:
+        """Get week-off policy by code"""
+        return self.db.query(WeekoffPolicy).filter(WeekoffPolicy.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another week-off policy"""
+        query = self.db.query(WeekoffPolicy.id).filter(WeekoffPolicy.code == code)
+        if exclude_id is not None:
+            query = query.filter(WeekoffPolicy.id != exclude_id)
+        return query.first() is not None
+    
+    def get_all_by_id(self) -> dict:
+        """Every week-off policy, keyed by ID (small configuration table)"""
+        return {row.id: row for row in self._read_query().all()}
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..models.work_shift import WorkShift
+from .base_repository import BaseRepository
+
+class WorkShiftRepository(BaseRepository[WorkShift]):
+    def __init__(self, db: Session):
+        super().__init__(WorkShift, db)
+    
+    def get_by_code(self, code: str) -> Optional[WorkShift]:
+        """Get work shift by code"""
+        return self.db.query(WorkShift).filter(WorkShift.code == code).first()
+    
+    def code_exists(self, code: str, exclude_id: Optional[int] = None) -> bool:
+        """Check if a code is already used by another work shift"""
+        query = self.db.query(WorkShift.id).filter(WorkShift.code == code)
+        if exclude_id is not None:
+            query = query.filter(WorkShift.id != exclude_id)
+        return query.first() is not None
+    
+    def get_all_by_id(self) -> dict:
+        """Every work shift, keyed by ID (small configuration table)"""
+        return {row.id: row for row in self._read_query().all()}
\ No newline at end of file
@@ -0,0 +1,160 @@
+from sqlalchemy import bindparam, func, insert, update
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable, List, Optional
+from ..models.user import User
+from ..models.workflow import WorkflowDefinition, WorkflowHistory, WorkflowInstance
+from .base_repository import BaseRepository
+
+class WorkflowDefinitionRepository(BaseRepository[WorkflowDefinition]):
+    def __init__(self, db: Session):
+        super().__init__(WorkflowDefinition, db)
+    
+    def get_active_by_code(self, code: str) -> Optional[WorkflowDefinition]:
+        """Get the active (latest) version of a workflow"""
+        return (
+            self.db.query(WorkflowDefinition)
+            .filter(WorkflowDefinition.code == code, WorkflowDefinition.is_active.is_(True))
+            .order_by(WorkflowDefinition.version.desc())
+            .first()
+        )
+    
+    def latest_version(self, code: str) -> int:
+        """Highest version number of a workflow code, 0 when unused"""
+        return self.db.query(func.max(WorkflowDefinition.version)).filter(WorkflowDefinition.code == code).scalar() or 0
+    
+    def get_by_ids(self, ids: Iterable[int]) -> List[WorkflowDefinition]:
+        ids = list(ids)
+        if not ids:
+            return []
+        return self._read_query().filter(WorkflowDefinition.id.in_(ids)).all()
+
+class WorkflowInstanceRepository(BaseRepository[WorkflowInstance]):
+    def __init__(self, db: Session):
+        super().__init__(WorkflowInstance, db)
+    
+    def claim_pending(self, limit: int) -> List[tuple]:
+        """
+        Lock up to `limit` instances with a queued action
+        
+        FOR UPDATE SKIP LOCKED lets several workers tick at once, each
+        claiming a disjoint batch. Rows stay locked until the caller commits.
+        """
+        return (
+            self.db.query(
+                WorkflowInstance.id,
+                WorkflowInstance.definition_id,
+                WorkflowInstance.state,
+                WorkflowInstance.pending_action,
+                WorkflowInstance.pending_actor_id,
+                WorkflowInstance.pending_comment,
+                WorkflowInstance.escalation_level,
+                WorkflowInstance.tenant_id
+            )
+            .filter(WorkflowInstance.pending_action.isnot(None))
+            .order_by(WorkflowInstance.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=WorkflowInstance)
+            .all()
+        )
+    
+    def get_requesters(self, ids: Iterable[int]) -> List[tuple]:
+        """(instance, workflow name, requester name, requester email) of instances started by a user"""
+        ids = list(ids)
+        if not ids:
+            return []
+        return (
+            self.db.query(WorkflowInstance, WorkflowDefinition.name, User.name, User.email)
+            .join(WorkflowDefinition, WorkflowDefinition.id == WorkflowInstance.definition_id)
+            .join(User, User.id == WorkflowInstance.created_by)
+            .filter(WorkflowInstance.id.in_(ids))
+            .all()
+        )
+    
+    def get_timers(self, due_before: datetime) -> List[tuple]:
+        """(id, due_at) of open instances whose SLA expires before due_before"""
+        return (
+            self._read_query(WorkflowInstance.id, WorkflowInstance.due_at)
+            .filter(
+                WorkflowInstance.is_completed.is_(False),
+                WorkflowInstance.due_at.isnot(None),
+                WorkflowInstance.due_at <= due_before
+            )
+            .all()
+        )
+    
+    def get_timer_states(self, ids: Iterable[int]) -> List[tuple]:
+        """(id, definition_id, state, due_at) of open instances without a queued action"""
+        ids = list(ids)
+        if not ids:
+            return []
+        return (
+            self.db.query(
+                WorkflowInstance.id,
+                WorkflowInstance.definition_id,
+                WorkflowInstance.state,
+                WorkflowInstance.due_at
+            )
+            .filter(
+                WorkflowInstance.id.in_(ids),
+                WorkflowInstance.is_completed.is_(False),
+                WorkflowInstance.pending_action.is_(None)
+            )
+            .all()
+        )
+    
+    def queue_action(self, instance_id: int, action: str, actor_id: Optional[int], comment: Optional[str]) -> bool:
+        """Queue an action unless another one is already waiting; True when queued"""
+        result = self.db.execute(
+            update(WorkflowInstance)
+            .where(
+                WorkflowInstance.id == instance_id,
+                WorkflowInstance.pending_action.is_(None),
+                WorkflowInstance.is_completed.is_(False)
+            )
+            .values(pending_action=action, pending_actor_id=actor_id, pending_comment=comment, last_error=None)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+    
+    def queue_timeouts(self, timeouts: List[dict]) -> int:
+        """
+        Queue timeout actions in one executemany
+        
+        Each dict holds b_id, b_due_at and b_action; rows that moved on
+        (different due_at) or already have an action queued are skipped, so
+        several workers firing the same timer queue it once.
+        """
+        if not timeouts:
+            return 0
+        # Core statement on the table: a plain executemany with per-row criteria
+        instances = WorkflowInstance.__table__
+        result = self.db.execute(
+            update(instances)
+            .where(
+                instances.c.id == bindparam("b_id"),
+                instances.c.due_at == bindparam("b_due_at"),
+                instances.c.pending_action.is_(None)
+            )
+            .values(pending_action=bindparam("b_action"), pending_actor_id=None, pending_comment=None),
+            timeouts
+        )
+        self.db.commit()
+        return result.rowcount
+
+class WorkflowHistoryRepository(BaseRepository[WorkflowHistory]):
+    def __init__(self, db: Session):
+        super().__init__(WorkflowHistory, db)
+    
+    def get_by_instance(self, instance_id: int) -> List[WorkflowHistory]:
+        return (
+            self._read_query()
+            .filter(WorkflowHistory.instance_id == instance_id)
+            .order_by(WorkflowHistory.id)
+            .all()
+        )
+    
+    def add_many(self, rows: List[dict]) -> None:
+        """Insert history rows in one executemany, without loading them back"""
+        if rows:
+            self.db.execute(insert(WorkflowHistory), rows)
\ No newline at end of file
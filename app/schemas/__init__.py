@@ -1,15 +1,18 @@
-from .enums import UserRole, UserStatus
+from .enums import UserRole, UserStatus, EmployeeStatus, WorkflowEntityType
 from .user import AdminCreateRequest, AdminUpdateRequest, AdminResponse, UserResponse
-from .token import LoginRequest, TokenResponse, TokenData
+from .token import LoginRequest, RefreshRequest, TokenResponse, TokenData
 
 __all__ = [
     "UserRole",
     "UserStatus",
+    "EmployeeStatus",
+    "WorkflowEntityType",
     "AdminCreateRequest",
     "AdminUpdateRequest",
     "AdminResponse",
     "UserResponse",
     "LoginRequest",
+    "RefreshRequest",
     "TokenResponse",
     "TokenData",
 ]
\ No newline at end of file
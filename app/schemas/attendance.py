@@ -0,0 +1,58 @@
+# Attendance punch requests and responses
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from ..core.config import settings
+from .enums import PunchType
+
+class PunchIn(BaseModel):
+    """One clock-in/out event as recorded by the device"""
+    employee_id: int = Field(..., gt=0)
+    device_id: str = Field(..., min_length=1, max_length=64)
+    punched_at: datetime = Field(..., description="Device time of the punch; without an offset it is taken as UTC")
+    punch_type: Optional[PunchType] = None
+    source: str = Field("device", min_length=1, max_length=20)
+
+    @field_validator("device_id", "source")
+    @classmethod
+    def printable(cls, value: str) -> str:
+        # PostgreSQL text cannot store NUL, and a row it rejects would fail the whole flush
+        if any(ord(char) < 32 or ord(char) == 127 for char in value):
+            raise ValueError("must not contain control characters")
+        return value
+
+    @field_validator("punched_at")
+    @classmethod
+    def to_utc(cls, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+class PunchBatch(BaseModel):
+    """Punches pushed by a device or gateway in one request"""
+    punches: List[PunchIn] = Field(..., min_length=1, max_length=settings.PUNCH_BATCH_MAX_ITEMS)
+
+class RejectedPunch(BaseModel):
+    index: int = Field(..., description="Position of the punch in the request")
+    reason: str
+
+class PunchBatchResponse(BaseModel):
+    """
+    Outcome of a punch batch
+
+    Accepted punches are buffered and written within about a second;
+    resending a punch that was already stored is harmless.
+    """
+    accepted: int
+    rejected: List[RejectedPunch]
+
+class PunchResponse(BaseModel):
+    employee_id: int
+    device_id: str
+    punched_at: datetime
+    punch_type: Optional[PunchType] = None
+    source: str
+    received_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
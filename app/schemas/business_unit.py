@@ -1 +1,25 @@
-# Your existing schemas
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class BusinessUnitBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    parent_id: Optional[int] = Field(None, description="Parent business unit, null for a top-level business unit")
+    head_employee_id: Optional[int] = Field(None, description="Employee heading this business unit")
+    is_active: bool = True
+
+class BusinessUnitCreate(BusinessUnitBase):
+    """Schema for creating a business unit"""
+
+class BusinessUnitUpdate(BusinessUnitBase):
+    """Schema for updating a business unit; a new parent_id moves its whole subtree"""
+
+class BusinessUnitResponse(BusinessUnitBase):
+    """Business unit response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1 +1,64 @@
 # Shared schemas (pagination, filters)
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar
+from typing_extensions import TypedDict
+
+T = TypeVar("T")
+
+class CursorPage(BaseModel, Generic[T]):
+    """Keyset-paginated response envelope"""
+    items: List[T]
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page")
+    has_more: bool = False
+    limit: int
+
+class RowSerializer:
+    """
+    JSON encoder for trusted ORM rows, compiled once per response schema
+    
+    The schema's fields become a TypedDict and its TypeAdapter encodes the
+    rows' loaded column values directly in pydantic-core: no model instances
+    are built and nothing is validated, so the output must come from the
+    database as-is. Produces the same JSON as the schema itself for flat
+    schemas without aliases or custom serializers.
+    """
+    
+    def __init__(self, schema: Type[BaseModel]):
+        if schema.__pydantic_decorators__.field_serializers or schema.__pydantic_decorators__.model_serializers:
+            raise TypeError(f"{schema.__name__} has custom serializers")
+        if any(field.alias or field.serialization_alias for field in schema.model_fields.values()):
+            raise TypeError(f"{schema.__name__} has field aliases")
+        self.fields = tuple(schema.model_fields)
+        row = TypedDict(f"{schema.__name__}Row", {
+            name: field.annotation for name, field in schema.model_fields.items()
+        })
+        page = TypedDict(f"{schema.__name__}RowPage", {
+            name: List[row] if name == "items" else field.annotation
+            for name, field in CursorPage.model_fields.items()
+        })
+        self._row = TypeAdapter(row)
+        self._rows = TypeAdapter(List[row])
+        self._page = TypeAdapter(page)
+    
+    def _values(self, obj: Any) -> Dict[str, Any]:
+        # Loaded attributes live in the instance dict; expired ones go through the ORM
+        state = obj.__dict__
+        try:
+            return {name: state[name] for name in self.fields}
+        except KeyError:
+            return {name: getattr(obj, name) for name in self.fields}
+    
+    def one(self, obj: Any) -> bytes:
+        return self._row.dump_json(self._values(obj))
+    
+    def many(self, objs: Iterable[Any]) -> bytes:
+        return self._rows.dump_json([self._values(obj) for obj in objs])
+    
+    def page(self, objs: Iterable[Any], next_cursor: Optional[str], has_more: bool, limit: int) -> bytes:
+        """A CursorPage of rows"""
+        return self._page.dump_json({
+            "items": [self._values(obj) for obj in objs],
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "limit": limit,
+        })
\ No newline at end of file
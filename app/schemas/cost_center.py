@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class CostCenterBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    parent_id: Optional[int] = Field(None, description="Parent cost center, null for a top-level cost center")
+    is_active: bool = True
+
+class CostCenterCreate(CostCenterBase):
+    """Schema for creating a cost center"""
+
+class CostCenterUpdate(CostCenterBase):
+    """Schema for updating a cost center; a new parent_id moves its whole subtree"""
+
+class CostCenterResponse(CostCenterBase):
+    """Cost center response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class DepartmentBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    parent_id: Optional[int] = Field(None, description="Parent department, null for a top-level department")
+    head_employee_id: Optional[int] = Field(None, description="Employee heading this department")
+    is_active: bool = True
+
+class DepartmentCreate(DepartmentBase):
+    """Schema for creating a department"""
+
+class DepartmentUpdate(DepartmentBase):
+    """Schema for updating a department; a new parent_id moves its whole subtree"""
+
+class DepartmentResponse(DepartmentBase):
+    """Department response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
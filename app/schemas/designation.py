@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class DesignationBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    is_active: bool = True
+
+class DesignationCreate(DesignationBase):
+    """Schema for creating a designation"""
+
+class DesignationUpdate(DesignationBase):
+    """Schema for updating a designation"""
+
+class DesignationResponse(DesignationBase):
+    """Designation response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
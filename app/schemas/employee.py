@@ -0,0 +1,96 @@
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
+from typing import Any, List, Optional
+from datetime import date, datetime
+from .enums import EmployeeStatus
+
+class EmployeeImportRow(BaseModel):
+    """One row of an employee roster import"""
+    employee_code: Optional[str] = Field(None, max_length=50, description="Generated when empty")
+    first_name: str = Field(..., min_length=1, max_length=100)
+    last_name: Optional[str] = Field(None, max_length=100)
+    email: EmailStr
+    phone_number: Optional[str] = Field(None, max_length=50)
+    gender: Optional[str] = Field(None, max_length=20)
+    date_of_birth: Optional[date] = None
+    date_of_joining: date
+    department: Optional[str] = Field(None, description="Department code or name")
+    designation: Optional[str] = Field(None, description="Designation code or name")
+    location: Optional[str] = Field(None, description="Location code or name")
+    status: EmployeeStatus = EmployeeStatus.ACTIVE
+    
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    @field_validator('*', mode='before')
+    @classmethod
+    def normalize_cells(cls, v: Any) -> Any:
+        """Spreadsheet cells: blank means missing, datetimes carry dates"""
+        if isinstance(v, str) and not v.strip():
+            return None
+        if isinstance(v, datetime):
+            return v.date()
+        return v
+    
+    @field_validator('status', mode='before')
+    @classmethod
+    def default_status(cls, v: Any) -> Any:
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return EmployeeStatus.ACTIVE
+        return v.strip().lower() if isinstance(v, str) else v
+
+class ImportRowError(BaseModel):
+    """Validation failure for a single import row"""
+    row: int
+    errors: List[str]
+
+class EmployeeImportJobResponse(BaseModel):
+    """Progress of an employee import job"""
+    id: str
+    filename: str
+    status: str
+    processed_rows: int
+    imported_rows: int
+    failed_rows: int
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
+    detail: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class EmployeeSummary(BaseModel):
+    """Employee listing entry"""
+    id: int
+    employee_code: str
+    first_name: str
+    last_name: Optional[str] = None
+    email: str
+    department_id: Optional[int] = None
+    designation_id: Optional[int] = None
+    location_id: Optional[int] = None
+    business_unit_id: Optional[int] = None
+    cost_center_id: Optional[int] = None
+    status: EmployeeStatus
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class ManagerChainEntry(BaseModel):
+    """Head of one department in an employee's reporting line"""
+    department_id: int
+    department_name: str
+    manager: EmployeeSummary
+
+class EmployeeReminderRequest(BaseModel):
+    """Reminder emailed to every active employee"""
+    subject: str = Field(..., min_length=1, max_length=200)
+    message: str = Field(..., min_length=1, max_length=5000)
+    
+    @field_validator('subject')
+    @classmethod
+    def single_line_subject(cls, v: str) -> str:
+        """The subject becomes a mail header, which cannot span lines"""
+        if '\r' in v or '\n' in v:
+            raise ValueError('Subject must be a single line')
+        return v
+
+class EmployeeReminderResponse(BaseModel):
+    recipients: int
\ No newline at end of file
@@ -8,4 +8,24 @@ class UserRole(str, enum.Enum):
 class UserStatus(str, enum.Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
-    SUSPENDED = "suspended"
\ No newline at end of file
+    SUSPENDED = "suspended"
+
+class EmployeeStatus(str, enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    EXITED = "exited"
+
+class WorkflowEntityType(str, enum.Enum):
+    LEAVE = "leave"
+    EXIT = "exit"
+    HELPDESK = "helpdesk"
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class PunchType(str, enum.Enum):
+    IN = "in"
+    OUT = "out"
\ No newline at end of file
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class ExitReasonBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    is_active: bool = True
+
+class ExitReasonCreate(ExitReasonBase):
+    """Schema for creating a exit reason"""
+
+class ExitReasonUpdate(ExitReasonBase):
+    """Schema for updating a exit reason"""
+
+class ExitReasonResponse(ExitReasonBase):
+    """Exit reason response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class GradeBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    level: Optional[int] = Field(None, ge=0, description="Seniority order, lowest first")
+    is_active: bool = True
+
+class GradeCreate(GradeBase):
+    """Schema for creating a grade"""
+
+class GradeUpdate(GradeBase):
+    """Schema for updating a grade"""
+
+class GradeResponse(GradeBase):
+    """Grade response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
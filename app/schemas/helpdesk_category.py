@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class HelpdeskCategoryBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    is_active: bool = True
+
+class HelpdeskCategoryCreate(HelpdeskCategoryBase):
+    """Schema for creating a helpdesk category"""
+
+class HelpdeskCategoryUpdate(HelpdeskCategoryBase):
+    """Schema for updating a helpdesk category"""
+
+class HelpdeskCategoryResponse(HelpdeskCategoryBase):
+    """Helpdesk category response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
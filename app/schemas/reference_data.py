@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from .designation import DesignationResponse
+from .exit_reason import ExitReasonResponse
+from .grade import GradeResponse
+from .helpdesk_category import HelpdeskCategoryResponse
+from .location import LocationResponse
+from .visit_type import VisitTypeResponse
+
+class ReferenceDataResponse(BaseModel):
+    """Every master data list of the caller's company, inactive entries included"""
+    version: int = Field(..., description="Increases with every master data change")
+    grades: List[GradeResponse]
+    designations: List[DesignationResponse]
+    visit_types: List[VisitTypeResponse]
+    exit_reasons: List[ExitReasonResponse]
+    helpdesk_categories: List[HelpdeskCategoryResponse]
+    locations: List[LocationResponse]
\ No newline at end of file
@@ -0,0 +1,30 @@
+# Shift roster responses
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
+from datetime import date, time
+
+class RosterShift(BaseModel):
+    """Work shift referenced by roster cells"""
+    id: int
+    name: str
+    code: str
+    start_time: time
+    end_time: time
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class EmployeeRoster(BaseModel):
+    """One employee's schedule, one cell per day of the range"""
+    employee_id: int
+    days: List[Optional[int]] = Field(
+        ...,
+        description="Work shift ID, 0 for a week-off/rest day, null when not scheduled or not yet joined"
+    )
+
+class RosterResponse(BaseModel):
+    """Shift roster for a date range"""
+    start_date: date
+    end_date: date
+    total_employees: int
+    shifts: List[RosterShift]
+    items: List[EmployeeRoster]
\ No newline at end of file
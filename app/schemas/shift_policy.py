@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+class ShiftPolicyBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    default_shift_id: Optional[int] = Field(None, description="Shift worked daily by employees without a shift rule")
+    grace_in_minutes: int = Field(0, ge=0, le=720)
+    grace_out_minutes: int = Field(0, ge=0, le=720)
+    half_day_minutes: int = Field(240, ge=0, le=1440)
+    full_day_minutes: int = Field(480, ge=0, le=1440)
+    is_active: bool = True
+
+class ShiftPolicyCreate(ShiftPolicyBase):
+    """Schema for creating a shift policy"""
+
+class ShiftPolicyUpdate(ShiftPolicyBase):
+    """Schema for updating a shift policy"""
+
+class ShiftPolicyResponse(ShiftPolicyBase):
+    """Shift policy response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
+from datetime import date, datetime
+
+class ShiftRuleBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    pattern: List[Optional[int]] = Field(
+        ...,
+        min_length=1,
+        max_length=366,
+        description="Work shift ID per day of the cycle, null for a rest day"
+    )
+    anchor_date: date = Field(..., description="Date on which the first day of the cycle falls")
+    is_active: bool = True
+
+class ShiftRuleCreate(ShiftRuleBase):
+    """Schema for creating a shift rule"""
+
+class ShiftRuleUpdate(ShiftRuleBase):
+    """Schema for updating a shift rule"""
+
+class ShiftRuleResponse(ShiftRuleBase):
+    """Shift rule response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
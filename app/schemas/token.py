@@ -1,4 +1,5 @@
 from pydantic import BaseModel, EmailStr
+from typing import Optional
 from .user import AdminResponse
 
 class LoginRequest(BaseModel):
@@ -17,10 +18,16 @@ class LoginRequest(BaseModel):
         }
     }
 
+class RefreshRequest(BaseModel):
+    """Refresh token rotation request"""
+    refresh_token: str
+
 class TokenResponse(BaseModel):
     """Token response schema"""
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
+    expires_in: Optional[int] = None  # Access token lifetime in seconds
     user: AdminResponse
     
     model_config = {
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
+from .common import RowSerializer
 from .enums import UserRole, UserStatus
 
 class AdminCreateRequest(BaseModel):
@@ -79,4 +80,8 @@ class UserResponse(BaseModel):
     status: UserStatus
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# Precompiled encoders for trusted User rows (see FastJSONResponse)
+admin_serializer = RowSerializer(AdminResponse)
+user_serializer = RowSerializer(UserResponse)
\ No newline at end of file
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Dict, List, Optional
+from datetime import datetime
+
+class WeekoffPolicyBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = Field(None, max_length=500)
+    weekly_off_days: List[int] = Field(
+        default_factory=list,
+        description="Weekdays off every week, 0 = Monday ... 6 = Sunday"
+    )
+    monthly_off_days: Dict[int, List[int]] = Field(
+        default_factory=dict,
+        description='Weekday -> weeks of the month it is off, e.g. {"5": [2, 4]}'
+    )
+    is_active: bool = True
+    
+    @field_validator('weekly_off_days')
+    @classmethod
+    def validate_weekdays(cls, v):
+        if any(day < 0 or day > 6 for day in v):
+            raise ValueError('Weekdays must be between 0 (Monday) and 6 (Sunday)')
+        return sorted(set(v))
+    
+    @field_validator('monthly_off_days')
+    @classmethod
+    def validate_monthly(cls, v):
+        for day, weeks in v.items():
+            if day < 0 or day > 6:
+                raise ValueError('Weekdays must be between 0 (Monday) and 6 (Sunday)')
+            if any(week < 1 or week > 5 for week in weeks):
+                raise ValueError('Weeks of the month must be between 1 and 5')
+        return {day: sorted(set(weeks)) for day, weeks in v.items() if weeks}
+
+class WeekoffPolicyCreate(WeekoffPolicyBase):
+    """Schema for creating a week-off policy"""
+
+class WeekoffPolicyUpdate(WeekoffPolicyBase):
+    """Schema for updating a week-off policy"""
+
+class WeekoffPolicyResponse(WeekoffPolicyBase):
+    """Week-off policy response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
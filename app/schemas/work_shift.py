@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime, time
+
+class WorkShiftBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    code: str = Field(..., min_length=1, max_length=50)
+    start_time: time
+    end_time: time = Field(..., description="Earlier than start_time for overnight shifts")
+    break_minutes: int = Field(0, ge=0, le=720)
+    is_active: bool = True
+
+class WorkShiftCreate(WorkShiftBase):
+    """Schema for creating a work shift"""
+
+class WorkShiftUpdate(WorkShiftBase):
+    """Schema for updating a work shift"""
+
+class WorkShiftResponse(WorkShiftBase):
+    """Work shift response schema"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,80 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
+from datetime import datetime
+from .enums import UserRole, WorkflowEntityType
+
+class WorkflowStateSpec(BaseModel):
+    """State of a workflow definition"""
+    name: str = Field(..., min_length=1, max_length=100)
+    sla_minutes: Optional[int] = Field(None, ge=1, description="Time allowed in this state before on_timeout applies")
+    on_timeout: Optional[str] = Field(None, max_length=100, description="Action applied when the SLA expires")
+    final: bool = False
+
+class WorkflowTransitionSpec(BaseModel):
+    """Transition of a workflow definition"""
+    from_state: str = Field(..., alias="from", max_length=100)
+    action: str = Field(..., min_length=1, max_length=100)
+    to: str = Field(..., max_length=100)
+    roles: List[UserRole] = Field(default_factory=list, description="Roles allowed to act, empty for any")
+    
+    model_config = ConfigDict(populate_by_name=True)
+
+class WorkflowDefinitionUpdate(BaseModel):
+    """Schema for publishing the next version of a workflow"""
+    name: str = Field(..., min_length=1, max_length=255)
+    entity_type: WorkflowEntityType
+    description: Optional[str] = Field(None, max_length=500)
+    initial_state: str = Field(..., max_length=100)
+    states: List[WorkflowStateSpec] = Field(..., min_length=1)
+    transitions: List[WorkflowTransitionSpec]
+
+class WorkflowDefinitionCreate(WorkflowDefinitionUpdate):
+    """Schema for creating a workflow"""
+    code: str = Field(..., min_length=1, max_length=50)
+
+class WorkflowDefinitionResponse(WorkflowDefinitionCreate):
+    """Workflow definition response schema"""
+    id: int
+    version: int
+    is_active: bool
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+class WorkflowStartRequest(BaseModel):
+    """Start a workflow for a request (leave, exit, ticket)"""
+    code: str = Field(..., description="Workflow code; its active version is used")
+    entity_id: int
+
+class WorkflowActionRequest(BaseModel):
+    """Action taken on a workflow instance"""
+    action: str = Field(..., min_length=1, max_length=100)
+    comment: Optional[str] = Field(None, max_length=1000)
+
+class WorkflowHistoryResponse(BaseModel):
+    """Applied transition"""
+    from_state: str
+    to_state: str
+    action: str
+    actor_id: Optional[int] = None
+    comment: Optional[str] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class WorkflowInstanceResponse(BaseModel):
+    """Workflow instance response schema"""
+    id: int
+    definition_id: int
+    entity_type: WorkflowEntityType
+    entity_id: int
+    state: str
+    state_entered_at: datetime
+    is_completed: bool
+    pending_action: Optional[str] = None
+    last_error: Optional[str] = None
+    due_at: Optional[datetime] = None
+    escalation_level: int
+    history: List[WorkflowHistoryResponse] = []
+    
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,18 +1,30 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 
 from ..models.user import User
 from ..schemas.user import AdminCreateRequest, AdminUpdateRequest, AdminResponse
-from ..schemas.enums import UserRole
+from ..schemas.enums import UserRole, UserStatus
 from ..repositories.user_repository import UserRepository
-from ..core.security import get_password_hash
+from ..utils.pagination import CursorPageResult, InvalidCursorError
+from ..core.security import PasswordHasherBusy, password_hasher
+from ..core.cache import invalidate_principal
+from ..core.revocation import token_revocation
+from ..exceptions.http_exceptions import ServiceBusyException
+from .email_service import EmailService
 
 class AdminService:
     def __init__(self, db: Session):
         self.db = db
         self.user_repo = UserRepository(db)
     
+    def _hash_password(self, password: str) -> str:
+        """Hash a password on the shared hashing executor"""
+        try:
+            return password_hasher.hash_blocking(password)
+        except PasswordHasherBusy:
+            raise ServiceBusyException("Password service is busy. Please retry shortly.")
+    
     def create_admin(self, admin_data: AdminCreateRequest, created_by_id: int) -> User:
         """Create a new admin account"""
         # Check if email already exists
@@ -24,11 +36,12 @@ class AdminService:
         
         # Prepare admin data
         admin_dict = admin_data.model_dump(exclude={'password', 'confirm_password'})
-        admin_dict['hashed_password'] = get_password_hash(admin_data.password)
+        admin_dict['hashed_password'] = self._hash_password(admin_data.password)
         admin_dict['role'] = UserRole.ADMIN
         admin_dict['created_by'] = created_by_id
         
-        # Create admin
+        # Create admin; the sign-in email commits with it
+        EmailService(self.db).queue_credentials(admin_data.name, admin_data.email)
         new_admin = self.user_repo.create(admin_dict)
         return new_admin
     
@@ -36,6 +49,16 @@ class AdminService:
         """Get all admin accounts"""
         return self.user_repo.get_by_role(UserRole.ADMIN, skip, limit)
     
+    def get_admins_page(self, limit: int = 50, cursor: Optional[str] = None) -> CursorPageResult:
+        """Get admin accounts with cursor pagination"""
+        try:
+            return self.user_repo.get_page_by_role(UserRole.ADMIN, limit, cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
     def get_admin_by_id(self, admin_id: int) -> User:
         """Get specific admin by ID"""
         admin = self.user_repo.get(admin_id)
@@ -49,6 +72,7 @@ class AdminService:
     def update_admin(self, admin_id: int, admin_data: AdminUpdateRequest) -> User:
         """Update admin account"""
         admin = self.get_admin_by_id(admin_id)
+        previous_email = admin.email
         
         # Check if email is being changed and if it's already taken
         if admin_data.email != admin.email:
@@ -63,13 +87,26 @@ class AdminService:
         
         # Update password only if provided
         if admin_data.password:
-            update_dict['hashed_password'] = get_password_hash(admin_data.password)
+            update_dict['hashed_password'] = self._hash_password(admin_data.password)
         
         # Update admin
         updated_admin = self.user_repo.update(admin, update_dict)
+        
+        # Email, status and password changes must not be served from cache
+        invalidate_principal(previous_email, updated_admin.email)
+        
+        # ...and end existing sessions: tokens are bound to the old email/credentials
+        if (
+            admin_data.password
+            or updated_admin.email != previous_email
+            or updated_admin.status != UserStatus.ACTIVE
+        ):
+            token_revocation.revoke_subject(previous_email)
         return updated_admin
     
     def delete_admin(self, admin_id: int) -> None:
         """Delete admin account"""
         admin = self.get_admin_by_id(admin_id)
-        self.user_repo.delete(admin_id)
\ No newline at end of file
+        self.user_repo.delete(admin_id)
+        invalidate_principal(admin.email)
+        token_revocation.revoke_subject(admin.email)
\ No newline at end of file
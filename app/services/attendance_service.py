@@ -0,0 +1,293 @@
+# Attendance punch ingestion: per-process buffer flushed to the database in bulk
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import threading
+import time
+
+from ..core.config import settings
+from ..core.database import SessionLocal, check_db_connection
+from ..core.metrics import (
+    PUNCHES_INGESTED, PUNCH_BUFFERED, PUNCH_BUFFER_DELAY, PUNCH_FLUSH_DURATION, PUNCH_INGEST_LAG
+)
+from ..core.tenancy import get_tenant
+from ..exceptions.http_exceptions import ServiceBusyException
+from ..models.attendance import AttendancePunch
+from ..repositories.attendance_repository import AttendancePunchRepository, PunchRow, month_start
+from ..repositories.employee_repository import EmployeeRepository
+from ..schemas.attendance import PunchBatch
+
+logger = logging.getLogger(__name__)
+
+_ACCEPTED = PUNCHES_INGESTED.labels("accepted")
+_REJECTED = PUNCHES_INGESTED.labels("rejected")
+_INSERTED = PUNCHES_INGESTED.labels("inserted")
+_DUPLICATE = PUNCHES_INGESTED.labels("duplicate")
+_FAILED = PUNCHES_INGESTED.labels("failed")
+_DEAD_LETTER = PUNCHES_INGESTED.labels("dead_letter")
+
+
+class PunchIngestor:
+    """
+    Buffers accepted punches and writes them in large batches
+
+    Requests only validate and append tuples to the buffer; a flusher
+    thread swaps the buffer out every `flush_interval` seconds (sooner
+    once `flush_rows` are waiting) and writes it with one binary COPY and
+    one deduplicating INSERT. Failed writes are retried, and rows the
+    database keeps refusing are dead-lettered. Punches still buffered
+    when the process dies are lost, so devices keep punches until the
+    API accepted them and may resend freely: the (employee, device,
+    punched_at) key drops repeats.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float,
+        flush_rows: int,
+        max_rows: int,
+        max_attempts: int,
+        partition_months_ahead: int
+    ):
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
+        self.max_rows = max_rows
+        self.max_attempts = max_attempts
+        self.partition_months_ahead = partition_months_ahead
+        self._rows: List[PunchRow] = []
+        self._accepted_at: List[float] = []  # Monotonic time of each submitted batch
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._partitioned_through: Optional[date] = None
+        self._failed_attempts = 0
+        self.flushes = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.failures = 0
+        self.dead_lettered = 0
+
+    def submit(self, rows: List[PunchRow]) -> None:
+        """Buffer validated punch rows; 503 when the buffer is full"""
+        with self._lock:
+            if len(self._rows) + len(rows) > self.max_rows:
+                raise ServiceBusyException("Punch buffer is full. Please retry shortly.")
+            self._rows.extend(rows)
+            self._accepted_at.append(time.monotonic())
+            buffered = len(self._rows)
+        PUNCH_BUFFERED.set(buffered)
+        _ACCEPTED.inc(len(rows))
+        if buffered >= self.flush_rows:
+            self._wake.set()
+
+    def ensure_partitions(self, db: Session, today: date) -> None:
+        """Create this month's and the next months' partitions once per month"""
+        current = month_start(today)
+        if self._partitioned_through == current:
+            return
+        AttendancePunchRepository(db).ensure_partitions(current, self.partition_months_ahead + 1)
+        self._partitioned_through = current
+
+    def _write(self, rows: List[PunchRow], now: datetime) -> int:
+        db = SessionLocal()
+        try:
+            self.ensure_partitions(db, now.date())
+            inserted = AttendancePunchRepository(db).write(rows)
+            db.commit()
+            return inserted
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _dead_letter(self, rows: List[PunchRow], error: Exception) -> None:
+        db = SessionLocal()
+        try:
+            AttendancePunchRepository(db).write_rejects(rows, str(error))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        logger.error(f"Dead-lettered {len(rows)} attendance punch(es) the database refused: {error}")
+
+    def _write_isolating(self, rows: List[PunchRow], now: datetime) -> Tuple[int, int]:
+        """
+        Write rows in halves until the failing ones are isolated
+
+        Returns (inserted, dead-lettered). Rows already committed when a
+        later half raises are sent again on retry; the dedup key drops them.
+        """
+        try:
+            return self._write(rows, now), 0
+        except Exception as e:
+            if len(rows) == 1:
+                self._dead_letter(rows, e)
+                return 0, 1
+        middle = len(rows) // 2
+        first = self._write_isolating(rows[:middle], now)
+        second = self._write_isolating(rows[middle:], now)
+        return first[0] + second[0], first[1] + second[1]
+
+    def flush(self) -> int:
+        """
+        Write everything buffered so far; returns the number of new rows
+
+        A failed write puts the rows back in front of the buffer. After
+        `max_attempts` failures in a row, while the database is reachable,
+        the batch is split until the rows it refuses are isolated; those
+        go to the dead-letter table so they cannot stall ingestion.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+                accepted_at, self._accepted_at = self._accepted_at, []
+            if not rows:
+                return 0
+
+            started = time.perf_counter()
+            now = datetime.now(timezone.utc)
+            try:
+                if self._failed_attempts >= self.max_attempts and check_db_connection():
+                    inserted, rejected = self._write_isolating(rows, now)
+                else:
+                    inserted, rejected = self._write(rows, now), 0
+            except Exception:
+                with self._lock:
+                    self._rows[:0] = rows
+                    self._accepted_at[:0] = accepted_at
+                self._failed_attempts += 1
+                self.failures += 1
+                _FAILED.inc(len(rows))
+                logger.exception(f"Writing {len(rows)} attendance punches failed; kept for the next flush")
+                return 0
+            finally:
+                PUNCH_BUFFERED.set(len(self._rows))
+            self._failed_attempts = 0
+
+            PUNCH_FLUSH_DURATION.observe(time.perf_counter() - started)
+            committed = time.monotonic()
+            PUNCH_BUFFER_DELAY.observe_many([committed - accepted for accepted in accepted_at])
+            PUNCH_INGEST_LAG.observe_many([(now - row[2]).total_seconds() for row in rows])
+            duplicates = len(rows) - inserted - rejected
+            self.flushes += 1
+            self.inserted += inserted
+            self.duplicates += duplicates
+            self.dead_lettered += rejected
+            _INSERTED.inc(inserted)
+            _DUPLICATE.inc(duplicates)
+            _DEAD_LETTER.inc(rejected)
+            return inserted
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        try:
+            with SessionLocal() as db:
+                self.ensure_partitions(db, datetime.now(timezone.utc).date())
+        except Exception:
+            logger.exception("Creating attendance punch partitions failed; retrying on the first flush")
+        self._thread = threading.Thread(target=self._loop, name="punch-ingestor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._rows),
+            "flushes": self.flushes,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "failed_flushes": self.failures,
+            "dead_lettered": self.dead_lettered,
+        }
+
+
+punch_ingestor = PunchIngestor(
+    flush_interval=settings.PUNCH_FLUSH_INTERVAL,
+    flush_rows=settings.PUNCH_FLUSH_ROWS,
+    max_rows=settings.PUNCH_BUFFER_MAX_ROWS,
+    max_attempts=settings.PUNCH_FLUSH_MAX_ATTEMPTS,
+    partition_months_ahead=settings.PUNCH_PARTITION_MONTHS_AHEAD
+)
+
+
+class AttendanceService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.punch_repo = AttendancePunchRepository(db)
+        self.employee_repo = EmployeeRepository(db)
+
+    def ingest(self, batch: PunchBatch) -> dict:
+        """
+        Validate a punch batch and hand the valid punches to the ingestor
+
+        Punches of employees outside the caller's company and punches
+        dated further ahead than the allowed clock skew are rejected one
+        by one; the rest of the batch is still accepted.
+        """
+        tenant_id = get_tenant(self.db)
+        if tenant_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Punches must be pushed by a company account"
+            )
+
+        known = self.employee_repo.existing_ids({punch.employee_id for punch in batch.punches})
+        received_at = datetime.now(timezone.utc)
+        latest = received_at + timedelta(seconds=settings.PUNCH_MAX_CLOCK_SKEW_SECONDS)
+        rows: List[PunchRow] = []
+        rejected: List[dict] = []
+        for index, punch in enumerate(batch.punches):
+            if punch.employee_id not in known:
+                rejected.append({"index": index, "reason": f"Employee {punch.employee_id} not found"})
+            elif punch.punched_at > latest:
+                rejected.append({"index": index, "reason": "Punch time is in the future"})
+            else:
+                rows.append((
+                    punch.employee_id,
+                    punch.device_id,
+                    punch.punched_at,
+                    punch.punch_type.value if punch.punch_type else None,
+                    punch.source,
+                    received_at,
+                    tenant_id,
+                ))
+        # Release the connection before touching the buffer
+        self.db.rollback()
+
+        if rows:
+            punch_ingestor.submit(rows)
+        _REJECTED.inc(len(rejected))
+        return {"accepted": len(rows), "rejected": rejected}
+
+    def list_punches(
+        self,
+        start: datetime,
+        end: datetime,
+        employee_id: Optional[int] = None,
+        limit: int = 1000
+    ) -> List[AttendancePunch]:
+        if end <= start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end must be after start"
+            )
+        return self.punch_repo.get_punches(start, end, employee_id, limit)
\ No newline at end of file
@@ -1,34 +1,46 @@
 # Authentication logic
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import timedelta
 
 from ..models.user import User
 from ..schemas.user import AdminResponse
 from ..schemas.token import LoginRequest, TokenResponse
-from ..schemas.enums import UserStatus
-from ..repositories.user_repository import UserRepository
-from ..core.security import verify_password, create_access_token
+from ..schemas.enums import UserRole, UserStatus
+from ..repositories.user_repository import AsyncUserRepository
+from ..core.revocation import token_revocation
+from ..core.security import (
+    PasswordHasherBusy, password_hasher, create_access_token, create_refresh_token,
+    decode_refresh_token, new_token_family
+)
 from ..core.config import settings
+from ..exceptions.http_exceptions import ServiceBusyException
+import logging
+
+logger = logging.getLogger(__name__)
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
-        self.user_repo = UserRepository(db)
+        self.user_repo = AsyncUserRepository(db)
     
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password"""
-        user = self.user_repo.get_by_email(email)
+        user = await self.user_repo.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        try:
+            verified = await password_hasher.verify(password, user.hashed_password)
+        except PasswordHasherBusy:
+            raise ServiceBusyException("Too many concurrent logins. Please retry shortly.")
+        if not verified:
             return None
         return user
     
-    def login(self, login_data: LoginRequest) -> TokenResponse:
+    async def login(self, login_data: LoginRequest) -> TokenResponse:
         """Login user and return access token"""
-        user = self.authenticate_user(login_data.email, login_data.password)
+        user = await self.authenticate_user(login_data.email, login_data.password)
         
         if not user:
             raise HTTPException(
@@ -43,12 +55,66 @@ class AuthService:
                 detail=f"Account is {user.status.value}. Please contact administrator."
             )
         
-        access_token = create_access_token(
-            data={"sub": user.email, "role": user.role.value}
-        )
-        
+        return self._issue_tokens(user, new_token_family())
+    
+    def _issue_tokens(self, user: User, family: str) -> TokenResponse:
+        """Access + refresh token pair for one login session (token family)"""
+        claims = {
+            "sub": user.email,
+            "uid": user.id,
+            "role": user.role.value,
+            "status": user.status.value,
+            "fam": family,
+        }
+        if user.role == UserRole.ADMIN:
+            claims["tid"] = user.id
+        elif user.role == UserRole.USER and user.created_by is not None:
+            claims["tid"] = user.created_by
         return TokenResponse(
-            access_token=access_token,
+            access_token=create_access_token(claims),
+            refresh_token=create_refresh_token(claims),
             token_type="bearer",
+            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
             user=AdminResponse.from_orm(user)
-        )
\ No newline at end of file
+        )
+    
+    async def refresh(self, refresh_token: str) -> TokenResponse:
+        """
+        Rotate a refresh token
+        
+        Each refresh token is single use. Presenting one that was already
+        rotated means it leaked, so the whole login session is revoked.
+        """
+        invalid = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        claims = decode_refresh_token(refresh_token)
+        if claims is None or not claims.get("jti"):
+            raise invalid
+        
+        if token_revocation.denylist.is_jti_revoked(claims["jti"], claims["exp"]):
+            logger.warning(f"Refresh token reuse detected for {claims.get('sub')}, revoking session")
+            token_revocation.revoke_family(claims.get("fam"))
+            raise invalid
+        if token_revocation.is_revoked(claims):
+            raise invalid
+        
+        user = await self.user_repo.get_by_email(claims.get("sub"))
+        if not user:
+            raise invalid
+        if user.status != UserStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Account is {user.status.value}. Please contact administrator."
+            )
+        
+        token_revocation.revoke_token(claims)
+        return self._issue_tokens(user, claims.get("fam") or new_token_family())
+    
+    @staticmethod
+    def logout(claims: Dict[str, Any]) -> None:
+        """Revoke the presented access token and every token of its login session"""
+        token_revocation.revoke_token(claims)
+        token_revocation.revoke_family(claims.get("fam"))
\ No newline at end of file
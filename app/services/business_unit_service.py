@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.business_unit_repository import BusinessUnitRepository
+from .hierarchy_service import HierarchyService
+
+class BusinessUnitService(HierarchyService):
+    label = "business unit"
+    employee_field = "business_unit_id"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, BusinessUnitRepository(db))
\ No newline at end of file
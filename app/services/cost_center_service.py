@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.cost_center_repository import CostCenterRepository
+from .hierarchy_service import HierarchyService
+
+class CostCenterService(HierarchyService):
+    label = "cost center"
+    employee_field = "cost_center_id"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, CostCenterRepository(db))
\ No newline at end of file
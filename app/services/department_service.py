@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List
+
+from ..repositories.department_repository import DepartmentRepository
+from .hierarchy_service import HierarchyService
+
+class DepartmentService(HierarchyService):
+    label = "department"
+    employee_field = "department_id"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, DepartmentRepository(db))
+    
+    def get_manager_chain(self, employee_id: int) -> List[dict]:
+        """
+        Heads of the employee's department and of every department above it,
+        nearest first; the employee is left out of their own chain
+        """
+        employee = self.employee_repo.get(employee_id)
+        if not employee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Employee not found"
+            )
+        if employee.department_id is None:
+            return []
+        return [
+            {"department_id": department.id, "department_name": department.name, "manager": head}
+            for department, head in self.repo.get_manager_chain(employee.department_id)
+            if head.id != employee.id
+        ]
\ No newline at end of file
@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.designation_repository import DesignationRepository
+from .master_data_service import MasterDataService
+
+class DesignationService(MasterDataService):
+    label = "designation"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, DesignationRepository(db))
\ No newline at end of file
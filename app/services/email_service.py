@@ -1 +1,493 @@
-# Email notifications
+# Transactional email: outbox on the job queue, pooled SMTP delivery
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from email.message import Message
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr, make_msgid, parseaddr
+from pathlib import Path
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import html
+import logging
+import queue
+import smtplib
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.events import JobBatchError, JobWorker, job_queue
+from ..core.metrics import EMAILS_SENT, SMTP_CONNECTIONS_OPENED
+from ..models.employee import Employee
+from ..schemas.enums import EmployeeStatus
+
+logger = logging.getLogger(__name__)
+
+EMAIL_QUEUE = "email"
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+# Rows fetched per query when fanning a reminder out to a whole company
+REMINDER_CHUNK_SIZE = 1000
+
+# Delivery order when the outbox is backed up: account mail before bulk reminders
+PRIORITY_CREDENTIALS = 10
+PRIORITY_APPROVAL = 5
+PRIORITY_WELCOME = 0
+PRIORITY_REMINDER = -10
+
+# Built once: the email package's header parsing costs more than the SMTP exchange
+FROM_HEADER = formataddr(parseaddr(settings.EMAIL_FROM), "utf-8")
+# Message-ID domain; make_msgid() would otherwise resolve the host name for every message
+MESSAGE_ID_DOMAIN = parseaddr(settings.EMAIL_FROM)[1].rpartition("@")[2] or "localhost"
+
+_sent = EMAILS_SENT.labels("sent")
+_retried = EMAILS_SENT.labels("retried")
+_rejected = EMAILS_SENT.labels("rejected")
+
+
+class CompiledTemplate:
+    """
+    A str.format style template parsed once into literal and field parts
+
+    Rendering is a join over the parts; fields in HTML templates are
+    escaped. A field missing from the context raises KeyError.
+    """
+
+    def __init__(self, source: str, escape: bool = False):
+        self.escape = escape
+        self._parts: List[Tuple[str, Optional[str], str, Optional[str]]] = [
+            (literal, field, spec or "", conversion)
+            for literal, field, spec, conversion in Formatter().parse(source)
+        ]
+
+    def render(self, context: Dict[str, Any]) -> str:
+        out = []
+        for literal, field, spec, conversion in self._parts:
+            out.append(literal)
+            if field is None:
+                continue
+            value = context[field]
+            if conversion == "r":
+                value = repr(value)
+            value = format(value, spec) if spec else str(value)
+            out.append(html.escape(value) if self.escape else value)
+        return "".join(out)
+
+
+class EmailTemplate:
+    """
+    Subject, text and optional HTML body of one email
+
+    Loaded from TEMPLATE_DIR: <name>.txt starts with a "Subject: ..."
+    line, <name>.html is the optional HTML alternative.
+    """
+
+    def __init__(self, name: str, directory: Path):
+        subject, _, text = (directory / f"{name}.txt").read_text(encoding="utf-8").partition("\n")
+        if not subject.startswith("Subject:"):
+            raise ValueError(f"Email template '{name}' must start with a 'Subject:' line")
+        self.subject = CompiledTemplate(subject[len("Subject:"):].strip())
+        self.text = CompiledTemplate(text)
+        html_path = directory / f"{name}.html"
+        self.html = CompiledTemplate(html_path.read_text(encoding="utf-8"), escape=True) if html_path.exists() else None
+
+
+class EmailTemplates:
+    """Templates compiled on first use and kept for the life of the process"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._compiled: Dict[str, EmailTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> EmailTemplate:
+        template = self._compiled.get(name)
+        if template is None:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid email template name '{name}'")
+            with self._lock:
+                template = self._compiled.get(name)
+                if template is None:
+                    template = self._compiled[name] = EmailTemplate(name, self.directory)
+        return template
+
+    def build(self, name: str, to: str, context: Dict[str, Any], message_id: Optional[str] = None) -> Message:
+        """Render a template into a ready-to-send message"""
+        template = self.get(name)
+        text = _text_part(template.text.render(context), "plain")
+        if template.html is None:
+            message = text
+        else:
+            message = MIMEMultipart("alternative")
+            message.attach(text)
+            message.attach(_text_part(template.html.render(context), "html"))
+        subject = template.subject.render(context)
+        if "\r" in subject or "\n" in subject:
+            # A line break would end the header and let the rest inject new ones
+            raise ValueError("Email subject must be a single line")
+        message["From"] = FROM_HEADER
+        message["To"] = to
+        message["Subject"] = subject if subject.isascii() else Header(subject, "utf-8")
+        message["Message-ID"] = message_id or make_msgid(domain=MESSAGE_ID_DOMAIN)
+        return message
+
+
+def _text_part(body: str, subtype: str) -> MIMEText:
+    return MIMEText(body, subtype, "us-ascii" if body.isascii() else "utf-8")
+
+
+class _PooledConnection:
+    __slots__ = ("smtp", "messages", "last_used")
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.messages = 0
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Persistent SMTP sessions shared by the sender threads
+
+    At most `size` connections are open at once. A released connection is
+    kept for the next message until it has carried max_messages; one that
+    sat idle longer than idle_check_seconds must answer a NOOP before it is
+    reused.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        starttls: bool,
+        timeout: float,
+        size: int,
+        max_messages: int,
+        idle_check_seconds: float
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.size = size
+        self.max_messages = max_messages
+        self.idle_check_seconds = idle_check_seconds
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.opened = 0
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+        except Exception:
+            smtp.close()
+            raise
+        self.opened += 1
+        SMTP_CONNECTIONS_OPENED.inc()
+        return _PooledConnection(smtp)
+
+    @staticmethod
+    def _discard(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+
+    def acquire(self) -> _PooledConnection:
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if time.monotonic() - connection.last_used < self.idle_check_seconds:
+                    return connection
+                try:
+                    if connection.smtp.noop()[0] == 250:
+                        return connection
+                except smtplib.SMTPException:
+                    pass
+                connection.smtp.close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, connection: _PooledConnection, reusable: bool = True) -> None:
+        try:
+            if reusable and connection.messages < self.max_messages:
+                connection.last_used = time.monotonic()
+                self._idle.put(connection)
+            elif reusable:
+                self._discard(connection)
+            else:
+                connection.smtp.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+class EmailSender:
+    """
+    Delivers a batch of messages over the connection pool
+
+    One thread per pooled connection sends in parallel, and at most
+    max_per_domain messages to the same recipient domain are in flight at
+    once, so a large batch for one provider cannot trip its throttling or
+    starve the other domains. Messages are interleaved across domains
+    before they are handed to the threads.
+    """
+
+    def __init__(self, pool: SMTPConnectionPool, max_per_domain: int):
+        self.pool = pool
+        self.max_per_domain = max_per_domain
+        self._domains: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _domain_slot(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._domains.get(domain)
+            if slot is None:
+                slot = self._domains[domain] = threading.BoundedSemaphore(self.max_per_domain)
+            return slot
+
+    def _executor_for_batch(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool.size, thread_name_prefix="smtp")
+            return self._executor
+
+    def _send(self, message: Message, domain: str) -> Optional[Tuple[str, bool]]:
+        """Send one message; returns (error, retry) when it was not accepted"""
+        with self._domain_slot(domain):
+            try:
+                connection = self.pool.acquire()
+            except (OSError, smtplib.SMTPException) as e:
+                return f"SMTP connection failed: {e}", True
+            reusable = True
+            try:
+                connection.smtp.send_message(message)
+                connection.messages += 1
+                return None
+            except smtplib.SMTPRecipientsRefused as e:
+                code, reply = next(iter(e.recipients.values()))
+                return f"Recipient refused: {code} {reply.decode(errors='replace')}", code < 500
+            except smtplib.SMTPResponseException as e:
+                return f"SMTP error: {e.smtp_code} {e.smtp_error.decode(errors='replace')}", e.smtp_code < 500
+            except (OSError, smtplib.SMTPException) as e:
+                reusable = False
+                return f"SMTP connection lost: {e}", True
+            except Exception as e:
+                # The message itself cannot be sent (e.g. a malformed header); the
+                # session may be mid-transaction, so the connection is dropped too
+                reusable = False
+                return f"Cannot send email: {type(e).__name__}: {e}", False
+            finally:
+                self.pool.release(connection, reusable)
+
+    def send_many(self, messages: List[Tuple[int, Message]]) -> Dict[int, Tuple[str, bool]]:
+        """Send keyed messages; returns {key: (error, retry)} for the ones not accepted"""
+        by_domain: Dict[str, deque] = defaultdict(deque)
+        for key, message in messages:
+            by_domain[parseaddr(message["To"])[1].rpartition("@")[2].lower()].append((key, message))
+        interleaved = []
+        while by_domain:
+            for domain in list(by_domain):
+                interleaved.append((domain, *by_domain[domain].popleft()))
+                if not by_domain[domain]:
+                    del by_domain[domain]
+
+        executor = self._executor_for_batch()
+        futures = [(key, executor.submit(self._send, message, domain)) for domain, key, message in interleaved]
+        failures = {}
+        for key, future in futures:
+            result = future.result()
+            if result is None:
+                _sent.inc()
+            else:
+                failures[key] = result
+                (_retried if result[1] else _rejected).inc()
+        return failures
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.pool.size,
+            "idle_connections": self.pool._idle.qsize(),
+            "connections_opened": self.pool.opened,
+            "domains": len(self._domains),
+        }
+
+
+email_templates = EmailTemplates(TEMPLATE_DIR)
+
+email_sender = EmailSender(
+    SMTPConnectionPool(
+        host=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USERNAME,
+        password=settings.SMTP_PASSWORD,
+        starttls=settings.SMTP_STARTTLS,
+        timeout=settings.SMTP_TIMEOUT,
+        size=settings.SMTP_POOL_SIZE,
+        max_messages=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        idle_check_seconds=settings.SMTP_IDLE_CHECK_SECONDS
+    ),
+    max_per_domain=settings.EMAIL_MAX_PER_DOMAIN
+)
+
+# Drains the email queue with its own batch size, next to the general job worker
+email_worker = JobWorker(
+    job_queue,
+    threads=settings.EMAIL_SENDER_THREADS,
+    batch_size=settings.EMAIL_BATCH_SIZE,
+    poll_interval=settings.JOB_POLL_INTERVAL,
+    queues=[EMAIL_QUEUE],
+    lock_timeout_seconds=settings.JOB_LOCK_TIMEOUT_SECONDS,
+    retention_hours=settings.JOB_RETENTION_HOURS,
+    housekeeping=False
+)
+
+
+def _payload(to: str, template: str, context: Dict[str, Any]) -> dict:
+    # The Message-ID is fixed at enqueue time, so a retried delivery can be recognised
+    return {"to": to, "template": template, "context": context, "message_id": make_msgid(domain=MESSAGE_ID_DOMAIN)}
+
+
+def queue_email(db: Session, to: str, template: str, context: Dict[str, Any], priority: int = 0) -> None:
+    """Add a message to the outbox; it is sent once the caller's transaction commits"""
+    job_queue.enqueue(db, "email.send", _payload(to, template, context), priority=priority)
+
+
+def queue_emails(
+    db: Session,
+    template: str,
+    recipients: Iterable[Tuple[str, Dict[str, Any]]],
+    priority: int = 0
+) -> int:
+    """Add one message per (address, context) with a single INSERT; returns the count"""
+    payloads = [_payload(to, template, context) for to, context in recipients]
+    job_queue.enqueue_many(db, "email.send", payloads, priority=priority)
+    return len(payloads)
+
+
+@job_queue.task("email.send", queue=EMAIL_QUEUE, batch=True)
+def send_outbox_batch(db: Session, payloads: List[dict]) -> None:
+    """Render and send a batch of outbox messages"""
+    failures: Dict[int, str] = {}
+    permanent = set()
+    messages = []
+    for position, payload in enumerate(payloads):
+        try:
+            messages.append((
+                position,
+                email_templates.build(payload["template"], payload["to"], payload["context"], payload.get("message_id"))
+            ))
+        except Exception as e:
+            # Broken template or context: retrying cannot help
+            failures[position] = f"Cannot render email: {type(e).__name__}: {e}"
+            permanent.add(position)
+
+    for position, (error, retry) in email_sender.send_many(messages).items():
+        failures[position] = error
+        if not retry:
+            permanent.add(position)
+    if failures:
+        raise JobBatchError(failures, permanent)
+
+
+@job_queue.task("email.reminder")
+def fan_out_reminder(db: Session, payload: dict) -> None:
+    """Queue a reminder for every active employee of the job's company"""
+    context = {"subject": payload["subject"], "message": payload["message"]}
+    last_id = 0
+    total = 0
+    while True:
+        rows = (
+            db.query(Employee.id, Employee.first_name, Employee.email)
+            .filter(Employee.status == EmployeeStatus.ACTIVE, Employee.id > last_id)
+            .order_by(Employee.id)
+            .limit(REMINDER_CHUNK_SIZE)
+            .all()
+        )
+        if not rows:
+            break
+        total += queue_emails(
+            db,
+            "reminder",
+            ((email, {**context, "first_name": first_name}) for _, first_name, email in rows),
+            priority=PRIORITY_REMINDER
+        )
+        last_id = rows[-1][0]
+    logger.info(f"Queued {total} reminder emails")
+
+
+class EmailService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def queue_credentials(self, name: str, email: str) -> None:
+        """Sign-in details for a new admin account (the password is never emailed)"""
+        queue_email(
+            self.db,
+            email,
+            "credentials",
+            {"name": name, "email": email, "login_url": settings.EMAIL_LOGIN_URL, "app_name": settings.APP_NAME},
+            priority=PRIORITY_CREDENTIALS
+        )
+
+    def queue_welcome(self, employees: Iterable[Dict[str, Any]]) -> int:
+        """Welcome emails for newly created employee records"""
+        return queue_emails(
+            self.db,
+            "welcome",
+            (
+                (employee["email"], {
+                    "first_name": employee["first_name"],
+                    "employee_code": employee["employee_code"],
+                    "email": employee["email"],
+                    "login_url": settings.EMAIL_LOGIN_URL,
+                })
+                for employee in employees
+            ),
+            priority=PRIORITY_WELCOME
+        )
+
+    def queue_approval(self, name: str, email: str, context: Dict[str, Any]) -> None:
+        """Outcome of a workflow request, for the person who raised it"""
+        queue_email(self.db, email, "approval", {**context, "name": name}, priority=PRIORITY_APPROVAL)
+
+    def queue_reminder(self, subject: str, message: str) -> int:
+        """
+        Remind every active employee of the caller's company
+
+        Only one job is written here; it fans out into individual emails
+        in the background. Returns the number of recipients at this moment.
+        """
+        job_queue.enqueue(self.db, "email.reminder", {"subject": subject, "message": message})
+        self.db.commit()
+        return self.db.query(Employee.id).filter(Employee.status == EmployeeStatus.ACTIVE).count()
\ No newline at end of file
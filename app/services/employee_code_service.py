@@ -0,0 +1,53 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from ..core.config import settings
+from ..core.database import get_db_context
+from ..models.employee_code_config import EmployeeCodeConfig
+from ..repositories.employee_code_repository import EmployeeCodeRepository
+from ..utils.code_generator import NumberBlockAllocator, format_employee_code
+
+
+def _reserve_block(config_id: int, count: int) -> int:
+    """
+    Claim a block of sequence numbers in a transaction of its own
+
+    The row lock is held only for this UPDATE and the block is committed
+    before any code is handed out, so concurrent imports never wait on each
+    other's batches, and a rolled-back batch leaves a gap instead of a
+    duplicate.
+    """
+    with get_db_context() as db:
+        return EmployeeCodeRepository(db).reserve_numbers(config_id, count)
+
+
+employee_code_allocator = NumberBlockAllocator(_reserve_block, settings.EMPLOYEE_CODE_BLOCK_SIZE)
+
+
+class EmployeeCodeService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.code_repo = EmployeeCodeRepository(db)
+    
+    def get_config(self) -> EmployeeCodeConfig:
+        """Get the active code configuration, creating the default one if missing"""
+        config = self.code_repo.get_active()
+        if config is None:
+            config = self.code_repo.create({"prefix": "EMP", "padding": 5, "next_number": 1})
+        return config
+    
+    def allocate_codes(self, count: int) -> List[str]:
+        """
+        Allocate `count` unique employee codes, ascending
+        
+        Numbers come from this worker's in-memory block; the sequence row is
+        only updated when the block runs out. Codes are unique across
+        workers but not gap-free.
+        """
+        if count <= 0:
+            return []
+        config = self.get_config()
+        return [
+            format_employee_code(config.prefix, number, config.padding, config.suffix)
+            for number in employee_code_allocator.take(config.id, count)
+        ]
\ No newline at end of file
@@ -0,0 +1,262 @@
+# Bulk employee roster import
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import ValidationError
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import threading
+import uuid
+
+from ..core.config import settings
+from ..core.database import get_db_context
+from ..core.tenancy import set_tenant
+from ..schemas.employee import EmployeeImportRow
+from ..repositories.department_repository import DepartmentRepository
+from ..repositories.designation_repository import DesignationRepository
+from ..repositories.location_repository import LocationRepository
+from ..repositories.employee_repository import EmployeeRepository
+from .email_service import EmailService
+from .employee_code_service import EmployeeCodeService
+from .roster_service import roster_engine
+from ..utils.helpers import chunked
+from ..utils.import_readers import ImportFileError, iter_import_rows
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_FIELDS = ("department", "designation", "location")
+
+
+class ImportJob:
+    """Progress and errors of one import, shared with the status endpoint"""
+
+    def __init__(self, filename: str, created_by: Optional[int] = None, tenant_id: Optional[int] = None):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.created_by = created_by
+        self.tenant_id = tenant_id
+        self.status = "queued"
+        self.processed_rows = 0
+        self.imported_rows = 0
+        self.failed_rows = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.errors_truncated = False
+        self.detail: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def add_error(self, row: int, errors: List[str]) -> None:
+        self.failed_rows += 1
+        if len(self.errors) < settings.EMPLOYEE_IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "errors": errors})
+        else:
+            self.errors_truncated = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "processed_rows": self.processed_rows,
+            "imported_rows": self.imported_rows,
+            "failed_rows": self.failed_rows,
+            "errors": list(self.errors),
+            "errors_truncated": self.errors_truncated,
+            "detail": self.detail,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ImportJobRegistry:
+    """
+    In-process registry of recent import jobs
+
+    Jobs live in the worker that accepted the upload; finished jobs are
+    dropped oldest-first once the registry is full.
+    """
+
+    def __init__(self, max_jobs: int = 200):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job: ImportJob) -> ImportJob:
+        with self._lock:
+            self._jobs[job.id] = job
+            for job_id in [key for key, value in self._jobs.items() if value.finished]:
+                if len(self._jobs) <= self.max_jobs:
+                    break
+                del self._jobs[job_id]
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+import_jobs = ImportJobRegistry()
+
+
+class EmployeeImportService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.employee_repo = EmployeeRepository(db)
+        self.code_service = EmployeeCodeService(db)
+        self.email_service = EmailService(db)
+        self.lookup_repos = {
+            "department": DepartmentRepository(db),
+            "designation": DesignationRepository(db),
+            "location": LocationRepository(db),
+        }
+    
+    def run(self, job: ImportJob, path: Path) -> ImportJob:
+        """
+        Import every row of the file in batches
+        
+        Rows are streamed from disk, validated and resolved in memory, and
+        each batch is written with one bulk INSERT and committed, so memory
+        stays flat and progress is visible while the job runs.
+        """
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        try:
+            # Reference lookups are built once per job, not per row
+            lookups = {field: repo.get_lookup_map("code", "name") for field, repo in self.lookup_repos.items()}
+            seen_emails: set = set()
+            seen_codes: set = set()
+            
+            rows = iter_import_rows(path, job.filename)
+            for batch in chunked(rows, settings.EMPLOYEE_IMPORT_BATCH_SIZE):
+                self._import_batch(job, batch, lookups, seen_emails, seen_codes)
+            
+            job.status = "completed"
+        except ImportFileError as e:
+            job.status = "failed"
+            job.detail = str(e)
+        except Exception as e:
+            logger.exception(f"Employee import {job.id} failed")
+            job.status = "failed"
+            job.detail = f"Import failed: {str(e)}"
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            if job.imported_rows:
+                roster_engine.invalidate(job.tenant_id)
+        
+        logger.info(
+            f"Employee import {job.id} {job.status}: {job.imported_rows} imported, "
+            f"{job.failed_rows} failed of {job.processed_rows} rows"
+        )
+        return job
+    
+    def _validate_row(
+        self,
+        raw: Dict[str, Any],
+        lookups: Dict[str, Dict[str, int]]
+    ) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Validate one row and resolve its references; returns (record, errors)"""
+        try:
+            row = EmployeeImportRow.model_validate(raw)
+        except ValidationError as e:
+            return None, [f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()]
+        
+        record = row.model_dump(exclude=set(REFERENCE_FIELDS))
+        record["email"] = row.email.lower()
+        errors = []
+        for field in REFERENCE_FIELDS:
+            value = getattr(row, field)
+            ref_id = None
+            if value is not None:
+                ref_id = lookups[field].get(value.lower())
+                if ref_id is None:
+                    errors.append(f"{field}: unknown {field} '{value}'")
+            record[f"{field}_id"] = ref_id
+        return record, errors
+    
+    def _allocate_free_codes(self, count: int, seen_codes: set) -> List[str]:
+        """
+        Generated employee codes not used by the file or the database
+        
+        Explicit codes may sit ahead of the sequence, so a generated code
+        can already be taken; those numbers are skipped and new ones drawn.
+        """
+        codes: List[str] = []
+        while len(codes) < count:
+            generated = self.code_service.allocate_codes(count - len(codes))
+            taken = self.employee_repo.existing_codes(generated)
+            codes.extend(code for code in generated if code not in taken and code not in seen_codes)
+        return codes
+    
+    def _import_batch(
+        self,
+        job: ImportJob,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        lookups: Dict[str, Dict[str, int]],
+        seen_emails: set,
+        seen_codes: set
+    ) -> None:
+        candidates: List[Tuple[int, Dict[str, Any]]] = []
+        for row_number, raw in batch:
+            record, errors = self._validate_row(raw, lookups)
+            if record is not None:
+                if record["email"] in seen_emails:
+                    errors.append("email: duplicate email in file")
+                if record["employee_code"] and record["employee_code"] in seen_codes:
+                    errors.append("employee_code: duplicate employee code in file")
+            if errors:
+                job.add_error(row_number, errors)
+                continue
+            seen_emails.add(record["email"])
+            if record["employee_code"]:
+                seen_codes.add(record["employee_code"])
+            candidates.append((row_number, record))
+        
+        # One query per batch for rows that already exist
+        taken_emails = self.employee_repo.existing_emails(r["email"] for _, r in candidates)
+        taken_codes = self.employee_repo.existing_codes(r["employee_code"] for _, r in candidates if r["employee_code"])
+        records = []
+        for row_number, record in candidates:
+            if record["email"] in taken_emails:
+                job.add_error(row_number, ["email: employee with this email already exists"])
+            elif record["employee_code"] in taken_codes:
+                job.add_error(row_number, ["employee_code: employee code already exists"])
+            else:
+                record["created_by"] = job.created_by
+                records.append((row_number, record))
+        
+        try:
+            missing_codes = [record for _, record in records if not record["employee_code"]]
+            for record, code in zip(missing_codes, self._allocate_free_codes(len(missing_codes), seen_codes)):
+                record["employee_code"] = code
+            
+            self.employee_repo.bulk_create((record for _, record in records), commit=False)
+            self.email_service.queue_welcome(record for _, record in records)
+            self.db.commit()
+            job.imported_rows += len(records)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            message = f"database: {str(e.orig if hasattr(e, 'orig') and e.orig else e).splitlines()[0]}"
+            for row_number, _ in records:
+                job.add_error(row_number, [message])
+        finally:
+            # Keep the identity map from growing across batches
+            self.db.expunge_all()
+            job.processed_rows += len(batch)
+
+
+def run_employee_import(job: ImportJob, path: Path) -> None:
+    """Background task entry point; owns its session and the uploaded file"""
+    try:
+        with get_db_context() as db:
+            set_tenant(db, job.tenant_id)
+            EmployeeImportService(db).run(job, path)
+    finally:
+        path.unlink(missing_ok=True)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.exit_reason_repository import ExitReasonRepository
+from .master_data_service import MasterDataService
+
+class ExitReasonService(MasterDataService):
+    label = "exit reason"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, ExitReasonRepository(db))
\ No newline at end of file
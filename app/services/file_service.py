@@ -0,0 +1,94 @@
+# File upload handling
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from pathlib import Path
+from typing import Iterable
+import hashlib
+import os
+import tempfile
+
+from ..core.storage import BlobInfo, BlobStorage
+from ..utils.validators import IMAGE_SNIFF_SIZE, detect_image_type
+
+# Read uploads 64KB at a time
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+class UnsupportedFileType(Exception):
+    """Raised when the uploaded bytes are not an allowed type"""
+
+
+def _open_temp(directory: Path):
+    return tempfile.NamedTemporaryFile(dir=directory, prefix=".upload_", suffix=".part", delete=False)
+
+
+def _write(tmp, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    tmp.write(chunk)
+
+
+def _discard(tmp) -> None:
+    tmp.close()
+    Path(tmp.name).unlink(missing_ok=True)
+
+
+def _close(tmp) -> Path:
+    tmp.flush()
+    os.fsync(tmp.fileno())
+    tmp.close()
+    return Path(tmp.name)
+
+
+async def save_image_upload(
+    file: UploadFile,
+    storage: BlobStorage,
+    max_size: int,
+    allowed_types: Iterable[str]
+) -> BlobInfo:
+    """
+    Stream an image upload into blob storage without buffering it in memory
+    
+    The type is sniffed from the first chunk's magic bytes, the upload is
+    aborted as soon as it exceeds max_size, and disk writes run in the
+    threadpool. Data is hashed while it is written to a staging file, which
+    the storage then moves to its content address (or drops if identical
+    content already exists), so readers never see partial files.
+    """
+    first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    while len(first_chunk) < IMAGE_SNIFF_SIZE:
+        more = await file.read(UPLOAD_CHUNK_SIZE)
+        if not more:
+            break
+        first_chunk += more
+    
+    detected = detect_image_type(first_chunk)
+    if detected is None or detected[0] not in allowed_types:
+        raise UnsupportedFileType("Unsupported image type")
+    content_type, _ = detected
+    
+    tmp = await run_in_threadpool(_open_temp, storage.staging_dir())
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        chunk = first_chunk
+        while chunk:
+            size += len(chunk)
+            if size > max_size:
+                raise UploadTooLarge(f"File exceeds {max_size} bytes")
+            await run_in_threadpool(_write, tmp, digest, chunk)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        
+        path = await run_in_threadpool(_close, tmp)
+    except BaseException:
+        # Runs inline so cleanup also happens when the request is cancelled
+        _discard(tmp)
+        raise
+    
+    try:
+        return await run_in_threadpool(storage.put_file, path, digest.hexdigest(), content_type)
+    finally:
+        path.unlink(missing_ok=True)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.grade_repository import GradeRepository
+from .master_data_service import MasterDataService
+
+class GradeService(MasterDataService):
+    label = "grade"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, GradeRepository(db))
\ No newline at end of file
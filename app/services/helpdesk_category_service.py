@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.helpdesk_category_repository import HelpdeskCategoryRepository
+from .master_data_service import MasterDataService
+
+class HelpdeskCategoryService(MasterDataService):
+    label = "helpdesk category"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, HelpdeskCategoryRepository(db))
\ No newline at end of file
@@ -0,0 +1,104 @@
+# Shared CRUD and tree queries for organization unit hierarchies
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+from ..models.employee import Employee
+from ..repositories.employee_repository import EmployeeRepository
+from ..repositories.hierarchy_repository import HierarchyError, HierarchyRepository
+
+class HierarchyService:
+    """
+    Base for services of tree-shaped units (departments, business units,
+    cost centers); subclasses set the repository, a label for messages and
+    the Employee column that assigns employees to the unit
+    """
+    label: str = "unit"
+    employee_field: str = ""
+
+    def __init__(self, db: Session, repo: HierarchyRepository):
+        self.db = db
+        self.repo = repo
+        self.employee_repo = EmployeeRepository(db)
+
+    def _validate(self, unit_data: BaseModel, exclude_id: Optional[int] = None) -> None:
+        if self.repo.code_exists(unit_data.code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{self.label.capitalize()} code already exists"
+            )
+        if unit_data.parent_id is not None and not self.repo.get(unit_data.parent_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Parent {self.label} not found"
+            )
+        head_id = getattr(unit_data, "head_employee_id", None)
+        if head_id is not None and not self.employee_repo.get(head_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Head employee not found"
+            )
+
+    def create(self, unit_data: BaseModel, created_by_id: int) -> Any:
+        """Create a unit under its parent"""
+        self._validate(unit_data)
+        unit_dict = unit_data.model_dump()
+        unit_dict['created_by'] = created_by_id
+        return self.repo.create(unit_dict)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Any]:
+        return self.repo.get_all(skip, limit)
+
+    def get_by_id(self, unit_id: int) -> Any:
+        unit = self.repo.get(unit_id)
+        if not unit:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.label.capitalize()} not found"
+            )
+        return unit
+
+    def update(self, unit_id: int, unit_data: BaseModel, updated_by_id: int) -> Any:
+        """Update a unit; a new parent_id moves its whole subtree"""
+        unit = self.get_by_id(unit_id)
+        self._validate(unit_data, exclude_id=unit_id)
+        update_dict = unit_data.model_dump()
+        update_dict['updated_by'] = updated_by_id
+        try:
+            return self.repo.update(unit, update_dict)
+        except HierarchyError as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    def delete(self, unit_id: int) -> None:
+        """Delete a unit; its children move up to its parent"""
+        self.get_by_id(unit_id)
+        self.repo.delete(unit_id)
+
+    def get_children(self, unit_id: int) -> List[Any]:
+        self.get_by_id(unit_id)
+        return self.repo.get_children(unit_id)
+
+    def get_descendants(self, unit_id: int, max_depth: Optional[int] = None) -> List[Any]:
+        self.get_by_id(unit_id)
+        return self.repo.get_descendants(unit_id, max_depth=max_depth)
+
+    def get_ancestors(self, unit_id: int) -> List[Any]:
+        self.get_by_id(unit_id)
+        return self.repo.get_ancestors(unit_id)
+
+    def get_employees(
+        self,
+        unit_id: int,
+        include_descendants: bool = True,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Employee]:
+        """Employees of a unit, and by default of every unit below it"""
+        self.get_by_id(unit_id)
+        unit_ids = self.repo.subtree_ids_query(unit_id) if include_descendants else [unit_id]
+        return self.employee_repo.get_in_units(getattr(Employee, self.employee_field), unit_ids, skip, limit)
\ No newline at end of file
@@ -0,0 +1,155 @@
+# Image derivatives (thumbnails and WebP variants)
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+import os
+import tempfile
+import threading
+
+from ..core.config import settings
+from ..core.storage import BlobStorage, blob_storage
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; originals are served without derivatives
+    Image = None
+    ImageOps = None
+
+# Public URL of content-addressed images, see endpoints/files.py
+IMAGE_URL_PREFIX = "/api/v1/upload/images"
+
+FULL_SIZE = "full"
+
+# Non-WebP fallback (extension, Pillow format) per source content type
+_FALLBACK_FORMATS = {
+    "image/jpeg": ("jpg", "JPEG"),
+    "image/png": ("png", "PNG"),
+    "image/gif": ("png", "PNG"),
+    "image/webp": ("png", "PNG"),
+}
+
+
+def image_url(digest: str, size: Optional[int] = None) -> str:
+    """URL serving an uploaded image, optionally as a fixed-size thumbnail"""
+    url = f"{IMAGE_URL_PREFIX}/{digest}"
+    return f"{url}?size={size}" if size else url
+
+
+class ImageDerivativeStore:
+    """
+    Derivatives of images kept in blob storage
+
+    Layout: {root}/{digest[:2]}/{digest}/ with one file per variant, e.g.
+    40.webp, 40.jpg and full.webp, where digest is the original's content
+    hash. Identical uploads share one blob, so derivatives are generated
+    once per distinct image. Generation runs on a small thread pool and
+    concurrent requests for the same image wait on the same job.
+    """
+
+    def __init__(self, storage: BlobStorage, root: Path, sizes: List[int], workers: int):
+        self.storage = storage
+        self.root = root
+        self.sizes = sorted(set(sizes))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-derivatives")
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None
+
+    def image_dir(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def source_path(self, digest: str) -> Optional[Path]:
+        """Original bytes of an image"""
+        return self.storage.local_path(digest)
+
+    def derivative_path(self, digest: str, variant: str, webp: bool) -> Optional[Path]:
+        """
+        Path of a variant ('full' or a thumbnail size)
+
+        Returns None when the digest is not a stored image. The full-size
+        non-WebP variant is the original itself.
+        """
+        info = self.storage.stat(digest)
+        if info is None or info.content_type not in _FALLBACK_FORMATS:
+            return None
+        if webp:
+            return self.image_dir(digest) / f"{variant}.webp"
+        if variant == FULL_SIZE:
+            return self.source_path(digest)
+        extension, _ = _FALLBACK_FORMATS[info.content_type]
+        return self.image_dir(digest) / f"{variant}.{extension}"
+
+    def schedule(self, digest: str) -> Optional[Future]:
+        """Generate every derivative of an image in the background"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            future = self._inflight.get(digest)
+            if future is not None:
+                return future
+            future = self._executor.submit(self._generate, digest)
+            self._inflight[digest] = future
+        # Outside the lock: a job that already finished runs the callback right here
+        future.add_done_callback(lambda done: self._forget(digest, done))
+        return future
+
+    def _forget(self, digest: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(digest) is future:
+                del self._inflight[digest]
+
+    def _save(self, image, target: Path, image_format: str) -> None:
+        if target.exists():
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".derivative_", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                if image_format == "JPEG":
+                    image.convert("RGB").save(tmp, image_format, quality=85, optimize=True)
+                elif image_format == "WEBP":
+                    image.save(tmp, image_format, quality=80, method=4)
+                else:
+                    image.save(tmp, image_format, optimize=True)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _generate(self, digest: str) -> None:
+        info = self.storage.stat(digest)
+        if info is None or info.content_type not in _FALLBACK_FORMATS:
+            return
+        extension, fallback_format = _FALLBACK_FORMATS[info.content_type]
+        directory = self.image_dir(digest)
+        directory.mkdir(parents=True, exist_ok=True)
+        try:
+            with self.storage.open(digest) as source, Image.open(source) as opened:
+                image = ImageOps.exif_transpose(opened)
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "P") else "RGB")
+
+                self._save(image, directory / f"{FULL_SIZE}.webp", "WEBP")
+                for size in self.sizes:
+                    thumbnail = image.copy()
+                    thumbnail.thumbnail((size, size), Image.LANCZOS)
+                    self._save(thumbnail, directory / f"{size}.webp", "WEBP")
+                    self._save(thumbnail, directory / f"{size}.{extension}", fallback_format)
+        except Exception as e:
+            logger.warning(f"Could not generate derivatives for image {digest}: {e}")
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+image_store = ImageDerivativeStore(
+    storage=blob_storage,
+    root=Path(settings.IMAGE_DERIVATIVE_DIR),
+    sizes=settings.IMAGE_THUMBNAIL_SIZES,
+    workers=settings.IMAGE_WORKERS
+)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.location_repository import LocationRepository
+from .master_data_service import MasterDataService
+
+class LocationService(MasterDataService):
+    label = "location"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, LocationRepository(db))
\ No newline at end of file
@@ -0,0 +1,67 @@
+# Shared CRUD for flat master data lists (grades, designations, locations, ...)
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+from ..core.tenancy import get_tenant
+from ..repositories.reference_data_repository import ReferenceDataRepository
+from .reference_data_service import reference_data_cache
+
+class MasterDataService:
+    """
+    Base for services of master data served in the /reference-data bundle;
+    subclasses set the repository and a label for messages. Every write
+    retires this worker's cached bundle of the tenant right away, other
+    workers follow the version bump written with it.
+    """
+    label: str = "record"
+
+    def __init__(self, db: Session, repo: ReferenceDataRepository):
+        self.db = db
+        self.repo = repo
+
+    def _ensure_unique_code(self, code: str, exclude_id: Optional[int] = None) -> None:
+        if self.repo.code_exists(code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{self.label.capitalize()} code already exists"
+            )
+
+    def _changed(self) -> None:
+        reference_data_cache.changed(get_tenant(self.db))
+
+    def create(self, data: BaseModel, created_by_id: int) -> Any:
+        self._ensure_unique_code(data.code)
+        obj_dict = data.model_dump()
+        obj_dict['created_by'] = created_by_id
+        obj = self.repo.create(obj_dict)
+        self._changed()
+        return obj
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Any]:
+        return self.repo.get_all(skip, limit)
+
+    def get_by_id(self, obj_id: int) -> Any:
+        obj = self.repo.get(obj_id)
+        if not obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.label.capitalize()} not found"
+            )
+        return obj
+
+    def update(self, obj_id: int, data: BaseModel, updated_by_id: int) -> Any:
+        obj = self.get_by_id(obj_id)
+        if data.code != obj.code:
+            self._ensure_unique_code(data.code, exclude_id=obj_id)
+        update_dict = data.model_dump()
+        update_dict['updated_by'] = updated_by_id
+        obj = self.repo.update(obj, update_dict)
+        self._changed()
+        return obj
+
+    def delete(self, obj_id: int) -> None:
+        self.get_by_id(obj_id)
+        self.repo.delete(obj_id)
+        self._changed()
\ No newline at end of file
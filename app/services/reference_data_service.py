@@ -0,0 +1,241 @@
+# Versioned, per-tenant cache of master data
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import select
+import threading
+import time
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.database import engine
+from ..core.metrics import REFERENCE_DATA_LOOKUPS, REFERENCE_DATA_NOTIFICATIONS
+from ..core.tenancy import get_tenant
+from ..models.reference_data import NO_TENANT_KEY
+from ..repositories.designation_repository import DesignationRepository
+from ..repositories.exit_reason_repository import ExitReasonRepository
+from ..repositories.grade_repository import GradeRepository
+from ..repositories.helpdesk_category_repository import HelpdeskCategoryRepository
+from ..repositories.location_repository import LocationRepository
+from ..repositories.reference_data_repository import (
+    REFERENCE_DATA_CHANNEL, ReferenceVersionRepository
+)
+from ..repositories.visit_type_repository import VisitTypeRepository
+from ..schemas.reference_data import ReferenceDataResponse
+
+logger = logging.getLogger(__name__)
+
+# Bundle sections and the repositories they are read from
+REFERENCE_REPOSITORIES: Dict[str, Callable[[Session], Any]] = {
+    "grades": GradeRepository,
+    "designations": DesignationRepository,
+    "visit_types": VisitTypeRepository,
+    "exit_reasons": ExitReasonRepository,
+    "helpdesk_categories": HelpdeskCategoryRepository,
+    "locations": LocationRepository,
+}
+
+_HIT = REFERENCE_DATA_LOOKUPS.labels("hit")
+_REVALIDATED = REFERENCE_DATA_LOOKUPS.labels("revalidated")
+_BUILT = REFERENCE_DATA_LOOKUPS.labels("built")
+
+
+class ReferenceBundle:
+    """Serialized master data of one tenant at one version"""
+
+    __slots__ = ("version", "etag", "body", "generation", "checked_at")
+
+    def __init__(self, version: int, etag: str, body: bytes, generation: int):
+        self.version = version
+        self.etag = etag
+        self.body = body
+        self.generation = generation
+        self.checked_at = time.monotonic()
+
+
+class ReferenceDataCache:
+    """
+    Master data bundles per tenant, kept per worker process
+
+    A bundle is stamped with the tenant's version from
+    reference_data_versions, which every master data write increments in
+    its own transaction. Writes in this worker and NOTIFYs from other
+    workers advance the tenant's generation here, which retires bundles
+    built before it. While no listener is connected, a bundle is trusted
+    for REFERENCE_DATA_RECHECK_SECONDS and then revalidated with one
+    primary-key read of the version row.
+    """
+
+    def __init__(self, max_tenants: int, ttl: float, recheck_seconds: float):
+        self._bundles = TTLCache(max_size=max_tenants, ttl=ttl, name="reference_data")
+        self.recheck_seconds = recheck_seconds
+        self.listening = False
+        self._generations: Dict[int, int] = {}
+        self._all_generation = 0  # Unscoped (superadmin) bundles span every tenant
+        self._lock = threading.Lock()
+
+    def _generation(self, tenant_id: Optional[int]) -> int:
+        if tenant_id is None:
+            return self._all_generation
+        return self._generations.get(tenant_id, 0)
+
+    def get(self, db: Session) -> ReferenceBundle:
+        """Current bundle of the session's tenant"""
+        tenant_id = get_tenant(db)
+        bundle = self._bundles.get(tenant_id)
+        if bundle is not None and bundle.generation == self._generation(tenant_id):
+            if self.listening or time.monotonic() - bundle.checked_at < self.recheck_seconds:
+                _HIT.inc()
+                return bundle
+
+        # Read the version before the rows, so a concurrent write can only make the bundle look older
+        generation = self._generation(tenant_id)
+        version = ReferenceVersionRepository(db).current(tenant_id)
+        if bundle is not None and bundle.version == version:
+            bundle.generation = generation
+            bundle.checked_at = time.monotonic()
+            _REVALIDATED.inc()
+            return bundle
+
+        bundle = self._build(db, tenant_id, version, generation)
+        self._bundles.set(tenant_id, bundle)
+        _BUILT.inc()
+        return bundle
+
+    def _build(self, db: Session, tenant_id: Optional[int], version: int, generation: int) -> ReferenceBundle:
+        sections = {name: repo(db).get_all_current() for name, repo in REFERENCE_REPOSITORIES.items()}
+        body = ReferenceDataResponse.model_validate(
+            {"version": version, **sections},
+            from_attributes=True
+        ).model_dump_json().encode("utf-8")
+        scope = "all" if tenant_id is None else tenant_id
+        return ReferenceBundle(version, f'"rd-{scope}-{version}"', body, generation)
+
+    def changed(self, tenant_id: Optional[int], version: Optional[int] = None) -> None:
+        """
+        Retire bundles after a master data change of `tenant_id`
+
+        With the committed `version` (from a notification), a bundle that
+        already has it is kept, so a worker's own writes are not reloaded
+        twice.
+        """
+        with self._lock:
+            if version is not None and tenant_id is not None:
+                bundle = self._bundles.get(tenant_id)
+                if bundle is not None and bundle.version >= version:
+                    self._all_generation += 1
+                    return
+            if tenant_id is not None:
+                self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            self._all_generation += 1
+
+    def notify(self, payload: str) -> None:
+        """Handle a "<tenant_key>:<version>" notification"""
+        REFERENCE_DATA_NOTIFICATIONS.inc()
+        try:
+            key, version = (int(part) for part in payload.split(":", 1))
+        except ValueError:
+            logger.warning(f"Ignoring malformed reference data notification '{payload}'")
+            return
+        self.changed(None if key == NO_TENANT_KEY else key, version)
+
+    def clear(self) -> None:
+        """Forget every bundle, e.g. after notifications may have been missed"""
+        self._bundles.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._bundles.stats(), "listening": self.listening}
+
+
+class ReferenceDataListener:
+    """
+    LISTEN for reference data changes on a dedicated connection
+
+    Runs in a daemon thread and feeds notifications to the cache. When the
+    connection drops it reconnects after RETRY_SECONDS and
+    clears the cache, since notifications sent meanwhile are lost; until
+    then the cache falls back to periodic version checks.
+    """
+
+    RETRY_SECONDS = 5.0
+    POLL_SECONDS = 1.0
+
+    def __init__(self, cache: ReferenceDataCache):
+        self.cache = cache
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connect(self):
+        # Outside the pool: the connection is held for the life of the worker
+        cargs, cparams = engine.dialect.create_connect_args(engine.url)
+        connection = engine.dialect.connect(*cargs, **cparams)
+        connection.autocommit = True
+        cursor = connection.cursor()
+        cursor.execute(f"LISTEN {REFERENCE_DATA_CHANNEL}")
+        cursor.close()
+        return connection
+
+    def _wait(self, connection) -> List[str]:
+        """Payloads received within POLL_SECONDS"""
+        if hasattr(connection, "poll"):  # psycopg2
+            if select.select([connection], [], [], self.POLL_SECONDS)[0]:
+                connection.poll()
+                payloads = [notify.payload for notify in connection.notifies]
+                del connection.notifies[:]
+                return payloads
+            return []
+        return [notify.payload for notify in connection.notifies(timeout=self.POLL_SECONDS)]  # psycopg 3
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                self.cache.clear()
+                self.cache.listening = True
+                logger.info(f"Listening for reference data changes on '{REFERENCE_DATA_CHANNEL}'")
+                while not self._stop.is_set():
+                    for payload in self._wait(connection):
+                        self.cache.notify(payload)
+            except Exception as e:
+                logger.warning(f"Reference data listener disconnected: {e}")
+            finally:
+                self.cache.listening = False
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            self._stop.wait(self.RETRY_SECONDS)
+
+    def start(self) -> None:
+        if engine.dialect.name != "postgresql":
+            logger.info("Reference data listener needs PostgreSQL; using periodic version checks")
+            return
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="reference-data-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.POLL_SECONDS + 1)
+            self._thread = None
+
+
+reference_data_cache = ReferenceDataCache(
+    max_tenants=settings.REFERENCE_DATA_CACHE_MAX_TENANTS,
+    ttl=settings.REFERENCE_DATA_CACHE_TTL_SECONDS,
+    recheck_seconds=settings.REFERENCE_DATA_RECHECK_SECONDS
+)
+reference_data_listener = ReferenceDataListener(reference_data_cache)
+
+
+class ReferenceDataService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_bundle(self) -> ReferenceBundle:
+        """Master data of the caller's company, from this worker's cache"""
+        return reference_data_cache.get(self.db)
\ No newline at end of file
@@ -0,0 +1,421 @@
+# Shift roster computation (vectorized over employees x days)
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from concurrent.futures import Future
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.tenancy import get_tenant
+from ..repositories.employee_repository import EmployeeRepository
+from ..repositories.shift_policy_repository import ShiftPolicyRepository
+from ..repositories.shift_rule_repository import ShiftRuleRepository
+from ..repositories.weekoff_policy_repository import WeekoffPolicyRepository
+from ..repositories.work_shift_repository import WorkShiftRepository
+
+logger = logging.getLogger(__name__)
+
+# Roster cell values: a work shift ID (> 0), or one of these
+OFF_DAY = 0
+UNSCHEDULED = -1
+
+# Kinds of compiled configuration, in the order of a group key
+RULE, POLICY, WEEKOFF = "rule", "policy", "weekoff"
+GROUP_KINDS = (RULE, POLICY, WEEKOFF)
+
+# Cached rosters are keyed by (tenant, start, end)
+RosterKey = Tuple[Optional[int], date, date]
+
+
+def _version(row: Any) -> Tuple[Any, bool]:
+    """Changes whenever the row is updated or (de)activated"""
+    return (row.updated_at, row.is_active)
+
+
+class DateAxis:
+    """Days of a roster range and their calendar attributes, as arrays"""
+
+    def __init__(self, start: date, end: date):
+        self.start = start
+        self.end = end
+        self.ordinals = np.arange(start.toordinal(), end.toordinal() + 1, dtype=np.int64)
+        # Ordinal 1 (0001-01-01) was a Monday, so weekday 0 = Monday as in date.weekday()
+        self.weekdays = (self.ordinals - 1) % 7
+        days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+        day_of_month = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+        self.weeks_of_month = (day_of_month - 1) // 7 + 1
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+
+class CompiledShiftRule:
+    """Rotation cycle as an array, expanded over a range by one modulo and one gather"""
+
+    __slots__ = ("id", "version", "cycle", "anchor")
+
+    def __init__(self, rule: Any):
+        self.id = rule.id
+        self.version = _version(rule)
+        self.cycle = np.array([shift_id or OFF_DAY for shift_id in rule.pattern], dtype=np.int32)
+        self.anchor = rule.anchor_date.toordinal()
+
+    def expand(self, axis: DateAxis) -> np.ndarray:
+        return self.cycle[(axis.ordinals - self.anchor) % len(self.cycle)]
+
+
+class CompiledShiftPolicy:
+    __slots__ = ("id", "version", "default_shift_id")
+
+    def __init__(self, policy: Any):
+        self.id = policy.id
+        self.version = _version(policy)
+        self.default_shift_id = policy.default_shift_id
+
+
+class CompiledWeekoffPolicy:
+    """Week-off days as lookup tables indexed by weekday and week of month"""
+
+    __slots__ = ("id", "version", "weekly", "monthly")
+
+    def __init__(self, policy: Any):
+        self.id = policy.id
+        self.version = _version(policy)
+        self.weekly = np.zeros(7, dtype=bool)
+        self.weekly[list(policy.weekly_off_days or [])] = True
+        self.monthly = np.zeros((7, 6), dtype=bool)  # [weekday, week of month]
+        for weekday, weeks in (policy.monthly_off_days or {}).items():
+            self.monthly[int(weekday), list(weeks)] = True
+
+    def mask(self, axis: DateAxis) -> np.ndarray:
+        return self.weekly[axis.weekdays] | self.monthly[axis.weekdays, axis.weeks_of_month]
+
+
+COMPILERS = {
+    RULE: CompiledShiftRule,
+    POLICY: CompiledShiftPolicy,
+    WEEKOFF: CompiledWeekoffPolicy,
+}
+
+
+class PolicySnapshot:
+    """Active compiled rules and policies by kind and ID"""
+
+    def __init__(self, compiled: Dict[str, Dict[int, Any]]):
+        self.compiled = compiled
+
+    def get(self, kind: str, id: int) -> Any:
+        return self.compiled[kind].get(id)
+
+    def versions(self, kind: str) -> Dict[int, Any]:
+        return {id: item.version for id, item in self.compiled[kind].items()}
+
+
+class Roster:
+    """
+    Schedule of every employee over a date range
+
+    Employees sharing the same (shift rule, shift policy, week-off policy)
+    form a group whose day row is computed once; the E x D grid is a single
+    gather of group rows, with days before each employee's joining date
+    blanked out. Roster objects are never mutated, so a cached roster can
+    be read while a refreshed copy is being built.
+    """
+
+    def __init__(
+        self,
+        axis: DateAxis,
+        employee_ids: np.ndarray,
+        joining: np.ndarray,
+        group_keys: np.ndarray,
+        group_index: np.ndarray,
+        group_rows: np.ndarray,
+        grid: np.ndarray,
+        versions: Dict[str, Dict[int, Any]]
+    ):
+        self.axis = axis
+        self.employee_ids = employee_ids
+        self.joining = joining
+        self.group_keys = group_keys
+        self.group_index = group_index
+        self.group_rows = group_rows
+        self.grid = grid
+        self.versions = versions
+        self._positions: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def build(cls, axis: DateAxis, assignments: List[tuple], snapshot: PolicySnapshot) -> "Roster":
+        """Compute the roster from (id, rule, policy, week-off, joining date) tuples"""
+        count = len(assignments)
+        employee_ids = np.fromiter((row[0] for row in assignments), dtype=np.int64, count=count)
+        joining = np.fromiter((row[4].toordinal() for row in assignments), dtype=np.int64, count=count)
+        keys = np.array(
+            [(row[1] or 0, row[2] or 0, row[3] or 0) for row in assignments],
+            dtype=np.int64
+        ).reshape(count, len(GROUP_KINDS))
+        group_keys, group_index = np.unique(keys, axis=0, return_inverse=True)
+        group_index = group_index.reshape(-1)
+
+        group_rows = np.empty((len(group_keys), len(axis)), dtype=np.int32)
+        for position, key in enumerate(group_keys):
+            group_rows[position] = _group_row(key, axis, snapshot)
+
+        grid = group_rows[group_index]
+        grid[axis.ordinals[np.newaxis, :] < joining[:, np.newaxis]] = UNSCHEDULED
+        versions = {kind: snapshot.versions(kind) for kind in GROUP_KINDS}
+        return cls(axis, employee_ids, joining, group_keys, group_index, group_rows, grid, versions)
+
+    def refreshed(self, snapshot: PolicySnapshot) -> "Roster":
+        """
+        Roster for the current rules and policies
+
+        Only groups using a rule or policy whose version changed are
+        recomputed, and only their employees' rows are rewritten; returns
+        self when nothing changed.
+        """
+        stale_groups = np.zeros(len(self.group_keys), dtype=bool)
+        versions = {}
+        for column, kind in enumerate(GROUP_KINDS):
+            versions[kind] = snapshot.versions(kind)
+            previous = self.versions[kind]
+            changed = [
+                id for id in previous.keys() | versions[kind].keys()
+                if previous.get(id) != versions[kind].get(id)
+            ]
+            if changed:
+                stale_groups |= np.isin(self.group_keys[:, column], changed)
+
+        if not stale_groups.any():
+            return self
+
+        group_rows = self.group_rows.copy()
+        for position in np.flatnonzero(stale_groups):
+            group_rows[position] = _group_row(self.group_keys[position], self.axis, snapshot)
+
+        grid = self.grid.copy()
+        rows = np.flatnonzero(stale_groups[self.group_index])
+        block = group_rows[self.group_index[rows]]
+        block[self.axis.ordinals[np.newaxis, :] < self.joining[rows, np.newaxis]] = UNSCHEDULED
+        grid[rows] = block
+        logger.debug(f"Roster refresh recomputed {int(stale_groups.sum())} groups, {len(rows)} employees")
+        return Roster(
+            self.axis, self.employee_ids, self.joining, self.group_keys,
+            self.group_index, group_rows, grid, versions
+        )
+
+    def position_of(self, employee_id: int) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {int(id): position for position, id in enumerate(self.employee_ids)}
+        return self._positions.get(employee_id)
+
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+
+
+def _group_row(key: np.ndarray, axis: DateAxis, snapshot: PolicySnapshot) -> np.ndarray:
+    """Day row shared by every employee with this (rule, policy, week-off) key"""
+    rule_id, policy_id, weekoff_id = (int(value) for value in key)
+
+    rule = snapshot.get(RULE, rule_id)
+    if rule is not None:
+        row = rule.expand(axis)
+    else:
+        policy = snapshot.get(POLICY, policy_id)
+        shift_id = policy.default_shift_id if policy is not None else None
+        row = np.full(len(axis), shift_id or UNSCHEDULED, dtype=np.int32)
+
+    weekoff = snapshot.get(WEEKOFF, weekoff_id)
+    if weekoff is not None:
+        row[weekoff.mask(axis) & (row > 0)] = OFF_DAY
+    return row
+
+
+class RosterEngine:
+    """
+    Computes rosters and keeps them per worker process and tenant
+
+    Compiled rules and policies are reused until their row version
+    changes. Cached rosters are refreshed incrementally against the current
+    rule and policy versions on every request, so editing one rule only
+    recomputes the employees using it. Employee changes (hires, exits,
+    reassignments) call `invalidate` for their company; in other workers
+    they are picked up when the cached roster expires after
+    ROSTER_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self, max_ranges: int, ttl: float):
+        self._compiled: Dict[Tuple[Optional[int], str, int], Any] = {}
+        self._compiled_lock = threading.Lock()
+        self._rosters = TTLCache(max_size=max_ranges, ttl=ttl, name="roster")
+        self._lock = threading.Lock()
+        self._building: Dict[RosterKey, Future] = {}
+        self._generations: Dict[Optional[int], int] = {}  # Bumped by invalidate, per tenant
+
+    def _compile(self, tenant_id: Optional[int], kind: str, rows: Dict[int, Any]) -> Dict[int, Any]:
+        compiled = {}
+        with self._compiled_lock:
+            for id, row in rows.items():
+                if not row.is_active:
+                    continue
+                item = self._compiled.get((tenant_id, kind, id))
+                if item is None or item.version != _version(row):
+                    item = COMPILERS[kind](row)
+                    self._compiled[(tenant_id, kind, id)] = item
+                compiled[id] = item
+            for stale in [
+                key for key in self._compiled
+                if key[0] == tenant_id and key[1] == kind and key[2] not in compiled
+            ]:
+                del self._compiled[stale]
+        return compiled
+
+    def load_snapshot(self, db: Session) -> PolicySnapshot:
+        """Current active rules and policies (small tables, read on every call)"""
+        tenant_id = get_tenant(db)
+        return PolicySnapshot({
+            RULE: self._compile(tenant_id, RULE, ShiftRuleRepository(db).get_all_by_id()),
+            POLICY: self._compile(tenant_id, POLICY, ShiftPolicyRepository(db).get_all_by_id()),
+            WEEKOFF: self._compile(tenant_id, WEEKOFF, WeekoffPolicyRepository(db).get_all_by_id()),
+        })
+
+    def _generation(self, tenant_id: Optional[int]) -> Tuple[int, int]:
+        # Unscoped rosters cover every tenant, so they go stale with any of them
+        return self._generations.get(tenant_id, 0), self._generations.get(None, 0)
+
+    def _store(self, key: RosterKey, roster: Roster, generation: Tuple[int, int]) -> None:
+        """Cache a roster unless its tenant was invalidated while it was computed"""
+        with self._lock:
+            if self._generation(key[0]) == generation:
+                self._rosters.set(key, roster)
+
+    def get_roster(self, db: Session, start: date, end: date) -> Roster:
+        snapshot = self.load_snapshot(db)
+        # Each company gets its own rosters; the session is already scoped to it
+        key = (get_tenant(db), start, end)
+
+        with self._lock:
+            generation = self._generation(key[0])
+            roster = self._rosters.get(key)
+            building = None
+            if roster is None:
+                building = self._building.get(key)
+                if building is None:
+                    owned: Future = Future()
+                    self._building[key] = owned
+
+        if roster is not None:
+            refreshed = roster.refreshed(snapshot)
+            if refreshed is not roster:
+                self._store(key, refreshed, generation)
+            return refreshed
+
+        if building is not None:
+            # Another request is building this range; reuse its roster
+            return building.result().refreshed(snapshot)
+
+        try:
+            started = time.perf_counter()
+            assignments = EmployeeRepository(db).get_schedule_assignments()
+            roster = Roster.build(DateAxis(start, end), assignments, snapshot)
+            logger.info(
+                f"Roster {start}..{end} built for {len(roster)} employees "
+                f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+        except BaseException as e:
+            owned.set_exception(e)
+            raise
+        else:
+            owned.set_result(roster)
+            self._store(key, roster, generation)
+        finally:
+            with self._lock:
+                del self._building[key]
+        return roster
+
+    def invalidate(self, tenant_id: Optional[int]) -> None:
+        """
+        Drop a company's cached rosters after its schedule assignments change
+
+        Unscoped rosters span every company and are dropped as well;
+        tenant_id None drops everything.
+        """
+        with self._lock:
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            if tenant_id is None:
+                self._rosters.clear()
+            else:
+                self._rosters.invalidate_where(lambda key: key[0] in (tenant_id, None))
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._rosters.stats(), "compiled_policies": len(self._compiled)}
+
+
+roster_engine = RosterEngine(
+    max_ranges=settings.ROSTER_CACHE_MAX_RANGES,
+    ttl=settings.ROSTER_CACHE_TTL_SECONDS
+)
+
+
+class RosterService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.work_shift_repo = WorkShiftRepository(db)
+
+    def get_roster(
+        self,
+        start_date: date,
+        end_date: date,
+        skip: int = 0,
+        limit: int = 100,
+        employee_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Scheduled shift of each employee for every day of a range"""
+        if end_date < start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date must not be before start_date"
+            )
+        days = (end_date - start_date).days + 1
+        if days > settings.ROSTER_MAX_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Roster range is limited to {settings.ROSTER_MAX_DAYS} days"
+            )
+
+        roster = roster_engine.get_roster(self.db, start_date, end_date)
+
+        if employee_id is not None:
+            position = roster.position_of(employee_id)
+            if position is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Employee not found"
+                )
+            rows = slice(position, position + 1)
+        else:
+            rows = slice(skip, skip + limit)
+
+        block = roster.grid[rows]
+        items = [
+            {
+                "employee_id": employee,
+                "days": [value if value != UNSCHEDULED else None for value in row]
+            }
+            for employee, row in zip(roster.employee_ids[rows].tolist(), block.tolist())
+        ]
+
+        shift_ids: Set[int] = set(np.unique(block[block > 0]).tolist())
+        shifts = self.work_shift_repo.get_all_by_id()
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_employees": len(roster),
+            "shifts": [shifts[id] for id in sorted(shift_ids) if id in shifts],
+            "items": items,
+        }
\ No newline at end of file
@@ -0,0 +1,60 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+
+from ..models.shift_policy import ShiftPolicy
+from ..schemas.shift_policy import ShiftPolicyCreate, ShiftPolicyUpdate
+from ..repositories.shift_policy_repository import ShiftPolicyRepository
+from ..repositories.work_shift_repository import WorkShiftRepository
+
+class ShiftPolicyService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.shift_policy_repo = ShiftPolicyRepository(db)
+        self.work_shift_repo = WorkShiftRepository(db)
+    
+    def _validate(self, policy_data: ShiftPolicyCreate, exclude_id: Optional[int] = None) -> None:
+        if self.shift_policy_repo.code_exists(policy_data.code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Shift policy code already exists"
+            )
+        if policy_data.default_shift_id is not None and not self.work_shift_repo.get(policy_data.default_shift_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Default work shift not found"
+            )
+    
+    def create_shift_policy(self, policy_data: ShiftPolicyCreate, created_by_id: int) -> ShiftPolicy:
+        """Create a new shift policy"""
+        self._validate(policy_data)
+        policy_dict = policy_data.model_dump()
+        policy_dict['created_by'] = created_by_id
+        return self.shift_policy_repo.create(policy_dict)
+    
+    def get_shift_policies(self, skip: int = 0, limit: int = 100) -> List[ShiftPolicy]:
+        """Get all shift policies"""
+        return self.shift_policy_repo.get_all(skip, limit)
+    
+    def get_shift_policy_by_id(self, policy_id: int) -> ShiftPolicy:
+        """Get specific shift policy by ID"""
+        policy = self.shift_policy_repo.get(policy_id)
+        if not policy:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Shift policy not found"
+            )
+        return policy
+    
+    def update_shift_policy(self, policy_id: int, policy_data: ShiftPolicyUpdate, updated_by_id: int) -> ShiftPolicy:
+        """Update shift policy"""
+        policy = self.get_shift_policy_by_id(policy_id)
+        self._validate(policy_data, exclude_id=policy_id)
+        update_dict = policy_data.model_dump()
+        update_dict['updated_by'] = updated_by_id
+        return self.shift_policy_repo.update(policy, update_dict)
+    
+    def delete_shift_policy(self, policy_id: int) -> None:
+        """Delete shift policy"""
+        self.get_shift_policy_by_id(policy_id)
+        self.shift_policy_repo.delete(policy_id)
\ No newline at end of file
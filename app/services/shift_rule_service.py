@@ -0,0 +1,67 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+
+from ..models.shift_rule import ShiftRule
+from ..schemas.shift_rule import ShiftRuleCreate, ShiftRuleUpdate
+from ..repositories.shift_rule_repository import ShiftRuleRepository
+from ..repositories.work_shift_repository import WorkShiftRepository
+
+class ShiftRuleService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.shift_rule_repo = ShiftRuleRepository(db)
+        self.work_shift_repo = WorkShiftRepository(db)
+    
+    def _validate(self, rule_data: ShiftRuleCreate, exclude_id: Optional[int] = None) -> None:
+        if self.shift_rule_repo.code_exists(rule_data.code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Shift rule code already exists"
+            )
+        shifts = self.work_shift_repo.get_all_by_id()
+        unknown = sorted({shift_id for shift_id in rule_data.pattern if shift_id is not None} - shifts.keys())
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown work shift IDs in pattern: {unknown}"
+            )
+    
+    def create_shift_rule(self, rule_data: ShiftRuleCreate, created_by_id: int) -> ShiftRule:
+        """Create a new shift rule"""
+        self._validate(rule_data)
+        rule_dict = rule_data.model_dump()
+        rule_dict['created_by'] = created_by_id
+        return self.shift_rule_repo.create(rule_dict)
+    
+    def get_shift_rules(self, skip: int = 0, limit: int = 100) -> List[ShiftRule]:
+        """Get all shift rules"""
+        return self.shift_rule_repo.get_all(skip, limit)
+    
+    def get_shift_rule_by_id(self, rule_id: int) -> ShiftRule:
+        """Get specific shift rule by ID"""
+        rule = self.shift_rule_repo.get(rule_id)
+        if not rule:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Shift rule not found"
+            )
+        return rule
+    
+    def update_shift_rule(self, rule_id: int, rule_data: ShiftRuleUpdate, updated_by_id: int) -> ShiftRule:
+        """
+        Update shift rule
+        
+        Cached rosters notice the new version and recompute only the
+        employees on this rule.
+        """
+        rule = self.get_shift_rule_by_id(rule_id)
+        self._validate(rule_data, exclude_id=rule_id)
+        update_dict = rule_data.model_dump()
+        update_dict['updated_by'] = updated_by_id
+        return self.shift_rule_repo.update(rule, update_dict)
+    
+    def delete_shift_rule(self, rule_id: int) -> None:
+        """Delete shift rule; its employees fall back to their shift policy"""
+        self.get_shift_rule_by_id(rule_id)
+        self.shift_rule_repo.delete(rule_id)
\ No newline at end of file
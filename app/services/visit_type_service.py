@@ -0,0 +1,10 @@
+from sqlalchemy.orm import Session
+
+from ..repositories.visit_type_repository import VisitTypeRepository
+from .master_data_service import MasterDataService
+
+class VisitTypeService(MasterDataService):
+    label = "visit type"
+    
+    def __init__(self, db: Session):
+        super().__init__(db, VisitTypeRepository(db))
\ No newline at end of file
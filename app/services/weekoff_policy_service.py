@@ -0,0 +1,60 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+
+from ..models.weekoff_policy import WeekoffPolicy
+from ..schemas.weekoff_policy import WeekoffPolicyCreate, WeekoffPolicyUpdate
+from ..repositories.weekoff_policy_repository import WeekoffPolicyRepository
+
+class WeekoffPolicyService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.weekoff_policy_repo = WeekoffPolicyRepository(db)
+    
+    def _ensure_unique_code(self, code: str, exclude_id: Optional[int] = None) -> None:
+        if self.weekoff_policy_repo.code_exists(code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Week-off policy code already exists"
+            )
+    
+    def _to_record(self, policy_data: WeekoffPolicyCreate) -> dict:
+        record = policy_data.model_dump()
+        # JSON object keys are strings
+        record['monthly_off_days'] = {str(day): weeks for day, weeks in policy_data.monthly_off_days.items()}
+        return record
+    
+    def create_weekoff_policy(self, policy_data: WeekoffPolicyCreate, created_by_id: int) -> WeekoffPolicy:
+        """Create a new week-off policy"""
+        self._ensure_unique_code(policy_data.code)
+        policy_dict = self._to_record(policy_data)
+        policy_dict['created_by'] = created_by_id
+        return self.weekoff_policy_repo.create(policy_dict)
+    
+    def get_weekoff_policies(self, skip: int = 0, limit: int = 100) -> List[WeekoffPolicy]:
+        """Get all week-off policies"""
+        return self.weekoff_policy_repo.get_all(skip, limit)
+    
+    def get_weekoff_policy_by_id(self, policy_id: int) -> WeekoffPolicy:
+        """Get specific week-off policy by ID"""
+        policy = self.weekoff_policy_repo.get(policy_id)
+        if not policy:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Week-off policy not found"
+            )
+        return policy
+    
+    def update_weekoff_policy(self, policy_id: int, policy_data: WeekoffPolicyUpdate, updated_by_id: int) -> WeekoffPolicy:
+        """Update week-off policy"""
+        policy = self.get_weekoff_policy_by_id(policy_id)
+        if policy_data.code != policy.code:
+            self._ensure_unique_code(policy_data.code, exclude_id=policy_id)
+        update_dict = self._to_record(policy_data)
+        update_dict['updated_by'] = updated_by_id
+        return self.weekoff_policy_repo.update(policy, update_dict)
+    
+    def delete_weekoff_policy(self, policy_id: int) -> None:
+        """Delete week-off policy"""
+        self.get_weekoff_policy_by_id(policy_id)
+        self.weekoff_policy_repo.delete(policy_id)
\ No newline at end of file
@@ -0,0 +1,62 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+
+from ..models.work_shift import WorkShift
+from ..schemas.work_shift import WorkShiftCreate, WorkShiftUpdate
+from ..repositories.work_shift_repository import WorkShiftRepository
+from ..repositories.shift_rule_repository import ShiftRuleRepository
+
+class WorkShiftService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.work_shift_repo = WorkShiftRepository(db)
+        self.shift_rule_repo = ShiftRuleRepository(db)
+    
+    def _ensure_unique_code(self, code: str, exclude_id: Optional[int] = None) -> None:
+        if self.work_shift_repo.code_exists(code, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Work shift code already exists"
+            )
+    
+    def create_work_shift(self, shift_data: WorkShiftCreate, created_by_id: int) -> WorkShift:
+        """Create a new work shift"""
+        self._ensure_unique_code(shift_data.code)
+        shift_dict = shift_data.model_dump()
+        shift_dict['created_by'] = created_by_id
+        return self.work_shift_repo.create(shift_dict)
+    
+    def get_work_shifts(self, skip: int = 0, limit: int = 100) -> List[WorkShift]:
+        """Get all work shifts"""
+        return self.work_shift_repo.get_all(skip, limit)
+    
+    def get_work_shift_by_id(self, shift_id: int) -> WorkShift:
+        """Get specific work shift by ID"""
+        shift = self.work_shift_repo.get(shift_id)
+        if not shift:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Work shift not found"
+            )
+        return shift
+    
+    def update_work_shift(self, shift_id: int, shift_data: WorkShiftUpdate, updated_by_id: int) -> WorkShift:
+        """Update work shift"""
+        shift = self.get_work_shift_by_id(shift_id)
+        if shift_data.code != shift.code:
+            self._ensure_unique_code(shift_data.code, exclude_id=shift_id)
+        update_dict = shift_data.model_dump()
+        update_dict['updated_by'] = updated_by_id
+        return self.work_shift_repo.update(shift, update_dict)
+    
+    def delete_work_shift(self, shift_id: int) -> None:
+        """Delete work shift that no shift rule uses"""
+        self.get_work_shift_by_id(shift_id)
+        for rule in self.shift_rule_repo.get_all_by_id().values():
+            if shift_id in rule.pattern:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Work shift is used by shift rule '{rule.code}'"
+                )
+        self.work_shift_repo.delete(shift_id)
\ No newline at end of file
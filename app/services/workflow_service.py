@@ -0,0 +1,555 @@
+# Approval workflow engine (compiled state machines, batched transitions, SLA timers)
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+import logging
+import threading
+import time
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.events import job_queue
+from ..core.metrics import WORKFLOW_TICK_DURATION, WORKFLOW_TRANSITIONS
+from ..core.principal import Principal
+from ..core.tenancy import set_tenant
+from ..models.workflow import WorkflowDefinition, WorkflowInstance
+from ..repositories.workflow_repository import (
+    WorkflowDefinitionRepository,
+    WorkflowHistoryRepository,
+    WorkflowInstanceRepository,
+)
+from .email_service import EmailService
+from ..schemas.workflow import (
+    WorkflowActionRequest,
+    WorkflowDefinitionCreate,
+    WorkflowDefinitionUpdate,
+    WorkflowStartRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+NO_TRANSITION = -1
+
+
+class WorkflowDefinitionError(ValueError):
+    """Definition that cannot be compiled into a state machine"""
+
+
+def _timestamp(value: datetime) -> float:
+    """Epoch seconds; naive datetimes are UTC (as stored by drivers without tz support)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class CompiledWorkflow:
+    """
+    Transition table of one definition version
+
+    States and actions are numbered once; `table[state][action]` holds the
+    target state number or NO_TRANSITION, so evaluating an action is a
+    couple of dict/list lookups with no JSON walking.
+    """
+
+    __slots__ = (
+        "id", "code", "version", "initial_state", "state_names", "state_index",
+        "action_index", "table", "roles", "sla", "timeout_actions", "final"
+    )
+
+    def __init__(self, definition: Any):
+        self.id = definition.id
+        self.code = definition.code
+        self.version = definition.version
+
+        states = list(definition.states or [])
+        self.state_names = [state["name"] for state in states]
+        if len(set(self.state_names)) != len(self.state_names):
+            raise WorkflowDefinitionError("State names must be unique")
+        self.state_index = {name: number for number, name in enumerate(self.state_names)}
+        if definition.initial_state not in self.state_index:
+            raise WorkflowDefinitionError(f"Unknown initial state '{definition.initial_state}'")
+        self.initial_state = definition.initial_state
+        self.final = [bool(state.get("final")) for state in states]
+
+        transitions = list(definition.transitions or [])
+        actions = sorted({transition["action"] for transition in transitions})
+        self.action_index = {action: number for number, action in enumerate(actions)}
+        self.table = [[NO_TRANSITION] * len(actions) for _ in states]
+        self.roles: Dict[Tuple[int, int], frozenset] = {}
+        for transition in transitions:
+            source = self.state_index.get(transition["from"])
+            target = self.state_index.get(transition["to"])
+            if source is None or target is None:
+                raise WorkflowDefinitionError(
+                    f"Transition '{transition['action']}' references an unknown state"
+                )
+            if self.final[source]:
+                raise WorkflowDefinitionError(f"Final state '{transition['from']}' cannot have transitions")
+            action = self.action_index[transition["action"]]
+            if self.table[source][action] != NO_TRANSITION:
+                raise WorkflowDefinitionError(
+                    f"Duplicate transition '{transition['action']}' from '{transition['from']}'"
+                )
+            self.table[source][action] = target
+            self.roles[(source, action)] = frozenset(transition.get("roles") or ())
+
+        self.sla: List[Optional[timedelta]] = []
+        self.timeout_actions: List[Optional[str]] = []
+        for number, state in enumerate(states):
+            minutes = state.get("sla_minutes")
+            timeout = state.get("on_timeout")
+            if timeout is not None and self._target(number, timeout) == NO_TRANSITION:
+                raise WorkflowDefinitionError(
+                    f"Timeout action '{timeout}' has no transition from '{state['name']}'"
+                )
+            self.sla.append(timedelta(minutes=minutes) if minutes and timeout else None)
+            self.timeout_actions.append(timeout)
+
+    def _target(self, state: int, action: str) -> int:
+        number = self.action_index.get(action)
+        return NO_TRANSITION if number is None else self.table[state][number]
+
+    def next_state(self, state: str, action: str) -> Optional[str]:
+        """Target of an action, or None when the action is not allowed in state"""
+        number = self.state_index.get(state)
+        if number is None:
+            return None
+        target = self._target(number, action)
+        return None if target == NO_TRANSITION else self.state_names[target]
+
+    def allows_role(self, state: str, action: str, role: Any) -> bool:
+        roles = self.roles.get((self.state_index[state], self.action_index[action]), frozenset())
+        return not roles or getattr(role, "value", role) in roles
+
+    def due_at(self, state: str, entered_at: datetime) -> Optional[datetime]:
+        sla = self.sla[self.state_index[state]]
+        return entered_at + sla if sla is not None else None
+
+    def timeout_action(self, state: str) -> Optional[str]:
+        number = self.state_index.get(state)
+        return None if number is None else self.timeout_actions[number]
+
+    def is_final(self, state: str) -> bool:
+        return self.final[self.state_index[state]]
+
+
+class WorkflowRegistry:
+    """
+    Compiled definitions by ID (LRU)
+
+    Definition rows are immutable (edits publish a new version row), so a
+    compiled entry never goes stale and is only ever evicted for space.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._compiled: "OrderedDict[int, CompiledWorkflow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.compilations = 0
+
+    def _put(self, definition: Any) -> CompiledWorkflow:
+        compiled = CompiledWorkflow(definition)
+        with self._lock:
+            self._compiled[definition.id] = compiled
+            self.compilations += 1
+            while len(self._compiled) > self.max_size:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def get(self, definition: Any) -> CompiledWorkflow:
+        with self._lock:
+            compiled = self._compiled.get(definition.id)
+            if compiled is not None:
+                self._compiled.move_to_end(definition.id)
+                return compiled
+        return self._put(definition)
+
+    def get_many(self, db: Session, definition_ids: Iterable[int]) -> Dict[int, CompiledWorkflow]:
+        """Compiled definitions by ID, loading the missing ones in one query"""
+        found: Dict[int, CompiledWorkflow] = {}
+        missing = []
+        with self._lock:
+            for definition_id in set(definition_ids):
+                compiled = self._compiled.get(definition_id)
+                if compiled is None:
+                    missing.append(definition_id)
+                else:
+                    found[definition_id] = compiled
+        for definition in WorkflowDefinitionRepository(db).get_by_ids(missing):
+            try:
+                found[definition.id] = self._put(definition)
+            except WorkflowDefinitionError as e:
+                logger.error(f"Workflow definition {definition.id} does not compile: {e}")
+        return found
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+class SlaScheduler:
+    """
+    Min-heap of (due time, instance ID) SLA timers
+
+    Holds only timers expiring within the loaded horizon; the heap is
+    reloaded from the due_at index every half horizon, which also picks up
+    timers set by other workers. Entries may be stale (the instance moved
+    on); firing re-checks due_at in the database, so that is harmless.
+    """
+
+    def __init__(self, horizon_seconds: float):
+        self.horizon = horizon_seconds
+        self._heap: List[Tuple[float, int]] = []
+        self._loaded_until: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def needs_refill(self, now: float) -> bool:
+        return self._loaded_until is None or now >= self._loaded_until - self.horizon / 2
+
+    def refill(self, timers: Iterable[Tuple[int, datetime]], until: float) -> None:
+        heap = [(_timestamp(due_at), instance_id) for instance_id, due_at in timers]
+        heapq.heapify(heap)
+        with self._lock:
+            self._heap = heap
+            self._loaded_until = until
+
+    def schedule(self, instance_id: int, due_at: datetime) -> None:
+        due = _timestamp(due_at)
+        with self._lock:
+            # Later timers are picked up by the next refill
+            if self._loaded_until is not None and due <= self._loaded_until:
+                heapq.heappush(self._heap, (due, instance_id))
+
+    def pop_due(self, now: float) -> List[int]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class WorkflowEngine:
+    """
+    Applies queued workflow actions in batches
+
+    API calls only validate and queue an action on the instance row. Each
+    tick fires expired SLA timers from the in-memory heap, claims a batch
+    of instances with queued actions (FOR UPDATE SKIP LOCKED, so workers
+    never block each other), evaluates them against the compiled tables,
+    and persists the batch with one bulk UPDATE plus one history INSERT.
+    """
+
+    def __init__(self, batch_size: int, horizon_seconds: float, cache_size: int):
+        self.batch_size = batch_size
+        self.registry = WorkflowRegistry(cache_size)
+        self.scheduler = SlaScheduler(horizon_seconds)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.ticks = 0
+
+    def fire_timers(self, db: Session, now: datetime) -> int:
+        """Queue the timeout action of instances whose SLA expired"""
+        instance_repo = WorkflowInstanceRepository(db)
+        clock = now.timestamp()
+        if self.scheduler.needs_refill(clock):
+            until = clock + self.scheduler.horizon
+            timers = instance_repo.get_timers(datetime.fromtimestamp(until, timezone.utc))
+            self.scheduler.refill(timers, until)
+            db.commit()
+
+        due_ids = self.scheduler.pop_due(clock)
+        if not due_ids:
+            return 0
+        rows = instance_repo.get_timer_states(due_ids)
+        compiled = self.registry.get_many(db, {row[1] for row in rows})
+        timeouts = []
+        for instance_id, definition_id, state, due_at in rows:
+            workflow = compiled.get(definition_id)
+            action = workflow.timeout_action(state) if workflow else None
+            if action and due_at is not None and _timestamp(due_at) <= clock:
+                timeouts.append({"b_id": instance_id, "b_due_at": due_at, "b_action": action})
+        queued = instance_repo.queue_timeouts(timeouts) if timeouts else 0
+        if not timeouts:
+            db.commit()
+        WORKFLOW_TRANSITIONS.labels("timeout").inc(queued)
+        return queued
+
+    def apply_pending(self, db: Session, now: datetime) -> int:
+        """Evaluate one batch of queued actions; returns the number of instances processed"""
+        instance_repo = WorkflowInstanceRepository(db)
+        claimed = instance_repo.claim_pending(self.batch_size)
+        if not claimed:
+            db.commit()
+            return 0
+
+        compiled = self.registry.get_many(db, {row[1] for row in claimed})
+        updates: List[dict] = []
+        rejected: List[dict] = []
+        history: List[dict] = []
+        timers: List[Tuple[int, datetime]] = []
+        for instance_id, definition_id, state, action, actor_id, comment, escalation_level, tenant_id in claimed:
+            workflow = compiled.get(definition_id)
+            target = workflow.next_state(state, action) if workflow else None
+            if target is None:
+                rejected.append({
+                    "id": instance_id,
+                    "pending_action": None,
+                    "pending_actor_id": None,
+                    "pending_comment": None,
+                    "last_error": f"Action '{action}' is not allowed in state '{state}'",
+                })
+                continue
+
+            due_at = workflow.due_at(target, now)
+            updates.append({
+                "id": instance_id,
+                "state": target,
+                "state_entered_at": now,
+                "is_completed": workflow.is_final(target),
+                "pending_action": None,
+                "pending_actor_id": None,
+                "pending_comment": None,
+                "last_error": None,
+                "due_at": due_at,
+                # Timer-driven transitions have no actor
+                "escalation_level": escalation_level + 1 if actor_id is None else 0,
+            })
+            history.append({
+                "instance_id": instance_id,
+                "from_state": state,
+                "to_state": target,
+                "action": action,
+                "actor_id": actor_id,
+                "comment": comment,
+                "tenant_id": tenant_id,
+            })
+            if due_at is not None:
+                timers.append((instance_id, due_at))
+
+        instance_repo.bulk_update(updates + rejected, commit=False)
+        WorkflowHistoryRepository(db).add_many(history)
+        completed = [{"instance_id": row["id"]} for row in updates if row["is_completed"]]
+        if completed:
+            job_queue.enqueue_many(db, "workflow.completed", completed)
+        db.commit()
+
+        for instance_id, due_at in timers:
+            self.scheduler.schedule(instance_id, due_at)
+        WORKFLOW_TRANSITIONS.labels("applied").inc(len(updates))
+        WORKFLOW_TRANSITIONS.labels("rejected").inc(len(rejected))
+        return len(claimed)
+
+    def tick(self, db: Session) -> int:
+        """Fire due timers, then drain queued actions batch by batch"""
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        self.fire_timers(db, now)
+        processed = 0
+        while True:
+            count = self.apply_pending(db, now)
+            processed += count
+            if count < self.batch_size:
+                break
+        self.ticks += 1
+        WORKFLOW_TICK_DURATION.observe(time.perf_counter() - started)
+        return processed
+
+    def _loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            db = SessionLocal()
+            try:
+                self.tick(db)
+            except Exception:
+                db.rollback()
+                logger.exception("Workflow engine tick failed")
+            finally:
+                db.close()
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._loop, args=(interval,), name="workflow-engine", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "compiled_definitions": len(self.registry),
+            "compilations": self.registry.compilations,
+            "scheduled_timers": len(self.scheduler),
+        }
+
+
+@job_queue.task("workflow.completed", batch=True)
+def notify_completed(db: Session, payloads: List[dict]) -> None:
+    """Email the outcome of finished requests to the users who started them"""
+    rows = WorkflowInstanceRepository(db).get_requesters(payload["instance_id"] for payload in payloads)
+    email_service = EmailService(db)
+    for instance, workflow_name, name, email in rows:
+        set_tenant(db, instance.tenant_id)  # The email job belongs to the instance's company
+        email_service.queue_approval(name, email, {
+            "entity_type": instance.entity_type.value,
+            "entity_id": instance.entity_id,
+            "state": instance.state,
+            "workflow": workflow_name,
+        })
+
+
+workflow_engine = WorkflowEngine(
+    batch_size=settings.WORKFLOW_BATCH_SIZE,
+    horizon_seconds=settings.WORKFLOW_SLA_HORIZON_SECONDS,
+    cache_size=settings.WORKFLOW_COMPILED_CACHE_SIZE
+)
+
+
+class WorkflowService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.definition_repo = WorkflowDefinitionRepository(db)
+        self.instance_repo = WorkflowInstanceRepository(db)
+        self.history_repo = WorkflowHistoryRepository(db)
+
+    def _definition_dict(self, definition_data: WorkflowDefinitionUpdate) -> dict:
+        definition_dict = definition_data.model_dump(mode="json", by_alias=True)
+        definition_dict['entity_type'] = definition_data.entity_type
+        # Compile before saving so broken definitions are rejected up front
+        try:
+            CompiledWorkflow(WorkflowDefinition(id=0, version=0, **definition_dict))
+        except WorkflowDefinitionError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        return definition_dict
+
+    def create_definition(self, definition_data: WorkflowDefinitionCreate, created_by_id: int) -> WorkflowDefinition:
+        """Create the first version of a workflow"""
+        if self.definition_repo.latest_version(definition_data.code):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Workflow code already exists"
+            )
+        definition_dict = self._definition_dict(definition_data)
+        definition_dict['version'] = 1
+        definition_dict['created_by'] = created_by_id
+        return self.definition_repo.create(definition_dict)
+
+    def get_definitions(self, skip: int = 0, limit: int = 100) -> List[WorkflowDefinition]:
+        return self.definition_repo.get_all(skip, limit)
+
+    def get_definition_by_id(self, definition_id: int) -> WorkflowDefinition:
+        definition = self.definition_repo.get(definition_id)
+        if not definition:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Workflow definition not found"
+            )
+        return definition
+
+    def publish_version(
+        self,
+        definition_id: int,
+        definition_data: WorkflowDefinitionUpdate,
+        created_by_id: int
+    ) -> WorkflowDefinition:
+        """
+        Publish the next version of a workflow
+
+        New instances use the new version; running instances finish on the
+        version they started with.
+        """
+        current = self.get_definition_by_id(definition_id)
+        definition_dict = self._definition_dict(definition_data)
+        definition_dict['code'] = current.code
+        definition_dict['version'] = self.definition_repo.latest_version(current.code) + 1
+        definition_dict['created_by'] = created_by_id
+
+        self.db.query(WorkflowDefinition).filter(
+            WorkflowDefinition.code == current.code
+        ).update({"is_active": False}, synchronize_session=False)
+        return self.definition_repo.create(definition_dict)
+
+    def start_instance(self, start_data: WorkflowStartRequest, actor_id: int) -> WorkflowInstance:
+        """Start a request on the active version of a workflow"""
+        definition = self.definition_repo.get_active_by_code(start_data.code)
+        if not definition:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Workflow not found"
+            )
+        workflow = workflow_engine.registry.get(definition)
+        now = datetime.now(timezone.utc)
+        due_at = workflow.due_at(workflow.initial_state, now)
+        instance = self.instance_repo.create({
+            "definition_id": definition.id,
+            "entity_type": definition.entity_type,
+            "entity_id": start_data.entity_id,
+            "state": workflow.initial_state,
+            "state_entered_at": now,
+            "is_completed": workflow.is_final(workflow.initial_state),
+            "due_at": due_at,
+            "created_by": actor_id,
+        })
+        if due_at is not None:
+            workflow_engine.scheduler.schedule(instance.id, due_at)
+        return instance
+
+    def get_instance(self, instance_id: int, with_history: bool = False) -> WorkflowInstance:
+        instance = self.instance_repo.get(instance_id)
+        if not instance:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Workflow instance not found"
+            )
+        if with_history:
+            instance.history = self.history_repo.get_by_instance(instance_id)
+        return instance
+
+    def submit_action(
+        self,
+        instance_id: int,
+        action_data: WorkflowActionRequest,
+        principal: Principal
+    ) -> WorkflowInstance:
+        """
+        Validate an action and queue it for the engine
+
+        The transition is applied by the next engine tick, together with
+        every other action queued meanwhile.
+        """
+        instance = self.get_instance(instance_id)
+        if instance.is_completed:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Workflow is already completed"
+            )
+        workflow = workflow_engine.registry.get(self.definition_repo.get(instance.definition_id))
+        if workflow.next_state(instance.state, action_data.action) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Action '{action_data.action}' is not allowed in state '{instance.state}'"
+            )
+        if not workflow.allows_role(instance.state, action_data.action, principal.role):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Your role cannot take this action"
+            )
+        if not self.instance_repo.queue_action(instance_id, action_data.action, principal.id, action_data.comment):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Another action is already pending for this workflow"
+            )
+        self.db.refresh(instance)
+        return instance
\ No newline at end of file
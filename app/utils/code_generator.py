@@ -1 +1,64 @@
 # Employee code generation
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import threading
+
+
+def format_employee_code(prefix: str, number: int, padding: int, suffix: Optional[str] = None) -> str:
+    """Render a sequence number as an employee code, e.g. EMP00042"""
+    return f"{prefix}{str(number).zfill(padding)}{suffix or ''}"
+
+
+class NumberBlockAllocator:
+    """
+    Thread-safe pool of sequence numbers reserved in blocks
+
+    `reserve(key, count)` must atomically claim `count` numbers for `key`
+    and return the first one. Numbers are then handed out from memory until
+    the block runs out, so the shared counter is touched once per block
+    instead of once per number. Each block is exclusive to this process;
+    numbers left over when the process exits are skipped, not reused.
+    """
+
+    def __init__(self, reserve: Callable[[Hashable, int], int], block_size: int):
+        self._reserve = reserve
+        self.block_size = max(block_size, 1)
+        self._blocks: Dict[Hashable, Tuple[int, int]] = {}  # key -> [next, end)
+        self._lock = threading.Lock()
+        self._reservations = 0
+
+    def take(self, key: Hashable, count: int) -> List[int]:
+        """`count` unused numbers for `key`, ascending"""
+        if count <= 0:
+            return []
+        with self._lock:
+            numbers: List[int] = []
+            next_number, end = self._blocks.get(key, (0, 0))
+            if next_number < end:
+                numbers.extend(range(next_number, min(end, next_number + count)))
+                next_number += len(numbers)
+            missing = count - len(numbers)
+            if missing:
+                # Requests larger than a block get one reservation of their own size
+                size = max(self.block_size, missing)
+                first = self._reserve(key, size)
+                self._reservations += 1
+                numbers.extend(range(first, first + missing))
+                next_number, end = first + missing, first + size
+            self._blocks[key] = (next_number, end)
+            return numbers
+
+    def discard(self, key: Optional[Hashable] = None) -> None:
+        """Drop the unused part of a block (all blocks when key is None)"""
+        with self._lock:
+            if key is None:
+                self._blocks.clear()
+            else:
+                self._blocks.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "block_size": self.block_size,
+                "reservations": self._reservations,
+                "available": sum(end - next_number for next_number, end in self._blocks.values()),
+            }
\ No newline at end of file
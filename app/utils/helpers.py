@@ -1 +1,16 @@
 # Helper functions
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most `size` items"""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
\ No newline at end of file
@@ -0,0 +1,66 @@
+# Streaming row readers for uploaded spreadsheets
+import codecs
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SUPPORTED_IMPORT_EXTENSIONS = (".csv", ".xlsx")
+
+
+class ImportFileError(ValueError):
+    """Raised when an uploaded import file cannot be read"""
+
+
+def normalize_header(value: Any) -> str:
+    """'Date of Joining ' -> 'date_of_joining'"""
+    return "_".join(str(value or "").strip().lower().replace("-", " ").split())
+
+
+def _rows_to_dicts(header: List[str], rows: Iterator[Tuple[int, List[Any]]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    for row_number, values in rows:
+        if not any(value not in (None, "") for value in values):
+            continue
+        yield row_number, {key: value for key, value in zip(header, values) if key}
+
+
+def iter_csv_rows(path: Path, encoding: str = "utf-8-sig") -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (row_number, row) from a CSV file without loading it into memory"""
+    with open(path, "rb") as raw:
+        reader = csv.reader(codecs.iterdecode(raw, encoding, errors="replace"))
+        try:
+            header = [normalize_header(value) for value in next(reader)]
+        except StopIteration:
+            raise ImportFileError("File is empty")
+        yield from _rows_to_dicts(header, ((index, row) for index, row in enumerate(reader, start=2)))
+
+
+def iter_xlsx_rows(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (row_number, row) from the first worksheet using openpyxl's streaming reader"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError("XLSX imports require the 'openpyxl' package")
+
+    try:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+    except Exception as e:
+        raise ImportFileError(f"Unreadable XLSX file: {e}")
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        try:
+            header = [normalize_header(value) for value in next(rows)]
+        except StopIteration:
+            raise ImportFileError("File is empty")
+        yield from _rows_to_dicts(header, ((index, list(row)) for index, row in enumerate(rows, start=2)))
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(path: Path, filename: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Pick a reader based on the original file extension"""
+    suffix = Path(filename or path.name).suffix.lower()
+    if suffix == ".csv":
+        return iter_csv_rows(path)
+    if suffix == ".xlsx":
+        return iter_xlsx_rows(path)
+    raise ImportFileError(f"Unsupported file type '{suffix}'. Use CSV or XLSX.")
\ No newline at end of file
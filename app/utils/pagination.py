@@ -1 +1,80 @@
 # Pagination utilities
+import base64
+import hashlib
+import hmac
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from ..core.config import settings
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or has been tampered with"""
+
+
+class CursorPageResult(NamedTuple):
+    """One page of a keyset-paginated query"""
+    items: List[Any]
+    next_cursor: Optional[str]
+    has_more: bool
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+_SIGNATURE_SIZE = 16
+
+
+def _sign(payload: bytes) -> bytes:
+    digest = hmac.new(settings.SECRET_KEY.encode("utf-8"), payload, hashlib.sha256).digest()
+    return digest[:_SIGNATURE_SIZE]
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Serialize keyset position into an opaque, signed, URL-safe token"""
+    payload = json.dumps(
+        {key: _encode_value(value) for key, value in data.items()},
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    token = payload + _sign(payload)
+    return base64.urlsafe_b64encode(token).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Verify and deserialize a token produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        token = base64.urlsafe_b64decode(padded.encode("ascii"))
+    except (ValueError, UnicodeEncodeError):
+        raise InvalidCursorError("Malformed pagination cursor")
+
+    payload, signature = token[:-_SIGNATURE_SIZE], token[-_SIGNATURE_SIZE:]
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    try:
+        data = json.loads(payload)
+        return {key: _decode_value(value) for key, value in data.items()}
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Malformed pagination cursor")
@@ -1 +1,24 @@
 # Custom validators
+from typing import Optional, Tuple
+
+# (signature offset, signature, content type, extension)
+IMAGE_SIGNATURES = (
+    (0, b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (0, b"GIF87a", "image/gif", "gif"),
+    (0, b"GIF89a", "image/gif", "gif"),
+    (8, b"WEBP", "image/webp", "webp"),
+)
+
+# Bytes needed to recognise every signature above
+IMAGE_SNIFF_SIZE = 16
+
+
+def detect_image_type(header: bytes) -> Optional[Tuple[str, str]]:
+    """Identify an image from its leading bytes; returns (content_type, extension)"""
+    for offset, signature, content_type, extension in IMAGE_SIGNATURES:
+        if header[offset:offset + len(signature)] == signature:
+            if extension == "webp" and not header.startswith(b"RIFF"):
+                continue
+            return content_type, extension
+    return None
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Benchmark the admin listing response path
+
+Compares FastAPI's default handling of `CursorPage[AdminResponse]`
+(model validation from ORM attributes, response_model serialization) with
+FastJSONResponse fed by the precompiled RowSerializer:
+    python scripts/benchmark_serialization.py [--rows 200] [--requests 200]
+
+Both routes serve the same in-memory User rows through the ASGI stack, so
+the difference is serialization only; no database is involved.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.responses import FastJSONResponse, orjson
+from app.models.user import User
+from app.schemas.common import CursorPage
+from app.schemas.enums import UserRole, UserStatus
+from app.schemas.user import AdminResponse, admin_serializer
+
+
+def make_rows(count):
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id=i,
+            name=f"Company {i}",
+            email=f"admin{i}@example.com",
+            role=UserRole.ADMIN,
+            status=UserStatus.ACTIVE,
+            account_url=f"https://example.com/accounts/{i}",
+            phone_number="+1 555 0100",
+            website="https://example.com",
+            address="1 Example Street, Springfield",
+            plan_name="Business",
+            plan_type="yearly",
+            currency="USD",
+            language="English",
+            profile_image=None,
+            created_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def build_app(rows):
+    app = FastAPI()
+
+    @app.get("/default", response_model=CursorPage[AdminResponse])
+    def default_path():
+        return CursorPage[AdminResponse](items=rows, next_cursor=None, has_more=False, limit=len(rows))
+
+    @app.get("/fast", response_model=CursorPage[AdminResponse], response_class=FastJSONResponse)
+    def fast_path():
+        return FastJSONResponse(admin_serializer.page(rows, None, False, len(rows)))
+
+    return app
+
+
+def measure(client, path, requests):
+    client.get(path)  # warm up
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path)
+    elapsed = time.perf_counter() - started
+    return elapsed, response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200, help="rows per page")
+    parser.add_argument("--requests", type=int, default=200, help="requests per path")
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.rows)
+    client = TestClient(build_app(rows))
+    total = args.rows * args.requests
+    print(f"{args.requests} requests x {args.rows} rows (orjson {'available' if orjson else 'missing'})")
+
+    results = {}
+    for path in ("/default", "/fast"):
+        elapsed, response = measure(client, path, args.requests)
+        results[path] = (elapsed, response.content)
+        print(f"  {path:<9} {elapsed:7.3f}s  {total / elapsed:12,.0f} rows/s")
+
+    if results["/default"][1] != results["/fast"][1]:
+        print("  ✗ response bodies differ")
+        return 1
+    print(f"  identical bodies, {results['/default'][0] / results['/fast'][0]:.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
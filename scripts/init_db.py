@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, ProgrammingError
 from app.models.base import Base
 from app.models.user import User
+import app.models  # noqa: F401 - registers all models on Base.metadata
 from app.schemas.enums import UserRole, UserStatus
 from app.core.database import engine, get_db_context
 from app.core.security import get_password_hash
@@ -0,0 +1,172 @@
+"""
+Convert large tenant-scoped tables to PostgreSQL partitioned tables
+
+Queries scoped to one tenant (see app/core/tenancy.py) then only scan that
+tenant's partition and its indexes:
+    python scripts/partition_by_tenant.py                      # list candidate tables
+    python scripts/partition_by_tenant.py workflow_history --partitions 16
+    python scripts/partition_by_tenant.py workflow_history --strategy list --tenants 3 7
+    python scripts/partition_by_tenant.py workflow_history --add-tenants 12
+
+hash spreads tenants over a fixed number of partitions. list gives each
+named tenant (large customers) a partition of its own and keeps everyone
+else in a DEFAULT partition; --add-tenants moves more tenants out of it
+later.
+
+PostgreSQL requires the partition key in the primary key, so a converted
+table's primary key becomes (tenant_id, id); the ORM keeps identifying rows
+by id, which the sequence still keeps unique. Tables referenced by foreign
+keys cannot be partitioned, and every row must have a tenant_id. Each
+table is converted in one transaction.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import Table, UniqueConstraint, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import AddConstraint, CreateIndex
+from app.models.base import Base
+import app.models  # noqa: F401 - registers all models on Base.metadata
+from app.core.database import engine
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PartitionError(Exception):
+    """Table that cannot be converted as requested"""
+
+
+def candidates():
+    """Tenant-scoped tables that no foreign key points to"""
+    referenced = {
+        fk.column.table.name
+        for table in Base.metadata.tables.values()
+        for fk in table.foreign_keys
+    }
+    return sorted(
+        name for name, table in Base.metadata.tables.items()
+        if "tenant_id" in table.c and name not in referenced
+    )
+
+
+def _relkind(conn: Connection, name: str):
+    return conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": name}
+    ).scalar()
+
+
+def convert(conn: Connection, table: Table, strategy: str, partitions: int, tenants) -> None:
+    """Recreate `table` partitioned by tenant_id and move its rows over"""
+    name = table.name
+    if name not in candidates():
+        raise PartitionError(f"{name} has no tenant_id column or is referenced by foreign keys")
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and "tenant_id" not in constraint.columns:
+            raise PartitionError(f"{name}: unique constraint {constraint.name} does not include tenant_id")
+    if _relkind(conn, name) == "p":
+        raise PartitionError(f"{name} is already partitioned")
+    if conn.execute(text(f"SELECT 1 FROM {name} WHERE tenant_id IS NULL LIMIT 1")).first():
+        raise PartitionError(f"{name} has rows without a tenant_id")
+
+    old = f"{name}_unpartitioned"
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence(:name, 'id')"), {"name": name}).scalar()
+    method = "HASH" if strategy == "hash" else "LIST"
+
+    conn.execute(text(f"ALTER TABLE {name} RENAME TO {old}"))
+    conn.execute(text(
+        f"CREATE TABLE {name} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY {method} (tenant_id)"
+    ))
+    if strategy == "hash":
+        for remainder in range(partitions):
+            conn.execute(text(
+                f"CREATE TABLE {name}_p{remainder} PARTITION OF {name} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            ))
+    else:
+        for tenant_id in tenants:
+            conn.execute(text(f"CREATE TABLE {name}_t{tenant_id} PARTITION OF {name} FOR VALUES IN ({tenant_id})"))
+        conn.execute(text(f"CREATE TABLE {name}_default PARTITION OF {name} DEFAULT"))
+
+    conn.execute(text(f"INSERT INTO {name} SELECT * FROM {old}"))
+    if sequence:
+        # Keep the ID sequence when the old table is dropped
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {name}.id"))
+    conn.execute(text(f"DROP TABLE {old}"))
+
+    # Keys and indexes are declared on the parent and created on every partition
+    conn.execute(text(f"ALTER TABLE {name} ALTER COLUMN tenant_id SET NOT NULL"))
+    conn.execute(text(f"ALTER TABLE {name} ADD PRIMARY KEY (tenant_id, id)"))
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            conn.execute(AddConstraint(constraint))
+    for constraint in table.foreign_key_constraints:
+        conn.execute(AddConstraint(constraint))
+    for index in table.indexes:
+        conn.execute(CreateIndex(index))
+
+
+def add_tenants(conn: Connection, table: Table, tenants) -> None:
+    """Give tenants of a LIST-partitioned table their own partitions"""
+    name = table.name
+    if _relkind(conn, f"{name}_default") is None:
+        raise PartitionError(f"{name} is not list-partitioned with a {name}_default partition")
+    for tenant_id in tenants:
+        partition = f"{name}_t{tenant_id}"
+        if _relkind(conn, partition) is not None:
+            raise PartitionError(f"{partition} already exists")
+        # The default partition may not keep rows of a tenant being attached
+        conn.execute(text(f"CREATE TABLE {partition} (LIKE {name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        conn.execute(text(f"INSERT INTO {partition} SELECT * FROM {name}_default WHERE tenant_id = {tenant_id}"))
+        conn.execute(text(f"DELETE FROM {name}_default WHERE tenant_id = {tenant_id}"))
+        conn.execute(text(f"ALTER TABLE {name} ATTACH PARTITION {partition} FOR VALUES IN ({tenant_id})"))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Partition tenant-scoped tables by tenant_id")
+    parser.add_argument("tables", nargs="*")
+    parser.add_argument("--strategy", choices=["hash", "list"], default="hash")
+    parser.add_argument("--partitions", type=int, default=16, help="hash partitions per table")
+    parser.add_argument("--tenants", type=int, nargs="*", default=[], help="tenants with their own list partition")
+    parser.add_argument("--add-tenants", type=int, nargs="*", help="move tenants of a list-partitioned table to their own partitions")
+    args = parser.parse_args(argv)
+
+    if not args.tables:
+        logger.info(f"Tables that can be partitioned: {', '.join(candidates())}")
+        return 0
+    if engine.dialect.name != "postgresql":
+        logger.error("Partitioning requires PostgreSQL")
+        return 2
+    if args.partitions < 1:
+        logger.error("--partitions must be at least 1")
+        return 2
+
+    failed = False
+    for name in args.tables:
+        table = Base.metadata.tables.get(name)
+        if table is None:
+            logger.error(f"✗ {name}: unknown table")
+            failed = True
+            continue
+        try:
+            with engine.begin() as conn:
+                if args.add_tenants is not None:
+                    add_tenants(conn, table, args.add_tenants)
+                else:
+                    convert(conn, table, args.strategy, args.partitions, args.tenants)
+        except PartitionError as e:
+            logger.error(f"✗ {e}")
+            failed = True
+            continue
+        logger.info(f"✓ {name} partitioned by tenant_id")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
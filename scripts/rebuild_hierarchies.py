@@ -0,0 +1,51 @@
+"""
+Rebuild organization hierarchy closure tables from parent_id
+
+Run after migrations or bulk loads that write parent_id directly:
+    python scripts/rebuild_hierarchies.py [departments] [business_units] [cost_centers]
+With no arguments every hierarchy is rebuilt.
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import get_db_context
+from app.repositories.department_repository import DepartmentRepository
+from app.repositories.business_unit_repository import BusinessUnitRepository
+from app.repositories.cost_center_repository import CostCenterRepository
+from app.repositories.hierarchy_repository import HierarchyError
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HIERARCHIES = {
+    "departments": DepartmentRepository,
+    "business_units": BusinessUnitRepository,
+    "cost_centers": CostCenterRepository,
+}
+
+def rebuild(names):
+    """Rebuild the named closure tables, each in its own transaction"""
+    failed = False
+    for name in names:
+        started = time.perf_counter()
+        try:
+            with get_db_context() as db:
+                rows = HIERARCHIES[name](db).rebuild()
+        except HierarchyError as e:
+            logger.error(f"✗ {name}: {e}")
+            failed = True
+            continue
+        logger.info(f"✓ {name}: {rows} closure rows in {time.perf_counter() - started:.2f}s")
+    return not failed
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(HIERARCHIES)
+    unknown = [name for name in names if name not in HIERARCHIES]
+    if unknown:
+        logger.error(f"Unknown hierarchies: {', '.join(unknown)} (choose from {', '.join(HIERARCHIES)})")
+        sys.exit(2)
+    sys.exit(0 if rebuild(names) else 1)
\ No newline at end of file
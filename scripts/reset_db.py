@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.models.base import Base
+import app.models  # noqa: F401 - registers all models on Base.metadata
 from app.core.database import engine
 from app.core.config import settings
 import logging
@@ -0,0 +1,81 @@
+"""
+Run background job workers outside the API processes
+
+    python scripts/run_job_workers.py [--processes N] [--threads N] [--queues default,reports] [--no-email]
+
+Starts N processes with a pool of worker threads each; every process
+claims its own batches from the jobs table, so throughput grows with the
+number of processes across any number of hosts. Each process also runs an
+email sender unless --no-email is given. Set JOB_WORKER_ENABLED=false and
+EMAIL_SENDER_ENABLED=false on the API when all jobs should run here. SIGINT/SIGTERM lets running
+batches finish before exiting.
+"""
+import argparse
+import multiprocessing
+import signal
+import threading
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+import logging
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def run_worker(threads, queues, email):
+    """Body of one worker process"""
+    import app.main  # noqa: F401 - imports every module that registers job handlers
+    from app.core.events import job_worker
+    from app.core.metrics import registry as metrics_registry
+    from app.services.email_service import email_sender, email_worker
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    job_worker.threads = threads
+    job_worker.queues = queues
+    if settings.METRICS_ENABLED:
+        metrics_registry.start(settings.METRICS_FLUSH_INTERVAL)
+    job_worker.start()
+    if email:
+        email_worker.start()
+    logger.info(f"✓ Worker {job_worker.worker_id}: {threads} threads on {', '.join(queues)}")
+    stop.wait()
+    job_worker.stop()
+    email_worker.stop()
+    email_sender.close()
+    metrics_registry.stop()
+    logger.info(f"✓ Worker {job_worker.worker_id} stopped")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument("--processes", type=int, default=settings.JOB_WORKER_PROCESSES)
+    parser.add_argument("--threads", type=int, default=settings.JOB_WORKER_THREADS)
+    parser.add_argument("--queues", default=",".join(settings.JOB_QUEUES), help="Comma-separated queue names")
+    parser.add_argument("--no-email", action="store_true", help="Do not send email from these processes")
+    args = parser.parse_args()
+    queues = [name.strip() for name in args.queues.split(",") if name.strip()]
+
+    # Fresh interpreters, so no process inherits another's pooled connections
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, args=(args.threads, queues, not args.no_email), name=f"job-worker-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The children get SIGINT from the terminal themselves
+
+    for process in processes:
+        process.join()
+    sys.exit(max((process.exitcode or 0) for process in processes))
\ No newline at end of file
@@ -1 +1,42 @@
-# Pytest fixtures
+# Shared fixtures: an in-memory SQLite database per test
+import os
+import tempfile
+
+# Settings are read on import, so point the app at SQLite before anything imports it;
+# tests use their own in-memory engine, the app's engines are never connected
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/levitica_hr_test.db")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.models.base import Base
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
\ No newline at end of file
@@ -0,0 +1,117 @@
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1.deps import get_current_user
+from app.api.v1.endpoints import files
+from app.core.storage import LocalBlobStorage
+from app.main import app
+
+CONTENT = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+URL = f"/api/v1/upload/files/{DIGEST}"
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = LocalBlobStorage(tmp_path / "blobs")
+    monkeypatch.setattr(files, "blob_storage", storage)
+    monkeypatch.setattr(files.image_store, "schedule", lambda digest: None)
+    return storage
+
+
+@pytest.fixture
+def client(storage):
+    app.dependency_overrides[get_current_user] = lambda: object()
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def _upload(client, content=CONTENT, filename="avatar.png"):
+    return client.post("/api/v1/upload/profile-image", files={"file": (filename, content, "image/png")})
+
+
+@pytest.fixture
+def stored(client):
+    assert _upload(client).status_code == 200
+
+
+class TestUpload:
+    def test_same_content_is_deduplicated(self, client, storage):
+        first = _upload(client).json()
+        second = _upload(client, filename="renamed.png").json()
+
+        assert first["image_id"] == second["image_id"] == DIGEST
+        assert (first["deduplicated"], second["deduplicated"]) == (False, True)
+        assert first["file_url"] == URL
+        assert list(storage.staging_dir().iterdir()) == []
+
+    def test_other_content_gets_its_own_blob(self, client):
+        other = _upload(client, content=CONTENT + b"\x00").json()
+
+        assert other["image_id"] == hashlib.sha256(CONTENT + b"\x00").hexdigest()
+        assert other["deduplicated"] is False
+
+    def test_non_images_are_rejected(self, client, storage):
+        response = _upload(client, content=b"%PDF-1.7 not an image at all")
+
+        assert response.status_code == 400
+        assert list(storage.staging_dir().iterdir()) == []
+
+
+@pytest.mark.usefixtures("stored")
+class TestGetFile:
+    def test_full_response(self, client):
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == f'"{DIGEST}"'
+        assert "immutable" in response.headers["cache-control"]
+
+    @pytest.mark.parametrize("if_none_match", [f'"{DIGEST}"', f'W/"{DIGEST}"', f'"other", "{DIGEST}"', "*"])
+    def test_matching_if_none_match_is_not_modified(self, client, if_none_match):
+        response = client.get(URL, headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == f'"{DIGEST}"'
+
+    def test_other_if_none_match_gets_the_file(self, client):
+        response = client.get(URL, headers={"If-None-Match": '"other"'})
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+
+    @pytest.mark.parametrize("byte_range, start, end", [
+        ("bytes=0-7", 0, 7),
+        ("bytes=100-199", 100, 199),
+        ("bytes=-16", len(CONTENT) - 16, len(CONTENT) - 1),
+        ("bytes=1000-", 1000, len(CONTENT) - 1),
+    ])
+    def test_range(self, client, byte_range, start, end):
+        response = client.get(URL, headers={"Range": byte_range})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[start:end + 1]
+        assert response.headers["content-range"] == f"bytes {start}-{end}/{len(CONTENT)}"
+
+    @pytest.mark.parametrize("byte_range", [f"bytes={len(CONTENT)}-", f"bytes={len(CONTENT) + 10}-{len(CONTENT) + 20}"])
+    def test_unsatisfiable_range(self, client, byte_range):
+        response = client.get(URL, headers={"Range": byte_range})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+    def test_head(self, client):
+        response = client.head(URL)
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) == len(CONTENT)
+
+    @pytest.mark.parametrize("digest", ["0" * 64, "not-a-digest", DIGEST.upper()])
+    def test_unknown_or_invalid_digest(self, client, digest):
+        assert client.get(f"/api/v1/upload/files/{digest}").status_code == 404
\ No newline at end of file
@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core import events
+from app.core.events import JobBatchError, JobError, JobQueue, JobWorker
+from app.core.tenancy import get_tenant, set_tenant
+from app.models.job import Job
+from app.models.location import Location
+from app.repositories.job_repository import JobRepository
+from app.schemas.enums import JobStatus
+
+RETRY_BASE = 10
+
+
+@pytest.fixture
+def queue():
+    return JobQueue(max_attempts=3, retry_base_seconds=RETRY_BASE, retry_max_seconds=25)
+
+
+@pytest.fixture
+def worker(queue, engine, monkeypatch):
+    # Workers open their own sessions; point them at the test database
+    monkeypatch.setattr(events, "SessionLocal", sessionmaker(bind=engine))
+    worker = JobWorker(
+        queue, threads=1, batch_size=10, poll_interval=1, queues=["default"],
+        lock_timeout_seconds=60, retention_hours=1
+    )
+    yield worker
+    events._workers.remove(worker)
+
+
+def _jobs(db):
+    db.expire_all()
+    return db.query(Job).order_by(Job.id).all()
+
+
+def _make_due(db):
+    db.query(Job).update({"run_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+    db.commit()
+
+
+def _delay(job):
+    return (job.run_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds()
+
+
+class TestJobQueue:
+    def test_enqueue_writes_in_the_callers_transaction(self, db, queue):
+        queue.task("greet", priority=3)(lambda db, payload: None)
+        set_tenant(db, 7)
+
+        queue.enqueue(db, "greet", {"name": "Asha"})
+        db.rollback()
+        assert _jobs(db) == []
+
+        queue.enqueue(db, "greet", {"name": "Asha"})
+        db.commit()
+        job = _jobs(db)[0]
+        assert (job.payload, job.priority, job.tenant_id, job.max_attempts) == ({"name": "Asha"}, 3, 7, 3)
+
+    def test_unknown_and_duplicate_tasks_are_refused(self, db, queue):
+        queue.task("greet")(lambda db, payload: None)
+
+        with pytest.raises(ValueError):
+            queue.enqueue(db, "unknown")
+        with pytest.raises(ValueError):
+            queue.task("greet")(lambda db, payload: None)
+
+    def test_retry_delay_doubles_up_to_the_maximum(self, queue):
+        for attempts, full in [(1, 10), (2, 20), (3, 25), (10, 25)]:
+            delays = [queue.retry_delay(attempts) for _ in range(50)]
+            assert all(full * 0.5 <= delay <= full for delay in delays)
+
+
+class TestJobWorker:
+    def test_runs_jobs_in_their_tenant_and_marks_them_done(self, db, queue, worker):
+        seen = []
+        queue.task("greet")(lambda db, payload: seen.append((get_tenant(db), payload["n"])))
+        set_tenant(db, 7)
+        queue.enqueue_many(db, "greet", [{"n": 1}, {"n": 2}])
+        db.commit()
+
+        assert worker.run_once() == 2
+
+        assert seen == [(7, 1), (7, 2)]
+        assert [job.status for job in _jobs(db)] == [JobStatus.DONE, JobStatus.DONE]
+        assert worker.run_once() == 0
+
+    def test_failed_job_is_retried_with_backoff_then_failed(self, db, queue, worker):
+        calls = []
+
+        def flaky(db, payload):
+            calls.append(payload)
+            raise RuntimeError("SMTP down")
+
+        queue.task("flaky")(flaky)
+        queue.enqueue(db, "flaky")
+        db.commit()
+
+        worker.run_once()
+        job = _jobs(db)[0]
+        assert (job.status, job.attempts, job.last_error) == (JobStatus.QUEUED, 1, "RuntimeError: SMTP down")
+        assert RETRY_BASE * 0.5 - 1 <= _delay(job) <= RETRY_BASE
+
+        _make_due(db)
+        worker.run_once()
+        assert RETRY_BASE - 1 <= _delay(_jobs(db)[0]) <= RETRY_BASE * 2
+
+        _make_due(db)
+        worker.run_once()
+        job = _jobs(db)[0]
+        assert (job.status, job.attempts, len(calls)) == (JobStatus.FAILED, 3, 3)
+        assert worker.stats()["failed_attempts"] == 3
+
+    def test_job_error_without_retry_fails_at_once(self, db, queue, worker):
+        def invalid(db, payload):
+            raise JobError("No such employee", retry=False)
+
+        queue.task("invalid")(invalid)
+        queue.enqueue(db, "invalid")
+        db.commit()
+
+        worker.run_once()
+
+        job = _jobs(db)[0]
+        assert (job.status, job.attempts) == (JobStatus.FAILED, 1)
+
+    def test_a_failing_job_does_not_undo_the_others(self, db, queue, worker):
+        def handler(db, payload):
+            db.add(Location(name="Office", code=f"L{payload['n']}"))
+            db.flush()
+            if payload["n"] == 2:
+                raise RuntimeError("bad payload")
+
+        queue.task("write")(handler)
+        queue.enqueue_many(db, "write", [{"n": 1}, {"n": 2}, {"n": 3}])
+        db.commit()
+
+        worker.run_once()
+
+        assert sorted(location.code for location in db.query(Location)) == ["L1", "L3"]
+        assert [job.status for job in _jobs(db)] == [JobStatus.DONE, JobStatus.QUEUED, JobStatus.DONE]
+
+    def test_batch_handler_reports_partial_failures(self, db, queue, worker):
+        batches = []
+
+        def send(db, payloads):
+            batches.append(payloads)
+            raise JobBatchError({1: "mailbox full", 2: "no such address"}, permanent=[2])
+
+        queue.task("send", batch=True)(send)
+        queue.enqueue_many(db, "send", [{"n": 1}, {"n": 2}, {"n": 3}])
+        db.commit()
+
+        worker.run_once()
+
+        assert batches == [[{"n": 1}, {"n": 2}, {"n": 3}]]
+        assert [(job.status, job.last_error) for job in _jobs(db)] == [
+            (JobStatus.DONE, None),
+            (JobStatus.QUEUED, "mailbox full"),
+            (JobStatus.FAILED, "no such address"),
+        ]
+
+    def test_unknown_task_is_requeued_without_using_an_attempt(self, db, queue, worker):
+        now = datetime.now(timezone.utc)
+        JobRepository(db).add_many([{
+            "queue": "default", "name": "from.newer.release", "payload": {}, "status": JobStatus.QUEUED,
+            "attempts": 0, "max_attempts": 1, "run_at": now, "created_at": now,
+        }])
+        db.commit()
+
+        for _ in range(3):
+            assert worker.run_once() == 1
+            job = _jobs(db)[0]
+            assert (job.status, job.attempts) == (JobStatus.QUEUED, 0)
+            assert job.last_error == "Unknown job 'from.newer.release'"
+            assert RETRY_BASE - 1 <= _delay(job) <= RETRY_BASE
+            _make_due(db)
+
+        assert worker.stats()["deferred"] == 3
+
+        # A worker that knows the task runs it with its attempts intact
+        queue.task("from.newer.release")(lambda db, payload: None)
+        worker.run_once()
+        assert (_jobs(db)[0].status, _jobs(db)[0].attempts) == (JobStatus.DONE, 1)
\ No newline at end of file
@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from app.core.revocation import BUCKET_SECONDS, InMemoryRevocationBackend, TokenDenylist, TokenRevocation
+from app.core.security import create_access_token, decode_access_token
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingBackend(InMemoryRevocationBackend):
+    """Shared event log standing in for the Redis stream"""
+
+    def __init__(self, log):
+        self.log = log
+        self.read = 0
+
+    def publish(self, event):
+        self.log.append(event)
+
+    def fetch(self):
+        events, self.read = self.log[self.read:], len(self.log)
+        return events
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+class TestTokenDenylist:
+    def test_revoked_jti_is_found_through_its_expiry_bucket(self, clock):
+        denylist = TokenDenylist(clock)
+        exp = int(clock.now) + 300
+        denylist.revoke_jti("a", exp)
+
+        assert denylist.is_revoked({"jti": "a", "exp": exp})
+        assert not denylist.is_revoked({"jti": "b", "exp": exp})
+        assert denylist.is_jti_revoked("a", exp)
+        # Another expiry points at another bucket; tokens carry their own exp, so this never happens for real
+        assert not denylist.is_jti_revoked("a", exp + BUCKET_SECONDS)
+
+    def test_buckets_are_dropped_once_their_tokens_expired(self, clock):
+        denylist = TokenDenylist(clock)
+        exp = int(clock.now) + 90
+        denylist.revoke_jti("a", exp)
+
+        clock.now = exp
+        denylist.prune()
+        assert denylist.is_jti_revoked("a", exp)
+
+        clock.now = (exp // BUCKET_SECONDS + 1) * BUCKET_SECONDS
+        denylist.prune()
+        assert denylist.stats()["buckets"] == 0
+
+    def test_subject_revocation_covers_tokens_issued_up_to_the_millisecond(self, clock):
+        denylist = TokenDenylist(clock)
+        denylist.revoke_subject("a@example.com", before=1000.457, until=5000)
+
+        assert denylist.is_revoked({"sub": "a@example.com", "iat": 999})  # Whole-second iat of older tokens
+        assert denylist.is_revoked({"sub": "a@example.com", "iat": 1000.457})
+        assert not denylist.is_revoked({"sub": "a@example.com", "iat": 1000.458})
+        assert not denylist.is_revoked({"sub": "b@example.com", "iat": 1000.0})
+
+    def test_an_older_subject_revocation_does_not_shorten_a_newer_one(self, clock):
+        denylist = TokenDenylist(clock)
+        denylist.revoke_subject("a@example.com", before=2000.0, until=5000)
+        denylist.revoke_subject("a@example.com", before=1000.0, until=5000)  # Replayed late from another worker
+
+        assert denylist.is_revoked({"sub": "a@example.com", "iat": 1500.0})
+
+    def test_family_revocation_and_expiry(self, clock):
+        denylist = TokenDenylist(clock)
+        denylist.revoke_family("f1", until=int(clock.now) + 10)
+
+        assert denylist.is_revoked({"fam": "f1", "iat": clock.now + 5})
+        assert not denylist.is_revoked({"fam": "f2"})
+
+        clock.now += 11
+        denylist.prune()
+        assert not denylist.is_revoked({"fam": "f1"})
+
+
+class TestTokenRevocation:
+    def test_token_issued_before_revoke_subject_is_rejected_and_after_accepted(self):
+        tokens = TokenRevocation(InMemoryRevocationBackend())
+        before = decode_access_token(create_access_token({"sub": "a@example.com"}))
+
+        tokens.revoke_subject("a@example.com")
+        time.sleep(0.002)  # Next millisecond, most likely still the same second
+        after = decode_access_token(create_access_token({"sub": "a@example.com"}))
+
+        assert tokens.is_revoked(before)
+        assert not tokens.is_revoked(after)
+
+    def test_events_reach_other_workers_on_sync(self, clock):
+        log = []
+        first = TokenRevocation(RecordingBackend(log), clock)
+        second = TokenRevocation(RecordingBackend(log), clock)
+        exp = int(clock.now) + 300
+
+        first.revoke_token({"jti": "a", "exp": exp})
+        first.revoke_family("f1")
+        first.revoke_subject("a@example.com")
+        assert not second.is_revoked({"jti": "a", "exp": exp})
+
+        second.sync()
+
+        assert second.is_revoked({"jti": "a", "exp": exp})
+        assert second.is_revoked({"fam": "f1"})
+        assert second.is_revoked({"sub": "a@example.com", "iat": clock.now})
+        assert second.stats()["revoked_tokens"] == 1
+
+    def test_publish_failure_still_revokes_locally(self, clock):
+        class BrokenBackend(InMemoryRevocationBackend):
+            def publish(self, event):
+                raise ConnectionError("down")
+
+        tokens = TokenRevocation(BrokenBackend(), clock)
+        tokens.revoke_family("f1")
+
+        assert tokens.is_revoked({"fam": "f1"})
\ No newline at end of file
@@ -0,0 +1,80 @@
+import hashlib
+
+import pytest
+
+from app.core.storage import LocalBlobStorage, is_valid_digest
+
+CONTENT = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalBlobStorage(tmp_path / "blobs")
+
+
+def _staged(storage, content=CONTENT, name="upload.part"):
+    path = storage.staging_dir() / name
+    path.write_bytes(content)
+    return path
+
+
+def _files(storage):
+    return sorted(
+        path.name for path in storage.root.rglob("*")
+        if path.is_file() and storage.staging_dir() not in path.parents
+    )
+
+
+class TestLocalBlobStorage:
+    def test_put_file_stores_by_digest(self, storage):
+        upload = _staged(storage)
+
+        info = storage.put_file(upload, DIGEST, "image/png")
+
+        assert (info.size, info.content_type, info.created) == (len(CONTENT), "image/png", True)
+        assert info.etag == f'"{DIGEST}"'
+        assert not upload.exists()
+        assert storage.local_path(DIGEST) == storage.root / DIGEST[:2] / DIGEST[2:4] / DIGEST
+        with storage.open(DIGEST) as handle:
+            assert handle.read() == CONTENT
+
+    def test_identical_content_is_stored_once(self, storage):
+        storage.put_file(_staged(storage, name="first.part"), DIGEST, "image/png")
+        second = _staged(storage, name="second.part")
+
+        info = storage.put_file(second, DIGEST, "image/gif")
+
+        assert info.created is False
+        assert info.content_type == "image/png"  # The stored blob keeps its metadata
+        assert not second.exists()
+        assert _files(storage) == [DIGEST, f"{DIGEST}.json"]
+
+    def test_blob_without_sidecar_is_repaired(self, storage):
+        storage.put_file(_staged(storage), DIGEST, "image/png")
+        (storage.local_path(DIGEST).with_name(f"{DIGEST}.json")).unlink()
+        assert storage.stat(DIGEST) is None
+
+        info = storage.put_file(_staged(storage), DIGEST, "image/png")
+
+        assert info.created is True
+        assert storage.stat(DIGEST).size == len(CONTENT)
+        assert _files(storage) == [DIGEST, f"{DIGEST}.json"]
+
+    def test_delete(self, storage):
+        storage.put_file(_staged(storage), DIGEST, "image/png")
+
+        assert storage.delete(DIGEST) is True
+        assert storage.delete(DIGEST) is False
+        assert storage.stat(DIGEST) is None
+        assert storage.local_path(DIGEST) is None
+
+
+@pytest.mark.parametrize("digest, valid", [
+    (DIGEST, True),
+    (DIGEST.upper(), False),
+    (DIGEST[:-1], False),
+    ("../" + DIGEST[3:], False),
+])
+def test_is_valid_digest(digest, valid):
+    assert is_valid_digest(digest) is valid
\ No newline at end of file
@@ -0,0 +1,81 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import HTTP_REQUESTS
+from app.main import app as main_app
+from app.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def _app():
+    files = APIRouter()
+
+    @files.get("/files/{digest}")
+    def get_file(digest: str):
+        return {}
+
+    @files.get("/raw/{rest:path}")
+    def get_raw(rest: str):
+        return {}
+
+    @files.get("/items/{item_id:int}")
+    def get_item(item_id: int):
+        return {}
+
+    @files.get("/static")
+    def get_static():
+        return {}
+
+    api = APIRouter()
+    api.include_router(files, prefix="/upload")
+    app = FastAPI()
+    app.include_router(api, prefix="/api/v1")
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def _count(route, status="200", method="GET"):
+    return HTTP_REQUESTS.labels(method, route, status).value
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(_app())
+
+
+class TestRouteLabel:
+    @pytest.mark.parametrize("path, route", [
+        ("/api/v1/upload/files/abc", "/api/v1/upload/files/{digest}"),
+        # Parameter values equal to a static segment of the path
+        ("/api/v1/upload/files/files", "/api/v1/upload/files/{digest}"),
+        ("/api/v1/upload/files/upload", "/api/v1/upload/files/{digest}"),
+        # Path parameters spanning several segments
+        ("/api/v1/upload/raw/a/b/c", "/api/v1/upload/raw/{rest}"),
+        ("/api/v1/upload/raw/raw/upload", "/api/v1/upload/raw/{rest}"),
+        # Converted parameters
+        ("/api/v1/upload/items/42", "/api/v1/upload/items/{item_id}"),
+        ("/api/v1/upload/static", "/api/v1/upload/static"),
+    ])
+    def test_label_is_the_prefixed_route_template(self, client, path, route):
+        before = _count(route)
+
+        assert client.get(path).status_code == 200
+
+        assert _count(route) == before + 1
+
+    def test_unmatched_requests_share_one_label(self, client):
+        before = _count(UNMATCHED_ROUTE, "404")
+
+        client.get("/api/v1/upload/missing/1")
+        client.get("/nowhere")
+
+        assert _count(UNMATCHED_ROUTE, "404") == before + 2
+
+    def test_application_routes(self, monkeypatch):
+        monkeypatch.setattr(main_app, "middleware_stack", None)
+        client = TestClient(main_app)
+        before = _count("/api/v1/upload/files/{digest}", "404")
+
+        client.get("/api/v1/upload/files/files")
+
+        assert _count("/api/v1/upload/files/{digest}", "404") == before + 1
\ No newline at end of file
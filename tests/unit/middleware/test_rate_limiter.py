@@ -0,0 +1,160 @@
+import os
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.middleware import rate_limiter as rate_limiter_module
+from app.middleware.rate_limiter import (
+    InMemoryRateLimitBackend, Rate, RedisRateLimitBackend, parse_rate
+)
+
+RATE = Rate(limit=3, window=10)
+
+
+class Clock:
+    """Settable time source; starts at the beginning of a 10 second window"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _memory_backend(clock):
+    return InMemoryRateLimitBackend(clock=clock)
+
+
+def _redis_backend(clock):
+    redis = pytest.importorskip("redis")
+    url = os.environ.get("RATE_LIMIT_TEST_REDIS_URL", "redis://localhost:6379/15")
+    try:
+        redis.Redis.from_url(url, socket_connect_timeout=0.2).ping()
+    except redis.exceptions.ConnectionError:
+        pytest.skip(f"No Redis server at {url}")
+    from redis import asyncio as redis_asyncio
+    return RedisRateLimitBackend(redis_asyncio.from_url(url), prefix=f"test:{uuid.uuid4().hex}", clock=clock)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture(params=[_memory_backend, _redis_backend], ids=["memory", "redis"])
+def backend(request, clock):
+    return request.param(clock)
+
+
+class TestParseRate:
+    @pytest.mark.parametrize("value, expected", [
+        ("10/minute", Rate(10, 60)),
+        (" 5 / seconds ", Rate(5, 1)),
+        ("100/Day", Rate(100, 86400)),
+        ("0/hour", None),
+        ("", None),
+        (None, None),
+    ])
+    def test_valid_rates(self, value, expected):
+        assert parse_rate(value) == expected
+
+    @pytest.mark.parametrize("value", ["10", "ten/minute", "10/fortnight"])
+    def test_invalid_rates(self, value):
+        with pytest.raises(ValueError):
+            parse_rate(value)
+
+
+@pytest.mark.asyncio
+class TestSlidingWindow:
+    async def test_requests_over_the_limit_are_rejected(self, backend):
+        results = [await backend.hit("ip:1", RATE) for _ in range(4)]
+
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert [result.remaining for result in results] == [2, 1, 0, 0]
+        # 3 requests decay to 2 a third into the next window: 13.3 seconds from now
+        assert results[-1].retry_after == 14
+
+    async def test_rejected_requests_are_not_counted(self, backend, clock):
+        for _ in range(10):
+            await backend.hit("ip:1", RATE)
+
+        # Only the 3 allowed requests carry over: 1.5 remain halfway through the next window
+        clock.now += 15
+        assert (await backend.hit("ip:1", RATE)).allowed
+
+    async def test_previous_window_is_weighted_by_the_remaining_overlap(self, backend, clock):
+        for _ in range(3):
+            await backend.hit("ip:1", RATE)
+
+        clock.now += 10  # Window boundary: the full previous count still applies
+        assert not (await backend.hit("ip:1", RATE)).allowed
+
+        clock.now += 5  # Halfway: 3 * 0.5 = 1.5 of the previous window remain
+        assert (await backend.hit("ip:1", RATE)).allowed
+        assert not (await backend.hit("ip:1", RATE)).allowed
+
+    async def test_previous_window_is_forgotten_after_two_windows(self, backend, clock):
+        for _ in range(3):
+            await backend.hit("ip:1", RATE)
+
+        clock.now += 20
+        assert [(await backend.hit("ip:1", RATE)).allowed for _ in range(4)] == [True, True, True, False]
+
+    async def test_retry_after_is_enough_to_be_allowed_again(self, backend, clock):
+        for _ in range(3):
+            await backend.hit("ip:1", RATE)
+        clock.now += 12
+
+        rejected = await backend.hit("ip:1", RATE)
+        assert not rejected.allowed
+
+        clock.now += rejected.retry_after - 1
+        assert not (await backend.hit("ip:1", RATE)).allowed
+        clock.now += 1
+        assert (await backend.hit("ip:1", RATE)).allowed
+
+    async def test_keys_are_limited_separately(self, backend):
+        for _ in range(3):
+            await backend.hit("ip:1", RATE)
+
+        assert not (await backend.hit("ip:1", RATE)).allowed
+        assert (await backend.hit("ip:2", RATE)).allowed
+
+    async def test_idle_keys_are_swept(self, clock):
+        backend = InMemoryRateLimitBackend(clock=clock)
+        await backend.hit("ip:1", RATE)
+
+        clock.now += InMemoryRateLimitBackend.SWEEP_INTERVAL
+        await backend.hit("ip:2", RATE)
+
+        assert len(backend) == 1
+
+
+class TestMiddleware:
+    @pytest.fixture
+    def client(self, monkeypatch, clock):
+        monkeypatch.setattr(rate_limiter_module.rate_limiter, "enabled", True)
+        monkeypatch.setattr(rate_limiter_module.rate_limiter, "backend", InMemoryRateLimitBackend(clock=clock))
+        monkeypatch.setattr(settings, "RATE_LIMIT_DEFAULT", "1/minute")
+        monkeypatch.setattr(app, "middleware_stack", None)  # Rebuilt with the setting above
+        return TestClient(app)
+
+    def test_rejection_carries_cors_headers(self, client):
+        origin = {"Origin": "https://hr.example.com"}
+        assert client.get("/", headers=origin).status_code == 200
+
+        response = client.get("/", headers=origin)
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) > 0
+        assert "access-control-allow-origin" in response.headers
+
+    def test_preflights_are_not_counted(self, client):
+        preflight = {"Origin": "https://hr.example.com", "Access-Control-Request-Method": "GET"}
+        for _ in range(3):
+            assert client.options("/", headers=preflight).status_code == 200
+
+        assert client.get("/").status_code == 200
\ No newline at end of file
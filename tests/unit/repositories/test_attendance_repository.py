@@ -0,0 +1,91 @@
+import struct
+from datetime import datetime, timedelta, timezone
+
+from app.models.attendance import AttendancePunch
+from app.repositories.attendance_repository import PUNCH_COLUMNS, AttendancePunchRepository, encode_binary_copy
+
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+PUNCHED = datetime(2024, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+RECEIVED = PUNCHED + timedelta(seconds=2)
+
+
+def _decode(data):
+    """Parse a binary COPY stream into header fields and tuples of raw field bytes (None for NULL)"""
+    assert data[:11] == b"PGCOPY\n\xff\r\n\x00"
+    flags, extension = struct.unpack_from("!ii", data, 11)
+    offset = 19 + extension
+    rows = []
+    while True:
+        (count,) = struct.unpack_from("!h", data, offset)
+        offset += 2
+        if count == -1:
+            break
+        fields = []
+        for _ in range(count):
+            (length,) = struct.unpack_from("!i", data, offset)
+            offset += 4
+            if length == -1:
+                fields.append(None)
+            else:
+                fields.append(data[offset:offset + length])
+                offset += length
+        rows.append(fields)
+    assert offset == len(data), "bytes after the trailer"
+    return flags, rows
+
+
+def _int4(value):
+    return struct.unpack("!i", value)[0]
+
+
+def _timestamp(value):
+    return PG_EPOCH + timedelta(microseconds=struct.unpack("!q", value)[0])
+
+
+class TestEncodeBinaryCopy:
+    def test_header_and_trailer_of_an_empty_stream(self):
+        data = encode_binary_copy([])
+
+        assert _decode(data) == (0, [])
+        assert data[-2:] == b"\xff\xff"
+
+    def test_fields_round_trip(self):
+        rows = [
+            (42, "gate-1", PUNCHED, "in", "device", RECEIVED, 7),
+            (2 ** 31 - 1, "kiosk ü", PUNCHED - timedelta(days=9000), None, "mobile", RECEIVED, None),
+        ]
+
+        flags, decoded = _decode(encode_binary_copy(rows))
+
+        assert flags == 0
+        assert [len(fields) for fields in decoded] == [len(PUNCH_COLUMNS)] * 2
+        first, second = decoded
+        assert _int4(first[0]) == 42
+        assert first[1] == b"gate-1"
+        assert _timestamp(first[2]) == PUNCHED
+        assert first[3] == b"in"
+        assert first[4] == b"device"
+        assert _timestamp(first[5]) == RECEIVED
+        assert _int4(first[6]) == 7
+        assert _int4(second[0]) == 2 ** 31 - 1
+        assert second[1].decode("utf-8") == "kiosk ü"
+        assert _timestamp(second[2]) == PUNCHED - timedelta(days=9000)  # Before 2000: negative offset
+        assert second[3] is None
+        assert second[6] is None
+
+    def test_timestamps_in_other_offsets_are_encoded_as_utc(self):
+        local = PUNCHED.astimezone(timezone(timedelta(hours=5, minutes=30)))
+
+        _, decoded = _decode(encode_binary_copy([(1, "d", local, None, "device", local, None)]))
+
+        assert _timestamp(decoded[0][2]) == PUNCHED
+
+
+class TestAttendancePunchRepository:
+    def test_write_skips_punches_already_stored(self, db):
+        repo = AttendancePunchRepository(db)
+        row = (1, "gate-1", PUNCHED, "in", "device", RECEIVED, 7)
+
+        assert repo.write([row, (2, "gate-1", PUNCHED, None, "device", RECEIVED, 7)]) == 2
+        assert repo.write([row]) == 0
+        assert db.query(AttendancePunch).count() == 2
\ No newline at end of file
@@ -0,0 +1,210 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from app.core.tenancy import set_tenant
+from app.models.location import Location
+from app.repositories import base_repository
+from app.repositories.base_repository import BaseRepository
+
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements sent to the database, executemany counted once"""
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield sent
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _rows(count, prefix="L"):
+    return [{"name": f"Office {i}", "code": f"{prefix}{i}"} for i in range(count)]
+
+
+def _location(db, tenant_id, code, name="Office"):
+    set_tenant(db, tenant_id)
+    location = BaseRepository(Location, db).create({"name": name, "code": code})
+    set_tenant(db, None)
+    return location
+
+
+class TestBulkCreate:
+    @pytest.mark.parametrize("count, chunk_size, chunks", [(4, 2, 2), (5, 2, 3), (2, 5, 1), (1, 1, 1)])
+    def test_chunk_boundaries(self, db, statements, count, chunk_size, chunks):
+        created = BaseRepository(Location, db).bulk_create(_rows(count), chunk_size=chunk_size)
+
+        assert [location.code for location in created] == [f"L{i}" for i in range(count)]
+        assert all(location.id is not None for location in created)
+        assert statements.count("INSERT") == chunks
+
+    def test_empty_input_sends_nothing(self, db, statements):
+        assert BaseRepository(Location, db).bulk_create([]) == []
+        assert "INSERT" not in statements
+
+    def test_accepts_a_generator(self, db):
+        created = BaseRepository(Location, db).bulk_create((row for row in _rows(3)), chunk_size=2)
+        assert len(created) == 3
+
+    def test_failing_chunk_rolls_back_earlier_chunks(self, db):
+        rows = _rows(3) + [{"name": "Duplicate", "code": "L0"}]
+        set_tenant(db, 1)
+        with pytest.raises(IntegrityError):
+            BaseRepository(Location, db).bulk_create(rows, chunk_size=2)
+        assert db.query(Location).count() == 0
+
+    def test_commit_false_leaves_the_transaction_open(self, db):
+        BaseRepository(Location, db).bulk_create(_rows(2), commit=False)
+        db.rollback()
+        assert db.query(Location).count() == 0
+
+    def test_stamps_the_session_tenant(self, db):
+        set_tenant(db, 7)
+        created = BaseRepository(Location, db).bulk_create(_rows(2) + [{"name": "Own", "code": "X", "tenant_id": 8}])
+        assert [location.tenant_id for location in created] == [7, 7, 8]
+
+
+class TestBulkUpdate:
+    def test_chunk_boundaries(self, db, statements):
+        repo = BaseRepository(Location, db)
+        created = repo.bulk_create(_rows(5))
+        statements.clear()
+
+        updated = repo.bulk_update([{"id": location.id, "city": "Pune"} for location in created], chunk_size=2)
+
+        assert updated == 5
+        assert statements.count("UPDATE") == 3
+        assert {location.city for location in db.query(Location)} == {"Pune"}
+
+
+class TestBulkUpsert:
+    def test_updates_conflicting_rows_and_inserts_new_ones(self, db):
+        set_tenant(db, 1)
+        repo = BaseRepository(Location, db)
+        existing = repo.bulk_create([{"name": "Old", "code": "A"}])[0]
+
+        results = repo.bulk_upsert(
+            [{"name": "New", "code": "A"}, {"name": "Branch", "code": "B"}],
+            index_elements=["tenant_id", "code"]
+        )
+
+        assert [(location.code, location.name) for location in results] == [("A", "New"), ("B", "Branch")]
+        assert results[0].id == existing.id
+        assert db.query(Location).count() == 2
+
+    def test_update_fields_limits_the_overwritten_columns(self, db):
+        set_tenant(db, 1)
+        repo = BaseRepository(Location, db)
+        repo.bulk_create([{"name": "Old", "code": "A", "city": "Pune"}])
+
+        results = repo.bulk_upsert(
+            [{"name": "New", "code": "A", "city": "Delhi"}],
+            index_elements=["tenant_id", "code"],
+            update_fields=["city"]
+        )
+
+        assert (results[0].name, results[0].city) == ("Old", "Delhi")
+
+    def test_empty_update_fields_keeps_conflicting_rows(self, db):
+        set_tenant(db, 1)
+        repo = BaseRepository(Location, db)
+        repo.bulk_create([{"name": "Old", "code": "A"}])
+
+        results = repo.bulk_upsert(
+            [{"name": "New", "code": "A"}, {"name": "Branch", "code": "B"}],
+            index_elements=["tenant_id", "code"],
+            update_fields=[]
+        )
+
+        assert [location.code for location in results] == ["B"]
+        assert db.query(Location).filter(Location.code == "A").one().name == "Old"
+
+    def test_same_code_in_another_tenant_is_not_a_conflict(self, db):
+        set_tenant(db, 1)
+        BaseRepository(Location, db).bulk_create([{"name": "Tenant 1", "code": "A"}])
+        set_tenant(db, 2)
+        results = BaseRepository(Location, db).bulk_upsert(
+            [{"name": "Tenant 2", "code": "A"}], index_elements=["tenant_id", "code"]
+        )
+
+        assert results[0].tenant_id == 2
+        set_tenant(db, None)
+        assert sorted(location.name for location in db.query(Location)) == ["Tenant 1", "Tenant 2"]
+
+    def test_chunks_stay_under_the_bind_parameter_limit(self, db, statements, monkeypatch):
+        width = len(Location.__table__.columns)
+        monkeypatch.setattr(base_repository, "MAX_BIND_PARAMS", width * 2)
+        set_tenant(db, 1)
+
+        results = BaseRepository(Location, db).bulk_upsert(_rows(5), index_elements=["tenant_id", "code"])
+
+        assert len(results) == 5
+        assert statements.count("INSERT") == 3
+
+    def test_empty_input_sends_nothing(self, db, statements):
+        assert BaseRepository(Location, db).bulk_upsert([], index_elements=["code"]) == []
+        assert statements == []
+
+
+class TestBulkDelete:
+    def test_chunk_boundaries_and_missing_ids(self, db, statements):
+        repo = BaseRepository(Location, db)
+        created = repo.bulk_create(_rows(5))
+        statements.clear()
+
+        deleted = repo.bulk_delete([location.id for location in created[:3]] + [9999], chunk_size=2)
+
+        assert deleted == 3
+        assert statements.count("DELETE") == 2
+        assert sorted(location.code for location in db.query(Location)) == ["L3", "L4"]
+
+
+class TestTenantScoping:
+    def test_bulk_update_skips_rows_of_other_tenants(self, db):
+        other = _location(db, 1, "HQ")
+        own = _location(db, 2, "BR")
+
+        set_tenant(db, 2)
+        updated = BaseRepository(Location, db).bulk_update([
+            {"id": other.id, "name": "HACK"},
+            {"id": own.id, "name": "Branch"},
+        ])
+
+        assert updated == 1
+        set_tenant(db, None)
+        db.expire_all()
+        assert db.get(Location, other.id).name == "Office"
+        assert db.get(Location, own.id).name == "Branch"
+
+    def test_bulk_update_groups_rows_setting_different_columns(self, db):
+        first = _location(db, 2, "A")
+        second = _location(db, 2, "B")
+
+        set_tenant(db, 2)
+        updated = BaseRepository(Location, db).bulk_update([
+            {"id": first.id, "name": "Renamed"},
+            {"id": second.id, "city": "Pune", "is_active": False},
+        ])
+
+        assert updated == 2
+        db.expire_all()
+        assert db.get(Location, first.id).name == "Renamed"
+        assert (db.get(Location, second.id).city, db.get(Location, second.id).is_active) == ("Pune", False)
+
+    def test_bulk_update_unscoped_session_updates_any_tenant(self, db):
+        location = _location(db, 1, "HQ")
+
+        assert BaseRepository(Location, db).bulk_update([{"id": location.id, "name": "Head Office"}]) == 1
+        db.expire_all()
+        assert db.get(Location, location.id).name == "Head Office"
+
+    def test_bulk_delete_skips_rows_of_other_tenants(self, db):
+        other = _location(db, 1, "HQ")
+
+        set_tenant(db, 2)
+        assert BaseRepository(Location, db).bulk_delete([other.id]) == 0
+        set_tenant(db, None)
+        assert db.get(Location, other.id) is not None
\ No newline at end of file
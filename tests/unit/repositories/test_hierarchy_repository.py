@@ -0,0 +1,137 @@
+import pytest
+from sqlalchemy import update
+
+from app.models.cost_center import CostCenter, CostCenterClosure
+from app.repositories.cost_center_repository import CostCenterRepository
+from app.repositories.hierarchy_repository import HierarchyError
+
+#   A           G
+#   ├── B
+#   │   ├── C
+#   │   │   └── D
+#   │   └── E
+#   └── F
+TREE = [("A", None), ("B", "A"), ("C", "B"), ("D", "C"), ("E", "B"), ("F", "A"), ("G", None)]
+
+
+@pytest.fixture
+def repo(db):
+    return CostCenterRepository(db)
+
+
+@pytest.fixture
+def nodes(repo):
+    created = {}
+    for code, parent in TREE:
+        parent_id = created[parent].id if parent else None
+        created[code] = repo.create({"name": code, "code": code, "parent_id": parent_id})
+    return created
+
+
+def _closure(db, nodes):
+    """Closure rows as (ancestor code, descendant code, depth)"""
+    codes = {node.id: code for code, node in nodes.items()}
+    return {
+        (codes[row.ancestor_id], codes[row.descendant_id], row.depth)
+        for row in db.query(CostCenterClosure)
+    }
+
+
+def _rebuilt(db, repo, nodes):
+    """Closure rows as rebuild() derives them from parent_id"""
+    repo.rebuild()
+    return _closure(db, nodes)
+
+
+def _codes(rows):
+    return [row.code for row in rows]
+
+
+class TestClosure:
+    def test_create_links_every_ancestor(self, db, repo, nodes):
+        closure = _closure(db, nodes)
+
+        assert {(a, d, depth) for a, d, depth in closure if d == "D"} == {
+            ("D", "D", 0), ("C", "D", 1), ("B", "D", 2), ("A", "D", 3)
+        }
+        assert len(closure) == 16
+        assert closure == _rebuilt(db, repo, nodes)
+
+    def test_reads(self, repo, nodes):
+        assert _codes(repo.get_descendants(nodes["B"].id)) == ["C", "E", "D"]
+        assert _codes(repo.get_children(nodes["A"].id)) == ["B", "F"]
+        assert _codes(repo.get_ancestors(nodes["D"].id)) == ["C", "B", "A"]
+        assert _codes(repo.get_roots()) == ["A", "G"]
+        assert repo.is_in_subtree(nodes["D"].id, nodes["B"].id)
+        assert not repo.is_in_subtree(nodes["F"].id, nodes["B"].id)
+
+
+class TestMove:
+    @pytest.mark.parametrize("node, parent", [("B", "F"), ("B", "G"), ("C", "A"), ("B", None), ("G", "D")])
+    def test_moved_subtree_matches_a_rebuild(self, db, repo, nodes, node, parent):
+        repo.move(nodes[node], nodes[parent].id if parent else None)
+
+        assert _closure(db, nodes) == _rebuilt(db, repo, nodes)
+
+    def test_moved_subtree_is_relinked_at_every_depth(self, db, repo, nodes):
+        repo.move(nodes["B"], nodes["F"].id)
+
+        assert _codes(repo.get_ancestors(nodes["D"].id)) == ["C", "B", "F", "A"]
+        assert _codes(repo.get_descendants(nodes["F"].id)) == ["B", "C", "E", "D"]
+        assert _codes(repo.get_children(nodes["A"].id)) == ["F"]
+
+    def test_update_with_parent_id_moves_the_subtree(self, db, repo, nodes):
+        repo.update(nodes["C"], {"parent_id": nodes["G"].id, "name": "Renamed"})
+
+        assert nodes["C"].name == "Renamed"
+        assert _codes(repo.get_ancestors(nodes["D"].id)) == ["C", "G"]
+
+    @pytest.mark.parametrize("node, parent", [("B", "D"), ("B", "C"), ("A", "E"), ("B", "B")])
+    def test_moving_under_its_own_subtree_is_rejected(self, db, repo, nodes, node, parent):
+        before, parent_id = _closure(db, nodes), nodes[node].parent_id
+
+        with pytest.raises(HierarchyError):
+            repo.move(nodes[node], nodes[parent].id)
+
+        db.rollback()
+        assert _closure(db, nodes) == before
+        assert db.get(CostCenter, nodes[node].id).parent_id == parent_id
+
+
+class TestDelete:
+    def test_children_move_up_to_the_parent(self, db, repo, nodes):
+        assert repo.delete(nodes["B"].id)
+        del nodes["B"]
+
+        assert _codes(repo.get_children(nodes["A"].id)) == ["C", "E", "F"]
+        assert _codes(repo.get_ancestors(nodes["D"].id)) == ["C", "A"]
+        assert _closure(db, nodes) == _rebuilt(db, repo, nodes)
+
+    def test_deleting_a_root_makes_its_children_roots(self, db, repo, nodes):
+        repo.delete(nodes["A"].id)
+        del nodes["A"]
+
+        assert _codes(repo.get_roots()) == ["B", "F", "G"]
+        assert _closure(db, nodes) == _rebuilt(db, repo, nodes)
+
+    def test_unknown_node(self, repo, nodes):
+        assert repo.delete(9999) is False
+
+
+class TestRebuild:
+    def test_repairs_parent_ids_written_directly(self, db, repo, nodes):
+        db.execute(update(CostCenter).where(CostCenter.id == nodes["E"].id).values(parent_id=nodes["G"].id))
+        db.commit()
+
+        assert repo.rebuild() == 15
+        assert _codes(repo.get_ancestors(nodes["E"].id)) == ["G"]
+
+    def test_cycle_is_rejected_and_the_closure_kept(self, db, repo, nodes):
+        before = _closure(db, nodes)
+        db.execute(update(CostCenter).where(CostCenter.id == nodes["A"].id).values(parent_id=nodes["D"].id))
+        db.commit()
+
+        with pytest.raises(HierarchyError):
+            repo.rebuild()
+
+        assert _closure(db, nodes) == before
\ No newline at end of file
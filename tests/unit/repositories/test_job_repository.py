@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+from app.schemas.enums import JobStatus
+
+NOW = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _job(name="task", queue="default", priority=0, run_at=NOW, attempts=0, max_attempts=3, **fields):
+    return {
+        "queue": queue, "name": name, "payload": {"n": name}, "priority": priority,
+        "status": JobStatus.QUEUED, "attempts": attempts, "max_attempts": max_attempts,
+        "run_at": run_at, "created_at": run_at, **fields,
+    }
+
+
+@pytest.fixture
+def repo(db):
+    return JobRepository(db)
+
+
+def _jobs(db):
+    db.expire_all()
+    return {job.name: job for job in db.query(Job)}
+
+
+class TestClaim:
+    def test_claims_due_jobs_of_the_queues_by_priority(self, db, repo):
+        repo.add_many([
+            _job("low", run_at=NOW - timedelta(minutes=5)),
+            _job("high", priority=5),
+            _job("later", run_at=NOW + timedelta(seconds=1)),
+            _job("other_queue", queue="reports"),
+            _job("running", status=JobStatus.RUNNING),
+        ])
+
+        claimed = repo.claim(["default"], 10, "worker-1", NOW)
+        db.commit()
+
+        assert sorted(row[1] for row in claimed) == ["high", "low"]
+        jobs = _jobs(db)
+        assert (jobs["high"].status, jobs["high"].attempts, jobs["high"].locked_by) == (
+            JobStatus.RUNNING, 1, "worker-1"
+        )
+        assert jobs["later"].status == jobs["other_queue"].status == JobStatus.QUEUED
+
+    def test_limit_takes_the_highest_priority_first(self, db, repo):
+        repo.add_many([_job(f"p{priority}", priority=priority) for priority in range(5)])
+
+        claimed = repo.claim(["default"], 2, "worker-1", NOW)
+
+        assert sorted(row[1] for row in claimed) == ["p3", "p4"]
+
+    def test_claimed_jobs_are_not_claimed_again(self, db, repo):
+        repo.add_many([_job()])
+        repo.claim(["default"], 10, "worker-1", NOW)
+
+        assert repo.claim(["default"], 10, "worker-2", NOW) == []
+
+
+class TestAcknowledge:
+    def test_defer_gives_the_claimed_attempt_back(self, db, repo):
+        repo.add_many([_job(attempts=1)])
+        job_id = repo.claim(["default"], 1, "worker-1", NOW)[0][0]
+        assert _jobs(db)["task"].attempts == 2
+
+        repo.defer([{"b_id": job_id, "b_run_at": NOW + timedelta(seconds=10), "b_error": "Unknown job 'task'"}])
+
+        job = _jobs(db)["task"]
+        assert (job.status, job.attempts, job.locked_by, job.locked_at) == (JobStatus.QUEUED, 1, None, None)
+        assert job.run_at.replace(tzinfo=timezone.utc) == NOW + timedelta(seconds=10)
+        assert job.last_error == "Unknown job 'task'"
+
+    def test_deferred_jobs_never_run_out_of_attempts(self, db, repo):
+        repo.add_many([_job(max_attempts=2)])
+        for _ in range(5):
+            job_id = repo.claim(["default"], 1, "worker-1", NOW)[0][0]
+            repo.defer([{"b_id": job_id, "b_run_at": NOW, "b_error": None}])
+
+        assert _jobs(db)["task"].attempts == 0
+
+    def test_complete_reschedule_and_fail(self, db, repo):
+        repo.add_many([_job("done"), _job("retry"), _job("fail")])
+        ids = {row[1]: row[0] for row in repo.claim(["default"], 10, "worker-1", NOW)}
+
+        repo.complete([ids["done"]], NOW)
+        repo.reschedule([{"b_id": ids["retry"], "b_run_at": NOW + timedelta(seconds=30), "b_error": "boom"}])
+        repo.fail([{"b_id": ids["fail"], "b_error": "gave up"}], NOW)
+
+        jobs = _jobs(db)
+        assert (jobs["done"].status, jobs["done"].last_error) == (JobStatus.DONE, None)
+        assert (jobs["retry"].status, jobs["retry"].attempts, jobs["retry"].last_error) == (JobStatus.QUEUED, 1, "boom")
+        assert (jobs["fail"].status, jobs["fail"].last_error) == (JobStatus.FAILED, "gave up")
+        assert all(job.locked_by is None for job in jobs.values())
+
+
+class TestHousekeeping:
+    def test_stale_locks_are_released_or_failed(self, db, repo):
+        started = NOW - timedelta(hours=1)
+        repo.add_many([_job(name, run_at=started) for name in ("stale", "fresh")] + [
+            _job("exhausted", run_at=started, max_attempts=1)
+        ])
+        repo.claim(["default"], 10, "dead-worker", started)
+        db.query(Job).filter(Job.name == "fresh").update({"locked_at": NOW})
+
+        assert repo.release_stale(NOW - timedelta(minutes=15), NOW) == 1
+
+        jobs = _jobs(db)
+        assert jobs["stale"].status == JobStatus.QUEUED
+        assert (jobs["exhausted"].status, jobs["exhausted"].last_error) == (JobStatus.FAILED, "Worker lock expired")
+        assert jobs["fresh"].status == JobStatus.RUNNING
+
+    def test_purge_keeps_failed_and_recent_jobs(self, db, repo):
+        repo.add_many([
+            _job("old", status=JobStatus.DONE, finished_at=NOW - timedelta(days=5)),
+            _job("recent", status=JobStatus.DONE, finished_at=NOW),
+            _job("failed", status=JobStatus.FAILED, finished_at=NOW - timedelta(days=5)),
+        ])
+
+        assert repo.purge_finished(NOW - timedelta(days=3)) == 1
+        assert sorted(_jobs(db)) == ["failed", "recent"]
\ No newline at end of file
@@ -0,0 +1,68 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.exceptions.http_exceptions import ServiceBusyException
+from app.models.attendance import AttendancePunch, AttendancePunchReject
+from app.services import attendance_service
+from app.services.attendance_service import PunchIngestor
+
+PUNCHED = datetime(2024, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _punches(count, employee_id=1):
+    return [
+        (employee_id, "gate-1", PUNCHED + timedelta(minutes=i), "in", "device", PUNCHED, 7)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def ingestor(engine, monkeypatch):
+    # Flushes open their own sessions; point them at the test database
+    monkeypatch.setattr(attendance_service, "SessionLocal", sessionmaker(bind=engine))
+    return PunchIngestor(flush_interval=60, flush_rows=1000, max_rows=100, max_attempts=2, partition_months_ahead=1)
+
+
+class TestPunchIngestor:
+    def test_flush_writes_the_buffer_and_counts_duplicates(self, ingestor, db):
+        ingestor.submit(_punches(3))
+        assert ingestor.flush() == 3
+
+        ingestor.submit(_punches(4))
+        assert ingestor.flush() == 1
+
+        assert db.query(AttendancePunch).count() == 4
+        assert ingestor.stats() == {
+            "buffered": 0, "flushes": 2, "inserted": 4, "duplicates": 3, "failed_flushes": 0, "dead_lettered": 0,
+        }
+
+    def test_full_buffer_rejects_the_batch(self, ingestor):
+        ingestor.submit(_punches(60))
+
+        with pytest.raises(ServiceBusyException):
+            ingestor.submit(_punches(41, employee_id=2))
+        assert ingestor.stats()["buffered"] == 60
+
+    def test_one_unwritable_punch_is_dead_lettered_and_the_rest_stored(self, ingestor, db):
+        rows = _punches(10)
+        poison = (1, None, PUNCHED - timedelta(days=1), "in", "device", PUNCHED, 7)  # NOT NULL violation
+        ingestor.submit(rows[:6] + [poison] + rows[6:])
+
+        # Failed flushes keep the rows until max_attempts is reached
+        assert ingestor.flush() == 0
+        assert ingestor.flush() == 0
+        assert ingestor.stats()["buffered"] == 11
+        assert db.query(AttendancePunch).count() == 0
+
+        assert ingestor.flush() == 10
+
+        stats = ingestor.stats()
+        assert (stats["buffered"], stats["failed_flushes"], stats["dead_lettered"]) == (0, 2, 1)
+        assert db.query(AttendancePunch).count() == 10
+        reject = db.query(AttendancePunchReject).one()
+        assert reject.tenant_id == 7
+        assert json.loads(reject.payload)["device_id"] is None
+        assert "NOT NULL" in reject.error
\ No newline at end of file
@@ -0,0 +1,105 @@
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from app.core.revocation import InMemoryRevocationBackend, TokenRevocation
+from app.core.security import decode_access_token, decode_refresh_token, get_password_hash
+from app.models.user import User
+from app.schemas.enums import UserRole, UserStatus
+from app.schemas.token import LoginRequest
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def revocation(monkeypatch):
+    revocation = TokenRevocation(InMemoryRevocationBackend())
+    monkeypatch.setattr(auth_service, "token_revocation", revocation)
+    return revocation
+
+
+PASSWORD = "correct horse"
+HASHED_PASSWORD = get_password_hash(PASSWORD)
+
+
+@pytest_asyncio.fixture
+async def user(async_db):
+    user = User(
+        name="Admin", email="admin@example.com", hashed_password=HASHED_PASSWORD,
+        role=UserRole.ADMIN, status=UserStatus.ACTIVE
+    )
+    async_db.add(user)
+    await async_db.commit()
+    await async_db.refresh(user)
+    return user
+
+
+async def _login(service, user):
+    return await service.login(LoginRequest(email=user.email, password=PASSWORD))
+
+
+async def _refresh_rejected(service, token):
+    with pytest.raises(HTTPException) as rejected:
+        await service.refresh(token)
+    return rejected.value.status_code
+
+
+@pytest.mark.asyncio
+class TestRefreshRotation:
+    async def test_refresh_rotates_within_the_login_family(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+
+        rotated = await service.refresh(login.refresh_token)
+
+        old, new = decode_refresh_token(login.refresh_token), decode_refresh_token(rotated.refresh_token)
+        assert new["fam"] == old["fam"]
+        assert new["jti"] != old["jti"]
+        assert decode_access_token(rotated.access_token)["tid"] == user.id
+        assert not revocation.is_revoked(new)
+
+    async def test_reusing_a_rotated_token_revokes_its_family(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+        other_login = await _login(service, user)
+        rotated = await service.refresh(login.refresh_token)
+
+        assert await _refresh_rejected(service, login.refresh_token) == 401
+
+        # The legitimate holder's newer tokens of that login die with it
+        assert await _refresh_rejected(service, rotated.refresh_token) == 401
+        assert revocation.is_revoked(decode_access_token(rotated.access_token))
+        # Other logins of the same user are unaffected
+        assert not revocation.is_revoked(decode_access_token(other_login.access_token))
+        await service.refresh(other_login.refresh_token)
+
+    async def test_access_tokens_are_not_accepted_as_refresh_tokens(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+
+        assert await _refresh_rejected(service, login.access_token) == 401
+
+    async def test_refresh_after_revoke_subject_is_rejected(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+
+        revocation.revoke_subject(user.email)
+
+        assert await _refresh_rejected(service, login.refresh_token) == 401
+
+    async def test_inactive_users_cannot_refresh(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+        user.status = UserStatus.SUSPENDED
+        await async_db.commit()
+
+        assert await _refresh_rejected(service, login.refresh_token) == 403
+
+    async def test_logout_revokes_the_session(self, async_db, user, revocation):
+        service = AuthService(async_db)
+        login = await _login(service, user)
+
+        AuthService.logout(decode_access_token(login.access_token))
+
+        assert revocation.is_revoked(decode_access_token(login.access_token))
+        assert await _refresh_rejected(service, login.refresh_token) == 401
\ No newline at end of file
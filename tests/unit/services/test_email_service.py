@@ -0,0 +1,217 @@
+import smtplib
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core import events
+from app.core.events import JobWorker, job_queue
+from app.models.job import Job
+from app.schemas.enums import JobStatus
+from app.services import email_service
+from app.services.email_service import EMAIL_QUEUE, EmailSender, SMTPConnectionPool, email_templates, queue_emails
+
+
+class FakeSMTP:
+    """
+    SMTP client talking to an in-process server
+
+    The local part of a recipient picks the server's answer: refused@ gets
+    a permanent 550, busy@ a 451 on its first attempt only, drop@ loses the
+    connection mid-message, anything else is accepted.
+    """
+
+    sessions = []
+    delivered = []
+    attempts = {}
+    lock = threading.Lock()
+    send_delay = 0.0
+
+    def __init__(self, host, port, timeout=None):
+        self.open = True
+        self.noop_code = 250
+        with self.lock:
+            self.sessions.append(self)
+
+    def send_message(self, message):
+        to = message["To"]
+        local = to.partition("@")[0]
+        with self.lock:
+            self.attempts[to] = self.attempts.get(to, 0) + 1
+            attempt = self.attempts[to]
+        time.sleep(self.send_delay)
+        if local == "refused":
+            raise smtplib.SMTPRecipientsRefused({to: (550, b"No such user")})
+        if local == "busy" and attempt == 1:
+            raise smtplib.SMTPRecipientsRefused({to: (451, b"Try again later")})
+        if local == "drop":
+            self.open = False
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        with self.lock:
+            self.delivered.append(to)
+
+    def noop(self):
+        return (self.noop_code, b"OK")
+
+    def quit(self):
+        self.open = False
+
+    def close(self):
+        self.open = False
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    FakeSMTP.sessions, FakeSMTP.delivered, FakeSMTP.attempts, FakeSMTP.send_delay = [], [], {}, 0.0
+    return FakeSMTP
+
+
+def _pool(size=2, max_messages=100, idle_check_seconds=30.0):
+    return SMTPConnectionPool(
+        host="localhost", port=25, username=None, password=None, starttls=False, timeout=1,
+        size=size, max_messages=max_messages, idle_check_seconds=idle_check_seconds
+    )
+
+
+@pytest.fixture
+def sender():
+    sender = EmailSender(_pool(), max_per_domain=4)
+    yield sender
+    sender.close()
+
+
+def _message(to):
+    return email_templates.build("reminder", to, {"subject": "Timesheets", "message": "Due today", "first_name": "A"})
+
+
+class TestSMTPConnectionPool:
+    def test_released_connections_are_reused(self, sender):
+        assert sender.send_many([(n, _message(f"user{n}@example.com")) for n in range(6)]) == {}
+
+        assert sorted(FakeSMTP.delivered) == sorted(f"user{n}@example.com" for n in range(6))
+        assert sender.pool.opened == len(FakeSMTP.sessions) <= 2
+
+    def test_a_broken_connection_is_dropped_from_the_pool(self):
+        sender = EmailSender(_pool(size=1), max_per_domain=1)
+        sender.send_many([(0, _message("first@example.com"))])
+        broken = FakeSMTP.sessions[0]
+
+        failures = sender.send_many([(1, _message("drop@example.com"))])
+        assert failures == {1: ("SMTP connection lost: Connection unexpectedly closed", True)}
+        assert sender.pool._idle.qsize() == 0
+
+        assert sender.send_many([(2, _message("next@example.com"))]) == {}
+        assert len(FakeSMTP.sessions) == 2 and not broken.open
+        sender.close()
+
+    def test_idle_connections_must_answer_noop(self):
+        pool = _pool(size=1, idle_check_seconds=0)
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.smtp.noop_code = 421
+
+        assert pool.acquire() is not connection
+        assert not connection.smtp.open
+
+    def test_connections_are_recycled_after_max_messages(self):
+        sender = EmailSender(_pool(size=1, max_messages=2), max_per_domain=1)
+
+        sender.send_many([(n, _message(f"user{n}@example.com")) for n in range(5)])
+
+        assert len(FakeSMTP.sessions) == 3
+        sender.close()
+
+    def test_pool_size_bounds_open_connections(self):
+        pool = _pool(size=2)
+        held = [pool.acquire(), pool.acquire()]
+        third = threading.Thread(target=lambda: pool.release(pool.acquire()))
+        third.start()
+        third.join(0.1)
+
+        assert third.is_alive()
+        pool.release(held[0])
+        third.join(1)
+        assert not third.is_alive() and len(FakeSMTP.sessions) == 2
+
+
+class TestEmailSender:
+    def test_refused_and_deferred_recipients_are_reported_by_key(self, sender):
+        failures = sender.send_many([
+            (0, _message("ok@example.com")),
+            (1, _message("refused@example.com")),
+            (2, _message("busy@example.com")),
+        ])
+
+        assert failures == {
+            1: ("Recipient refused: 550 No such user", False),
+            2: ("Recipient refused: 451 Try again later", True),
+        }
+
+    def test_sends_per_domain_are_limited(self, monkeypatch):
+        sender = EmailSender(_pool(size=6), max_per_domain=2)
+        FakeSMTP.send_delay = 0.02
+        active, peak = {}, {}
+        original = FakeSMTP.send_message
+
+        def tracking(self, message):
+            domain = message["To"].partition("@")[2]
+            with FakeSMTP.lock:
+                active[domain] = active.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), active[domain])
+            try:
+                original(self, message)
+            finally:
+                with FakeSMTP.lock:
+                    active[domain] -= 1
+
+        monkeypatch.setattr(FakeSMTP, "send_message", tracking)
+        sender.send_many([(n, _message(f"user{n}@{'big' if n < 12 else 'small'}.com")) for n in range(15)])
+        sender.close()
+
+        assert peak["big.com"] == 2
+        assert len(FakeSMTP.delivered) == 15
+
+
+class TestOutbox:
+    @pytest.fixture
+    def worker(self, engine, monkeypatch, sender):
+        monkeypatch.setattr(events, "SessionLocal", sessionmaker(bind=engine))
+        monkeypatch.setattr(email_service, "email_sender", sender)
+        worker = JobWorker(
+            job_queue, threads=1, batch_size=50, poll_interval=1, queues=[EMAIL_QUEUE],
+            lock_timeout_seconds=60, retention_hours=1, housekeeping=False
+        )
+        yield worker
+        events._workers.remove(worker)
+
+    def test_only_failed_messages_are_retried(self, db, worker):
+        context = {"subject": "Timesheets", "message": "Due today", "first_name": "A"}
+        queue_emails(db, "reminder", [
+            ("ok@example.com", context),
+            ("refused@example.com", context),
+            ("busy@example.com", context),
+            ("broken@example.com", {"subject": "Timesheets"}),  # Missing fields: cannot render
+        ])
+        db.commit()
+
+        worker.run_once()
+
+        db.expire_all()
+        jobs = {job.payload["to"]: job for job in db.query(Job)}
+        assert {to: job.status for to, job in jobs.items()} == {
+            "ok@example.com": JobStatus.DONE,
+            "refused@example.com": JobStatus.FAILED,
+            "busy@example.com": JobStatus.QUEUED,
+            "broken@example.com": JobStatus.FAILED,
+        }
+        assert jobs["broken@example.com"].last_error.startswith("Cannot render email: KeyError")
+
+        db.query(Job).update({"run_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+        db.commit()
+        assert worker.run_once() == 1
+
+        assert sorted(FakeSMTP.delivered) == ["busy@example.com", "ok@example.com"]
+        assert FakeSMTP.attempts == {"ok@example.com": 1, "refused@example.com": 1, "busy@example.com": 2}
\ No newline at end of file
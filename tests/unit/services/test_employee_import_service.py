@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.config import settings
+from app.models.department import Department
+from app.models.employee import Employee
+from app.services import employee_code_service
+from app.services.employee_import_service import EmployeeImportService, ImportJob
+from app.utils.code_generator import NumberBlockAllocator
+
+HEADER = "Employee Code,First Name,Email,Date of Joining,Department"
+
+
+@pytest.fixture(autouse=True)
+def sequence(engine, monkeypatch):
+    """Codes reserved through the test database by a fresh allocator"""
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(
+        employee_code_service, "employee_code_allocator",
+        NumberBlockAllocator(employee_code_service._reserve_block, block_size=2)
+    )
+
+
+@pytest.fixture
+def department(db):
+    department = Department(name="Engineering", code="ENG")
+    db.add(department)
+    db.commit()
+    return department
+
+
+def _import(db, tmp_path, *rows):
+    path = tmp_path / "employees.csv"
+    path.write_text("\n".join((HEADER,) + rows))
+    return EmployeeImportService(db).run(ImportJob("employees.csv"), path)
+
+
+def _employees(db):
+    return {employee.email: employee for employee in db.query(Employee)}
+
+
+class TestEmployeeImport:
+    def test_rows_are_checked_and_generated_codes_skip_taken_ones(self, db, tmp_path, monkeypatch, department):
+        monkeypatch.setattr(settings, "EMPLOYEE_IMPORT_BATCH_SIZE", 3)
+
+        job = _import(
+            db, tmp_path,
+            # Batch 1: the second generated code would collide with Bob's code from the same batch
+            ",Alice,alice@example.com,2024-01-15,ENG",
+            "EMP00002,Bob,bob@example.com,2024-01-15,engineering",
+            ",Erin,erin@example.com,2024-01-15,",
+            # Batch 2: rejected rows, and an explicit code of a later generated one
+            ",Alicia,ALICE@example.com,2024-01-15,ENG",
+            ",Carol,carol@example.com,2024-01-15,OPS",
+            "EMP00004,Frank,frank@example.com,2024-01-15,",
+            # Batch 3: the next generated code was stored by the previous batch
+            ",Dave,dave@example.com,2024-01-15,ENG",
+        )
+
+        assert job.status == "completed"
+        assert (job.processed_rows, job.imported_rows, job.failed_rows) == (7, 5, 2)
+        assert job.errors == [
+            {"row": 5, "errors": ["email: duplicate email in file"]},
+            {"row": 6, "errors": ["department: unknown department 'OPS'"]},
+        ]
+        employees = _employees(db)
+        assert {email: employee.employee_code for email, employee in employees.items()} == {
+            "alice@example.com": "EMP00001",
+            "bob@example.com": "EMP00002",
+            "erin@example.com": "EMP00003",
+            "frank@example.com": "EMP00004",
+            "dave@example.com": "EMP00005",
+        }
+        assert employees["bob@example.com"].department_id == department.id
+        assert employees["erin@example.com"].department_id is None
+
+    def test_existing_employees_are_not_imported_again(self, db, tmp_path, department):
+        _import(db, tmp_path, "EMP00009,Alice,alice@example.com,2024-01-15,ENG")
+
+        job = _import(
+            db, tmp_path,
+            ",Alice,Alice@Example.com,2024-01-15,ENG",
+            "EMP00009,Bob,bob@example.com,2024-01-15,ENG",
+            ",Carol,carol@example.com,not a date,ENG",
+        )
+
+        assert (job.imported_rows, job.failed_rows) == (0, 3)
+        errors = {error["row"]: error["errors"] for error in job.errors}
+        assert errors[2] == ["email: employee with this email already exists"]
+        assert errors[3] == ["employee_code: employee code already exists"]
+        assert errors[4][0].startswith("date_of_joining:")
+        assert len(_employees(db)) == 1
+
+    def test_unsupported_file_fails_the_job(self, db, tmp_path):
+        path = tmp_path / "employees.txt"
+        path.write_text(HEADER)
+
+        job = EmployeeImportService(db).run(ImportJob("employees.txt"), path)
+
+        assert job.status == "failed"
+        assert "Unsupported file type" in job.detail
\ No newline at end of file
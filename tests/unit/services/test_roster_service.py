@@ -0,0 +1,233 @@
+import threading
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.core.tenancy import set_tenant
+from app.models.shift_policy import ShiftPolicy
+from app.models.shift_rule import ShiftRule
+from app.models.weekoff_policy import WeekoffPolicy
+from app.services import roster_service
+from app.services.roster_service import (
+    COMPILERS, OFF_DAY, POLICY, RULE, UNSCHEDULED, WEEKOFF,
+    DateAxis, PolicySnapshot, Roster, RosterEngine
+)
+
+_ = UNSCHEDULED
+# 2024-03-01 is a Friday; the range covers the first two weeks of the month
+AXIS_START, AXIS_END = date(2024, 3, 1), date(2024, 3, 14)
+EDITED = datetime(2024, 1, 1)
+
+
+def _rule(id, pattern, anchor, active=True):
+    return ShiftRule(id=id, pattern=pattern, anchor_date=anchor, is_active=active, updated_at=EDITED)
+
+
+def _policy(id, default_shift_id, active=True, updated_at=EDITED):
+    return ShiftPolicy(id=id, default_shift_id=default_shift_id, is_active=active, updated_at=updated_at)
+
+
+def _weekoff(id, weekly=(), monthly=None, active=True, updated_at=EDITED):
+    return WeekoffPolicy(
+        id=id, weekly_off_days=list(weekly), monthly_off_days=monthly or {},
+        is_active=active, updated_at=updated_at
+    )
+
+
+def _snapshot(rules=(), policies=(), weekoffs=()):
+    return PolicySnapshot({
+        kind: {row.id: COMPILERS[kind](row) for row in rows if row.is_active}
+        for kind, rows in ((RULE, rules), (POLICY, policies), (WEEKOFF, weekoffs))
+    })
+
+
+RULES = [
+    _rule(1, [10, 20, None], date(2024, 3, 1)),
+    _rule(2, [40, 50], date(2024, 3, 10)),  # Anchored after the range start
+]
+POLICIES = [_policy(1, 30), _policy(2, 60, active=False)]
+WEEKOFFS = [
+    _weekoff(1, weekly=[6]),  # Sundays
+    _weekoff(2, monthly={"5": [2]}),  # Second Saturday
+]
+
+# (id, rule, policy, week-off, joining date)
+ASSIGNMENTS = [
+    (101, 1, 1, 1, date(2020, 1, 1)),
+    (102, None, 1, 2, date(2020, 1, 1)),
+    (103, None, 2, 1, date(2020, 1, 1)),
+    (104, 1, None, 1, date(2024, 3, 5)),
+    (105, 2, None, None, date(2020, 1, 1)),
+    (106, None, None, None, date(2020, 1, 1)),
+]
+
+#            Fri Sat Sun Mon Tue Wed Thu Fri Sat Sun Mon Tue Wed Thu
+EXPECTED = {
+    101: [10, 20, 0, 10, 20, 0, 10, 20, 0, 0, 20, 0, 10, 20],
+    102: [30, 30, 30, 30, 30, 30, 30, 30, 0, 30, 30, 30, 30, 30],
+    103: [_] * 14,
+    104: [_, _, _, _, 20, 0, 10, 20, 0, 0, 20, 0, 10, 20],
+    105: [50, 40, 50, 40, 50, 40, 50, 40, 50, 40, 50, 40, 50, 40],
+    106: [_] * 14,
+}
+
+
+def _grid(roster):
+    return {employee: row for employee, row in zip(roster.employee_ids.tolist(), roster.grid.tolist())}
+
+
+class TestDateAxis:
+    def test_weekdays_and_weeks_of_month(self):
+        axis = DateAxis(date(2024, 2, 26), date(2024, 3, 9))
+
+        assert len(axis) == 13
+        assert axis.weekdays.tolist() == [date.fromordinal(int(o)).weekday() for o in axis.ordinals]
+        assert axis.weeks_of_month.tolist() == [4, 4, 4, 5, 1, 1, 1, 1, 1, 1, 1, 2, 2]
+
+
+class TestCompiledPolicies:
+    def test_rule_expands_rest_days_and_days_before_the_anchor(self):
+        axis = DateAxis(AXIS_START, AXIS_END)
+
+        assert COMPILERS[RULE](RULES[0]).expand(axis).tolist() == [10, 20, OFF_DAY] * 4 + [10, 20]
+        assert COMPILERS[RULE](RULES[1]).expand(axis).tolist() == EXPECTED[105]
+
+    def test_weekoff_mask_combines_weekly_and_monthly_days(self):
+        axis = DateAxis(AXIS_START, AXIS_END)
+        weekoff = COMPILERS[WEEKOFF](_weekoff(3, weekly=[4], monthly={"5": [1]}))
+
+        assert np.flatnonzero(weekoff.mask(axis)).tolist() == [0, 1, 7]
+
+    def test_version_follows_updates_and_activation(self):
+        compiled = COMPILERS[POLICY](_policy(1, 30))
+
+        assert compiled.version == COMPILERS[POLICY](_policy(1, 31)).version
+        assert compiled.version != COMPILERS[POLICY](_policy(1, 30, updated_at=datetime(2024, 2, 1))).version
+        assert compiled.version != COMPILERS[POLICY](_policy(1, 30, active=False)).version
+
+
+class TestRoster:
+    def test_build_matches_hand_computed_schedule(self):
+        roster = Roster.build(DateAxis(AXIS_START, AXIS_END), ASSIGNMENTS, _snapshot(RULES, POLICIES, WEEKOFFS))
+
+        assert _grid(roster) == EXPECTED
+        assert len(roster) == 6
+        assert roster.position_of(104) == 3
+        assert roster.position_of(999) is None
+
+    def test_employees_with_the_same_assignment_share_a_group(self):
+        roster = Roster.build(DateAxis(AXIS_START, AXIS_END), ASSIGNMENTS, _snapshot(RULES, POLICIES, WEEKOFFS))
+
+        twins = Roster.build(
+            DateAxis(AXIS_START, AXIS_END),
+            ASSIGNMENTS + [(107, 1, 1, 1, date(2024, 3, 12))],
+            _snapshot(RULES, POLICIES, WEEKOFFS)
+        )
+
+        assert len(twins.group_keys) == len(roster.group_keys) == 6
+        assert _grid(twins)[107] == [_] * 11 + EXPECTED[101][11:]
+
+    def test_refreshed_returns_the_same_roster_when_nothing_changed(self):
+        roster = Roster.build(DateAxis(AXIS_START, AXIS_END), ASSIGNMENTS, _snapshot(RULES, POLICIES, WEEKOFFS))
+
+        assert roster.refreshed(_snapshot(RULES, POLICIES, WEEKOFFS)) is roster
+
+    @pytest.mark.parametrize("rules, policies, weekoffs", [
+        # Default shift of policy 1 edited
+        (RULES, [_policy(1, 35, updated_at=datetime(2024, 2, 1)), POLICIES[1]], WEEKOFFS),
+        # Policy 2 reactivated
+        (RULES, [POLICIES[0], _policy(2, 60)], WEEKOFFS),
+        # Sunday week-off deactivated
+        (RULES, POLICIES, [_weekoff(1, weekly=[6], active=False), WEEKOFFS[1]]),
+        # Rule 2 deleted
+        (RULES[:1], POLICIES, WEEKOFFS),
+    ])
+    def test_refreshed_equals_a_fresh_build(self, rules, policies, weekoffs):
+        axis = DateAxis(AXIS_START, AXIS_END)
+        roster = Roster.build(axis, ASSIGNMENTS, _snapshot(RULES, POLICIES, WEEKOFFS))
+        snapshot = _snapshot(rules, policies, weekoffs)
+
+        refreshed = roster.refreshed(snapshot)
+
+        assert refreshed is not roster
+        assert _grid(refreshed) == _grid(Roster.build(axis, ASSIGNMENTS, snapshot))
+        assert _grid(roster) == EXPECTED  # The cached roster is left untouched
+        assert refreshed.refreshed(snapshot) is refreshed
+
+    def test_refreshed_only_rewrites_employees_of_changed_groups(self):
+        roster = Roster.build(DateAxis(AXIS_START, AXIS_END), ASSIGNMENTS, _snapshot(RULES, POLICIES, WEEKOFFS))
+
+        refreshed = roster.refreshed(_snapshot(RULES, POLICIES, [WEEKOFFS[0], _weekoff(2, monthly={"5": [1]}, updated_at=datetime(2024, 2, 1))]))
+
+        changed = {employee for employee, row in _grid(refreshed).items() if row != EXPECTED[employee]}
+        assert changed == {102}
+        assert _grid(refreshed)[102][1] == OFF_DAY and _grid(refreshed)[102][8] == 30
+
+
+class TestRosterEngine:
+    def test_rosters_are_cached_per_tenant_and_range(self, db):
+        engine = RosterEngine(max_ranges=10, ttl=60)
+        set_tenant(db, 1)
+        first = engine.get_roster(db, AXIS_START, AXIS_END)
+
+        assert engine.get_roster(db, AXIS_START, AXIS_END) is first
+        set_tenant(db, 2)
+        assert engine.get_roster(db, AXIS_START, AXIS_END) is not first
+        assert engine.stats()["size"] == 2
+
+    def test_invalidate_drops_only_that_tenants_rosters(self, db):
+        engine = RosterEngine(max_ranges=10, ttl=60)
+        rosters = {}
+        for tenant_id in (1, 2, None):
+            set_tenant(db, tenant_id)
+            rosters[tenant_id] = engine.get_roster(db, AXIS_START, AXIS_END)
+
+        engine.invalidate(1)
+
+        set_tenant(db, 2)
+        assert engine.get_roster(db, AXIS_START, AXIS_END) is rosters[2]
+        set_tenant(db, 1)
+        assert engine.get_roster(db, AXIS_START, AXIS_END) is not rosters[1]
+        # Unscoped rosters include every tenant's employees
+        set_tenant(db, None)
+        assert engine.get_roster(db, AXIS_START, AXIS_END) is not rosters[None]
+
+    def test_a_slow_build_does_not_block_other_tenants(self, db, engine, monkeypatch):
+        roster_engine = RosterEngine(max_ranges=10, ttl=60)
+        set_tenant(db, 2)
+        cached = roster_engine.get_roster(db, AXIS_START, AXIS_END)
+
+        building, release = threading.Event(), threading.Event()
+        builds = []
+        build = Roster.build.__func__
+
+        def slow_build(cls, *args):
+            builds.append(args)
+            building.set()
+            assert release.wait(5)
+            return build(cls, *args)
+
+        monkeypatch.setattr(roster_service.Roster, "build", classmethod(slow_build))
+        sessions = [type(db)(bind=engine) for _ in range(2)]
+        results = []
+
+        def tenant_one(session):
+            set_tenant(session, 1)
+            results.append(roster_engine.get_roster(session, AXIS_START, AXIS_END))
+
+        threads = [threading.Thread(target=tenant_one, args=(session,)) for session in sessions]
+        threads[0].start()
+        assert building.wait(5)
+        threads[1].start()
+
+        # Tenant 1 is still building; tenant 2 is served from its cache meanwhile
+        assert roster_engine.get_roster(db, AXIS_START, AXIS_END) is cached
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        for session in sessions:
+            session.close()
+
+        assert len(builds) == 1  # The second caller reused the first build
+        assert len(results) == 2 and results[0] is results[1]
\ No newline at end of file
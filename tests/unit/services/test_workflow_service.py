@@ -0,0 +1,191 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.principal import Principal
+from app.models.job import Job
+from app.models.workflow import WorkflowDefinition, WorkflowHistory, WorkflowInstance
+from app.schemas.enums import UserRole, UserStatus, WorkflowEntityType
+from app.schemas.workflow import WorkflowActionRequest, WorkflowDefinitionCreate, WorkflowStartRequest
+from app.services.workflow_service import (
+    CompiledWorkflow, WorkflowDefinitionError, WorkflowEngine, WorkflowService
+)
+
+STATES = [
+    {"name": "pending", "sla_minutes": 60, "on_timeout": "escalate"},
+    {"name": "escalated", "sla_minutes": 30, "on_timeout": "reject"},
+    {"name": "approved", "final": True},
+    {"name": "rejected", "final": True},
+]
+TRANSITIONS = [
+    {"from": "pending", "action": "approve", "to": "approved", "roles": ["admin"]},
+    {"from": "pending", "action": "reject", "to": "rejected"},
+    {"from": "pending", "action": "escalate", "to": "escalated"},
+    {"from": "escalated", "action": "approve", "to": "approved", "roles": ["superadmin"]},
+    {"from": "escalated", "action": "reject", "to": "rejected"},
+]
+
+
+def _definition(**overrides):
+    fields = {"id": 1, "code": "leave", "version": 1, "initial_state": "pending",
+              "states": STATES, "transitions": TRANSITIONS, **overrides}
+    return WorkflowDefinition(**fields)
+
+
+def _principal(id=1, role=UserRole.ADMIN):
+    return Principal(id, f"user{id}@example.com", role, UserStatus.ACTIVE, {}, loader=lambda: None)
+
+
+@pytest.fixture
+def service(db):
+    return WorkflowService(db)
+
+
+@pytest.fixture
+def workflow_engine():
+    return WorkflowEngine(batch_size=10, horizon_seconds=600, cache_size=10)
+
+
+@pytest.fixture
+def instance(service):
+    service.create_definition(WorkflowDefinitionCreate(
+        code="leave", name="Leave approval", entity_type=WorkflowEntityType.LEAVE,
+        initial_state="pending", states=STATES, transitions=TRANSITIONS
+    ), created_by_id=1)
+    return service.start_instance(WorkflowStartRequest(code="leave", entity_id=42), actor_id=1)
+
+
+def _later(minutes):
+    return datetime.now(timezone.utc) + timedelta(minutes=minutes)
+
+
+def _reload(db, instance):
+    db.expire_all()
+    return db.get(WorkflowInstance, instance.id)
+
+
+class TestCompiledWorkflow:
+    def test_transition_table(self):
+        workflow = CompiledWorkflow(_definition())
+
+        assert workflow.next_state("pending", "approve") == "approved"
+        assert workflow.next_state("escalated", "escalate") is None
+        assert workflow.next_state("approved", "reject") is None
+        assert workflow.next_state("unknown", "approve") is None
+        assert workflow.next_state("pending", "unknown") is None
+        assert workflow.is_final("rejected") and not workflow.is_final("pending")
+
+    def test_roles_and_timeouts(self):
+        workflow = CompiledWorkflow(_definition())
+        entered = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+        assert workflow.allows_role("pending", "approve", UserRole.ADMIN)
+        assert not workflow.allows_role("escalated", "approve", UserRole.ADMIN)
+        assert workflow.allows_role("pending", "reject", UserRole.USER)  # No roles listed: anyone
+        assert workflow.due_at("escalated", entered) == entered + timedelta(minutes=30)
+        assert workflow.due_at("approved", entered) is None
+        assert workflow.timeout_action("pending") == "escalate"
+
+    @pytest.mark.parametrize("overrides, message", [
+        ({"initial_state": "draft"}, "Unknown initial state"),
+        ({"states": STATES + [{"name": "pending"}]}, "unique"),
+        ({"transitions": TRANSITIONS + [{"from": "pending", "action": "x", "to": "nowhere"}]}, "unknown state"),
+        ({"transitions": TRANSITIONS + [{"from": "pending", "action": "approve", "to": "rejected"}]}, "Duplicate"),
+        ({"transitions": TRANSITIONS + [{"from": "approved", "action": "reopen", "to": "pending"}]}, "Final state"),
+        ({"states": [{**STATES[0], "on_timeout": "expire"}] + STATES[1:]}, "Timeout action"),
+    ])
+    def test_invalid_definitions(self, overrides, message):
+        with pytest.raises(WorkflowDefinitionError, match=message):
+            CompiledWorkflow(_definition(**overrides))
+
+
+class TestWorkflowEngine:
+    def test_approve_completes_the_instance(self, db, service, workflow_engine, instance):
+        service.submit_action(instance.id, WorkflowActionRequest(action="approve", comment="OK"), _principal())
+
+        assert workflow_engine.apply_pending(db, _later(1)) == 1
+
+        instance = _reload(db, instance)
+        assert (instance.state, instance.is_completed, instance.pending_action) == ("approved", True, None)
+        assert instance.due_at is None
+        history = db.query(WorkflowHistory).one()
+        assert (history.from_state, history.to_state, history.actor_id, history.comment) == (
+            "pending", "approved", 1, "OK"
+        )
+        assert db.query(Job).filter(Job.name == "workflow.completed").one().payload == {"instance_id": instance.id}
+
+    def test_reject_moves_to_the_rejected_state(self, db, service, workflow_engine, instance):
+        service.submit_action(instance.id, WorkflowActionRequest(action="reject"), _principal(role=UserRole.USER))
+        workflow_engine.apply_pending(db, _later(1))
+
+        assert _reload(db, instance).state == "rejected"
+
+    def test_submit_action_validates_before_queueing(self, db, service, instance):
+        with pytest.raises(HTTPException) as invalid:
+            service.submit_action(instance.id, WorkflowActionRequest(action="reopen"), _principal())
+        with pytest.raises(HTTPException) as forbidden:
+            service.submit_action(instance.id, WorkflowActionRequest(action="approve"), _principal(role=UserRole.USER))
+        service.submit_action(instance.id, WorkflowActionRequest(action="reject"), _principal())
+        with pytest.raises(HTTPException) as pending:
+            service.submit_action(instance.id, WorkflowActionRequest(action="approve"), _principal())
+
+        assert (invalid.value.status_code, forbidden.value.status_code, pending.value.status_code) == (400, 403, 409)
+
+    def test_action_no_longer_allowed_is_rejected_with_last_error(self, db, service, workflow_engine, instance):
+        # Queued while valid, but the instance moved on before the tick (e.g. another worker escalated it)
+        service.instance_repo.queue_action(instance.id, "escalate", 1, None)
+        workflow_engine.apply_pending(db, _later(1))
+        service.instance_repo.queue_action(instance.id, "escalate", 1, None)
+
+        assert workflow_engine.apply_pending(db, _later(2)) == 1
+
+        instance = _reload(db, instance)
+        assert (instance.state, instance.pending_action) == ("escalated", None)
+        assert instance.last_error == "Action 'escalate' is not allowed in state 'escalated'"
+        assert db.query(WorkflowHistory).count() == 1
+
+    def test_timeouts_escalate_and_count_the_escalation_level(self, db, service, workflow_engine, instance):
+        assert workflow_engine.fire_timers(db, _later(30)) == 0
+
+        assert workflow_engine.fire_timers(db, _later(61)) == 1
+        workflow_engine.apply_pending(db, _later(61))
+        instance = _reload(db, instance)
+        assert (instance.state, instance.escalation_level) == ("escalated", 1)
+
+        assert workflow_engine.fire_timers(db, _later(92)) == 1
+        workflow_engine.apply_pending(db, _later(92))
+        instance = _reload(db, instance)
+        assert (instance.state, instance.escalation_level, instance.is_completed) == ("rejected", 2, True)
+        assert [row.actor_id for row in db.query(WorkflowHistory)] == [None, None]
+
+    def test_a_user_action_resets_the_escalation_level(self, db, service, workflow_engine, instance):
+        workflow_engine.fire_timers(db, _later(61))
+        workflow_engine.apply_pending(db, _later(61))
+
+        service.submit_action(instance.id, WorkflowActionRequest(action="reject"), _principal())
+        workflow_engine.apply_pending(db, _later(62))
+
+        assert _reload(db, instance).escalation_level == 0
+
+    def test_a_timer_fired_by_two_workers_is_queued_once(self, db, instance):
+        workers = [WorkflowEngine(batch_size=10, horizon_seconds=600, cache_size=10) for _ in range(2)]
+
+        assert [worker.fire_timers(db, _later(61)) for worker in workers] == [1, 0]
+        assert _reload(db, instance).pending_action == "escalate"
+
+    def test_queue_timeouts_skips_queued_and_moved_on_instances(self, db, service, instance):
+        due_at = _reload(db, instance).due_at
+        timeout = {"b_id": instance.id, "b_due_at": due_at, "b_action": "escalate"}
+
+        assert service.instance_repo.queue_timeouts([{**timeout, "b_due_at": due_at + timedelta(seconds=1)}]) == 0
+        assert service.instance_repo.queue_timeouts([timeout]) == 1
+        assert service.instance_repo.queue_timeouts([timeout]) == 0
+
+    def test_stale_timer_of_an_instance_that_moved_on_is_ignored(self, db, service, workflow_engine, instance):
+        workflow_engine.fire_timers(db, _later(1))  # Loads the pending state's timer into the heap
+        service.submit_action(instance.id, WorkflowActionRequest(action="reject"), _principal())
+        workflow_engine.apply_pending(db, _later(2))
+
+        assert workflow_engine.fire_timers(db, _later(61)) == 0
+        assert _reload(db, instance).pending_action is None
\ No newline at end of file
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from app.utils.code_generator import NumberBlockAllocator, format_employee_code
+
+
+class Counter:
+    """Shared sequence standing in for the database counter"""
+
+    def __init__(self, start=1):
+        self.next = start
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, key, count):
+        with self._lock:
+            first = self.next
+            self.next += count
+            self.calls.append((key, count))
+            return first
+
+
+class TestFormatEmployeeCode:
+    @pytest.mark.parametrize("prefix, number, padding, suffix, expected", [
+        ("EMP", 42, 5, None, "EMP00042"),
+        ("EMP", 42, 5, "-IN", "EMP00042-IN"),
+        ("EMP", 42, 0, None, "EMP42"),
+        ("", 7, 3, "", "007"),
+        ("E", 123456, 3, None, "E123456"),
+    ])
+    def test_padding_and_suffix(self, prefix, number, padding, suffix, expected):
+        assert format_employee_code(prefix, number, padding, suffix) == expected
+
+
+class TestNumberBlockAllocator:
+    def test_numbers_come_from_one_block_until_it_runs_out(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=10)
+
+        assert allocator.take("acme", 3) == [1, 2, 3]
+        assert allocator.take("acme", 7) == [4, 5, 6, 7, 8, 9, 10]
+        assert counter.calls == [("acme", 10)]
+
+    def test_rollover_uses_the_rest_of_the_block_then_a_new_one(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=4)
+        allocator.take("acme", 3)
+
+        assert allocator.take("acme", 3) == [4, 5, 6]
+        assert counter.calls == [("acme", 4), ("acme", 4)]
+        assert allocator.stats()["available"] == 2
+
+    def test_rollover_skips_numbers_reserved_elsewhere(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=3)
+        allocator.take("acme", 2)
+        counter.next += 100  # Another process reserved a block meanwhile
+
+        assert allocator.take("acme", 3) == [3, 104, 105]
+
+    def test_requests_larger_than_a_block_reserve_their_own_size(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=5)
+
+        assert allocator.take("acme", 12) == list(range(1, 13))
+        assert counter.calls == [("acme", 12)]
+        assert allocator.stats()["available"] == 0
+
+    def test_keys_have_separate_blocks(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=5)
+
+        assert allocator.take("acme", 2) == [1, 2]
+        assert allocator.take("globex", 2) == [6, 7]
+        assert allocator.take("acme", 1) == [3]
+
+    def test_zero_count_reserves_nothing(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=5)
+
+        assert allocator.take("acme", 0) == []
+        assert counter.calls == []
+
+    def test_discard_drops_the_unused_part_of_a_block(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=5)
+        allocator.take("acme", 1)
+        allocator.discard("acme")
+
+        assert allocator.take("acme", 1) == [6]
+        assert allocator.stats()["reservations"] == 2
+
+    def test_concurrent_takes_never_hand_out_a_number_twice(self):
+        counter = Counter()
+        allocator = NumberBlockAllocator(counter, block_size=7)
+        taken = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            for _ in range(200):
+                taken.extend(allocator.take("acme", 3))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(taken) == 8 * 200 * 3
+        assert len(set(taken)) == len(taken)
+        # Blocks are used up before new ones are reserved, so nothing is skipped
+        assert sorted(taken) == list(range(1, len(taken) + 1))
\ No newline at end of file